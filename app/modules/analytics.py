@@ -0,0 +1,516 @@
+"""
+Analytics
+
+Column-wise statistics for the website's analytics tab. The employees'
+fields are extracted once into factorized columns (integer codes plus the
+distinct values in order of first appearance). Donut distributions,
+averages and the high-performer/needs-improvement counts are then
+computed with bincount and array operations. Only the handful of distinct
+values per column goes through Python, instead of every employee's
+attributes.
+
+Values are factorized by type as well as value, so 4, 4.0, True and "4"
+keep the separate treatment the per-employee code gave them.
+
+Cross-tabs and grouped statistics (counts, means, percentiles) work the
+same way for any pair of fields. They are memoized by the content hash of
+the columns they read, so regenerating the site from an unchanged dataset
+reuses them.
+"""
+
+import hashlib
+import math
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .employee import EmployeeRow
+from .header_mapper import CardGroup, CardType, ChartType, HeaderMapping, header_mapper
+
+# Chart order of the rating donuts; other rating fields follow them, then the remaining donuts
+RATING_FIELD_ORDER = [
+    'communication_rating',
+    'collaboration_rating',
+    'professionalism_rating',
+    'technical_knowledge_expertise_rating',
+    'workflow_implementation_management_execution_rating',
+    'overall_performance_rating'
+]
+
+# Donut labels for numeric values of RATING_NUM fields and of the other (score) fields
+RATING_NUM_LABELS = {1: "Very Unsatisfied", 2: "Unsatisfied", 3: "Neutral", 4: "Satisfied", 5: "Very Satisfied"}
+SCORE_LABELS = {
+    0: "0 (Not Applicable)",
+    1: "1 (Unsatisfactory)",
+    2: "2 (Needs to Improve)",
+    3: "3 (Meets Expectations)",
+    4: "4 (Exceeds Expectations)",
+    5: "5 (Exceptional)",
+}
+
+HIGH_PERFORMER_RATING = 4
+NEEDS_IMPROVEMENT_RATING = 2
+
+DEFAULT_PERCENTILES = (25, 50, 75)
+CACHE_MAX_ENTRIES = 256
+
+# Leading number of a rating such as 4, "4" or "3 (Meets Expectations)"
+_SCORE_PATTERN = re.compile(r"^\s*(-?\d+(?:\.\d+)?)")
+
+# (kind, arguments, column hashes) -> result, least recently used first
+_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    # Series keeps list values (e.g. data_sources) as single elements instead of a 2-D array
+    return pd.Series(values, dtype=object).to_numpy()
+
+
+def factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Factorize an object column by value and type.
+
+    Args:
+        values: Object array (None where an employee has no value)
+
+    Returns:
+        (codes, uniques): codes index uniques, which hold the first value of each
+        (type, value) group in order of first appearance
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=np.intp), values
+    try:
+        value_codes, _ = pd.factorize(values, use_na_sentinel=False)
+    except TypeError:
+        # Unhashable values (lists): group them by their text instead
+        value_codes, _ = pd.factorize(_object_array([str(value) for value in values]), use_na_sentinel=False)
+    type_codes, types = pd.factorize(_object_array(list(map(type, values))))
+    codes, _ = pd.factorize(value_codes * len(types) + type_codes)
+    _, first = np.unique(codes, return_index=True)
+    return codes, values[first]
+
+
+def _int_rating(value: Any) -> Optional[int]:
+    # The per-employee code counted truthy int/float values, truncated to int
+    if value and isinstance(value, (int, float)):
+        try:
+            return int(value)
+        except (ValueError, OverflowError):
+            return None
+    return None
+
+
+class EmployeeFrame:
+    """Columns of a list of employees, extracted and factorized once per field."""
+
+    def __init__(self, employees: List[Any]):
+        """
+        Initialize the frame.
+
+        Args:
+            employees: Employee objects, EmployeeStore rows or employee data dictionaries
+        """
+        self.size = len(employees)
+        self._store = None
+        self._rows = None
+        self._records = None
+        self._factorized: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._hashes: Dict[str, str] = {}
+
+        stores = {id(employee._store) for employee in employees if isinstance(employee, EmployeeRow)}
+        if employees and len(stores) == 1 and all(isinstance(employee, EmployeeRow) for employee in employees):
+            # Rows of one store: read its columns directly
+            self._store = employees[0]._store
+            self._rows = np.fromiter((employee.row_index for employee in employees), dtype=np.intp,
+                                     count=len(employees))
+        else:
+            self._records = [employee if isinstance(employee, dict)
+                             else employee.as_record() if hasattr(employee, 'as_record') else vars(employee)
+                             for employee in employees]
+
+    @property
+    def fields(self) -> List[str]:
+        """Every field present on at least one employee (in first-seen order)."""
+        if self._store is not None:
+            return self._store.fields
+        return list(dict.fromkeys(field for record in self._records for field in record))
+
+    def column(self, field: str) -> np.ndarray:
+        """A field's values as an object array (None where absent)."""
+        if self._store is not None:
+            return _object_array(self._store.column(field))[self._rows]
+        return _object_array([record.get(field) for record in self._records])
+
+    def factorized(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """(codes, uniques) of a field; see factorize()."""
+        if field not in self._factorized:
+            self._factorized[field] = factorize(self.column(field))
+        return self._factorized[field]
+
+    def field_hash(self, field: str) -> str:
+        """Content hash of a field's column (values, their types and row order)."""
+        if field not in self._hashes:
+            codes, uniques = self.factorized(field)
+            digest = hashlib.sha256(field.encode("utf-8"))
+            digest.update(repr([(type(value).__name__, value) for value in uniques]).encode("utf-8"))
+            digest.update(np.ascontiguousarray(codes, dtype=np.int64).tobytes())
+            self._hashes[field] = digest.hexdigest()
+        return self._hashes[field]
+
+    def group_ids(self, field: str) -> Tuple[List[str], np.ndarray]:
+        """
+        Group employees by a field's stripped text.
+
+        Returns:
+            (labels, ids): sorted group labels, and each employee's position in
+            them (-1 where the field is missing or blank)
+        """
+        codes, uniques = self.factorized(field)
+        texts = ['' if value is None else str(value).strip() for value in uniques]
+        labels = sorted({text for text in texts if text})
+        position = {label: i for i, label in enumerate(labels)}
+        lookup = np.array([position[text] if text else -1 for text in texts], dtype=np.intp)
+        return labels, lookup[codes]
+
+    def scores(self, field: str) -> np.ndarray:
+        """A field's numeric scores (see score()); NaN where there is none."""
+        codes, uniques = self.factorized(field)
+        lookup = np.array([score(value) for value in uniques], dtype=float)
+        return lookup[codes]
+
+    def value_counts(self, field: str, label: Callable[[Any], str]) -> Dict[str, int]:
+        """
+        Count a field's values by label, skipping missing values.
+
+        Args:
+            field: Field name
+            label: Maps a value to its label; values with the same label are counted together
+
+        Returns:
+            Label -> count, in order of each label's first appearance
+        """
+        codes, uniques = self.factorized(field)
+        counts = np.bincount(codes, minlength=len(uniques))
+        result: Dict[str, int] = {}
+        for value, count in zip(uniques, counts):
+            if value is not None:
+                key = label(value)
+                result[key] = result.get(key, 0) + int(count)
+        return result
+
+    def ratings(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        A field's numeric ratings.
+
+        Returns:
+            (present, values): mask of employees with a truthy int/float value, and
+            that value truncated to int (0 elsewhere)
+        """
+        codes, uniques = self.factorized(field)
+        converted = [_int_rating(value) for value in uniques]
+        present = np.array([value is not None for value in converted], dtype=bool)
+        values = np.array([value or 0 for value in converted], dtype=np.int64)
+        return present[codes], values[codes]
+
+
+def score(value: Any) -> float:
+    """
+    Numeric score of a rating value: the number itself or the leading number of its text.
+
+    0 marks "Not Applicable" on the rating scales and, like a missing or
+    non-numeric value, has no score (NaN).
+    """
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        match = _SCORE_PATTERN.match(str(value)) if value is not None else None
+        if not match:
+            return float("nan")
+        number = float(match.group(1))
+    return number if number != 0 else float("nan")
+
+
+def _score_order(scores: List[float]) -> List[int]:
+    # Scored labels ascending by score, then the rest in first-appearance order (sorted() is stable)
+    return sorted(range(len(scores)), key=lambda i: (math.isnan(scores[i]), 0 if math.isnan(scores[i]) else scores[i]))
+
+
+def _memoized(key: tuple, compute: Callable[[], Any]) -> Any:
+    if key in _cache:
+        _cache.move_to_end(key)
+        return _cache[key]
+    result = _cache[key] = compute()
+    if len(_cache) > CACHE_MAX_ENTRIES:
+        _cache.popitem(last=False)
+    return result
+
+
+def clear_cache() -> None:
+    """Forget memoized cross-tabs and grouped statistics."""
+    _cache.clear()
+
+
+def crosstab(frame: EmployeeFrame, group_field: str, value_field: str,
+             labels: Optional[Dict[int, str]] = None) -> Dict[str, Any]:
+    """
+    Count each value of value_field per group of group_field.
+
+    Employees missing either field are left out. Result dicts are shared by the
+    memo cache; treat them as read-only.
+
+    Args:
+        frame: Employees to count
+        group_field: Field whose text defines the groups (e.g. "Employee Role")
+        value_field: Field whose values are counted (e.g. a rating)
+        labels: Descriptions of numeric values, as for the donut charts
+
+    Returns:
+        {'groups': sorted group labels, 'values': value labels counted in some group
+         (ascending score, then first appearance), 'counts': one row of counts per group}
+    """
+    key = ("crosstab", group_field, value_field, tuple(sorted((labels or {}).items())),
+           frame.field_hash(group_field), frame.field_hash(value_field))
+    return _memoized(key, lambda: _crosstab(frame, group_field, value_field, labels or {}))
+
+
+def _crosstab(frame: EmployeeFrame, group_field: str, value_field: str, labels: Dict[int, str]) -> Dict[str, Any]:
+    groups, group_ids = frame.group_ids(group_field)
+    codes, uniques = frame.factorized(value_field)
+
+    value_labels: Dict[str, int] = {}
+    value_scores: List[float] = []
+    lookup = np.full(len(uniques), -1, dtype=np.intp)
+    for i, value in enumerate(uniques):
+        if value is not None:
+            label = chart_label(value, labels)
+            if label not in value_labels:
+                value_labels[label] = len(value_labels)
+                value_scores.append(score(value))
+            lookup[i] = value_labels[label]
+    value_ids = lookup[codes]
+
+    # One bincount over (group, value) pairs
+    counted = (group_ids >= 0) & (value_ids >= 0)
+    pairs = group_ids[counted] * len(value_labels) + value_ids[counted]
+    counts = np.bincount(pairs, minlength=len(groups) * len(value_labels)).reshape(len(groups), len(value_labels))
+
+    # Values seen only on employees outside every group get no column
+    order = [i for i in _score_order(value_scores) if counts[:, i].any()]
+    return {
+        'groups': groups,
+        'values': [list(value_labels)[i] for i in order],
+        'counts': counts[:, order].tolist(),
+    }
+
+
+def grouped_stats(frame: EmployeeFrame, group_field: str, value_field: str,
+                  percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+    """
+    Count, mean and percentiles of value_field's scores per group of group_field.
+
+    Only values with a score count (see score()). Result dicts are shared by the
+    memo cache; treat them as read-only.
+
+    Args:
+        frame: Employees to summarize
+        group_field: Field whose text defines the groups
+        value_field: Rating field to summarize
+        percentiles: Percentiles to report (0-100, linear interpolation)
+
+    Returns:
+        {'groups': sorted group labels, 'count': scored values per group,
+         'mean': mean per group, 'percentiles': {"p50": value per group, ...}};
+        means and percentiles are None for groups without scores
+    """
+    key = ("grouped_stats", group_field, value_field, tuple(percentiles),
+           frame.field_hash(group_field), frame.field_hash(value_field))
+    return _memoized(key, lambda: _grouped_stats(frame, group_field, value_field, tuple(percentiles)))
+
+
+def _grouped_stats(frame: EmployeeFrame, group_field: str, value_field: str,
+                   percentiles: Tuple[float, ...]) -> Dict[str, Any]:
+    groups, group_ids = frame.group_ids(group_field)
+    scores = frame.scores(value_field)
+    scored = (group_ids >= 0) & ~np.isnan(scores)
+    group_ids, scores = group_ids[scored], scores[scored]
+
+    counts = np.bincount(group_ids, minlength=len(groups))
+    sums = np.bincount(group_ids, weights=scores, minlength=len(groups))
+
+    # Sorted by group, then score: each group's scores are one contiguous sorted run
+    order = np.lexsort((scores, group_ids))
+    sorted_scores = scores[order]
+    ends = np.cumsum(counts)
+    starts = ends - counts
+
+    means = []
+    quantiles: Dict[str, List[Optional[float]]] = {_percentile_key(p): [] for p in percentiles}
+    for g in range(len(groups)):
+        if counts[g] == 0:
+            means.append(None)
+            for values in quantiles.values():
+                values.append(None)
+            continue
+        means.append(round(float(sums[g] / counts[g]), 2))
+        run = sorted_scores[starts[g]:ends[g]]
+        for p, value in zip(percentiles, np.percentile(run, percentiles)):
+            quantiles[_percentile_key(p)].append(round(float(value), 2))
+
+    return {'groups': groups, 'count': counts.tolist(), 'mean': means, 'percentiles': quantiles}
+
+
+def _percentile_key(percentile: float) -> str:
+    return f"p{percentile:g}"
+
+
+def chart_label(value: Any, labels: Dict[int, str]) -> str:
+    """Donut label of a value; numbers found in labels get their description."""
+    if isinstance(value, (int, float)):
+        return labels.get(value, str(value))
+    return str(value)
+
+
+def donut_chart_mappings() -> List[HeaderMapping]:
+    """Header mappings charted as donuts, rating fields first in RATING_FIELD_ORDER."""
+    chart_fields = [mapping for mapping_list in header_mapper.header_mappings_by_name.values()
+                    for mapping in mapping_list if mapping.data_type_in_chart == ChartType.DONUT]
+
+    rating_fields = []
+    other_fields = []
+    for mapping in chart_fields:
+        field_name = mapping.mapped_header.lower()
+        if any(rating_term in field_name for rating_term in ['rating', 'performance']):
+            rating_fields.append(mapping)
+        else:
+            other_fields.append(mapping)
+
+    def get_rating_field_priority(mapping):
+        field_name_lower = mapping.mapped_header.lower().replace(' ', '_').replace('&', '').replace(',', '').replace('/', '_')
+        try:
+            return RATING_FIELD_ORDER.index(field_name_lower)
+        except ValueError:
+            return len(RATING_FIELD_ORDER)  # Put unknown rating fields at the end
+
+    rating_fields.sort(key=get_rating_field_priority)
+    return rating_fields + other_fields
+
+
+def chart_data(employees: List[Any], frame: Optional[EmployeeFrame] = None) -> Dict[str, Any]:
+    """
+    Donut chart distributions of every DONUT field.
+
+    Args:
+        employees: Employee objects, EmployeeStore rows or employee data dictionaries
+        frame: Frame of the same employees, when the caller already has one
+
+    Returns:
+        {'data': field -> {label: count} (fields without values omitted),
+         'field_types': field -> card type value}
+    """
+    frame = frame or EmployeeFrame(employees)
+    data = {}
+    field_types = {}
+    for mapping in donut_chart_mappings():
+        field_name = mapping.mapped_header
+        field_types[field_name] = mapping.data_type_in_card.value
+        labels = RATING_NUM_LABELS if mapping.data_type_in_card.value == 'rating_num' else SCORE_LABELS
+        field_data = frame.value_counts(field_name, lambda value: chart_label(value, labels))
+        if field_data:
+            data[field_name] = field_data
+    return {'data': data, 'field_types': field_types}
+
+
+def performance_stats(employees: List[Any], frame: Optional[EmployeeFrame] = None) -> Dict[str, Any]:
+    """
+    Headcount, average overall rating, high performers and employees needing improvement.
+
+    An employee's overall rating is the first "overall performance rating" field
+    (by name) with a numeric value; without one, the rounded mean of their numeric
+    rating fields (comments excluded).
+
+    Args:
+        employees: Employee objects, EmployeeStore rows or employee data dictionaries
+        frame: Frame of the same employees, when the caller already has one
+
+    Returns:
+        {'total_employees', 'average_rating', 'high_performers', 'needs_improvement'}
+    """
+    frame = frame or EmployeeFrame(employees)
+    fields = sorted(frame.fields)
+    overall_fields = [field for field in fields
+                      if all(term in field.lower() for term in ('overall', 'performance', 'rating'))]
+    rating_fields = [field for field in fields if 'rating' in field.lower() and 'comment' not in field.lower()]
+
+    overall = np.zeros(frame.size, dtype=np.int64)
+    has_overall = np.zeros(frame.size, dtype=bool)
+    for field in overall_fields:
+        present, values = frame.ratings(field)
+        take = present & ~has_overall
+        overall[take] = values[take]
+        has_overall |= take
+
+    rating_sum = np.zeros(frame.size, dtype=np.int64)
+    rating_count = np.zeros(frame.size, dtype=np.int64)
+    for field in rating_fields:
+        present, values = frame.ratings(field)
+        rating_sum += values
+        rating_count += present
+
+    # np.rint rounds half to even, like round()
+    averaged = ~has_overall & (rating_count > 0)
+    overall[averaged] = np.rint(rating_sum[averaged] / rating_count[averaged]).astype(np.int64)
+
+    rated = overall[overall != 0]
+    average_rating = int(rated.sum()) / len(rated) if len(rated) > 0 else 0
+    return {
+        'total_employees': frame.size,
+        'average_rating': average_rating,
+        'high_performers': int(np.count_nonzero(rated >= HIGH_PERFORMER_RATING)),
+        'needs_improvement': int(np.count_nonzero(rated <= NEEDS_IMPROVEMENT_RATING)),
+    }
+
+
+def cohort_analytics(employees: List[Any], frame: Optional[EmployeeFrame] = None) -> Dict[str, Any]:
+    """
+    Precomputed data for the Summary tab's cohort charts.
+
+    Ratings (RATING_NUM donut fields) are broken down by role and by title;
+    software proficiency (SOFTWARE_TOOLS donut fields) by role.
+
+    Args:
+        employees: Employee objects, EmployeeStore rows or employee data dictionaries
+        frame: Frame of the same employees, when the caller already has one
+
+    Returns:
+        {'ratings': rating fields, 'cohorts': {group field: {'ratings': {field: crosstab()},
+         'stats': {field: grouped_stats()}}}, 'software': {'group_field', 'groups', 'tools',
+         'mean': [[mean per tool] per group], 'count': [[...]]}}
+    """
+    frame = frame or EmployeeFrame(employees)
+    mappings = donut_chart_mappings()
+    rating_fields = [m.mapped_header for m in mappings if m.data_type_in_card == CardType.RATING_NUM]
+    tools = [m.mapped_header for m in mappings if m.group_under == CardGroup.SOFTWARE_TOOLS]
+    group_fields = header_mapper.get_role_fields()[:1] + header_mapper.get_title_fields()[:1]
+
+    cohorts = {}
+    for group_field in group_fields:
+        cohorts[group_field] = {
+            'ratings': {field: crosstab(frame, group_field, field, RATING_NUM_LABELS) for field in rating_fields},
+            'stats': {field: grouped_stats(frame, group_field, field) for field in rating_fields},
+        }
+
+    software = {'group_field': None, 'groups': [], 'tools': tools, 'mean': [], 'count': []}
+    if group_fields:
+        role_field = group_fields[0]
+        tool_stats = [grouped_stats(frame, role_field, tool) for tool in tools]
+        groups = frame.group_ids(role_field)[0]
+        software.update({
+            'group_field': role_field,
+            'groups': groups,
+            'mean': [[stats['mean'][g] for stats in tool_stats] for g in range(len(groups))],
+            'count': [[stats['count'][g] for stats in tool_stats] for g in range(len(groups))],
+        })
+    return {'ratings': rating_fields, 'cohorts': cohorts, 'software': software}
@@ -0,0 +1,273 @@
+"""
+Asset Sync
+
+Change-detecting directory sync shared by the image library, the website
+export and the external EmployeeData repository copy. Only new or changed
+files are transferred, on a thread pool, using reflinks or hardlinks where
+the filesystem supports them.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .config import Config
+
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/XFS and similar filesystems
+_FICLONE = 0x40049409
+LINK_MODES = ("auto", "copy", "reflink", "hardlink")
+
+
+@dataclass
+class SyncResult:
+    """Outcome of one directory sync."""
+    copied: List[str] = field(default_factory=list)
+    linked: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # file name -> error
+
+    @property
+    def transferred(self) -> List[str]:
+        """Files written to the target (copied or linked)."""
+        return self.copied + self.linked
+
+    def status_by_file(self) -> Dict[str, bool]:
+        """Map every file name to whether it is now present and up to date in the target."""
+        status = {name: True for name in self.transferred + self.unchanged}
+        status.update({name: False for name in self.failed})
+        return status
+
+    def summary(self) -> str:
+        return (f"{len(self.copied)} copied, {len(self.linked)} linked, "
+                f"{len(self.unchanged)} unchanged, {len(self.failed)} failed")
+
+
+def _hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _scan(directory: str, files: Optional[Iterable[str]] = None) -> Dict[str, os.stat_result]:
+    """Return file name -> stat for the regular files of a directory (optionally a subset)."""
+    if files is not None:
+        stats = {}
+        for name in files:
+            try:
+                stats[name] = os.stat(os.path.join(directory, name))
+            except OSError:
+                continue
+        return stats
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.stat() for entry in entries if entry.is_file()}
+    except OSError:
+        return {}
+
+
+def _reflink(source: str, target: str) -> bool:
+    """Clone source into target with copy-on-write if the filesystem supports it."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(source, 'rb') as src, open(target, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, target)
+        return True
+    except OSError:
+        try:
+            os.remove(target)
+        except OSError:
+            pass
+        return False
+
+
+def _transfer(source: str, target: str, link_mode: str, replace: bool = True) -> bool:
+    """
+    Write source to target.
+
+    Args:
+        replace: Target exists; write a temporary file and rename it over the
+            target so readers never see a partial file
+
+    Returns:
+        True if the file was linked, False if it was copied
+    """
+    # A partial new file is harmless: its size differs, so the next sync retries it
+    tmp_path = target + ".sync-tmp" if replace else target
+    linked = False
+    try:
+        if link_mode == "hardlink":
+            try:
+                os.link(source, tmp_path)
+                linked = True
+            except OSError:
+                pass
+        elif link_mode in ("auto", "reflink"):
+            linked = _reflink(source, tmp_path)
+        if not linked:
+            shutil.copy2(source, tmp_path)
+        if replace:
+            os.replace(tmp_path, target)
+    finally:
+        if replace and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return linked
+
+
+class AssetSync:
+    """Copies new or changed files from one directory to another."""
+
+    def __init__(self, use_hash: bool = None, link_mode: str = None, max_workers: int = None,
+                 manifest_dir: str = None):
+        """
+        Initialize the sync engine.
+
+        Args:
+            use_hash: Decide "changed" by content hash (kept in a persisted manifest)
+                instead of size + modification time
+            link_mode: "auto" (reflink, else copy), "copy", "reflink" or "hardlink"
+                (hardlink, else copy); the target shares storage with the source
+                when linked
+            max_workers: Thread pool size for transfers
+            manifest_dir: Directory of the hash manifests (defaults to Config)
+        """
+        self.use_hash = Config.ASSET_SYNC_USE_HASH if use_hash is None else use_hash
+        self.link_mode = link_mode or Config.ASSET_SYNC_LINK_MODE
+        if self.link_mode not in LINK_MODES:
+            raise ValueError(f"Unknown link mode '{self.link_mode}', expected one of {LINK_MODES}")
+        self.max_workers = max_workers or Config.ASSET_SYNC_WORKERS
+        self.manifest_dir = manifest_dir or Config.get_asset_sync_manifest_dir_path()
+        # "auto" drops to plain copies after the first failed reflink
+        self._transfer_mode = self.link_mode
+
+    def _manifest_path(self, source_dir: str, target_dir: str) -> str:
+        pair = f"{os.path.abspath(source_dir)}|{os.path.abspath(target_dir)}"
+        return os.path.join(self.manifest_dir, hashlib.sha1(pair.encode('utf-8')).hexdigest()[:16] + ".json")
+
+    def _load_manifest(self, path: str) -> Dict[str, Dict]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, path: str, manifest: Dict[str, Dict]) -> None:
+        if not Config.ensure_directory_exists(self.manifest_dir):
+            return
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not save asset sync manifest: {e}")
+
+    def sync(self, source_dir: str, target_dir: str, files: Optional[Iterable[str]] = None,
+             force: bool = False, filter_func: Optional[Callable[[str], bool]] = None) -> SyncResult:
+        """
+        Bring target_dir up to date with source_dir.
+
+        Args:
+            source_dir: Directory to copy from
+            target_dir: Directory to copy into (created if missing)
+            files: File names to sync (defaults to every file in source_dir)
+            force: Transfer every file even if it looks unchanged
+            filter_func: Optional predicate on file names (e.g. supported images only)
+
+        Returns:
+            SyncResult listing copied, linked, unchanged and failed files
+        """
+        result = SyncResult()
+        source_stats = _scan(source_dir, files)
+        if filter_func is not None:
+            source_stats = {name: st for name, st in source_stats.items() if filter_func(name)}
+        if not source_stats:
+            return result
+
+        if os.path.isdir(target_dir) and os.path.samefile(source_dir, target_dir):
+            result.unchanged = sorted(source_stats)
+            return result
+        os.makedirs(target_dir, exist_ok=True)
+        target_stats = _scan(target_dir, source_stats.keys())
+
+        manifest_path = self._manifest_path(source_dir, target_dir) if self.use_hash else None
+        old_manifest = self._load_manifest(manifest_path) if manifest_path else {}
+        manifest = {}
+        pending = []
+        for name in sorted(source_stats):
+            src, dst = source_stats[name], target_stats.get(name)
+            changed = force or dst is None or dst.st_size != src.st_size
+            if manifest_path:
+                entry = old_manifest.get(name)
+                if entry and entry['size'] == src.st_size and entry['mtime_ns'] == src.st_mtime_ns:
+                    digest = entry['sha256']
+                else:
+                    # Source stat moved (edit, checkout, cloud sync): rehash to see if content changed
+                    digest = _hash_file(os.path.join(source_dir, name))
+                    changed = changed or not entry or entry['sha256'] != digest
+                manifest[name] = {'size': src.st_size, 'mtime_ns': src.st_mtime_ns, 'sha256': digest}
+            elif not changed:
+                changed = dst.st_mtime_ns != src.st_mtime_ns
+            if changed:
+                pending.append((name, dst is not None))
+            else:
+                result.unchanged.append(name)
+
+        def transfer(item):
+            name, exists = item
+            try:
+                mode = self._transfer_mode
+                linked = _transfer(os.path.join(source_dir, name), os.path.join(target_dir, name),
+                                   mode, replace=exists)
+                if mode == "auto" and not linked:
+                    self._transfer_mode = "copy"
+                return name, linked, None
+            except Exception as e:
+                return name, False, str(e)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as pool:
+                for name, linked, error in pool.map(transfer, pending):
+                    if error:
+                        result.failed[name] = error
+                        manifest.pop(name, None)
+                    elif linked:
+                        result.linked.append(name)
+                    else:
+                        result.copied.append(name)
+
+        if manifest_path:
+            self._save_manifest(manifest_path, manifest)
+        return result
+
+
+def sync_directory(source_dir: str, target_dir: str, files: Optional[Iterable[str]] = None,
+                   force: bool = False, filter_func: Optional[Callable[[str], bool]] = None,
+                   **options) -> SyncResult:
+    """
+    Convenience function: sync source_dir into target_dir with the configured defaults.
+
+    Args:
+        source_dir: Directory to copy from
+        target_dir: Directory to copy into
+        files: File names to sync (defaults to every file in source_dir)
+        force: Transfer every file even if it looks unchanged
+        filter_func: Optional predicate on file names
+        **options: AssetSync options (use_hash, link_mode, max_workers, manifest_dir)
+
+    Returns:
+        SyncResult of the sync
+    """
+    result = AssetSync(**options).sync(source_dir, target_dir, files, force, filter_func)
+    for name, error in result.failed.items():
+        print(f"[ERROR] Error copying {name}: {error}")
+    return result
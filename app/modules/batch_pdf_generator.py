@@ -7,6 +7,9 @@ evaluator-employee pairs. Each PDF displays both evaluator and employee profile
 
 import os
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import List, Dict, Any, Callable, Optional, Tuple
 
 # Fix console encoding for Windows (safe)
@@ -19,13 +22,18 @@ except Exception:
     pass
 
 from .config import Config
-from .excel_parser import ExcelEmployeeParser
-from .image_manager import ImageManager
+from .employee import EmployeeManager
+from .excel_parser import ExcelEmployeeParser, cell_value
+from .image_manager import ImageManager, thumbnail_for
+from .pdf_book import PdfBook
+from .pdf_layout import LAYOUT_VERSION, TEAL, ReportLayout
+from .pdf_manifest import PdfInputs, PdfManifest
+from .pdf_resources import PdfResourceRegistry, circular_image_cache
 import pandas as pd
 
-# PIL imports for circular image processing
+# PIL is needed for circular image processing
 try:
-    from PIL import Image, ImageDraw
+    import PIL  # noqa: F401
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
@@ -146,13 +154,17 @@ def _find_name_field(data: Dict[str, Any], field_keywords: List[str]) -> Optiona
     return None
 
 
-def _get_image_path(name: str, image_manager: ImageManager, name_to_image: Dict[str, str]) -> Optional[str]:
-    """Get image path for a name, using image_manager or existing mappings."""
+def _get_image_path(name: str, image_manager: ImageManager, name_to_image: Dict[str, str],
+                    thumbnails: Dict[str, Dict[str, Any]] = None) -> Optional[str]:
+    """Get image path for a name, using image_manager or existing mappings.
+
+    Returns the PDF-sized thumbnail when one is available, else the original.
+    """
     # First check existing mappings
     if name in name_to_image:
         img_path = name_to_image[name]
         if img_path and os.path.exists(img_path):
-            return img_path
+            return thumbnail_for(img_path, Config.PDF_PROFILE_IMAGE_PX, index=thumbnails)
     
     # Try to find using image manager
     if name:
@@ -160,56 +172,422 @@ def _get_image_path(name: str, image_manager: ImageManager, name_to_image: Dict[
         if best_match:
             img_path = os.path.join(image_manager.target_dir, best_match)
             if os.path.exists(img_path):
-                return img_path
+                return thumbnail_for(img_path, Config.PDF_PROFILE_IMAGE_PX, index=thumbnails)
     
     return None
 
 
+def _load_review_rows(parser: ExcelEmployeeParser, stream: bool, log_func: Callable[[str], None]):
+    """Return (raw_row_values, employee_data) rows that have an employee name.
+
+    In stream mode the rows come straight from openpyxl's read-only iterator, so
+    rendering starts before the workbook has been read completely.
+    """
+    if stream:
+        log_func("Streaming Excel file...")
+        rows = parser.stream_rows()
+        if rows is None:
+            log_func("Failed to load Excel file")
+            return None
+        return ((values, emp_data) for values, emp_data in rows if parser.find_employee_name(emp_data))
+
+    log_func("Loading Excel file...")
+    if not parser.load_excel():
+        log_func("Failed to load Excel file")
+        return None
+
+    records = parser.extract_all_employee_data()
+    # Normalized like streamed rows, so both modes give the same PDF text and fingerprints
+    raw_rows = (tuple(cell_value(value) for value in row) for row in parser.df.itertuples(index=False, name=None))
+    review_rows = [(values, emp_data) for values, emp_data in zip(raw_rows, records)
+                   if parser.find_employee_name(emp_data)]
+    if not review_rows:
+        log_func("No employee data found in Excel file")
+        return None
+
+    log_func(f"Found {len(review_rows)} rows to process")
+    return review_rows
+
+
+
+@dataclass
+class _RenderContext:
+    """Export-wide state every row is rendered with (sent once to each worker process)."""
+    header_mappings: Dict[int, Any]
+    group_order: List[Any]
+    group_to_fields: Dict[Any, List[Any]]
+    columns: List[str]
+    rating_checked_path: str
+    rating_unchecked_path: str
+
+
+@dataclass
+class _RenderJob:
+    """One evaluator-employee review PDF to render."""
+    row_number: int  # 1-based position among the review rows
+    pdf_path: str
+    evaluator_name: str
+    employee_name: str
+    employee_img_path: Optional[str]
+    evaluator_img_path: Optional[str]
+    emp_data: Dict[str, Any]
+    row_values: Tuple
+    fingerprint: str = ""  # Inputs recorded in the export directory's PDF manifest
+
+
+# Render context of a pool worker process (set by _init_render_worker)
+_worker_context: Optional[_RenderContext] = None
+
+
+def _init_render_worker(context: _RenderContext) -> None:
+    global _worker_context
+    _worker_context = context
+
+
+def _render_chunk(jobs: List[_RenderJob], context: _RenderContext = None) -> List[Tuple[_RenderJob, Optional[str], List[str]]]:
+    """Render a chunk of review PDFs, each into a temporary file next to its target.
+
+    A failing row is reported and skipped without affecting the rest of the chunk.
+
+    Returns:
+        (job, temporary PDF path or None if rendering failed, log messages) per job, in order
+    """
+    context = context or _worker_context
+    results = []
+    for job in jobs:
+        messages = [f"Processing: {job.evaluator_name} -> {job.employee_name}"]
+        # Rows sharing a file name render to distinct temporary files; the caller renames in row order
+        part_path = f"{job.pdf_path}.{job.row_number}.part"
+        try:
+            _render_review_pdf(job, context, part_path)
+        except Exception as e:
+            import traceback
+            messages.append(f"Row {job.row_number}: Error - {str(e)}")
+            messages.append(traceback.format_exc())
+            try:
+                os.remove(part_path)
+            except OSError:
+                pass
+            part_path = None
+        results.append((job, part_path, messages))
+    return results
+
+
+def _render_review_pdf(job: _RenderJob, context: _RenderContext, part_path: str) -> None:
+    """Render one review into its own PDF file."""
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    c = canvas.Canvas(part_path, pagesize=letter)
+    _draw_review(c, PdfResourceRegistry(c), job, context)  # rating icons embedded once per PDF
+    c.save()
+
+
+def _draw_review(c, resources: PdfResourceRegistry, job: _RenderJob, context: _RenderContext) -> None:
+    """Draw one review onto a canvas: both profile images in the header, then every answered field.
+
+    Ends with showPage(); the caller saves the canvas.
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from .header_mapper import CardGroup
+
+    evaluator_name, employee_name = job.evaluator_name, job.employee_name
+    employee_img_path, evaluator_img_path = job.employee_img_path, job.evaluator_img_path
+    emp_data, row_values = job.emp_data, job.row_values
+    header_mappings = context.header_mappings
+    group_order, group_to_fields = context.group_order, context.group_to_fields
+    columns = context.columns
+    rating_checked_path = context.rating_checked_path
+    rating_unchecked_path = context.rating_unchecked_path
+
+    width, height = letter
+    
+    # Header setup - dual images side by side (employee left, evaluator right)
+    header_y = height - 0.75*inch
+    img_size = 0.9*inch
+    left_margin = 0.75*inch
+    spacing = 1.0*inch  # Space between images (increased significantly for clear separation)
+    name_gap = 0.2*inch  # Gap between image and name (increased further to prevent overlap)
+    circle_border_width = 2  # Border width for circular images
+    
+    # Helper function to draw circular image with visible border
+    def draw_circular_image(img_path, x, y, size):
+        """Draw an image with a circular mask and visible border."""
+        if PIL_AVAILABLE:
+            try:
+                # Masked, downscaled photo prepared once per process (and persisted across runs)
+                c.drawImage(circular_image_cache().get(img_path), x, y, size, size,
+                            preserveAspectRatio=True, mask='auto')
+                
+                # Draw visible circle border in teal (matching other elements)
+                c.setStrokeColorRGB(*TEAL)  # Teal border to match design
+                c.setLineWidth(circle_border_width)
+                # Draw circle outline (centered on image)
+                c.circle(x + size/2, y + size/2, size/2, stroke=1, fill=0)
+                
+                return
+            except Exception:
+                # Fallback to regular image if circular fails
+                pass
+        
+        # Fallback: draw regular image (square/rectangular) with border
+        try:
+            c.drawImage(img_path, x, y, size, size, preserveAspectRatio=True, mask='auto')
+            # Draw border around square image in teal
+            c.setStrokeColorRGB(*TEAL)  # Teal border to match design
+            c.setLineWidth(circle_border_width)
+            c.rect(x, y, size, size, stroke=1, fill=0)
+        except Exception:
+            pass
+    
+    # Draw employee image (left) - circular
+    employee_img_x = left_margin
+    employee_img_y = header_y - img_size
+    if employee_img_path and os.path.exists(employee_img_path):
+        draw_circular_image(employee_img_path, employee_img_x, employee_img_y, img_size)
+    
+    # Draw evaluator image (right) - circular
+    evaluator_img_x = left_margin + img_size + spacing if employee_img_path else left_margin
+    evaluator_img_y = header_y - img_size
+    if evaluator_img_path and os.path.exists(evaluator_img_path):
+        draw_circular_image(evaluator_img_path, evaluator_img_x, evaluator_img_y, img_size)
+    
+    # Draw role labels and names below images
+    label_y = header_y - img_size - name_gap
+    name_y = label_y - 14  # Names below labels
+    
+    # Employee label and name (left) - centered below image
+    c.setFont('Helvetica-Bold', 11)
+    c.setFillColorRGB(*TEAL)
+    employee_label = "Employee"
+    if employee_img_path:
+        label_width = c.stringWidth(employee_label, 'Helvetica-Bold', 11)
+        label_x = employee_img_x + (img_size - label_width) / 2
+        c.drawString(label_x, label_y, employee_label)
+    else:
+        c.drawString(left_margin, label_y, employee_label)
+    
+    # Employee name
+    c.setFont('Helvetica-Bold', 16)
+    c.setFillColorRGB(0, 0, 0)  # Black for name
+    if employee_img_path:
+        name_width = c.stringWidth(employee_name, 'Helvetica-Bold', 16)
+        name_x = employee_img_x + (img_size - name_width) / 2
+        c.drawString(name_x, name_y, employee_name)
+    else:
+        c.drawString(left_margin, name_y, employee_name)
+    
+    # Evaluator label and name (right) - centered below image
+    c.setFont('Helvetica-Bold', 11)
+    c.setFillColorRGB(*TEAL)
+    evaluator_label = "Evaluator"
+    if evaluator_img_path:
+        label_width = c.stringWidth(evaluator_label, 'Helvetica-Bold', 11)
+        label_x = evaluator_img_x + (img_size - label_width) / 2
+        c.drawString(label_x, label_y, evaluator_label)
+    else:
+        label_width = c.stringWidth(evaluator_label, 'Helvetica-Bold', 11)
+        label_x = width - left_margin - label_width
+        c.drawString(label_x, label_y, evaluator_label)
+    
+    # Evaluator name
+    c.setFont('Helvetica-Bold', 16)
+    c.setFillColorRGB(0, 0, 0)  # Black for name
+    if evaluator_img_path:
+        name_width = c.stringWidth(evaluator_name, 'Helvetica-Bold', 16)
+        name_x = evaluator_img_x + (img_size - name_width) / 2
+        c.drawString(name_x, name_y, evaluator_name)
+    else:
+        name_width = c.stringWidth(evaluator_name, 'Helvetica-Bold', 16)
+        name_x = width - left_margin - name_width
+        c.drawString(name_x, name_y, evaluator_name)
+    
+    # Date if available (positioned below names)
+    date_val = _find_name_field(emp_data, ['date', 'evaluation'])
+    if date_val:
+        c.setFont('Helvetica', 10)
+        c.setFillColorRGB(0, 0, 0)  # Black for date
+        date_y = name_y - 14  # Below names
+        date_str = _format_date_only(date_val)
+        # Center date below employee name if image exists
+        if employee_img_path:
+            date_width = c.stringWidth(date_str, 'Helvetica', 10)
+            date_x = employee_img_x + (img_size - date_width) / 2
+            c.drawString(date_x, date_y, date_str)
+        else:
+            c.drawString(left_margin, date_y, date_str)
+    
+    # Divider line (below date/names)
+    divider_y = date_y - 0.15*inch if date_val else name_y - 0.15*inch
+    c.setLineWidth(1)
+    c.setStrokeColorRGB(*TEAL)
+    c.line(left_margin, divider_y, width - left_margin, divider_y)
+    
+    # Body: measured and paginated by the shared layout, then drawn in one pass
+    layout = ReportLayout(letter, rating_icons=(rating_checked_path, rating_unchecked_path))
+    
+    # Render evaluation data - include ALL fields from Excel
+    # First, render fields from header mappings (organized by groups)
+    if header_mappings:
+        for grp in group_order:
+            values = []
+            for m in group_to_fields.get(grp, []):
+                val = emp_data.get(m.mapped_header)
+                if val and str(val).strip():
+                    values.append((m.mapped_header, val, m))
+            if not values:
+                continue
+            layout.heading(grp.value.replace('_', ' ').title())
+            # Exclude certain fields from Basic Info section
+            for label, val, m in values:
+                # Skip excluded fields in Basic Info: id, Employee Name, Employee Name Alt
+                if grp == CardGroup.BASIC_INFO:
+                    label_str = str(label).strip()
+                    label_lower = label_str.lower()
+                    # Exclude: id, Employee Name, Employee Name Alt
+                    if (label_lower == "id" or 
+                        label_str == "Employee Name" or 
+                        label_str == "Employee Name Alt"):
+                        continue
+                # Use clean display labels for ratings and text
+                display_label = _get_display_label(label)
+                if getattr(m, 'data_type_in_card', None) and m.data_type_in_card.value.lower() == 'rating_num':
+                    try:
+                        score = int(str(val).strip()[:1]) if str(val).strip() else 0
+                    except Exception:
+                        score = 0
+                    layout.rating(display_label, score)
+                else:
+                    layout.value_box(display_label, val)
+            layout.space(10)
+    
+    # Also render any remaining fields that might not be in header mappings
+    # This ensures we capture everything from the Excel file
+    rendered_fields = set()
+    if header_mappings:
+        for m in header_mappings.values():
+            rendered_fields.add(m.mapped_header)
+    
+    # Check for unmapped fields in parsed data
+    unmapped_fields = []
+    for k, v in emp_data.items():
+        # Skip already rendered fields and metadata
+        if k in rendered_fields:
+            continue
+        if not v or str(v).strip() == '':
+            continue
+        # Skip internal/metadata fields
+        if k.lower() in ['id', 'start_time', 'completion_time', 'last_modified']:
+            continue
+        # Skip name fields (already in header)
+        if k.lower() in ['employee name', 'employee name alt', 'evaluator name']:
+            continue
+        unmapped_fields.append((k, v))
+    
+    # Also check raw Excel data for any columns not in parsed data
+    if row_values:
+        # Get all column names
+        for col_idx, col_name in enumerate(columns):
+            # Skip columns we've already handled
+            if col_idx in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]:  # Metadata and name columns
+                continue
+            
+            # Check if this column is represented in rendered fields
+            col_normalized = str(col_name).strip().replace('\xa0', ' ').replace('\n', ' ').lower()
+            found_in_rendered = False
+            for rendered_field in rendered_fields:
+                rendered_normalized = str(rendered_field).strip().replace('\xa0', ' ').replace('\n', ' ').lower()
+                if col_normalized in rendered_normalized or rendered_normalized in col_normalized:
+                    found_in_rendered = True
+                    break
+            
+            if not found_in_rendered:
+                # Check if value exists
+                try:
+                    raw_val = row_values[col_idx]
+                    if pd.notna(raw_val) and str(raw_val).strip():
+                        # Check if not already in unmapped_fields
+                        col_clean = str(col_name).strip().replace('\xa0', ' ')
+                        already_added = any(col_clean.lower() == str(uf[0]).lower() for uf in unmapped_fields)
+                        if not already_added:
+                            unmapped_fields.append((col_clean, str(raw_val).strip()))
+                except IndexError:
+                    pass
+    
+    if unmapped_fields:
+        layout.heading("Additional Information")
+        for label, val in unmapped_fields:
+            layout.ensure_lines(4)
+            # Use clean display label
+            layout.value_box(_get_display_label(label), val)
+        layout.space(10)
+    
+    layout.draw(c, divider_y - 0.2*inch, resources)
+    c.showPage()
+
+
 def export_batch_pdfs_with_dual_images(
     excel_path: str,
     export_dir: str,
     log_func: Callable[[str], None],
+    stream: bool = False,
+    workers: int = None,
+    book: bool = False,
+    split_pages: Optional[int] = None,
+    force: bool = False,
 ) -> str:
     """Export PDFs for evaluator-employee pairs with dual images in header.
     
+    Rows are rendered in chunks on a process pool. Progress messages and output
+    files come out in row order regardless of which worker finishes first; a
+    row that fails does not affect the others.
+    
+    PDFs whose inputs (answers, header mappings, photos, layout version) are
+    unchanged since the last export into the same directory are reused rather
+    than rendered again, and PDFs no row produces anymore are removed; see
+    pdf_manifest. Rows of the same evaluator-employee pair get numbered file
+    names (..._Review_2.pdf) in row order instead of overwriting each other.
+    
+    In book mode every review goes into one PDF (Config.BATCH_PDF_BOOK_FILE_NAMING),
+    rendered in this process, with an outline entry per review and a table of
+    contents; evaluator photos and icons are embedded once per file.
+    
     Args:
         excel_path: Path to Excel file with evaluator-employee data
         export_dir: Directory to save PDFs
         log_func: Function to log progress messages
+        stream: Read the workbook with openpyxl's read-only row iterator and
+            render each PDF as soon as its row is read
+        workers: Render processes (defaults to Config.BATCH_PDF_WORKERS, else
+            the CPU count); 1 renders every PDF in this process
+        book: Write all reviews into one consolidated PDF instead of one file per row
+        split_pages: In book mode, start a new part file every ~N pages
+            (defaults to Config.PDF_BOOK_SPLIT_PAGES)
+        force: Render every PDF even if the manifest says it is up to date
         
     Returns:
         Path to export directory if successful, empty string otherwise
     """
     try:
-        from reportlab.lib.pagesizes import letter
-        from reportlab.pdfgen import canvas
-        from reportlab.lib.units import inch
-        from reportlab.lib.utils import simpleSplit
-        from .header_mapper import CardGroup
+        from reportlab.pdfgen import canvas  # noqa: F401
     except Exception as e:
         log_func(f"ReportLab not available: {e}")
         return ""
 
-    # Parse Excel file
-    log_func("Loading Excel file...")
+    # Parse Excel file (headers are mapped before any row is rendered)
     parser = ExcelEmployeeParser(excel_path)
-    if not parser.load_excel():
-        log_func("Failed to load Excel file")
-        return ""
-    
-    employees_data = parser.parse_all_employees_as_dicts()
-    if not employees_data:
-        log_func("No employee data found in Excel file")
+    review_rows = _load_review_rows(parser, stream, log_func)
+    if review_rows is None:
         return ""
     
-    log_func(f"Found {len(employees_data)} rows to process")
-    
     # Setup image manager
     image_source_dir = Config.get_image_source_path()
     image_target_dir = Config.get_image_target_path()
     image_manager = ImageManager(image_source_dir, image_target_dir)
     image_manager.setup_directories()
     image_manager.scan_source_images()
+    thumbnails = image_manager.generate_thumbnails()
     
     # Load existing image mappings
     name_to_image = {}
@@ -223,21 +601,11 @@ def export_batch_pdfs_with_dual_images(
     except Exception:
         pass
     
-    # Rating icon asset paths
-    rating_checked_path = os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_checked.png')
-    rating_unchecked_path = os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_unchecked.png')
-    
-    def _rgb(hex_color: str):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16)/255.0 for i in (0, 2, 4))
-    
-    TEAL = _rgb('2B7A78')
-    BOX_BG = _rgb('F7FBFA')
-    
     # Precompute grouping from header_mappings
     group_to_fields = {}
     group_order = []
     header_mappings = parser.header_mappings
+    employee_manager = EmployeeManager(header_mappings)
     if header_mappings:
         for _idx, m in header_mappings.items():
             grp = m.group_under
@@ -248,420 +616,238 @@ def export_batch_pdfs_with_dual_images(
         for grp in group_to_fields:
             group_to_fields[grp] = sorted(group_to_fields[grp], key=lambda m: m.display_order)
     
+    # Raw row values give access to the "Evaluator Name" column which may not be in mapped data
+    context = _RenderContext(
+        header_mappings=header_mappings,
+        group_order=group_order,
+        group_to_fields=group_to_fields,
+        columns=parser.columns,
+        rating_checked_path=os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_checked.png'),
+        rating_unchecked_path=os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_unchecked.png'),
+    )
+    
     os.makedirs(export_dir, exist_ok=True)
     
-    # Process each row (evaluator-employee pair)
-    # Access raw Excel data to get "Evaluator Name" column which may not be in mapped data
-    df = parser.df
+    manifest = None
+    if not book:
+        manifest = PdfManifest(export_dir, force=force)
+        inputs = PdfInputs(f"batch-{LAYOUT_VERSION}", header_mappings, extra=[str(col) for col in parser.columns])
+    
+    pdf_book = None
+    if book:
+        # One canvas: rows are drawn here in order, so the pool is not used
+        workers = 1
+        total_entries = len(review_rows) if isinstance(review_rows, list) else None
+        if total_entries is None:
+            log_func("Streaming: the book gets an outline but no contents pages")
+        pdf_book = PdfBook(export_dir, Config.BATCH_PDF_BOOK_FILE_NAMING, Config.PDF_BOOK_TITLE,
+                           total_entries=total_entries, split_pages=split_pages or Config.PDF_BOOK_SPLIT_PAGES)
+    
+    workers = workers or Config.BATCH_PDF_WORKERS or os.cpu_count() or 1
+    chunk_size = Config.BATCH_PDF_CHUNK_SIZE if workers > 1 else 1
+    if workers > 1 and isinstance(review_rows, list):
+        # Known row count: spread it evenly and never start more workers than chunks
+        chunk_size = max(1, min(chunk_size, -(-len(review_rows) // workers)))
+        workers = min(workers, max(1, -(-len(review_rows) // chunk_size)))
+    if workers > 1:
+        log_func(f"Rendering with {workers} worker processes")
+    
     processed_count = 0
+    pdf_name_counts: Dict[str, int] = {}  # base file name -> rows that used it so far
+    pending = deque()  # (future, chunk items, jobs) in row order
+    pool = None
     
-    for idx, emp_data in enumerate(employees_data):
-        try:
-            # Get evaluator and employee names from raw Excel data
-            # Column E (index 4): "Name" = Evaluator Name
-            # Column 7: "Employee Name\xa0" (mapped as "Employee Name Alt") = Employee Name
-            evaluator_name = None
-            employee_name = None
-            
-            # Get evaluator name from column E (index 4) - "Name" field
-            if df is not None and idx < len(df):
+    def finish(items, results):
+        """Log a chunk's messages and move its PDFs into place, in row order."""
+        nonlocal processed_count
+        results = iter(results)
+        for item in items:
+            if isinstance(item, str):
+                log_func(item)
+                continue
+            job, part_path, messages = next(results)
+            for message in messages:
+                log_func(message)
+            if part_path is not None:
                 try:
-                    # Column E (index 4) is "Name" which refers to the Evaluator
-                    evaluator_name_raw = df.iloc[idx, 4]
-                    if pd.notna(evaluator_name_raw):
-                        evaluator_name = str(evaluator_name_raw).strip()
-                except (IndexError, KeyError):
-                    pass
-            
-            # Fallback: try column 6 "Evaluator Name" if column E didn't work
-            if not evaluator_name and df is not None and idx < len(df):
+                    os.replace(part_path, job.pdf_path)
+                except OSError as e:
+                    log_func(f"Row {job.row_number}: Error - {str(e)}")
+                    try:
+                        os.remove(part_path)
+                    except OSError:
+                        pass
+                    part_path = None
+            pdf_filename = os.path.basename(job.pdf_path)
+            if part_path is None:
+                manifest.failed(pdf_filename)
+                continue
+            manifest.built(pdf_filename, job.fingerprint)
+            log_func(f"Saved: {pdf_filename}")
+            processed_count += 1
+    
+    def drain(max_in_flight: int):
+        """Finish completed chunks from the front; wait while more than max_in_flight are queued."""
+        while pending and (len(pending) > max_in_flight or pending[0][0].done()):
+            future, items, jobs = pending.popleft()
+            try:
+                results = future.result()
+            except Exception as e:
+                # A crashed worker breaks the pool; render the affected rows here instead
+                log_func(f"Render worker failed ({e}); rendering {len(jobs)} rows in this process")
+                results = _render_chunk(jobs, context)
+            finish(items, results)
+    
+    def submit(items, in_process: bool = False):
+        nonlocal pool
+        jobs = [item for item in items if isinstance(item, _RenderJob)]
+        if workers > 1 and jobs and not in_process:
+            if pool is None:
+                pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                           initargs=(context,))
+            try:
+                future = pool.submit(_render_chunk, jobs)
+            except Exception as e:
+                future = Future()
+                future.set_exception(e)
+        else:
+            future = Future()
+            future.set_result(_render_chunk(jobs, context))
+        pending.append((future, items, jobs))
+        drain(2 * workers)
+    
+    def add_to_book(items):
+        """Draw prepared rows into the book, in row order."""
+        nonlocal processed_count
+        for item in items:
+            if isinstance(item, str):
+                log_func(item)
+                continue
+            log_func(f"Processing: {item.evaluator_name} -> {item.employee_name}")
+            c = pdf_book.begin_entry(f"{item.employee_name} - reviewed by {item.evaluator_name}")
+            try:
+                _draw_review(c, pdf_book.resources, item, context)
+                processed_count += 1
+            except Exception as e:
+                import traceback
+                c.showPage()
+                log_func(f"Row {item.row_number}: Error - {str(e)} (review left incomplete in the book)")
+                log_func(traceback.format_exc())
+    
+    # Process each row (evaluator-employee pair); skip notices travel with their chunk to keep log order
+    chunk = []
+    chunk_jobs = 0
+    try:
+        for idx, (row_values, emp_data) in enumerate(review_rows):
+            try:
+                # Get evaluator and employee names from raw Excel data
+                # Column E (index 4): "Name" = Evaluator Name
+                # Column 7: "Employee Name\xa0" (mapped as "Employee Name Alt") = Employee Name
+                evaluator_name = None
+                employee_name = None
+                
+                # Get evaluator name from column E (index 4) - "Name" field
                 try:
-                    evaluator_name_raw = df.iloc[idx, 6]
+                    # Column E (index 4) is "Name" which refers to the Evaluator
+                    evaluator_name_raw = row_values[4]
                     if pd.notna(evaluator_name_raw):
                         evaluator_name = str(evaluator_name_raw).strip()
-                except (IndexError, KeyError):
+                except IndexError:
                     pass
-            
-            # Get employee name from mapped data (column 7 -> "Employee Name Alt")
-            employee_name = emp_data.get('Employee Name Alt') or emp_data.get('Employee Name')
-            
-            # Additional fallback: try to find in mapped data if raw access didn't work
-            if not evaluator_name:
-                evaluator_name = _find_name_field(emp_data, ['evaluator name', 'evaluator_name', 'name'])
-            
-            if not employee_name:
-                employee_name = _find_name_field(emp_data, ['employee name', 'employee_name'])
-            
-            if not evaluator_name:
-                log_func(f"Row {idx + 1}: Skipping - no evaluator name found")
-                continue
-            if not employee_name:
-                log_func(f"Row {idx + 1}: Skipping - no employee name found")
-                continue
-            
-            log_func(f"Processing: {evaluator_name} -> {employee_name}")
-            
-            # Get image paths
-            employee_img_path = _get_image_path(employee_name, image_manager, name_to_image)
-            evaluator_img_path = _get_image_path(evaluator_name, image_manager, name_to_image)
-            
-            # Create PDF filename
-            safe_evaluator = _safe_filename(evaluator_name)
-            safe_employee = _safe_filename(employee_name)
-            pdf_filename = f"{safe_evaluator}_{safe_employee}_Review.pdf"
-            pdf_path = os.path.join(export_dir, pdf_filename)
-            
-            # Create PDF
-            c = canvas.Canvas(pdf_path, pagesize=letter)
-            width, height = letter
-            
-            # Header setup - dual images side by side (employee left, evaluator right)
-            header_y = height - 0.75*inch
-            img_size = 0.9*inch
-            left_margin = 0.75*inch
-            spacing = 1.0*inch  # Space between images (increased significantly for clear separation)
-            name_gap = 0.2*inch  # Gap between image and name (increased further to prevent overlap)
-            circle_border_width = 2  # Border width for circular images
-            
-            # Helper function to draw circular image with visible border
-            def draw_circular_image(img_path, x, y, size):
-                """Draw an image with a circular mask and visible border."""
-                if PIL_AVAILABLE:
+                
+                # Fallback: try column 6 "Evaluator Name" if column E didn't work
+                if not evaluator_name:
                     try:
-                        from reportlab.lib.utils import ImageReader
-                        import io
-                        
-                        # Load and process image
-                        pil_img = Image.open(img_path)
-                        # Convert to RGBA if needed
-                        if pil_img.mode != 'RGBA':
-                            pil_img = pil_img.convert('RGBA')
-                        
-                        # Create circular mask
-                        mask = Image.new('L', pil_img.size, 0)
-                        draw = ImageDraw.Draw(mask)
-                        # Draw white circle
-                        draw.ellipse([0, 0, pil_img.size[0], pil_img.size[1]], fill=255)
-                        
-                        # Apply mask
-                        pil_img.putalpha(mask)
-                        
-                        # Save to bytes
-                        img_bytes = io.BytesIO()
-                        pil_img.save(img_bytes, format='PNG')
-                        img_bytes.seek(0)
-                        
-                        # Draw circular image
-                        c.drawImage(ImageReader(img_bytes), x, y, size, size, preserveAspectRatio=True, mask='auto')
-                        
-                        # Draw visible circle border in teal (matching other elements)
-                        c.setStrokeColorRGB(*TEAL)  # Teal border to match design
-                        c.setLineWidth(circle_border_width)
-                        # Draw circle outline (centered on image)
-                        c.circle(x + size/2, y + size/2, size/2, stroke=1, fill=0)
-                        
-                        return
-                    except Exception:
-                        # Fallback to regular image if circular fails
+                        evaluator_name_raw = row_values[6]
+                        if pd.notna(evaluator_name_raw):
+                            evaluator_name = str(evaluator_name_raw).strip()
+                    except IndexError:
                         pass
                 
-                # Fallback: draw regular image (square/rectangular) with border
-                try:
-                    c.drawImage(img_path, x, y, size, size, preserveAspectRatio=True, mask='auto')
-                    # Draw border around square image in teal
-                    c.setStrokeColorRGB(*TEAL)  # Teal border to match design
-                    c.setLineWidth(circle_border_width)
-                    c.rect(x, y, size, size, stroke=1, fill=0)
-                except Exception:
-                    pass
-            
-            # Draw employee image (left) - circular
-            employee_img_x = left_margin
-            employee_img_y = header_y - img_size
-            if employee_img_path and os.path.exists(employee_img_path):
-                draw_circular_image(employee_img_path, employee_img_x, employee_img_y, img_size)
-            
-            # Draw evaluator image (right) - circular
-            evaluator_img_x = left_margin + img_size + spacing if employee_img_path else left_margin
-            evaluator_img_y = header_y - img_size
-            if evaluator_img_path and os.path.exists(evaluator_img_path):
-                draw_circular_image(evaluator_img_path, evaluator_img_x, evaluator_img_y, img_size)
-            
-            # Draw role labels and names below images
-            label_y = header_y - img_size - name_gap
-            name_y = label_y - 14  # Names below labels
-            
-            # Employee label and name (left) - centered below image
-            c.setFont('Helvetica-Bold', 11)
-            c.setFillColorRGB(*TEAL)
-            employee_label = "Employee"
-            if employee_img_path:
-                label_width = c.stringWidth(employee_label, 'Helvetica-Bold', 11)
-                label_x = employee_img_x + (img_size - label_width) / 2
-                c.drawString(label_x, label_y, employee_label)
-            else:
-                c.drawString(left_margin, label_y, employee_label)
-            
-            # Employee name
-            c.setFont('Helvetica-Bold', 16)
-            c.setFillColorRGB(0, 0, 0)  # Black for name
-            if employee_img_path:
-                name_width = c.stringWidth(employee_name, 'Helvetica-Bold', 16)
-                name_x = employee_img_x + (img_size - name_width) / 2
-                c.drawString(name_x, name_y, employee_name)
-            else:
-                c.drawString(left_margin, name_y, employee_name)
-            
-            # Evaluator label and name (right) - centered below image
-            c.setFont('Helvetica-Bold', 11)
-            c.setFillColorRGB(*TEAL)
-            evaluator_label = "Evaluator"
-            if evaluator_img_path:
-                label_width = c.stringWidth(evaluator_label, 'Helvetica-Bold', 11)
-                label_x = evaluator_img_x + (img_size - label_width) / 2
-                c.drawString(label_x, label_y, evaluator_label)
-            else:
-                label_width = c.stringWidth(evaluator_label, 'Helvetica-Bold', 11)
-                label_x = width - left_margin - label_width
-                c.drawString(label_x, label_y, evaluator_label)
-            
-            # Evaluator name
-            c.setFont('Helvetica-Bold', 16)
-            c.setFillColorRGB(0, 0, 0)  # Black for name
-            if evaluator_img_path:
-                name_width = c.stringWidth(evaluator_name, 'Helvetica-Bold', 16)
-                name_x = evaluator_img_x + (img_size - name_width) / 2
-                c.drawString(name_x, name_y, evaluator_name)
-            else:
-                name_width = c.stringWidth(evaluator_name, 'Helvetica-Bold', 16)
-                name_x = width - left_margin - name_width
-                c.drawString(name_x, name_y, evaluator_name)
-            
-            # Date if available (positioned below names)
-            date_val = _find_name_field(emp_data, ['date', 'evaluation'])
-            if date_val:
-                c.setFont('Helvetica', 10)
-                c.setFillColorRGB(0, 0, 0)  # Black for date
-                date_y = name_y - 14  # Below names
-                date_str = _format_date_only(date_val)
-                # Center date below employee name if image exists
-                if employee_img_path:
-                    date_width = c.stringWidth(date_str, 'Helvetica', 10)
-                    date_x = employee_img_x + (img_size - date_width) / 2
-                    c.drawString(date_x, date_y, date_str)
-                else:
-                    c.drawString(left_margin, date_y, date_str)
-            
-            # Divider line (below date/names)
-            divider_y = date_y - 0.15*inch if date_val else name_y - 0.15*inch
-            c.setLineWidth(1)
-            c.setStrokeColorRGB(*TEAL)
-            c.line(left_margin, divider_y, width - left_margin, divider_y)
-            
-            # Body content
-            body_font = 'Helvetica'
-            label_font = 'Helvetica-Bold'
-            body_size = 10
-            label_size = 11
-            line_leading = 12
-            x = 0.75*inch
-            y = divider_y - 0.2*inch
-            max_width = width - 1.5*inch
-            
-            def draw_text(text: str, font: str, size: int, extra_gap: int = 0):
-                """Draw wrapped text and move cursor up with leading & gap."""
-                nonlocal y
-                lines = simpleSplit(str(text), font, size, max_width)
-                for ln in lines:
-                    c.setFont(font, size)
-                    c.drawString(x, y, ln)
-                    y -= line_leading
-                if extra_gap:
-                    y -= extra_gap
-            
-            def ensure_space_lines(lines_needed: int = 4):
-                """Guard: page break by approximate line count."""
-                nonlocal y
-                if y - lines_needed * line_leading < 0.75*inch:
-                    c.showPage()
-                    y = height - 0.75*inch
-            
-            def ensure_space_px(pixels_needed: float):
-                """Guard: page break by pixel height need."""
-                nonlocal y
-                if y - pixels_needed < 0.75*inch:
-                    c.showPage()
-                    y = height - 0.75*inch
-            
-            def draw_value_box(label: str, value: str):
-                """Teal label + rounded rectangle for the value body."""
-                nonlocal y
-                c.setFillColorRGB(*TEAL)
-                c.setFont(label_font, 10)
-                c.drawString(x, y, label)
-                y -= 12
-                c.setFillColorRGB(*BOX_BG)
-                c.setStrokeColorRGB(*TEAL)
-                text_lines = simpleSplit(str(value), body_font, body_size, max_width - 12)
-                box_h = len(text_lines) * line_leading + 12
-                c.roundRect(x, y - box_h + 6, max_width, box_h, 6, stroke=1, fill=1)
-                c.setFillColorRGB(0, 0, 0)
-                c.setFont(body_font, body_size)
-                ty = y - 6
-                for ln in text_lines:
-                    c.drawString(x + 6, ty, ln)
-                    ty -= line_leading
-                y = y - box_h - 6
-            
-            # Render evaluation data - include ALL fields from Excel
-            # First, render fields from header mappings (organized by groups)
-            if header_mappings:
-                for grp in group_order:
-                    values = []
-                    for m in group_to_fields.get(grp, []):
-                        val = emp_data.get(m.mapped_header)
-                        if val and str(val).strip():
-                            values.append((m.mapped_header, val, m))
-                    if not values:
-                        continue
-                    ensure_space_lines(6)
-                    group_title = grp.value.replace('_', ' ').title()
-                    c.setFillColorRGB(*TEAL)
-                    c.setFont(label_font, 13)
-                    c.drawString(x, y, group_title)
-                    y -= 4
-                    c.setLineWidth(0.8)
-                    c.setStrokeColorRGB(*TEAL)
-                    c.line(x, y, x + max_width, y)
-                    y -= 8
-                    # Exclude certain fields from Basic Info section
-                    for label, val, m in values:
-                        # Skip excluded fields in Basic Info: id, Employee Name, Employee Name Alt
-                        if grp == CardGroup.BASIC_INFO:
-                            label_str = str(label).strip()
-                            label_lower = label_str.lower()
-                            # Exclude: id, Employee Name, Employee Name Alt
-                            if (label_lower == "id" or 
-                                label_str == "Employee Name" or 
-                                label_str == "Employee Name Alt"):
-                                continue
-                        mapping = m
-                        base_gap = 18
-                        if getattr(mapping, 'data_type_in_card', None) and mapping.data_type_in_card.value.lower() == 'rating_num':
-                            icon_size = 0.22 * inch
-                            ensure_space_px(icon_size + base_gap + 8)
-                            c.setFillColorRGB(*TEAL)
-                            # Use clean display label for ratings too
-                            display_label = _get_display_label(label)
-                            draw_text(display_label, label_font, label_size)
-                            try:
-                                score = int(str(val).strip()[:1]) if str(val).strip() else 0
-                            except Exception:
-                                score = 0
-                            icon_y = y
-                            icon_x = x
-                            for i in range(5):
-                                icon_path = rating_checked_path if i < score else rating_unchecked_path
-                                try:
-                                    c.drawImage(icon_path, icon_x, icon_y - icon_size + 8, icon_size, icon_size, mask='auto')
-                                except Exception:
-                                    pass
-                                icon_x += icon_size + 2
-                            y -= (icon_size + 6)
-                        else:
-                            text_lines = simpleSplit(str(val), body_font, body_size, max_width - 12)
-                            box_h = len(text_lines) * line_leading + 12
-                            ensure_space_px(box_h + base_gap)
-                            # Use clean display label
-                            display_label = _get_display_label(label)
-                            draw_value_box(display_label, val)
-                    y -= 10
-            
-            # Also render any remaining fields that might not be in header mappings
-            # This ensures we capture everything from the Excel file
-            rendered_fields = set()
-            if header_mappings:
-                for m in header_mappings.values():
-                    rendered_fields.add(m.mapped_header)
-            
-            # Check for unmapped fields in parsed data
-            unmapped_fields = []
-            for k, v in emp_data.items():
-                # Skip already rendered fields and metadata
-                if k in rendered_fields:
-                    continue
-                if not v or str(v).strip() == '':
-                    continue
-                # Skip internal/metadata fields
-                if k.lower() in ['id', 'start_time', 'completion_time', 'last_modified']:
+                # Get employee name from mapped data (column 7 -> "Employee Name Alt")
+                employee_name = emp_data.get('Employee Name Alt') or emp_data.get('Employee Name')
+                
+                # Additional fallback: try to find in mapped data if raw access didn't work
+                if not evaluator_name:
+                    evaluator_name = _find_name_field(emp_data, ['evaluator name', 'evaluator_name', 'name'])
+                
+                if not employee_name:
+                    employee_name = employee_manager.get_employee_name(emp_data)
+                
+                if not evaluator_name:
+                    chunk.append(f"Row {idx + 1}: Skipping - no evaluator name found")
                     continue
-                # Skip name fields (already in header)
-                if k.lower() in ['employee name', 'employee name alt', 'evaluator name']:
+                if not employee_name:
+                    chunk.append(f"Row {idx + 1}: Skipping - no employee name found")
                     continue
-                unmapped_fields.append((k, v))
-            
-            # Also check raw Excel data for any columns not in parsed data
-            if df is not None and idx < len(df):
-                row_data = df.iloc[idx]
-                # Get all column names
-                for col_idx, col_name in enumerate(df.columns):
-                    # Skip columns we've already handled
-                    if col_idx in [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]:  # Metadata and name columns
+                
+                # Get image paths
+                employee_img_path = _get_image_path(employee_name, image_manager, name_to_image, thumbnails)
+                evaluator_img_path = _get_image_path(evaluator_name, image_manager, name_to_image, thumbnails)
+                
+                # Create PDF filename; a repeated pair is numbered so every row keeps its own file
+                safe_evaluator = _safe_filename(evaluator_name)
+                safe_employee = _safe_filename(employee_name)
+                base_name = f"{safe_evaluator}_{safe_employee}_Review"
+                pdf_name_counts[base_name] = pdf_name_counts.get(base_name, 0) + 1
+                if pdf_name_counts[base_name] > 1:
+                    pdf_filename = f"{base_name}_{pdf_name_counts[base_name]}.pdf"
+                else:
+                    pdf_filename = f"{base_name}.pdf"
+                
+                fingerprint = ""
+                if manifest is not None:
+                    fingerprint = inputs.fingerprint(
+                        emp_data, (employee_img_path, evaluator_img_path),
+                        extra=[evaluator_name, employee_name, [str(v) for v in row_values]])
+                    if manifest.is_current(pdf_filename, fingerprint):
                         continue
-                    
-                    # Check if this column is represented in rendered fields
-                    col_normalized = str(col_name).strip().replace('\xa0', ' ').replace('\n', ' ').lower()
-                    found_in_rendered = False
-                    for rendered_field in rendered_fields:
-                        rendered_normalized = str(rendered_field).strip().replace('\xa0', ' ').replace('\n', ' ').lower()
-                        if col_normalized in rendered_normalized or rendered_normalized in col_normalized:
-                            found_in_rendered = True
-                            break
-                    
-                    if not found_in_rendered:
-                        # Check if value exists
-                        try:
-                            raw_val = row_data.iloc[col_idx] if hasattr(row_data, 'iloc') else row_data[col_idx]
-                            if pd.notna(raw_val) and str(raw_val).strip():
-                                # Check if not already in unmapped_fields
-                                col_clean = str(col_name).strip().replace('\xa0', ' ')
-                                already_added = any(col_clean.lower() == str(uf[0]).lower() for uf in unmapped_fields)
-                                if not already_added:
-                                    unmapped_fields.append((col_clean, str(raw_val).strip()))
-                        except (IndexError, KeyError):
-                            pass
-            
-            if unmapped_fields:
-                ensure_space_lines(6)
-                c.setFillColorRGB(*TEAL)
-                c.setFont(label_font, 13)
-                c.drawString(x, y, "Additional Information")
-                y -= 4
-                c.setLineWidth(0.8)
-                c.setStrokeColorRGB(*TEAL)
-                c.line(x, y, x + max_width, y)
-                y -= 8
-                for label, val in unmapped_fields:
-                    ensure_space_lines(4)
-                    # Use clean display label
-                    label_clean = _get_display_label(label)
-                    text_lines = simpleSplit(str(val), body_font, body_size, max_width - 12)
-                    box_h = len(text_lines) * line_leading + 12
-                    ensure_space_px(box_h + 18)
-                    draw_value_box(label_clean, val)
-                y -= 10
-            
-            c.showPage()
-            c.save()
-            log_func(f"Saved: {pdf_filename}")
-            processed_count += 1
+                
+                chunk.append(_RenderJob(
+                    row_number=idx + 1,
+                    pdf_path=os.path.join(export_dir, pdf_filename),
+                    evaluator_name=evaluator_name,
+                    employee_name=employee_name,
+                    employee_img_path=employee_img_path,
+                    evaluator_img_path=evaluator_img_path,
+                    emp_data=emp_data,
+                    row_values=tuple(row_values),
+                    fingerprint=fingerprint,
+                ))
+                chunk_jobs += 1
+            except Exception as e:
+                import traceback
+                chunk.append(f"Row {idx + 1}: Error - {str(e)}")
+                chunk.append(traceback.format_exc())
+                continue
             
-        except Exception as e:
-            log_func(f"Row {idx + 1}: Error - {str(e)}")
-            import traceback
-            log_func(traceback.format_exc())
-            continue
+            if pdf_book is not None:
+                add_to_book(chunk)
+                chunk, chunk_jobs = [], 0
+            elif chunk_jobs >= chunk_size:
+                submit(chunk)
+                chunk, chunk_jobs = [], 0
+        
+        if pdf_book is not None:
+            add_to_book(chunk)
+            for book_path in pdf_book.close():
+                log_func(f"Saved: {os.path.basename(book_path)}")
+        elif chunk:
+            # A lone partial chunk is not worth starting a pool for
+            submit(chunk, in_process=pool is None)
+        drain(0)
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
-    log_func(f"Completed: {processed_count} PDFs generated in {export_dir}")
-    return export_dir
+    if manifest is not None:
+        removed = manifest.save()
+        log_func(f"PDFs: {manifest.summary()}")
+        if removed:
+            log_func(f"Removed {removed} outdated PDFs")
 
+    if pdf_book is not None:
+        log_func(f"Completed: {processed_count} reviews in {len(pdf_book.paths)} PDF(s) in {export_dir}")
+    else:
+        log_func(f"Completed: {processed_count} PDFs generated in {export_dir}")
+    return export_dir
@@ -3,6 +3,8 @@ Command Line Interface Module
 """
 
 import argparse
+import json
+import os
 import sys
 from typing import List
 
@@ -26,16 +28,32 @@ Examples:
   python employee_self_evaluation_app.py --validate                # Validate system configuration
   python employee_self_evaluation_app.py --parse-excel             # Parse Excel file to JSON only
   python employee_self_evaluation_app.py --generate-website        # Generate HTML website from JSON data
+  python employee_self_evaluation_app.py --publish                 # Pipeline with a minified, precompressed website
+  python employee_self_evaluation_app.py --invalidate-cache        # Drop cached parses and deltas, then run the pipeline
+  python employee_self_evaluation_app.py --warehouse-ingest 2024.xlsx 2024   # File a past year's workbook in the warehouse
+  python employee_self_evaluation_app.py --employee-history jdoe@ennead.com   # One employee's responses across years
+  python employee_self_evaluation_app.py --batch-pdfs reviews.xlsx out/ --pdf-workers 4   # Evaluator-employee PDFs on 4 processes
+  python employee_self_evaluation_app.py --batch-pdfs reviews.xlsx out/ --pdf-book      # All reviews in one outlined PDF
+  python employee_self_evaluation_app.py --batch-pdfs reviews.xlsx out/ --stream        # Render while the workbook is read
         """
     )
     parser.add_argument('--validate', '-v', action='store_true', help='Validate system configuration and exit')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose logging')
     parser.add_argument('--parse-excel', action='store_true', help='Parse Excel file to JSON format')
     parser.add_argument('--generate-website', action='store_true', help='Generate HTML website from parsed JSON data')
+    parser.add_argument('--publish', action='store_true', help='Minify the website, content-hash its assets and write .gz/.br siblings')
     parser.add_argument('--no-images', action='store_true', help='Skip copying employee profile images (used with --parse-excel)')
     parser.add_argument('--copy-external-images', action='store_true', help='Copy images from external EmployeeData repository')
     parser.add_argument('--external-repo-path', type=str, help='Path to external EmployeeData repository')
     parser.add_argument('--force-copy-images', action='store_true', help='Force overwrite existing images when copying from external repo')
+    parser.add_argument('--invalidate-cache', action='store_true', help='Clear the Excel parse cache and row manifests so the workbook is fully re-read and re-rendered (with --batch-pdfs, every PDF is rendered again)')
+    parser.add_argument('--batch-pdfs', nargs=2, metavar=('EXCEL_FILE', 'OUTPUT_DIR'), help='Generate evaluator-employee review PDFs from an Excel file')
+    parser.add_argument('--pdf-workers', type=int, metavar='N', help='Processes rendering review PDFs in parallel (default: CPU count; 1 = serial)')
+    parser.add_argument('--stream', action='store_true', help='Read the workbook row by row and render each PDF as soon as its row is read (used with --batch-pdfs; bounded memory for very large exports)')
+    parser.add_argument('--pdf-book', action='store_true', help='Write all review PDFs into one file with an outline and table of contents (used with --batch-pdfs)')
+    parser.add_argument('--pdf-split-pages', type=int, metavar='N', help='Split the --pdf-book output into parts of about N pages')
+    parser.add_argument('--warehouse-ingest', nargs=2, metavar=('EXCEL_FILE', 'YEAR'), help="Parse a year's workbook and file its responses in the evaluation warehouse")
+    parser.add_argument('--employee-history', metavar='EMAIL_OR_NAME', help="Print an employee's responses for every year in the evaluation warehouse")
     parser.add_argument('--version', action='version', version='Employee Evaluation System v1.0.0')
     return parser
 
@@ -44,6 +62,64 @@ def run_cli(args: List[str] = None) -> int:
     parser = create_argument_parser()
     parsed_args = parser.parse_args(args)
     try:
+        if parsed_args.publish:
+            Config.WEBSITE_PUBLISH = True
+
+        if parsed_args.invalidate_cache:
+            from .parse_cache import ParseCache
+            from .excel_parser import clear_row_manifests
+            removed = ParseCache().clear()
+            manifests = clear_row_manifests()
+            log_info(f"Invalidated parse cache ({removed} entries, {manifests} row manifests removed)")
+
+        if parsed_args.batch_pdfs:
+            from .batch_pdf_generator import export_batch_pdfs_with_dual_images
+            excel_file, output_dir = parsed_args.batch_pdfs
+            if parsed_args.pdf_workers is not None and parsed_args.pdf_workers < 1:
+                log_error("--pdf-workers must be at least 1")
+                return 2
+            if parsed_args.pdf_split_pages is not None and parsed_args.pdf_split_pages < 1:
+                log_error("--pdf-split-pages must be at least 1")
+                return 2
+            log_info(f"Generating review PDFs from {excel_file}...")
+            result = export_batch_pdfs_with_dual_images(excel_file, output_dir, log_info,
+                                                        stream=parsed_args.stream,
+                                                        workers=parsed_args.pdf_workers,
+                                                        book=parsed_args.pdf_book,
+                                                        split_pages=parsed_args.pdf_split_pages,
+                                                        force=parsed_args.invalidate_cache)
+            if result:
+                log_info(f"Review PDFs written to {result}")
+                return 0
+            else:
+                log_error("Failed to generate review PDFs")
+                return 1
+
+        if parsed_args.warehouse_ingest:
+            from .excel_parser import parse_excel_to_employees
+            from .warehouse import update_warehouse
+            excel_file, year = parsed_args.warehouse_ingest
+            if not year.isdigit():
+                log_error("--warehouse-ingest YEAR must be a year such as 2024")
+                return 2
+            log_info(f"Filing {excel_file} in the evaluation warehouse as {year}...")
+            employees = parse_excel_to_employees(excel_file)
+            if not employees:
+                log_error(f"No responses parsed from {excel_file}")
+                return 1
+            counts = update_warehouse(employees, int(year), source=os.path.basename(excel_file))
+            return 0 if counts is not None else 1
+
+        if parsed_args.employee_history:
+            from .warehouse import EvaluationWarehouse
+            with EvaluationWarehouse() as warehouse:
+                history = warehouse.employee_history(parsed_args.employee_history)
+            if not history:
+                log_error(f"No responses in the warehouse for {parsed_args.employee_history}")
+                return 1
+            print(json.dumps(history, indent=2, ensure_ascii=False))
+            return 0
+
         if parsed_args.parse_excel:
             log_info("Parsing Excel file to JSON...")
             excel_file = Config.get_excel_input_path()
@@ -41,10 +41,69 @@ class Config:
     WEBSITE_JS_DIR = os.path.join("docs", "js")
     WEBSITE_ASSETS_DIR = os.path.join("docs", "assets")
     WEBSITE_IMAGES_DIR = os.path.join("docs", "assets", "images")
+    # Large sites: cards are written to data/cards-NNNN.js shards and rendered on scroll (see site_shards)
+    WEBSITE_SHARDED = False
+    WEBSITE_SHARD_SIZE = 100
+    WEBSITE_CARD_WORKERS = 1  # Processes rendering employee cards (1 = serial, None = CPU count)
+    WEBSITE_CARD_CHUNK_SIZE = 500  # Cards handed to a worker at a time
+    # Publish stage (see site_publish): minified pages, content-hashed assets, .gz/.br siblings.
+    # Off by default (GitHub Pages serves docs/ as is); enable with --publish
+    WEBSITE_PUBLISH = False
+    WEBSITE_PUBLISH_MANIFEST_NAME = ".site_manifest.json"
+    # Files earlier builds wrote before the website manifest existed; removed when a build does not write them
+    WEBSITE_LEGACY_FILES = ("css/styles.css", "js/script.js", "_headers")
+    # Chart.js pinned and served from the site. The vendored copy (downloaded once when missing) is
+    # only used when it matches CHART_JS_SHA256, and CHART_JS_INTEGRITY (the "sha384-..." value the
+    # CDN publishes for the file) is added to the script tag; leave either empty to skip that check.
+    # NOT YET PINNED: until the file is committed under assets/vendor and both digests are filled in
+    # from a trusted download, no copy is vendored and the report loads Chart.js from the CDN
+    CHART_JS_VERSION = "4.4.1"
+    CHART_JS_URL = f"https://cdn.jsdelivr.net/npm/chart.js@{CHART_JS_VERSION}/dist/chart.umd.js"
+    CHART_JS_SHA256 = ""
+    CHART_JS_INTEGRITY = ""
+    CHART_JS_VENDOR_FILE = os.path.join("assets", "vendor", f"chart-{CHART_JS_VERSION}.umd.js")
     
     # Data directories
     DATA_DIR = os.path.join("assets", "data")
     ASSETS_DIR = "assets"
+
+    # Parse cache (content-addressed by workbook hash + header mapper config)
+    PARSE_CACHE_DIR = os.path.join("assets", "data", "parse_cache")
+    PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    # Per-ID row manifests used for incremental (delta) parsing, one per (workbook, JSON export) pair
+    PARSE_MANIFEST_DIR = os.path.join("assets", "data", "parse_manifests")
+
+    # Year-over-year evaluation warehouse (SQLite). Years are filed explicitly with --warehouse-ingest;
+    # when enabled, the pipeline also files each run under EVALUATION_YEAR, adding and updating only
+    WAREHOUSE_ENABLED = False
+    WAREHOUSE_FILE = os.path.join("assets", "data", "evaluation_warehouse.sqlite")
+    EVALUATION_YEAR = 2025
+
+    # Asset sync (image library, website export, external repository copy)
+    ASSET_SYNC_WORKERS = 8
+    ASSET_SYNC_USE_HASH = False  # True: detect changes by content hash instead of size + mtime
+    ASSET_SYNC_LINK_MODE = "auto"  # auto (reflink, else copy), copy, reflink or hardlink
+    ASSET_SYNC_MANIFEST_DIR = os.path.join("assets", "data", "asset_sync")
+
+    # Profile photo thumbnails (content-addressed by source image hash)
+    THUMBNAIL_DIR = os.path.join("assets", "thumbnails")
+    THUMBNAIL_INDEX_FILE = "index.json"
+    THUMBNAIL_SIZES = [96, 256]  # Square edge in pixels
+    THUMBNAIL_FORMATS = ["webp", "jpeg"]
+    THUMBNAIL_QUALITY = 82
+    THUMBNAIL_WORKERS = None  # Process pool size (None = CPU count)
+    CARD_IMAGE_DISPLAY_PX = 80  # Rendered size of .profile-image
+    PDF_PROFILE_IMAGE_PX = 256  # Minimum variant embedded for ~1 inch PDF portraits
+
+    # Batch evaluator-employee PDF export
+    BATCH_PDF_WORKERS = None  # Render process pool size (None = CPU count)
+    BATCH_PDF_CHUNK_SIZE = 8  # Rows handed to a worker at a time
+    # Circular-masked header photos (see pdf_resources.CircularImageCache)
+    PDF_IMAGE_CACHE_ENTRIES = 256  # Prepared photos kept in memory per process
+    PDF_IMAGE_CACHE_PERSIST = True  # Keep masked photos on disk across runs
+    PDF_IMAGE_CACHE_DIR = os.path.join("assets", "data", "pdf_image_cache")
+    PDF_IMAGE_CACHE_MAX_FILES = 2048
+    PDF_WRAP_CACHE_ENTRIES = 4096  # Wrapped text blocks kept per process (see pdf_layout.wrap_lines)
     
     # Default file names and paths
     DEFAULT_AVATAR_PATH = os.path.join("assets", "images", "default-avatar.png")
@@ -114,7 +173,14 @@ class Config:
     # Export settings
     ENABLE_PDF_EXPORT = False
     PDF_EXPORT_DIR = os.path.join("OUTPUT", "ModalPDF")
+    PDF_EXPORT_PAGES = 4  # Concurrent browser pages printing modals (see modal_pdf)
     PDF_FILE_NAMING = "2025PerformanceReview_{name}.pdf"  # expects a 'name' safe string
+    PDF_OUTPUT_MANIFEST_NAME = ".pdf_manifest.json"  # Sidecar in each export directory (see pdf_manifest)
+    # Book mode: all reports in one PDF ('part' is "" or "_Part01", "_Part02", ... when split)
+    PDF_BOOK_TITLE = "2025 Performance Reviews"
+    PDF_BOOK_FILE_NAMING = "2025PerformanceReview_All{part}.pdf"
+    BATCH_PDF_BOOK_FILE_NAMING = "2025EvaluatorEmployeeReviews{part}.pdf"
+    PDF_BOOK_SPLIT_PAGES = None  # Default pages per part (None = single file)
     
     # Removed REQUIRED_FIELDS and EXCLUDED_FIELDS - no longer needed for Excel parsing
     
@@ -211,11 +277,51 @@ class Config:
         """Get the website output directory path."""
         return os.path.join(cls._get_project_root(), cls.WEBSITE_OUTPUT_DIR)
     
+    @classmethod
+    def get_chart_js_vendor_path(cls) -> str:
+        """Get the vendored Chart.js file path."""
+        return os.path.join(cls._get_project_root(), cls.CHART_JS_VENDOR_FILE)
+    
     @classmethod
     def get_data_dir_path(cls) -> str:
         """Get the data directory path."""
         return os.path.join(cls._get_project_root(), cls.DATA_DIR)
     
+    @classmethod
+    def get_parse_cache_dir_path(cls) -> str:
+        """Get the parse cache directory path."""
+        return os.path.join(cls._get_project_root(), cls.PARSE_CACHE_DIR)
+    
+    @classmethod
+    def get_warehouse_path(cls) -> str:
+        """Get the evaluation warehouse database path."""
+        return os.path.join(cls._get_project_root(), cls.WAREHOUSE_FILE)
+    
+    @classmethod
+    def get_parse_manifest_dir_path(cls) -> str:
+        """Get the row manifest directory path used for delta parsing."""
+        return os.path.join(cls._get_project_root(), cls.PARSE_MANIFEST_DIR)
+    
+    @classmethod
+    def get_asset_sync_manifest_dir_path(cls) -> str:
+        """Get the directory of the asset sync hash manifests."""
+        return os.path.join(cls._get_project_root(), cls.ASSET_SYNC_MANIFEST_DIR)
+    
+    @classmethod
+    def get_pdf_image_cache_dir_path(cls) -> str:
+        """Get the directory of the persisted circular-masked PDF photos."""
+        return os.path.join(cls._get_project_root(), cls.PDF_IMAGE_CACHE_DIR)
+    
+    @classmethod
+    def get_pdf_export_dir_path(cls) -> str:
+        """Get the directory of the modal PDFs printed from the website."""
+        return os.path.join(cls._get_project_root(), cls.PDF_EXPORT_DIR)
+    
+    @classmethod
+    def get_thumbnail_dir_path(cls) -> str:
+        """Get the profile photo thumbnail directory path."""
+        return os.path.join(cls._get_project_root(), cls.THUMBNAIL_DIR)
+    
     @classmethod
     def get_assets_dir_path(cls) -> str:
         """Get the assets directory path."""
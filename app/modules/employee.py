@@ -5,33 +5,29 @@ Centralized Employee class to manage data from different sources including
 Excel parsing, image matching, and other data sources.
 """
 
+from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from .config import Config
+from .header_mapper import HeaderMapping, header_mapper
 
 
 # Employee class no longer uses these dataclasses - all data is stored dynamically
 
 
-class Employee:
-    """Simple Employee class that dynamically generates attributes based on mapped headers."""
+# Marks a field that is absent for a row in EmployeeStore columns
+_MISSING = object()
 
-    def __init__(self, data: Dict[str, Any] = None):
-        """Initialize Employee with dynamic attributes from parsed Excel data."""
-        # Initialize with empty data if none provided
-        if data is None:
-            data = {}
 
-        # Dynamically assign all attributes from the input data
-        for key, value in data.items():
-            setattr(self, key, value)
+class EmployeeBase(ABC):
+    """Behaviour shared by Employee objects and EmployeeStore row views."""
+
+    __slots__ = ()
+
+    @abstractmethod
+    def as_record(self) -> Dict[str, Any]:
+        """Return the employee's fields in insertion order."""
 
-        # Ensure basic metadata exists
-        if not hasattr(self, 'data_sources'):
-            self.data_sources: List[str] = []
-        if not hasattr(self, 'last_updated'):
-            self.last_updated: Optional[str] = None
-    
     def add_data_source(self, source: str):
         """Add a data source to track where data came from."""
         if not hasattr(self, 'data_sources'):
@@ -52,37 +48,20 @@ class Employee:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert employee data to dictionary for JSON serialization."""
-        # Start with all dynamic attributes
-        result = {}
-        for attr_name in dir(self):
-            if not attr_name.startswith('_'):  # Skip private attributes
-                value = getattr(self, attr_name)
-                if not callable(value):  # Skip methods
-                    result[attr_name] = value
-
-        return result
-    
-    @classmethod
-    def from_excel_data(cls, excel_data: Dict[str, Any]) -> 'Employee':
-        """Create Employee instance from Excel data dictionary."""
-        # Create employee with all the Excel data
-        employee = cls(excel_data)
-
-        # Add data source
-        employee.add_data_source('excel_parser')
+        # Same keys and (sorted) order as scanning dir(), without the per-call attribute scan
+        return {key: value for key, value in sorted(self.as_record().items())
+                if not key.startswith('_') and not callable(value)}
 
-        return employee
-    
     def __str__(self) -> str:
         """String representation of employee."""
-        for key, value in self.__dict__.items():
+        for key, value in self.as_record().items():
             if "name" in key.lower():
                 return f"Employee(name='{value}')"
         return f"Employee(name='Unknown')"
 
     def __repr__(self) -> str:
         """Detailed string representation."""
-        for key, value in self.__dict__.items():
+        for key, value in self.as_record().items():
             if "name" in key.lower():
                 name = value
             if "title" in key.lower():
@@ -93,25 +72,321 @@ class Employee:
         return f"Employee(name='{name}', title='{title}', role='{role}')"
 
 
+class Employee(EmployeeBase):
+    """Simple Employee class that dynamically generates attributes based on mapped headers."""
+
+    def __init__(self, data: Dict[str, Any] = None):
+        """Initialize Employee with dynamic attributes from parsed Excel data."""
+        # Initialize with empty data if none provided
+        if data is None:
+            data = {}
+
+        # Dynamically assign all attributes from the input data
+        for key, value in data.items():
+            setattr(self, key, value)
+
+        # Ensure basic metadata exists
+        if not hasattr(self, 'data_sources'):
+            self.data_sources: List[str] = []
+        if not hasattr(self, 'last_updated'):
+            self.last_updated: Optional[str] = None
+
+    def as_record(self) -> Dict[str, Any]:
+        """Return the employee's fields in insertion order."""
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_excel_data(cls, excel_data: Dict[str, Any]) -> 'Employee':
+        """Create Employee instance from Excel data dictionary."""
+        # Create employee with all the Excel data
+        employee = cls(excel_data)
+
+        # Add data source
+        employee.add_data_source('excel_parser')
+
+        return employee
+
+
+class EmployeeRow(EmployeeBase):
+    """
+    Lightweight view of one row in an EmployeeStore.
+
+    Exposes the same attribute API as Employee (getattr/setattr/hasattr, dir,
+    to_dict) but holds only a store reference and a row index; field values
+    live in the store's columns.
+    """
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: 'EmployeeStore', index: int):
+        object.__setattr__(self, '_store', store)
+        object.__setattr__(self, '_index', index)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. for data fields
+        try:
+            value = self._store._columns[name][self._index]
+        except KeyError:
+            raise AttributeError(name) from None
+        if value is _MISSING:
+            raise AttributeError(name)
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        self._store.set_value(self._index, name, value)
+
+    def __delattr__(self, name: str):
+        column = self._store._columns.get(name)
+        if column is None or column[self._index] is _MISSING:
+            raise AttributeError(name)
+        column[self._index] = _MISSING
+
+    def __dir__(self) -> List[str]:
+        return list(self.as_record()) + _ROW_CLASS_ATTRIBUTES
+
+    def __eq__(self, other: Any) -> bool:
+        return (isinstance(other, EmployeeRow)
+                and other._store is self._store and other._index == self._index)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._index))
+
+    @property
+    def row_index(self) -> int:
+        """Position of this row in its store."""
+        return self._index
+
+    def as_record(self) -> Dict[str, Any]:
+        """Return the row's present fields in store column order."""
+        index = self._index
+        return {field: column[index] for field, column in self._store._columns.items()
+                if column[index] is not _MISSING}
+
+
+_ROW_CLASS_ATTRIBUTES = dir(EmployeeRow)
+
+
+class EmployeeStore:
+    """
+    Columnar container for employee records.
+
+    Every field is kept once as a list indexed by row position, so a record
+    costs one list slot per field instead of a per-object __dict__, and field
+    access is a dictionary lookup plus an index. Rows are handed out as
+    EmployeeRow views that behave like Employee objects.
+    """
+
+    def __init__(self, fields: Optional[List[str]] = None):
+        """
+        Initialize an empty store.
+
+        Args:
+            fields: Optional field order (e.g. the mapped headers); fixing it
+                up front keeps each row's field order identical to its record
+        """
+        self._columns: Dict[str, List[Any]] = {}
+        self._size = 0
+        if fields:
+            for field in list(fields) + ['data_sources', 'last_updated']:
+                self._columns.setdefault(field, [])
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]], fields: Optional[List[str]] = None,
+                     data_source: Optional[str] = None) -> 'EmployeeStore':
+        """Build a store from flat record dictionaries (e.g. parsed Excel rows or JSON)."""
+        store = cls(fields)
+        for record in records:
+            store.append(record, data_source)
+        return store
+
+    @classmethod
+    def from_json_list(cls, records: List[Dict[str, Any]]) -> 'EmployeeStore':
+        """
+        Build a store from records written by to_json_list / employee_data.json.
+
+        Fields are kept in sorted order, matching Employee(record) for such records.
+        """
+        fields = sorted({field for record in records for field in record})
+        return cls.from_records(records, fields)
+
+    def append(self, data: Optional[Dict[str, Any]] = None, data_source: Optional[str] = None) -> EmployeeRow:
+        """
+        Add a record and return its row view.
+
+        Mirrors Employee(data) (and Employee.from_excel_data when data_source
+        is given): data_sources and last_updated are always present.
+        """
+        index = self._size
+        self._size += 1
+        for column in self._columns.values():
+            column.append(_MISSING)
+
+        data = data or {}
+        for field, value in data.items():
+            self.set_value(index, field, value)
+        if 'data_sources' not in data:
+            self.set_value(index, 'data_sources', [])
+        if 'last_updated' not in data:
+            self.set_value(index, 'last_updated', None)
+
+        row = EmployeeRow(self, index)
+        if data_source:
+            row.add_data_source(data_source)
+        return row
+
+    def set_value(self, index: int, field: str, value: Any):
+        """Set one field of one row, adding the column on first use."""
+        column = self._columns.get(field)
+        if column is None:
+            column = self._columns[field] = [_MISSING] * self._size
+        column[index] = value
+
+    def get_value(self, index: int, field: str, default: Any = None) -> Any:
+        """Return one field of one row, or default when the row has no value."""
+        column = self._columns.get(field)
+        if column is None:
+            return default
+        value = column[index]
+        return default if value is _MISSING else value
+
+    @property
+    def fields(self) -> List[str]:
+        """All field names in column order."""
+        return list(self._columns)
+
+    def column(self, field: str) -> List[Any]:
+        """Return a field's values for every row (None where absent)."""
+        column = self._columns.get(field)
+        if column is None:
+            return [None] * self._size
+        return [None if value is _MISSING else value for value in column]
+
+    def rows(self) -> List[EmployeeRow]:
+        """Return a row view for every record."""
+        return [EmployeeRow(self, index) for index in range(self._size)]
+
+    def to_json_list(self) -> List[Dict[str, Any]]:
+        """Convert all rows to JSON-serializable dictionaries."""
+        return [row.to_dict() for row in self]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield EmployeeRow(self, index)
+
+    def __getitem__(self, index: int) -> EmployeeRow:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("EmployeeStore index out of range")
+        return EmployeeRow(self, index)
+
+
 class EmployeeManager:
     """Manager class to handle multiple employees and data operations."""
     
-    def __init__(self):
+    def __init__(self, header_mappings: Optional[Dict[int, HeaderMapping]] = None):
+        """
+        Initialize the manager.
+
+        Args:
+            header_mappings: Header mappings of the parsed workbook (defaults to the
+                predefined HeaderMapper mappings); the name and email fields are
+                resolved from them once instead of per employee
+        """
         self.employees: List[Employee] = []
+        self.name_fields: List[str] = header_mapper.get_name_fields(header_mappings)
+        self.email_fields: List[str] = header_mapper.get_email_fields(header_mappings)
+        self.title_fields: List[str] = header_mapper.get_title_fields(header_mappings)
+        self.role_fields: List[str] = header_mapper.get_role_fields(header_mappings)
+        self._name_index: Dict[str, Employee] = {}
+        self._email_index: Dict[str, Employee] = {}
     
     def add_employee(self, employee: Employee):
         """Add an employee to the manager."""
         self.employees.append(employee)
+        self._index_employee(employee)
+
+    def add_employees(self, employees: List[Employee]):
+        """Add several employees to the manager."""
+        for employee in employees:
+            self.add_employee(employee)
+
+    def reindex(self):
+        """Rebuild the name and email indexes (after employee names or emails were edited)."""
+        self._name_index.clear()
+        self._email_index.clear()
+        for employee in self.employees:
+            self._index_employee(employee)
+
+    def _index_employee(self, employee: Employee):
+        # First employee wins, matching the order a linear scan would find
+        name = self.get_employee_name(employee)
+        if name:
+            self._name_index.setdefault(self.normalize_key(name), employee)
+        email = self.get_employee_email(employee)
+        if email:
+            self._email_index.setdefault(self.normalize_key(email), employee)
+
+    @staticmethod
+    def normalize_key(value: Any) -> str:
+        """Normalize a name or email for index lookups (case and whitespace insensitive)."""
+        return " ".join(str(value).split()).casefold()
+
+    def get_employee_name(self, employee: Any) -> Optional[str]:
+        """
+        Get an employee's display name from the canonical name fields.
+
+        Args:
+            employee: Employee object, EmployeeStore row, or employee data dictionary
+
+        Returns:
+            The first non-empty name field value, or None
+        """
+        return self._first_value(employee, self.name_fields, "name")
+
+    def get_employee_email(self, employee: Any) -> Optional[str]:
+        """Get an employee's email from the canonical email fields, or None."""
+        return self._first_value(employee, self.email_fields, "email")
+
+    def get_employee_title(self, employee: Any) -> Optional[str]:
+        """Get an employee's job title from the canonical title fields, or None."""
+        return self._first_value(employee, self.title_fields, "title")
+
+    def get_employee_role(self, employee: Any) -> Optional[str]:
+        """Get an employee's role from the canonical role fields, or None."""
+        return self._first_value(employee, self.role_fields, "role")
+
+    @staticmethod
+    def _first_value(employee: Any, fields: List[str], keyword: str) -> Optional[str]:
+        record = employee if isinstance(employee, dict) else employee.as_record()
+        for field in fields:
+            value = record.get(field)
+            if value:
+                return str(value)
+        if any(field in record for field in fields):
+            return None
+        # Records without the mapped fields (e.g. flat {"name": ...} data): fall back to key search
+        for key in sorted(record):
+            value = record[key]
+            if (value and keyword in key.lower() and not key.startswith(('_', 'profile_image'))
+                    and not callable(value)):
+                return str(value)
+        return None
     
     def get_employee_by_name(self, name: str) -> Optional[Employee]:
         """Get employee by name (case-insensitive)."""
-        for emp in self.employees:
-            for key, value in emp.__dict__.items():
-                if "name" in key.lower():
-                    emp_name = value
-            if emp_name and emp_name.lower() == name.lower():
-                return emp
-        return None
+        if not name:
+            return None
+        return self._name_index.get(self.normalize_key(name))
+
+    def get_employee_by_email(self, email: str) -> Optional[Employee]:
+        """Get employee by email (case-insensitive)."""
+        if not email:
+            return None
+        return self._email_index.get(self.normalize_key(email))
     
     def get_employees_with_images(self) -> List[Employee]:
         """Get all employees that have profile images."""
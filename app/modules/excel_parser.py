@@ -6,15 +6,20 @@ Parses the Excel file exported from MS Form and converts it to structured JSON f
 
 import os
 import sys
+import hashlib
+import itertools
+import numpy as np
 import pandas as pd
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator, Union, Set, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 import re
 from .image_manager import ImageManager
-from .employee import Employee, EmployeeManager
+from .employee import Employee, EmployeeManager, EmployeeStore
 from .config import Config
 from .header_mapper import HeaderMapper, CardGroup
+from .parse_cache import ParseCache, mappings_signature
 
 # Fix console encoding for Windows (safe)
 try:
@@ -26,18 +31,135 @@ except Exception:
     pass
 
 
+# Cell strings pandas.read_excel treats as missing by default (keep streaming output identical)
+PANDAS_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def cell_value(value: Any) -> Any:
+    """
+    Normalize a raw cell the same way for the DataFrame and streaming read paths.
+
+    pandas stores a numeric column with blank cells as floats while openpyxl
+    hands over ints, so whole-number floats become ints; missing cells become None.
+    """
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float):
+        if value != value:
+            return None
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def cell_text(value: Any) -> Optional[str]:
+    """Cleaned text of a raw cell as stored in employee records, or None when it is empty."""
+    value = cell_value(value)
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+# Mapped headers used to fingerprint rows for incremental parsing
+ROW_ID_FIELD = "id"
+LAST_MODIFIED_FIELD = "last_modified"
+
+
+@dataclass
+class ParseDelta:
+    """Row-level difference between a workbook and the manifest of the previous run."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    full_rebuild: bool = False  # No usable manifest, or the column layout/mappings changed
+    images_changed: bool = False  # The photo library differs from the one the last run matched against
+    previous_rows: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    manifest_path: str = ""  # Where save_manifest writes (one manifest per workbook and output)
+    manifest: Dict[str, Any] = field(default_factory=dict)  # Filled in by the parser once the rows are exported
+
+    @property
+    def dirty_ids(self) -> Set[str]:
+        """Row IDs that must be materialized again (added or changed)."""
+        return set(self.added) | set(self.changed)
+
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.deleted or self.images_changed)
+
+    def save_manifest(self) -> bool:
+        """
+        Persist the manifest of this run so the next run only sees new edits.
+
+        Call it once every consumer of the delta (the website build) has
+        succeeded; until then the next run diffs against the old manifest and
+        rebuilds the same rows again.
+
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if not self.manifest_path or not self.manifest:
+            return False
+        tmp_path = self.manifest_path + ".tmp"
+        try:
+            Path(self.manifest_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.manifest, f, indent=1, ensure_ascii=False)
+            os.replace(tmp_path, self.manifest_path)
+            return True
+        except Exception as e:
+            print(f"[WARN] Could not save row manifest {self.manifest_path}: {e}")
+            return False
+
+    def summary(self) -> str:
+        text = (f"{len(self.added)} added, {len(self.changed)} changed, "
+                f"{len(self.deleted)} deleted, {len(self.unchanged)} unchanged")
+        if self.images_changed:
+            text += ", photo library changed"
+        return f"{text} (full rebuild)" if self.full_rebuild else text
+
+
+def record_digest(record: Dict[str, Any]) -> str:
+    """Digest of an exported employee record, as written to and read back from the JSON export."""
+    return hashlib.sha1(json.dumps(record, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def image_library_signature(image_dir: str) -> str:
+    """Digest of the names, sizes and mtimes of the supported images in a directory."""
+    entries = []
+    try:
+        with os.scandir(image_dir) as scan:
+            for entry in scan:
+                if entry.is_file() and Config.is_supported_image_file(entry.name):
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    except OSError:
+        pass
+    return hashlib.sha1(json.dumps(sorted(entries)).encode('utf-8')).hexdigest()
+
+
 class ExcelEmployeeParser:
     """Parser for Excel-based employee evaluation data."""
     
-    def __init__(self, excel_path: str):
+    def __init__(self, excel_path: str, use_cache: bool = True):
         """
         Initialize the parser with the Excel file path.
         
         Args:
             excel_path: Path to the Excel file
+            use_cache: Reuse parsed data from the parse cache when the workbook
+                and header mapper configuration are unchanged
         """
         self.excel_path = Path(excel_path)
         self.df: Optional[pd.DataFrame] = None
+        self.columns: List[str] = []
+        self.parse_cache: Optional[ParseCache] = ParseCache() if use_cache else None
+        self._column_values: Dict[int, np.ndarray] = {}
+        self.row_ids: List[str] = []
+        self.row_manifest: Optional[Dict[str, Dict[str, Any]]] = None
         self.employees_data: List[Dict[str, Any]] = []
         self.header_mapper = HeaderMapper()
         self.header_mappings: Dict[str, Any] = {}
@@ -53,13 +175,24 @@ class ExcelEmployeeParser:
             if not self.excel_path.exists():
                 print(f"Error: Excel file not found at {self.excel_path}")
                 return False
-                
-            self.df = pd.read_excel(self.excel_path, engine='openpyxl')
-            print(f"✅ Successfully loaded Excel file: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+
+            cache_key, cached = self._load_from_cache()
+            if cached:
+                self.df = cached['df']
+                self._column_values = cached['column_values']
+                print(f"⚡ Loaded parsed workbook from cache: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+            else:
+                self.df = pd.read_excel(self.excel_path, engine='openpyxl')
+                self._column_values = {}
+                print(f"✅ Successfully loaded Excel file: {self.df.shape[0]} rows, {self.df.shape[1]} columns")
+            self.columns = list(self.df.columns)
             
             # Create header mappings
             self.header_mappings = self.header_mapper.map_excel_headers(self.df)
             print(f"📋 Created {len(self.header_mappings)} header mappings")
+
+            if cache_key and not cached:
+                self._store_in_cache(cache_key)
             
             # Print mapping summary for inspection
             self._print_mapping_summary()
@@ -73,9 +206,38 @@ class ExcelEmployeeParser:
             print(f"Error loading Excel file: {e}")
             return False
     
+    def _load_from_cache(self) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up this workbook in the parse cache.
+
+        Returns:
+            (cache_key, payload) tuple; payload is None on a miss and both are
+            None when caching is disabled or the lookup fails
+        """
+        if self.parse_cache is None:
+            return None, None
+        try:
+            cache_key = self.parse_cache.make_key(str(self.excel_path), self.header_mapper)
+            return cache_key, self.parse_cache.load(cache_key)
+        except Exception as e:
+            print(f"[WARN] Parse cache lookup failed: {e}")
+            return None, None
+
+    def _store_in_cache(self, cache_key: str):
+        """Store the DataFrame and its cleaned mapped columns in the parse cache."""
+        column_count = self.df.shape[1]
+        self._column_values = {
+            col_index: self._extract_column_values(col_index)
+            for _, col_index in self._build_column_plan()
+            if col_index < column_count
+        }
+        payload = {'df': self.df, 'column_values': self._column_values}
+        if self.parse_cache.store(cache_key, payload):
+            print(f"[SAVED] Cached parsed workbook ({cache_key[:12]})")
+
     def _print_mapping_summary(self):
         """Print a summary of header mappings for inspection."""
-        summary = self.header_mapper.get_mapping_summary()
+        summary = self.header_mapper.get_mapping_summary(self.header_mappings)
         
         print(f"\n[INFO] Header Mapping Summary:")
         print(f"   Total mappings: {summary['total_mappings']}")
@@ -170,13 +332,11 @@ class ExcelEmployeeParser:
             except IndexError:
                 continue
 
-            # Skip empty values
-            if pd.isna(value) or not str(value).strip():
+            # Clean the value, skipping empty ones
+            clean_value = cell_text(value)
+            if clean_value is None:
                 continue
 
-            # Clean the value
-            clean_value = str(value).strip()
-
             # Store in appropriate group using mapped header as key
             group = mapping.group_under
             grouped_data[group][mapping.mapped_header] = clean_value
@@ -201,6 +361,200 @@ class ExcelEmployeeParser:
         
         return employee
     
+    def _build_column_plan(self) -> List[Tuple[str, int]]:
+        """
+        Order mapped columns the same way extract_employee_data flattens them.
+
+        Records are flattened group by group (CardGroup order) and, within a
+        group, in header mapping order, so the plan follows that sequence.
+
+        Returns:
+            List of (mapped_header, column_index) tuples in record key order
+        """
+        group_rank = {group: rank for rank, group in enumerate(CardGroup)}
+        plan = [(mapping.mapped_header, col_index, group_rank[mapping.group_under])
+                for col_index, mapping in self.header_mappings.items()]
+        plan.sort(key=lambda entry: entry[2])  # stable: keeps mapping order within a group
+        return [(mapped_header, col_index) for mapped_header, col_index, _ in plan]
+
+    def _extract_column_values(self, col_index: int) -> np.ndarray:
+        """
+        Clean one DataFrame column in a single vectorized pass.
+
+        Values are cleaned with cell_text exactly like extract_employee_data
+        and the streaming path; missing and blank cells are masked as None.
+
+        Args:
+            col_index: Position of the column in the DataFrame
+
+        Returns:
+            Object array of cleaned strings, with None for empty cells
+        """
+        # Not Series.map: it would turn the None results back into NaN
+        values = np.empty(len(self.df), dtype=object)
+        values[:] = [cell_text(value) for value in self.df.iloc[:, col_index].tolist()]
+        return values
+
+    def _cleaned_column(self, col_index: int) -> np.ndarray:
+        """Return cleaned values for a column, reusing the parse cache when loaded from it."""
+        values = self._column_values.get(col_index)
+        if values is None:
+            values = self._extract_column_values(col_index)
+        return values
+
+    def extract_all_employee_data(self, positions: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract every row using columnar extraction instead of iterrows.
+
+        Each mapped column is cleaned once as a whole array and the records are
+        then assembled in one pass. The output matches calling
+        extract_employee_data on each row.
+
+        Args:
+            positions: Optional row positions to materialize (delta parsing);
+                all rows are extracted when omitted
+
+        Returns:
+            List of flat employee data dictionaries, one per selected row
+        """
+        if self.df is None:
+            return []
+
+        row_count = len(self.df) if positions is None else len(positions)
+        selection = None if positions is None else np.asarray(positions, dtype=int)
+        column_count = self.df.shape[1]
+        keys = []
+        columns = []
+        for mapped_header, col_index in self._build_column_plan():
+            # Same guard as the per-row path: mappings past the last column are skipped
+            if col_index >= column_count:
+                continue
+            keys.append(mapped_header)
+            values = self._cleaned_column(col_index)
+            columns.append(values if selection is None else values[selection])
+
+        if not columns:
+            return [{} for _ in range(row_count)]
+
+        return [
+            {key: value for key, value in zip(keys, row_values) if value is not None}
+            for row_values in zip(*columns)
+        ]
+
+    def _find_mapped_column(self, mapped_header: str) -> Optional[int]:
+        """Return the DataFrame column index mapped to a header, if present."""
+        for col_index, mapping in self.header_mappings.items():
+            if mapping.mapped_header == mapped_header and col_index < self.df.shape[1]:
+                return col_index
+        return None
+
+    def build_row_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Fingerprint every row by its form response ID.
+
+        Each entry holds the row's "Last modified time" and a hash of all of
+        its cleaned cells, so edits are caught even when Forms leaves the
+        modified time blank. Rows without an ID fall back to "row-N".
+
+        Returns:
+            Dictionary of row ID -> {"last_modified", "row_hash"} in row order
+        """
+        if self.df is None:
+            return {}
+
+        row_count, column_count = self.df.shape
+        id_col = self._find_mapped_column(ROW_ID_FIELD)
+        modified_col = self._find_mapped_column(LAST_MODIFIED_FIELD)
+        ids = self._cleaned_column(id_col) if id_col is not None else [None] * row_count
+        modified = self._cleaned_column(modified_col) if modified_col is not None else [None] * row_count
+        columns = [self._cleaned_column(col_index) for col_index in range(column_count)]
+
+        self.row_ids = []
+        manifest = {}
+        for position, (row_id, last_modified, row_values) in enumerate(zip(ids, modified, zip(*columns))):
+            row_id = row_id or f"row-{position + 1}"
+            if row_id in manifest:
+                row_id = f"{row_id}#{position + 1}"
+            joined = "\x1f".join("\x00" if value is None else value for value in row_values)
+            manifest[row_id] = {
+                "last_modified": last_modified or "",
+                "row_hash": hashlib.sha1(joined.encode('utf-8')).hexdigest(),
+            }
+            self.row_ids.append(row_id)
+
+        self.row_manifest = manifest
+        return manifest
+
+    def _manifest_signature(self) -> str:
+        """Digest of the column layout and header mappings the manifest was built with."""
+        raw = json.dumps([str(column) for column in self.columns], ensure_ascii=False)
+        raw += mappings_signature(self.header_mappings)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def manifest_path_for(self, output_path: str) -> str:
+        """Row manifest of this workbook exported to output_path (each pair keeps its own baseline)."""
+        pair = f"{os.path.abspath(self.excel_path)}|{os.path.abspath(output_path)}"
+        return os.path.join(Config.get_parse_manifest_dir_path(),
+                            hashlib.sha1(pair.encode('utf-8')).hexdigest()[:16] + ".json")
+
+    @staticmethod
+    def _load_manifest(manifest_path: str) -> Dict[str, Any]:
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def compute_delta(self, output_path: str, image_dir: Optional[str] = None) -> ParseDelta:
+        """
+        Compare the loaded workbook with the manifest saved by the last export to output_path.
+
+        The manifest is only replaced by ParseDelta.save_manifest, so a run
+        whose output failed is diffed against the same baseline again.
+
+        Args:
+            output_path: Export the manifest belongs to (the JSON export path)
+            image_dir: Photo library the rows are matched against; when its
+                contents changed, images_changed is set
+
+        Returns:
+            ParseDelta describing added, changed, deleted and unchanged row IDs
+        """
+        current = self.build_row_manifest()
+        manifest_path = self.manifest_path_for(output_path)
+        previous = self._load_manifest(manifest_path)
+        delta = ParseDelta(previous_rows=previous.get('rows', {}), manifest_path=manifest_path)
+        delta.full_rebuild = previous.get('signature') != self._manifest_signature()
+        images = image_library_signature(image_dir) if image_dir else None
+        delta.images_changed = bool(image_dir) and not delta.full_rebuild and previous.get('images') != images
+
+        for row_id, entry in current.items():
+            old = delta.previous_rows.get(row_id)
+            if old is None:
+                delta.added.append(row_id)
+            elif (delta.full_rebuild
+                  or old.get('last_modified') != entry['last_modified']
+                  or old.get('row_hash') != entry['row_hash']):
+                delta.changed.append(row_id)
+            else:
+                delta.unchanged.append(row_id)
+        delta.deleted = [row_id for row_id in delta.previous_rows if row_id not in current]
+        delta.manifest = {"signature": self._manifest_signature(), "images": images,
+                          "rows": {row_id: dict(entry) for row_id, entry in current.items()}}
+        return delta
+
+    @staticmethod
+    def find_employee_name(employee_data: Dict[str, Any]) -> Optional[str]:
+        """Return the first non-empty value whose mapped header mentions a name."""
+        for field, value in employee_data.items():
+            if value and "name" in field.lower():
+                return value
+        return None
+
+    def create_employee_store(self) -> EmployeeStore:
+        """Return an empty EmployeeStore whose field order follows the column plan."""
+        return EmployeeStore(fields=[mapped_header for mapped_header, _ in self._build_column_plan()])
+
     def parse_all_employees(self) -> List[Employee]:
         """
         Parse all employee data from the Excel file.
@@ -213,26 +567,17 @@ class ExcelEmployeeParser:
             return []
         
         employees = []
+        # Rows are stored column-wise; each employee is a lightweight row view
+        store = self.create_employee_store()
         
         print(f"[INFO] Parsing {len(self.df)} employee records...")
         
-        for index, row in self.df.iterrows():
+        for index, employee_data in zip(self.df.index, self.extract_all_employee_data()):
             try:
-                employee_data = self.extract_employee_data(row)
-                
                 # Only add if we have essential data - check for any employee name field
-                # Look for employee name using mapped headers
-                employee_name = None
-                
-                for field in employee_data.keys():
-                    if "name" in field.lower():
-                        if employee_data[field]:
-                            employee_name = employee_data[field]
-                            break
-
-                if employee_name:
-                    # Create Employee object from data
-                    employee = Employee.from_excel_data(employee_data)
+                if self.find_employee_name(employee_data):
+                    # Create employee row from data
+                    employee = store.append(employee_data, data_source='excel_parser')
                     employees.append(employee)
                     print(f"[OK] Parsed employee: {employee}")
                 else:
@@ -249,22 +594,148 @@ class ExcelEmployeeParser:
         """Return each employee as a flat dict using existing mapping logic."""
         if self.df is None:
             return []
-        employees: List[Dict[str, Any]] = []
-        for _, row in self.df.iterrows():
-            try:
-                emp = self.extract_employee_data(row)
-                # ensure name exists
-                name = None
-                for k, v in emp.items():
-                    if v and "name" in k.lower():
-                        name = v
-                        break
-                if name:
-                    employees.append(emp)
-            except Exception:
-                continue
-        return employees
+        return [emp for emp in self.extract_all_employee_data() if self.find_employee_name(emp)]
     
+    @staticmethod
+    def _normalize_stream_headers(header_row: Tuple[Any, ...]) -> List[str]:
+        """
+        Turn a raw openpyxl header row into the column names pandas would produce.
+
+        Trailing empty header cells are dropped, blank headers become
+        "Unnamed: N" and duplicates get ".1", ".2" suffixes, so header mapping
+        behaves the same in streaming and DataFrame mode.
+        """
+        cells = list(header_row)
+        while cells and cells[-1] is None:
+            cells.pop()
+
+        headers = []
+        seen: Dict[str, int] = {}
+        for index, cell in enumerate(cells):
+            header = f"Unnamed: {index}" if cell is None else str(cell)
+            if header in seen:
+                seen[header] += 1
+                header = f"{header}.{seen[header]}"
+            else:
+                seen[header] = 0
+            headers.append(header)
+        return headers
+
+    @staticmethod
+    def _convert_stream_row(row: Tuple[Any, ...], width: int) -> Tuple[Any, ...]:
+        """Pad/trim a raw row to the header width and normalize cells like the DataFrame path (see cell_value)."""
+        values = []
+        for index in range(width):
+            value = row[index] if index < len(row) else None
+            if isinstance(value, str) and value in PANDAS_NA_STRINGS:
+                value = None
+            values.append(cell_value(value))
+        return tuple(values)
+
+    def stream_rows(self) -> Optional[Iterator[Tuple[Tuple[Any, ...], Dict[str, Any]]]]:
+        """
+        Open the workbook in openpyxl read-only mode and stream its rows.
+
+        Headers are read and mapped immediately (peeking at the first data row
+        for mapping conflict resolution), so header_mappings and columns are
+        available as soon as this returns. Data rows are only read as the
+        returned generator is consumed, which keeps memory bounded for very
+        large MS Forms exports.
+
+        Returns:
+            Generator of (raw_row_values, employee_data) tuples, or None on error
+        """
+        try:
+            if not self.excel_path.exists():
+                print(f"Error: Excel file not found at {self.excel_path}")
+                return None
+
+            from openpyxl import load_workbook
+            workbook = load_workbook(self.excel_path, read_only=True, data_only=True)
+        except Exception as e:
+            print(f"Error opening Excel file: {e}")
+            return None
+
+        try:
+            worksheet = workbook.worksheets[0]
+            # Exports often carry a stale <dimension> (e.g. A1:A1); read every cell instead
+            worksheet.reset_dimensions()
+            rows = worksheet.iter_rows(values_only=True)
+            header_row = next(rows, None)
+            if header_row is None:
+                print(f"Error: Excel file has no header row: {self.excel_path}")
+                workbook.close()
+                return None
+
+            self.columns = self._normalize_stream_headers(header_row)
+            width = len(self.columns)
+            first_row = next(rows, None)
+            first_values = self._convert_stream_row(first_row, width) if first_row is not None else None
+
+            sample = pd.DataFrame([first_values] if first_values else [], columns=self.columns)
+            self.header_mappings = self.header_mapper.map_excel_headers(sample)
+            print(f"✅ Streaming Excel file: {width} columns")
+            print(f"📋 Created {len(self.header_mappings)} header mappings")
+            self._print_mapping_summary()
+            self._save_header_mappings_json()
+        except Exception as e:
+            workbook.close()
+            print(f"Error reading Excel headers: {e}")
+            return None
+
+        if first_row is not None:
+            rows = itertools.chain([first_row], rows)
+        return self._iter_stream(workbook, rows, width)
+
+    def _iter_stream(self, workbook, rows, width: int) -> Iterator[Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+        """Yield (raw_row_values, employee_data) per non-blank row, closing the workbook at the end."""
+        plan = [(mapped_header, col_index) for mapped_header, col_index in self._build_column_plan()
+                if col_index < width]
+        try:
+            for row in rows:
+                values = self._convert_stream_row(row, width)
+                if all(value is None for value in values):
+                    continue
+                yield values, self._extract_stream_record(values, plan)
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _extract_stream_record(values: Tuple[Any, ...], plan: List[Tuple[str, int]]) -> Dict[str, Any]:
+        """Build one flat employee dict from raw cell values, cleaned like extract_employee_data."""
+        employee = {}
+        for mapped_header, col_index in plan:
+            clean_value = cell_text(values[col_index])
+            if clean_value is not None:
+                employee[mapped_header] = clean_value
+        return employee
+
+    def stream_employees(self, as_dicts: bool = False) -> Iterator[Union[Employee, Dict[str, Any]]]:
+        """
+        Stream Employee objects (or flat dicts) straight from the workbook.
+
+        Unlike load_excel + parse_all_employees, the first record is yielded as
+        soon as its row has been read.
+
+        Args:
+            as_dicts: Yield flat employee dicts instead of Employee objects
+
+        Yields:
+            Employee objects or dicts for rows that have an employee name
+        """
+        rows = self.stream_rows()
+        if rows is None:
+            return
+
+        count = 0
+        for _values, employee_data in rows:
+            if not self.find_employee_name(employee_data):
+                continue
+            count += 1
+            yield employee_data if as_dicts else Employee.from_excel_data(employee_data)
+
+        print(f"[SUCCESS] Streamed {count} employee records")
+
     def save_to_json(self, employees: List[Employee], output_path: str = None) -> bool:
         """
         Save the parsed employee data to a JSON file.
@@ -343,9 +814,21 @@ class ExcelEmployeeParser:
         self.header_mapper.show_field(original_header)
 
 
-def parse_excel_to_employees(excel_path: str) -> List[Employee]:
-    """Parse Excel file and return Employee objects directly."""
+def parse_excel_to_employees(excel_path: str, stream: bool = False) -> Union[List[Employee], Iterator[Employee]]:
+    """
+    Parse Excel file and return Employee objects directly.
+
+    Args:
+        excel_path: Path to the Excel file
+        stream: Return a generator that yields employees while the workbook is
+            still being read (openpyxl read-only mode) instead of a list
+
+    Returns:
+        List of Employee objects, or a generator of them when streaming
+    """
     parser = ExcelEmployeeParser(excel_path)
+    if stream:
+        return parser.stream_employees()
     if not parser.load_excel():
         return []
 
@@ -353,93 +836,72 @@ def parse_excel_to_employees(excel_path: str) -> List[Employee]:
     return employees
 
 
-def parse_excel_to_json(excel_path: str, output_path: str = None, 
-                       copy_images: bool = True, image_source_dir: str = None) -> bool:
+def _attach_profile_images(employees: List[Employee], image_source_dir: str = None,
+                           merge_existing: bool = False,
+                           employee_manager: EmployeeManager = None) -> None:
     """
-    Convenience function to parse Excel file and save to JSON.
-    
+    Match profile images for employees and set their image attributes.
+
     Args:
-        excel_path: Path to the Excel file
-        output_path: Path to save the JSON file
-        copy_images: Whether to copy employee profile images
+        employees: Employee objects to update in place
         image_source_dir: Source directory for employee images
-        
-    Returns:
-        True if successful, False otherwise
+        merge_existing: Keep previously saved image mappings (delta parsing
+            only matches the changed employees)
+        employee_manager: Manager whose resolved name fields identify employees
     """
-    parser = ExcelEmployeeParser(excel_path)
-    
-    if not parser.load_excel():
-        return False
-    
-    employees = parser.parse_all_employees()
-    if not employees:
-        return False
-    
-    # Copy employee images if requested
-    if copy_images:
-        print("\n[INFO] Processing employee profile images...")
-        try:
-            # Set default image source directory
-            if not image_source_dir:
-                image_source_dir = Config.get_image_source_path()
-            
-            image_manager = ImageManager(image_source_dir, Config.IMAGE_TARGET_DIR)
-            image_mappings = image_manager.copy_employee_images(employees)
-            
-            # Update employee objects with image information
-            for employee in employees:
-                # Find the employee name from the available name attributes
-                emp_name = None
-                for attr_name in dir(employee):
-                    if not attr_name.startswith('_') and 'name' in attr_name.lower():
-                        attr_value = getattr(employee, attr_name)
-                        if attr_value and not callable(attr_value):
-                            emp_name = str(attr_value)
-                            break
-                
-                if emp_name and emp_name in image_mappings:
-                    image_info = image_mappings[emp_name]
-                    if image_info['filename'] and image_info['copied']:
-                        setattr(employee, 'profile_image_filename', image_info['filename'])
-                        setattr(employee, 'profile_image_path', f"{Config.IMAGE_TARGET_DIR}/{image_info['filename']}")
-                        setattr(employee, 'image_match_confidence', image_info['confidence'])
-                        print(f"[OK] Set image for {emp_name}: {image_info['filename']}")
-                    else:
-                        setattr(employee, 'profile_image_filename', None)
-                        setattr(employee, 'profile_image_path', None)
-                        setattr(employee, 'image_match_confidence', None)
+    print("\n[INFO] Processing employee profile images...")
+    try:
+        # Set default image source directory
+        if not image_source_dir:
+            image_source_dir = Config.get_image_source_path()
+
+        image_manager = ImageManager(image_source_dir, Config.IMAGE_TARGET_DIR)
+        if merge_existing:
+            image_manager.load_image_mappings(Config.get_image_mappings_path())
+        if employee_manager is None:
+            employee_manager = EmployeeManager()
+        image_mappings = image_manager.copy_employee_images(employees, employee_manager)
+
+        # Update employee objects with image information
+        for employee in employees:
+            emp_name = employee_manager.get_employee_name(employee)
+
+            if emp_name and emp_name in image_mappings:
+                image_info = image_mappings[emp_name]
+                if image_info['filename'] and image_info['copied']:
+                    setattr(employee, 'profile_image_filename', image_info['filename'])
+                    setattr(employee, 'profile_image_path', f"{Config.IMAGE_TARGET_DIR}/{image_info['filename']}")
+                    setattr(employee, 'image_match_confidence', image_info['confidence'])
+                    print(f"[OK] Set image for {emp_name}: {image_info['filename']}")
                 else:
                     setattr(employee, 'profile_image_filename', None)
                     setattr(employee, 'profile_image_path', None)
                     setattr(employee, 'image_match_confidence', None)
-                    
-            # Save image mappings for reference
-            image_manager.save_image_mappings(Config.get_image_mappings_path())
-            
-            # Show asset library statistics
-            asset_stats = image_manager.get_asset_library_stats()
-            print(f"📚 Asset Library: {asset_stats['total_images']} total images")
-            print(f"   Matched: {asset_stats['matched_images']}")
-            print(f"   Available: {asset_stats['unmatched_images']}")
-                    
-        except Exception as e:
-            print(f"[WARN] Warning: Could not process images: {e}")
-            for employee in employees:
+            else:
                 setattr(employee, 'profile_image_filename', None)
                 setattr(employee, 'profile_image_path', None)
                 setattr(employee, 'image_match_confidence', None)
-    
-    # Create employee manager and save to JSON
-    employee_manager = EmployeeManager()
-    for employee in employees:
-        employee_manager.add_employee(employee)
-    
-    
-    if not employee_manager.save_to_json(output_path):
-        return False
-    
-    # Print summary
+
+        # Save image mappings for reference
+        image_manager.save_image_mappings(Config.get_image_mappings_path())
+
+        # Show asset library statistics
+        asset_stats = image_manager.get_asset_library_stats()
+        print(f"📚 Asset Library: {asset_stats['total_images']} total images")
+        print(f"   Matched: {asset_stats['matched_images']}")
+        print(f"   Available: {asset_stats['unmatched_images']}")
+
+    except Exception as e:
+        print(f"[WARN] Warning: Could not process images: {e}")
+        for employee in employees:
+            setattr(employee, 'profile_image_filename', None)
+            setattr(employee, 'profile_image_path', None)
+            setattr(employee, 'image_match_confidence', None)
+
+
+def _print_parse_summary(employees: List[Employee], employee_manager: EmployeeManager,
+                         copy_images: bool) -> None:
+    """Print the parsing summary shown at the end of a JSON export."""
     print("\n[INFO] Parsing Summary:")
     print(f"   Total employees: {len(employees)}")
     # Count employees with ratings (any non-empty rating)
@@ -465,10 +927,171 @@ def parse_excel_to_json(excel_path: str, output_path: str = None,
         image_stats = employee_manager.get_image_statistics()
         print(f"   Employees with profile images: {image_stats['employees_with_images']}")
         print(f"   Image coverage: {image_stats['image_coverage_percentage']}%")
+
+
+def parse_excel_to_json(excel_path: str, output_path: str = None, 
+                       copy_images: bool = True, image_source_dir: str = None) -> bool:
+    """
+    Convenience function to parse Excel file and save to JSON.
+    
+    Args:
+        excel_path: Path to the Excel file
+        output_path: Path to save the JSON file
+        copy_images: Whether to copy employee profile images
+        image_source_dir: Source directory for employee images
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    parser = ExcelEmployeeParser(excel_path)
+    
+    if not parser.load_excel():
+        return False
+    
+    employees = parser.parse_all_employees()
+    if not employees:
+        return False
+    
+    # Create employee manager (its name index is shared with image matching)
+    employee_manager = EmployeeManager(parser.header_mappings)
+    employee_manager.add_employees(employees)
+
+    # Copy employee images if requested
+    if copy_images:
+        _attach_profile_images(employees, image_source_dir, employee_manager=employee_manager)
+    
+    if not employee_manager.save_to_json(output_path):
+        return False
     
+    _print_parse_summary(employees, employee_manager, copy_images)
+
     return True
 
 
+def clear_row_manifests() -> int:
+    """Remove every saved row manifest so the next run rebuilds all outputs."""
+    manifest_dir = Config.get_parse_manifest_dir_path()
+    if not os.path.isdir(manifest_dir):
+        return 0
+    removed = 0
+    for name in os.listdir(manifest_dir):
+        if name.endswith(".json"):
+            os.remove(os.path.join(manifest_dir, name))
+            removed += 1
+    return removed
+
+
+def _reusable_records(delta: ParseDelta, json_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Return the previously exported records of unchanged rows, keyed by row ID.
+
+    The manifest records where each row's record sits in the JSON export and
+    its digest, so rows are matched by the same row IDs the delta uses (also
+    the synthesized "row-N" and "id#N" ones); a record that was edited or
+    moved since is not reused.
+    """
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            records = json.load(f)
+    except Exception:
+        return {}
+    reusable = {}
+    for row_id in delta.unchanged:
+        entry = delta.previous_rows.get(row_id, {})
+        position = entry.get('record')
+        if (isinstance(position, int) and 0 <= position < len(records)
+                and record_digest(records[position]) == entry.get('record_hash')):
+            reusable[row_id] = records[position]
+    return reusable
+
+
+def parse_excel_incremental(excel_path: str, output_path: str = None, copy_images: bool = True,
+                            image_source_dir: str = None) -> Optional[Tuple[List[Employee], ParseDelta]]:
+    """
+    Parse an Excel re-export, materializing only rows that changed since the last run.
+
+    Rows are matched by form response ID against the row manifest of this
+    workbook and JSON export. Added and changed rows are turned into Employee
+    objects and image-matched; unchanged rows are reused from the previous
+    JSON export; deleted rows are dropped. When the photo library changed,
+    every employee is image-matched again. The merged list is saved to JSON
+    as usual.
+
+    The row manifest is not saved here: call delta.save_manifest() once the
+    outputs built from the employees (the website) are written.
+
+    Args:
+        excel_path: Path to the Excel file
+        output_path: Path of the JSON export (also the source of reused records)
+        copy_images: Whether to match profile images for changed employees
+        image_source_dir: Source directory for employee images
+
+    Returns:
+        (employees, delta) tuple, or None if parsing failed
+    """
+    if output_path is None:
+        output_path = Config.get_json_output_path()
+    if not image_source_dir:
+        image_source_dir = Config.get_image_source_path()
+
+    parser = ExcelEmployeeParser(excel_path)
+    if not parser.load_excel():
+        return None
+
+    delta = parser.compute_delta(output_path, image_source_dir if copy_images else None)
+    print(f"[INFO] Row delta: {delta.summary()}")
+
+    # Unchanged rows missing from the previous export (e.g. JSON deleted) are materialized again
+    previous_records = {} if delta.full_rebuild else _reusable_records(delta, output_path)
+    positions = [position for position, row_id in enumerate(parser.row_ids) if row_id not in previous_records]
+
+    fresh = {}
+    store = parser.create_employee_store()
+    for position, employee_data in zip(positions, parser.extract_all_employee_data(positions)):
+        if parser.find_employee_name(employee_data):
+            employee = store.append(employee_data, data_source='excel_parser')
+            fresh[parser.row_ids[position]] = employee
+            print(f"[OK] Parsed employee: {employee}")
+
+    employee_manager = EmployeeManager(parser.header_mappings)
+    rematch_images = copy_images and delta.images_changed
+    if copy_images and fresh and not rematch_images:
+        _attach_profile_images(list(fresh.values()), image_source_dir, merge_existing=True,
+                               employee_manager=employee_manager)
+
+    row_ids = []
+    records = []
+    for row_id in parser.row_ids:
+        if row_id in fresh:
+            records.append(fresh[row_id].to_dict())
+        elif row_id in previous_records:
+            records.append(previous_records[row_id])
+        else:
+            continue
+        row_ids.append(row_id)
+    if not records:
+        return None
+
+    # Same employees a full run would load back from the JSON export
+    employees = EmployeeStore.from_json_list(records).rows()
+    if rematch_images:
+        _attach_profile_images(employees, image_source_dir, employee_manager=employee_manager)
+        employees = EmployeeStore.from_json_list([employee.to_dict() for employee in employees]).rows()
+    employee_manager.add_employees(employees)
+    if not employee_manager.save_to_json(output_path):
+        return None
+
+    # Where each row's record sits in the export, so the next run reuses it by row ID
+    rows = delta.manifest['rows']
+    for position, (row_id, employee) in enumerate(zip(row_ids, employees)):
+        rows[row_id]['record'] = position
+        rows[row_id]['record_hash'] = record_digest(employee.to_dict())
+
+    print(f"[SUCCESS] Materialized {len(fresh)} of {len(employees)} employee records")
+    _print_parse_summary(employees, employee_manager, copy_images)
+    return employees, delta
+
+
 if __name__ == "__main__":
     # Example usage
     excel_file = Config.get_excel_input_path()
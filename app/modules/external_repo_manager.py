@@ -5,9 +5,9 @@ Handles copying images from external EmployeeData repository to local assets dir
 """
 
 import os
-import shutil
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
+from .asset_sync import AssetSync
 from .config import Config
 from .utils import log_info, log_error
 
@@ -76,7 +76,7 @@ class ExternalRepoManager:
         Copy all images from external EmployeeData repository to local assets/images.
         
         Args:
-            force_copy: If True, overwrite existing images. If False, skip existing images.
+            force_copy: If True, overwrite every image. If False, copy only new or changed images.
             
         Returns:
             Dictionary mapping image filenames to copy success status
@@ -98,43 +98,23 @@ class ExternalRepoManager:
             log_info("⚠️  No images found in external repository")
             return {}
         
-        # Copy images
-        copy_results = {}
-        copied_count = 0
-        skipped_count = 0
-        
-        log_info(f"[INFO] Copying images from external repository...")
+        # Copy new or changed images (size + mtime, or content hash if configured)
+        log_info(f"[INFO] Syncing images from external repository...")
         log_info(f"   Source: {self.external_image_dir}")
         log_info(f"   Target: {self.local_target_dir}")
         
-        for image_file in external_images:
-            source_path = os.path.join(self.external_image_dir, image_file)
-            target_path = os.path.join(self.local_target_dir, image_file)
-            
-            try:
-                # Check if target already exists
-                if os.path.exists(target_path) and not force_copy:
-                    log_info(f"⏭️  Image already exists: {image_file}")
-                    copy_results[image_file] = True
-                    skipped_count += 1
-                    continue
-                
-                # Copy the image
-                shutil.copy2(source_path, target_path)
-                log_info(f"✅ Copied: {image_file}")
-                copy_results[image_file] = True
-                copied_count += 1
-                
-            except Exception as e:
-                log_error(f"❌ Error copying {image_file}: {e}")
-                copy_results[image_file] = False
+        result = AssetSync().sync(self.external_image_dir, self.local_target_dir,
+                                  files=external_images, force=force_copy)
+        for image_file, error in result.failed.items():
+            log_error(f"❌ Error copying {image_file}: {error}")
+        copy_results = result.status_by_file()
         
         # Summary
         log_info(f"📦 External Repository Copy Summary:")
         log_info(f"   Total images found: {len(external_images)}")
-        log_info(f"   Successfully copied: {copied_count}")
-        log_info(f"   Already existed: {skipped_count}")
-        log_info(f"   Failed: {len(external_images) - copied_count - skipped_count}")
+        log_info(f"   Successfully copied: {len(result.transferred)}")
+        log_info(f"   Already up to date: {len(result.unchanged)}")
+        log_info(f"   Failed: {len(result.failed)}")
         
         return copy_results
     
@@ -171,7 +151,7 @@ def copy_images_from_employee_data_repo(external_repo_path: str = None,
     
     Args:
         external_repo_path: Path to EmployeeData repository (uses config if None)
-        force_copy: Whether to overwrite existing images
+        force_copy: Whether to overwrite images that are already up to date
         
     Returns:
         True if copying was successful, False otherwise
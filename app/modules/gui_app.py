@@ -4,8 +4,12 @@ import traceback
 import webbrowser
 from tkinter import Tk, Button, Label, filedialog, StringVar, END, DISABLED, NORMAL
 
-from .excel_parser import parse_excel_to_json
+from .excel_parser import parse_excel_incremental
 from .pdf_exporter import export_pdfs_reportlab
+from .employee import EmployeeManager, EmployeeStore
+from .image_manager import load_thumbnail_index, thumbnail_for
+from .pdf_layout import LABEL_FONT, LABEL_SIZE, ReportLayout
+from .pdf_resources import PdfResourceRegistry
 def _safe_filename(name: str) -> str:
     import re
     return re.sub(r"[^\w\-\.]+", "_", name)[:80] or "Employee"
@@ -15,7 +19,6 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
         from reportlab.lib.pagesizes import letter
         from reportlab.pdfgen import canvas
         from reportlab.lib.units import inch
-        from reportlab.lib.utils import simpleSplit
         from .header_mapper import CardGroup
     except Exception as e:
         log_func(f"ReportLab not available: {e}")
@@ -53,11 +56,14 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
         for grp in group_to_fields:
             group_to_fields[grp] = sorted(group_to_fields[grp], key=lambda m: m.display_order)
 
+    employee_manager = EmployeeManager(header_mappings)
+    thumbnails = load_thumbnail_index()
     for emp in employees:
-        name_field = next((v for k,v in emp.items() if v and 'name' in k.lower()), None)
+        name_field = employee_manager.get_employee_name(emp)
         safe = _safe_filename(name_field or 'Employee')
         pdf_path = os.path.join(export_dir, Config.PDF_FILE_NAMING.format(name=safe))
         c = canvas.Canvas(pdf_path, pagesize=letter)
+        resources = PdfResourceRegistry(c)  # rating icons embedded once per PDF
         width, height = letter
 
         # Header
@@ -70,7 +76,8 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
         img_path = name_to_image.get(name_field or '', None)
         if img_path and os.path.exists(img_path):
             try:
-                c.drawImage(img_path, left_margin, header_y - img_size, img_size, img_size, preserveAspectRatio=True, mask='auto')
+                c.drawImage(thumbnail_for(img_path, Config.PDF_PROFILE_IMAGE_PX, index=thumbnails),
+                            left_margin, header_y - img_size, img_size, img_size, preserveAspectRatio=True, mask='auto')
             except Exception:
                 pass
 
@@ -112,63 +119,8 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
         c.setLineWidth(1)
         c.line(left_margin, header_y - img_size - 0.15*inch, width - left_margin, header_y - img_size - 0.15*inch)
 
-        # Modal-like palette and spacing
-        def _rgb(hex_color: str):
-            hex_color = hex_color.lstrip('#')
-            return tuple(int(hex_color[i:i+2], 16)/255.0 for i in (0, 2, 4))
-        TEAL = _rgb('2B7A78')
-        BOX_BG = _rgb('F7FBFA')
-        body_font = "Helvetica"
-        label_font = "Helvetica-Bold"
-        body_size = 10
-        label_size = 11
-        line_leading = 12
-        x = 0.75*inch
-        y = header_y - img_size - 0.35*inch
-        max_width = width - 1.5*inch
-
-        def draw_text(text: str, font: str, size: int, extra_gap: int = 0):
-            nonlocal y
-            lines = simpleSplit(str(text), font, size, max_width)
-            for ln in lines:
-                c.setFont(font, size)
-                c.drawString(x, y, ln)
-                y -= line_leading
-            if extra_gap:
-                y -= extra_gap
-
-        def ensure_space_lines(lines_needed: int = 4):
-            nonlocal y
-            if y - lines_needed * line_leading < 0.75*inch:
-                c.showPage()
-                y = height - 0.75*inch
-
-        def ensure_space_px(pixels_needed: float):
-            nonlocal y
-            if y - pixels_needed < 0.75*inch:
-                c.showPage()
-                y = height - 0.75*inch
-
-        def draw_value_box(label: str, value: str):
-            nonlocal y
-            # Label in teal
-            c.setFillColorRGB(*TEAL)
-            c.setFont(label_font, 10)
-            c.drawString(x, y, label)
-            y -= 12
-            # Value rounded box with light teal border
-            c.setFillColorRGB(*BOX_BG)
-            c.setStrokeColorRGB(*TEAL)
-            text_lines = simpleSplit(str(value), body_font, body_size, max_width - 12)
-            box_h = len(text_lines) * line_leading + 12
-            c.roundRect(x, y - box_h + 6, max_width, box_h, 6, stroke=1, fill=1)
-            c.setFillColorRGB(0,0,0)
-            c.setFont(body_font, body_size)
-            ty = y - 6
-            for ln in text_lines:
-                c.drawString(x + 6, ty, ln)
-                ty -= line_leading
-            y = y - box_h - 6
+        # Body: measured and paginated by the shared layout, then drawn in one pass
+        layout = ReportLayout(letter, rating_icons=(rating_checked_path, rating_unchecked_path))
 
         # Render grouped fields if mappings available; otherwise fallback to flat
         if header_mappings:
@@ -181,67 +133,34 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
                         values.append((m.mapped_header, val))
                 if not values:
                     continue
-                # Group box
-                ensure_space_lines(6)
-                group_title = grp.value.replace('_',' ').title()
-                c.setFillColorRGB(*TEAL)
-                c.setFont(label_font, 13)
-                c.drawString(x, y, group_title)
-                # place divider a bit lower to avoid overlapping the title baseline
-                y -= 8
-                c.setLineWidth(0.8)
-                c.setStrokeColorRGB(*TEAL)
-                c.line(x, y, x+max_width, y)
-                y -= 8
+                # Group title; divider a bit lower to avoid overlapping the title baseline
+                layout.heading(grp.value.replace('_',' ').title(), rule_gap=8)
                 # Fields
                 basic_allow = {"Title", "Employee Role", "Email"}
                 for label, val in values:
                     if grp == CardGroup.BASIC_INFO and label not in basic_allow:
                         continue
-                    # estimate space before drawing
-                    # default base spacing
-                    base_gap = 18
-                    # Check if rating_num
                     # Check if rating_num
                     mapping = next((m for m in group_to_fields.get(grp, []) if m.mapped_header == label), None)
                     if mapping and getattr(mapping, 'data_type_in_card', '').value.lower() == 'rating_num':
-                        icon_size = 0.22*inch
-                        ensure_space_px(icon_size + base_gap + 8)
-                        # Draw label
-                        c.setFillColorRGB(*TEAL)
-                        draw_text(label, label_font, label_size)
-                        # Draw 5 icons
                         try:
                             score = int(str(val).strip()[:1]) if str(val).strip() else 0
                         except Exception:
                             score = 0
-                        icon_y = y
-                        icon_x = x
-                        for i in range(5):
-                            icon_path = rating_checked_path if i < score else rating_unchecked_path
-                            try:
-                                c.drawImage(icon_path, icon_x, icon_y - icon_size + 8, icon_size, icon_size, mask='auto')
-                            except Exception:
-                                pass
-                            icon_x += icon_size + 2
-                        y -= (icon_size + 6)
+                        layout.rating(label, score)
                     else:
-                        # compute value box height and ensure space
-                        text_lines = simpleSplit(str(val), body_font, body_size, max_width - 12)
-                        box_h = len(text_lines) * line_leading + 12
-                        ensure_space_px(box_h + base_gap)
-                        draw_value_box(label, val)
+                        layout.value_box(label, val)
                 # Extra space between groups
-                y -= 10
+                layout.space(10)
         else:
             # Fallback: flat
             for k, v in emp.items():
                 if not v:
                     continue
-                ensure_space_lines(4)
-                label = k.replace('_', ' ').title()
-                draw_text(label, label_font, label_size)
-                draw_text(v, body_font, body_size, extra_gap=4)
+                layout.ensure_lines(4)
+                layout.text(k.replace('_', ' ').title(), LABEL_FONT, LABEL_SIZE)
+                layout.text(v, extra_gap=4)
+        layout.draw(c, header_y - img_size - 0.35*inch, resources)
 
         c.showPage()
         c.save()
@@ -249,52 +168,14 @@ def _export_pdf_reportlab(employees: list, export_dir: str, log_func, header_map
 
     return export_dir
 from .html_generator import create_html_output_from_employees
-from .employee import Employee
+from .modal_pdf import export_modal_pdfs
 from .config import Config
 import shutil
 import asyncio
 
-async def _export_pdf_with_playwright(index_html_path: str, export_dir: str, log_func) -> str:
-    try:
-        from playwright.async_api import async_playwright
-    except Exception as e:
-        log_func(f"Playwright not available: {e}")
-        return ""
-
-    if not export_dir:
-        raise ValueError("PDF export directory is required")
-    os.makedirs(export_dir, exist_ok=True)
-
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context()
-        page = await context.new_page()
-        file_url = "file:///" + index_html_path.replace("\\", "/")
-        await page.goto(file_url)
-        # Wait for modal hooks
-        await page.wait_for_function("() => window.__employeeCount && window.__employeeCount() > 0")
-        count = await page.evaluate("() => window.__employeeCount()")
-
-        # Derive names from DOM (employee-name text)
-        names = await page.evaluate("() => Array.from(document.querySelectorAll('#employee-list .employee-card .employee-name')).map(e => e.textContent.trim())")
-        # Fallback safe names
-        def _safe(n):
-            import re
-            return re.sub(r"[^\w\-\.]+", "_", n)[:80] or "Employee"
-
-        for i in range(count):
-            await page.evaluate(f"window.__openModalAt({i})")
-            await page.wait_for_selector('#modalOverlay:not([hidden])')
-            # Print only the modal
-            # Use page.pdf with letter size
-            name = _safe(names[i] if i < len(names) else f"Employee_{i+1}")
-            pdf_path = os.path.join(export_dir, Config.PDF_FILE_NAMING.format(name=name))
-            await page.pdf(path=pdf_path, format='letter', print_background=True, margin={"top":"0","right":"0","bottom":"0","left":"0"})
-            log_func(f"Saved PDF: {pdf_path}")
-            await page.evaluate("window.__closeModal()")
-
-        await browser.close()
-    return export_dir
+async def _export_pdf_with_playwright(index_html_path: str, export_dir: str, log_func, pages: int = None) -> str:
+    """Print every employee modal to a PDF on a pool of browser pages (see modal_pdf)."""
+    return await export_modal_pdfs(index_html_path, export_dir, log_func, pages=pages)
 
 
 DARK_BG = "#121212"
@@ -311,10 +192,7 @@ def _load_employees_from_json(json_path: str):
         import json
         with open(json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-        employees = []
-        for emp in data:
-            employees.append(Employee(emp))
-        return employees
+        return EmployeeStore.from_json_list(data).rows()
     except Exception:
         return []
 
@@ -346,33 +224,24 @@ def run_pipeline(excel_path: str, log_func) -> str:
             log_func(f"Excel not found: {excel_path}")
             return ""
 
-        # Clear cached JSON to ensure fresh parsing from Excel
+        # Only responses added or changed since the last run are re-parsed and image-matched
         json_output = Config.get_json_output_path()
-        if os.path.exists(json_output):
-            try:
-                os.remove(json_output)
-                log_func("Cleared cached data.")
-            except Exception:
-                pass
-
         log_func("Parsing Excel ...")
-        success = parse_excel_to_json(excel_path, json_output, copy_images=True)
-        if not success:
+        result = parse_excel_incremental(excel_path, json_output, copy_images=True)
+        if not result:
             log_func("Failed to parse Excel.")
             return ""
 
-        log_func("Loading employees from JSON ...")
-        employees = _load_employees_from_json(json_output)
-        if not employees:
-            log_func("Failed to load employee data from JSON.")
-            return ""
+        employees, delta = result
+        log_func(f"Parsed {len(employees)} employees ({delta.summary()})")
 
         log_func("Generating HTML ...")
         website_dir = Config.get_website_output_path()
-        index_path = create_html_output_from_employees(employees, website_dir)
+        index_path = create_html_output_from_employees(employees, website_dir, delta=delta)
         if not index_path:
             log_func("Failed to generate HTML website.")
             return ""
+        delta.save_manifest()
 
         log_func(f"Generated (project docs): {index_path}")
 
@@ -386,7 +255,8 @@ def run_pipeline(excel_path: str, log_func) -> str:
                 if getattr(Config, 'ENABLE_PDF_EXPORT', False):
                     try:
                         log_func("Exporting PDFs (letter size)...")
-                        export_dir = asyncio.run(_export_pdf_with_playwright(desktop_index, log_func))
+                        export_dir = asyncio.run(_export_pdf_with_playwright(
+                            desktop_index, Config.get_pdf_export_dir_path(), log_func))
                         if export_dir:
                             log_func(f"PDFs saved in: {export_dir}")
                     except Exception as e:
@@ -518,9 +388,9 @@ class GuiApp:
                 return
             self.log("Exporting PDFs (letter size) with dedicated module...")
             self.log(f"DEBUG: Using Excel file: {self.file_path}")
-            # Reuse parsed data for accurate PDF content
+            # Reuse parsed data for accurate PDF content; PDFs whose inputs are unchanged
+            # since the last export into this folder are reused (see pdf_manifest)
             try:
-                from .config import Config as _C
                 from .excel_parser import ExcelEmployeeParser as _P
                 parser = _P(self.file_path)  # Use the selected Excel file, not default path
                 self.log(f"DEBUG: Parser created with path: {parser.excel_path}")
@@ -5,11 +5,19 @@ This module handles the mapping of Excel headers to structured data fields
 with grouping and ordering capabilities for card display.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import pandas as pd
 
+# Fuzzy matches must score above this (see HeaderMapper._calculate_similarity)
+FUZZY_MATCH_THRESHOLD = 0.7
+# Resolved header rows kept per process (see HeaderMapper.map_excel_headers)
+RESOLUTION_CACHE_ENTRIES = 64
+
 
 class CardGroup(Enum):
     """Card display groups in order of appearance."""
@@ -51,6 +59,67 @@ class HeaderMapping:
     display_order: int  # Order within the group
 
 
+def mappings_signature(header_mappings: Dict[int, HeaderMapping]) -> str:
+    """Return a digest of a column index -> HeaderMapping dictionary."""
+    parts = [
+        (
+            col_index,
+            m.original_header,
+            m.mapped_header,
+            m.group_under.value,
+            m.data_type_in_card.value,
+            m.data_type_in_chart.value,
+            m.display_order,
+        )
+        for col_index, m in sorted(header_mappings.items())
+    ]
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+class _SimilarityIndex:
+    """
+    Predefined headers prepared for fuzzy matching.
+
+    Lowercased text and word sets are computed once, and an inverted word index
+    limits the word-overlap scoring to mappings that share a word with the header.
+    Scores equal HeaderMapper._calculate_similarity; ties go to the earlier mapping.
+    """
+
+    def __init__(self, mappings: List[HeaderMapping]):
+        self.mappings = mappings
+        self.texts = [str(m.original_header).lower().strip() for m in mappings]
+        self.words = [frozenset(text.split()) for text in self.texts]
+        self.by_word: Dict[str, List[int]] = {}
+        for i, words in enumerate(self.words):
+            for word in words:
+                self.by_word.setdefault(word, []).append(i)
+
+    def best_match(self, header: Any) -> Optional[HeaderMapping]:
+        """The mapping most similar to header (above FUZZY_MATCH_THRESHOLD), or None."""
+        if not header:
+            return None
+        text = str(header).lower().strip()
+        words = frozenset(text.split())
+
+        scores: Dict[int, float] = {}
+        for i in {i for word in words for i in self.by_word.get(word, ())}:
+            scores[i] = len(words & self.words[i]) / len(words | self.words[i])
+        # Equality and containment take precedence over word overlap
+        for i, other in enumerate(self.texts):
+            if text == other:
+                scores[i] = 1.0
+            elif text in other or other in text:
+                scores[i] = 0.8
+
+        best = min(((-score, i) for i, score in scores.items() if score > FUZZY_MATCH_THRESHOLD), default=None)
+        return self.mappings[best[1]] if best else None
+
+
+# Header-row signature -> resolved mappings, shared by every HeaderMapper in the process
+_resolution_cache: "OrderedDict[str, Dict[int, HeaderMapping]]" = OrderedDict()
+_resolution_lock = threading.Lock()
+
+
 class HeaderMapper:
     """Maps Excel headers to structured data fields with grouping."""
     
@@ -188,12 +257,42 @@ class HeaderMapper:
         Map actual Excel headers to our predefined mappings using column indices.
         Handles duplicate column names by mapping to different predefined mappings.
 
+        Resolutions are cached by a signature of the predefined mappings, the
+        header row and the first row's numeric columns (which settle fuzzy-match
+        conflicts), so loading the same layout again skips the matching. The
+        predefined mappings are never modified; every call returns new
+        HeaderMapping objects the caller may change freely.
+
         Args:
             df: Pandas DataFrame from Excel file
 
         Returns:
             Dictionary mapping column indices to HeaderMapping objects
         """
+        signature = self._header_signature(df)
+        with _resolution_lock:
+            resolved = _resolution_cache.get(signature)
+            if resolved is not None:
+                _resolution_cache.move_to_end(signature)
+
+        if resolved is None:
+            resolved = self._resolve_headers(df)
+            with _resolution_lock:
+                _resolution_cache[signature] = resolved
+                while len(_resolution_cache) > RESOLUTION_CACHE_ENTRIES:
+                    _resolution_cache.popitem(last=False)
+
+        return {col_index: replace(mapping) for col_index, mapping in resolved.items()}
+
+    def _header_signature(self, df: pd.DataFrame) -> str:
+        """Digest of everything map_excel_headers reads: mapper configuration, headers and first-row types."""
+        first_row = [self._is_numeric_value(value) for value in df.iloc[0]] if len(df) else None
+        raw = repr((mappings_signature(self.header_mappings), [(type(h).__name__, str(h)) for h in df.columns],
+                    first_row))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _resolve_headers(self, df: pd.DataFrame) -> Dict[int, HeaderMapping]:
+        """Resolve a header row (exact pass, then fuzzy pass) into new HeaderMapping objects."""
         actual_mappings = {}
         used_mappings = set()  # Track which mapped_headers have been used
 
@@ -209,33 +308,27 @@ class HeaderMapper:
                     available_mappings.sort(key=lambda m: abs(m.column_index - col_index))
                     mapping = available_mappings[0]
 
-                    mapping.column_index = col_index
-                    mapping.column_letter = self._column_number_to_letter(col_index)
-                    actual_mappings[col_index] = mapping
+                    actual_mappings[col_index] = replace(mapping, column_index=col_index,
+                                                         column_letter=self._column_number_to_letter(col_index))
                     used_mappings.add(mapping.mapped_header)
 
         # Second pass: fuzzy matches with conflict resolution
+        similarity_index = _SimilarityIndex(list(self.header_mappings.values()))
+        first_row = df.iloc[0] if len(df) else None
         for col_index, actual_header in enumerate(df.columns):
             # Skip if already mapped
             if col_index in actual_mappings:
                 continue
 
             # Try fuzzy matching
-            best_match = None
-            best_score = 0
-
-            for predefined_mapping in self.header_mappings.values():
-                similarity = self._calculate_similarity(actual_header, predefined_mapping.original_header)
-                if similarity > best_score and similarity > 0.7:
-                    best_score = similarity
-                    best_match = predefined_mapping
+            best_match = similarity_index.best_match(actual_header)
 
             if best_match:
                 # Check for conflicts with existing mappings
                 existing_mapping = self._find_existing_mapping_for_field(actual_mappings, best_match.mapped_header)
                 if existing_mapping:
                     # Resolve conflict by preferring numeric data over text data
-                    should_replace = self._should_replace_mapping(df, existing_mapping, col_index, actual_header, best_match)
+                    should_replace = self._should_replace_mapping(first_row, existing_mapping, col_index, actual_header, best_match)
                     if should_replace:
                         # Remove the old mapping
                         old_col_index = None
@@ -281,16 +374,20 @@ class HeaderMapper:
                 return mapping
         return None
 
-    def _should_replace_mapping(self, df: pd.DataFrame, existing_mapping: HeaderMapping,
+    def _should_replace_mapping(self, first_row: Optional[pd.Series], existing_mapping: HeaderMapping,
                                new_col_index: int, new_header: str, predefined_mapping) -> bool:
         """
         Determine if a new mapping should replace an existing one.
         Prefers numeric data over text data for the same field.
+
+        first_row is the sheet's first data row (None when the sheet has no rows).
         """
         # Get sample values from both columns
+        if first_row is None:
+            return True  # Replace if we can't get sample values
         try:
-            existing_value = df.iloc[0][existing_mapping.original_header]
-            new_value = df.iloc[0][new_header]
+            existing_value = first_row[existing_mapping.original_header]
+            new_value = first_row[new_header]
         except (KeyError, IndexError):
             return True  # Replace if we can't get sample values
 
@@ -309,6 +406,9 @@ class HeaderMapper:
         """Check if a value is numeric (indicating it's likely a rating)."""
         if pd.isna(value):
             return False
+        # A numeric column with blank cells is read as floats (4.0); the streaming reader gives 4
+        if isinstance(value, float) and value.is_integer():
+            return True
         try:
             int(str(value).strip())
             return True
@@ -388,6 +488,39 @@ class HeaderMapper:
         
         return visible_fields
     
+    def get_name_fields(self, mappings: Optional[Dict[int, HeaderMapping]] = None) -> List[str]:
+        """
+        Get the mapped headers holding an employee name, canonical field first.
+
+        Args:
+            mappings: Header mappings of a parsed workbook (defaults to the predefined mappings)
+
+        Returns:
+            Basic-info field names containing "name", in display order
+        """
+        return self._find_basic_fields(mappings, "name")
+
+    def get_email_fields(self, mappings: Optional[Dict[int, HeaderMapping]] = None) -> List[str]:
+        """Get the mapped headers holding an employee email, canonical field first."""
+        return self._find_basic_fields(mappings, "email")
+
+    def get_title_fields(self, mappings: Optional[Dict[int, HeaderMapping]] = None) -> List[str]:
+        """Get the mapped headers holding an employee's job title, canonical field first."""
+        return self._find_basic_fields(mappings, "title")
+
+    def get_role_fields(self, mappings: Optional[Dict[int, HeaderMapping]] = None) -> List[str]:
+        """Get the mapped headers holding an employee's role, canonical field first."""
+        return self._find_basic_fields(mappings, "role")
+
+    def _find_basic_fields(self, mappings: Optional[Dict[int, HeaderMapping]], keyword: str) -> List[str]:
+        """Return basic-info mapped headers containing keyword, sorted by display order."""
+        if not mappings:
+            mappings = self.header_mappings
+        fields = sorted((m for m in mappings.values()
+                         if m.group_under == CardGroup.BASIC_INFO and keyword in m.mapped_header.lower()),
+                        key=lambda m: m.display_order)
+        return list(dict.fromkeys(m.mapped_header for m in fields))
+
     def update_card_group_order(self, new_order: List[CardGroup]):
         """Update the card group display order."""
         self.card_group_order = new_order
@@ -404,18 +537,25 @@ class HeaderMapper:
             for mapping in self.header_mappings_by_name[original_header]:
                 mapping.data_type_in_card = card_type
     
-    def get_mapping_summary(self) -> Dict[str, Any]:
-        """Get a summary of all mappings for inspection."""
+    def get_mapping_summary(self, mappings: Optional[Dict[int, HeaderMapping]] = None) -> Dict[str, Any]:
+        """
+        Get a summary of mappings for inspection.
+
+        Args:
+            mappings: Header mappings of a parsed workbook (defaults to the predefined mappings)
+        """
+        if not mappings:
+            mappings = self.header_mappings
         summary = {
-            "total_mappings": len(self.header_mappings),
+            "total_mappings": len(mappings),
             "card_group_order": [group.value for group in self.card_group_order],
             "groups": {},
             "ordered_mappings": []  # All mappings ordered by column index
         }
         
         # Create ordered mappings by column index
-        for col_index in sorted(self.header_mappings.keys()):
-            mapping = self.header_mappings[col_index]
+        for col_index in sorted(mappings.keys()):
+            mapping = mappings[col_index]
             summary["ordered_mappings"].append({
                 "column_index": mapping.column_index,
                 "column_letter": mapping.column_letter,
@@ -428,7 +568,7 @@ class HeaderMapper:
             })
         
         for group in CardGroup:
-            group_mappings = [m for m in self.header_mappings.values() 
+            group_mappings = [m for m in mappings.values() 
                             if m.group_under == group]
             summary["groups"][group.value] = {
                 "count": len(group_mappings),
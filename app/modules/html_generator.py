@@ -4,17 +4,27 @@ HTML Report Generator
 This module handles the generation of interactive HTML reports from employee evaluation data.
 """
 
+import hashlib
+import html
 import os
 import json
 import shutil
 from collections import defaultdict, Counter
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 # Removed parser import - functions moved to this module
+from .asset_sync import sync_directory
 from .config import Config
 from .header_mapper import CardGroup, CardType, header_mapper, ChartType
-from .employee import Employee
+from .employee import Employee, EmployeeManager
+from .image_manager import ImageManager, load_thumbnail_index
+from .search_index import SEARCH_INDEX_FILE, build_employee_search_index, search_index_script
+from .site_publish import SiteWriter
+from .utils import source_signature
+from .site_shards import (SHARDED_CARDS_SCRIPT, SHARDED_CARDS_STYLE, index_script_tag, remove_card_shards,
+                          write_card_shards)
 
 
 
@@ -38,40 +48,124 @@ def get_excluded_chart_fields() -> set:
     return excluded_fields
 
 
-def create_html_output_from_employees(employees: List[Employee], output_dir: str = None) -> str:
-    """Create HTML output from Employee objects directly."""
+def _file_stats(directory: str, names: Optional[List[str]] = None) -> List[Tuple[str, int, int]]:
+    """(name, size, mtime) of the given files of a directory (every file when names is None)."""
+    try:
+        names = sorted(os.listdir(directory)) if names is None else names
+    except OSError:
+        return []
+    stats = []
+    for name in names:
+        try:
+            stat = os.stat(os.path.join(directory, name))
+        except OSError:
+            continue
+        stats.append((name, stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def site_inputs_signature(employees: List[Employee], profile_images: List[str], sharded: bool,
+                          publish: bool) -> str:
+    """
+    Digest of everything a website build is made from.
+
+    Covers the employee records, the generator code (every module of this
+    package), the Config settings, the shown photos and their thumbnails,
+    the rating icons and the vendored Chart.js, so a code, template, photo
+    or configuration change rebuilds the site even when no response changed.
+    """
+    settings = sorted((name, repr(value)) for name, value in vars(Config).items() if name.isupper())
+    files = [
+        _file_stats(Config.get_image_target_path(), profile_images),
+        _file_stats(Config.get_thumbnail_dir_path(), [Config.THUMBNAIL_INDEX_FILE]),
+        _file_stats(os.path.join(Config.get_assets_dir_path(), "icons")),
+        _file_stats(os.path.dirname(Config.get_chart_js_vendor_path()),
+                    [os.path.basename(Config.get_chart_js_vendor_path())]),
+    ]
+    digest = hashlib.sha256(json.dumps([source_signature(), settings, files, sharded, publish]).encode('utf-8'))
+    for employee in employees:
+        digest.update(json.dumps(employee.to_dict(), sort_keys=True, ensure_ascii=False, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def create_html_output_from_employees(employees: List[Employee], output_dir: str = None, sharded: bool = None,
+                                      workers: int = None, publish: bool = None, delta=None) -> str:
+    """
+    Create HTML output from Employee objects directly.
+
+    Given the row delta of an incremental parse, the build is skipped when no
+    response changed and the site on disk was built from the same inputs
+    (see site_inputs_signature); otherwise the site is rebuilt and only files
+    whose content changed are rewritten.
+
+    Args:
+        employees: Employees to render
+        output_dir: Website output directory (defaults to Config.get_website_output_path())
+        sharded: Write cards as lazily loaded shards instead of inline (defaults to Config.WEBSITE_SHARDED)
+        workers: Processes rendering the cards (defaults to Config.WEBSITE_CARD_WORKERS, else
+            the CPU count); the output is the same for any count
+        publish: Minify, content-hash and precompress the output (defaults to Config.WEBSITE_PUBLISH)
+        delta: ParseDelta the employees were parsed with (None always builds)
+    """
     try:
         # Use config defaults if not provided
         if output_dir is None:
             output_dir = Config.get_website_output_path()
+        if sharded is None:
+            sharded = Config.WEBSITE_SHARDED
+        if workers is None:
+            workers = Config.WEBSITE_CARD_WORKERS or os.cpu_count() or 1
 
         print(f"[OK] Using {len(employees)} employee records from Employee objects")
+        if publish is None:
+            publish = Config.WEBSITE_PUBLISH
 
-        # Generate HTML directly from Employee objects
-        html_content = generate_html_template_from_employees(employees)
+        # Refresh the thumbnails of the photos the cards show (cached by image hash) before they reference them
+        profile_images = sorted({employee.profile_image_filename for employee in employees
+                                 if getattr(employee, 'profile_image_path', None)
+                                 and getattr(employee, 'profile_image_filename', None)})
+        ImageManager().generate_thumbnails(profile_images)
 
         # Create output directory
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
 
+        # Pages and assets go through the writer: unchanged files are left alone
+        writer = SiteWriter(output_path, publish, site_inputs_signature(employees, profile_images, sharded, publish))
+        if delta is not None:
+            if not delta.has_changes() and writer.is_current():
+                print("[INFO] No response, photo, code or setting changes - keeping existing website")
+                return str(output_path / "index.html")
+            print(f"[INFO] Rebuilding website ({delta.summary()})")
+        employee_manager = EmployeeManager()
+        search_index = build_employee_search_index(employees, employee_manager)
+        writer.asset(f"js/{SEARCH_INDEX_FILE}", search_index_script(search_index))
+
+        if sharded:
+            fragments = generate_employee_card_fragments(employees, employee_manager, workers=workers)
+            index = write_card_shards(output_path, search_index["names"], fragments, Config.WEBSITE_SHARD_SIZE,
+                                      writer.asset)
+            print(f"[OK] Wrote {index['count']} cards in {len(index['shards'])} shards")
+        else:
+            remove_card_shards(output_path)
+
+        # Generate HTML directly from Employee objects
+        html_content = generate_html_template_from_employees(employees, sharded=sharded, workers=workers)
+
         # Create subdirectories
-        (output_path / "css").mkdir(exist_ok=True)
-        (output_path / "js").mkdir(exist_ok=True)
         (output_path / "assets").mkdir(exist_ok=True)
         (output_path / "assets" / "images").mkdir(parents=True, exist_ok=True)
 
-        # Write main HTML file
-        with open(output_path / "index.html", 'w', encoding='utf-8') as f:
-            f.write(html_content)
-
-        # Write CSS file
-        with open(output_path / "css" / "styles.css", 'w', encoding='utf-8') as f:
-            f.write(get_css_styles())
-
-        # Note: JavaScript generation removed for simplified Employee object pipeline
+        writer.asset("css/styles.css", get_css_styles())
+        writer.vendor(Config.CHART_JS_URL, Config.get_chart_js_vendor_path(), "js/chart.umd.js",
+                      Config.CHART_JS_SHA256)
+        writer.page("index.html", html_content)
+        removed = writer.finish()
+        print(f"[OK] Website files: {writer.changed} written, {len(writer.written) - writer.changed} unchanged, "
+              f"{removed} removed")
 
         # Copy images to website assets
-        copy_images_to_website(output_path)
+        copy_images_to_website(output_path, profile_images)
 
         print(f"🌐 Website generated successfully!")
         print(f"   📁 Output directory: {output_path}")
@@ -84,13 +178,32 @@ def create_html_output_from_employees(employees: List[Employee], output_dir: str
         return ""
 
 
-def generate_html_template_from_employees(employees: List[Employee]) -> str:
-    """Generate HTML template from Employee objects, using mapped headers for grouping."""
+def generate_html_template_from_employees(employees: List[Employee], sharded: bool = False, workers: int = 1) -> str:
+    """
+    Generate HTML template from Employee objects, using mapped headers for grouping.
+
+    With sharded=True the cards are not inlined: the page loads data/cards-index.js
+    and renders the shards written by site_shards.write_card_shards() on scroll.
+    """
     # Generate employee cards
-    cards_html = generate_employee_cards(employees)
+    if sharded:
+        cards_html = ''
+        list_class = 'card-shards'
+        head_html = '\n    ' + index_script_tag() + SHARDED_CARDS_STYLE
+        list_script = SHARDED_CARDS_SCRIPT
+        employees_js = "window.__cardIndex.names.map(name => ({'Employee Name': name}))"
+    else:
+        cards_html = generate_employee_cards(employees, workers=workers)
+        list_class = 'employee-grid'
+        head_html = ''
+        list_script = ''
+        employees_js = json.dumps([employee.as_record() for employee in employees])
     
     # Generate analytics data
     analytics_html = generate_analytics_content(employees)
+    # Subresource integrity for the pinned Chart.js (the vendored copy has the same bytes)
+    chart_js_integrity = (f' integrity="{Config.CHART_JS_INTEGRITY}" crossorigin="anonymous"'
+                          if Config.CHART_JS_INTEGRITY else '')
 
     # HTML template with external CSS link
     html_template = '''<!DOCTYPE html>
@@ -100,7 +213,8 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Employee Evaluation Report</title>
     <link rel="stylesheet" href="css/styles.css">
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script src="''' + Config.CHART_JS_URL + '''"''' + chart_js_integrity + '''></script>
+    <script src="js/''' + SEARCH_INDEX_FILE + '''" defer></script>''' + head_html + '''
     <style>
         .modal-overlay { position: fixed; inset: 0; background: rgba(0,0,0,0.6); display: flex; align-items: center; justify-content: center; z-index: 10000; }
         .modal-overlay[hidden] { display: none; }
@@ -134,7 +248,7 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
         
         <!-- Search Container -->
         <div class="search-container">
-            <input type="text" class="search-box" placeholder="Search by employee name..." onkeyup="filterEmployees()">
+            <input type="text" class="search-box" placeholder="Search by employee name..." onkeyup="scheduleFilter()">
             <div class="search-icon">
                 <img src="https://img.icons8.com/?size=100&id=e4NkZ7kWAD7f&format=png&color=000000" alt="Search" style="width: 20px; height: 20px;">
             </div>
@@ -148,7 +262,7 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
         
         <!-- Tab Content -->
         <div id="detailed" class="tab-content active">
-            <div id="employee-list" class="employee-grid">
+            <div id="employee-list" class="''' + list_class + '''">
 ''' + cards_html + '''
             </div>
         </div>
@@ -177,10 +291,10 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
             <div class="modal-hint">Use ← and → keys or buttons to navigate</div>
         </div>
     </div>
-    
+    ''' + list_script + '''
     <script>
         // Employee data for charts and search
-        const employees = ''' + json.dumps([employee.__dict__ for employee in employees]) + ''';
+        const employees = ''' + employees_js + ''';
         
         // Modal enlarge-on-click handlers
         (function setupCardEnlarge() {
@@ -191,21 +305,29 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
             const nextBtn = overlay ? overlay.querySelector('#modalNext') : null;
             const listEl = document.getElementById('employee-list');
             function getCards() { return Array.from(listEl ? listEl.querySelectorAll('.employee-card') : []); }
+            // Sharded sites provide cards that may not be rendered yet; otherwise every card is in the DOM
+            const source = window.__cardSource || {
+                count: function() { return getCards().length; },
+                indexOf: function(card) { return getCards().indexOf(card); },
+                card: function(i) { return getCards()[i]; }
+            };
             let currentIndex = -1;
 
             function openAt(index) {
-                const cards = getCards();
-                if (!overlay || !modalBody || cards.length === 0) return;
-                const normalized = ((index % cards.length) + cards.length) % cards.length;
+                const count = source.count();
+                if (!overlay || !modalBody || count === 0) return;
+                const normalized = ((index % count) + count) % count;
                 currentIndex = normalized;
-                const card = cards[normalized];
-                modalBody.innerHTML = '';
-                const clone = card.cloneNode(true);
-                clone.style.transform = 'none';
-                clone.style.cursor = 'default';
-                modalBody.appendChild(clone);
-                overlay.hidden = false;
-                document.body.style.overflow = 'hidden';
+                return Promise.resolve(source.card(normalized)).then(function(card) {
+                    if (!card || currentIndex !== normalized) return;
+                    modalBody.innerHTML = '';
+                    const clone = card.cloneNode(true);
+                    clone.style.transform = 'none';
+                    clone.style.cursor = 'default';
+                    modalBody.appendChild(clone);
+                    overlay.hidden = false;
+                    document.body.style.overflow = 'hidden';
+                });
             }
 
             function closeOverlay() {
@@ -218,9 +340,8 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
 
             document.addEventListener('click', function(e){
                 const card = e.target.closest && e.target.closest('.employee-card');
-                const cards = getCards();
                 if (card && listEl && listEl.contains(card)) {
-                    const idx = cards.indexOf(card);
+                    const idx = source.indexOf(card);
                     if (idx !== -1) openAt(idx);
                 }
             });
@@ -248,7 +369,7 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
             // Expose for automation/export
             window.__openModalAt = openAt;
             window.__closeModal = closeOverlay;
-            window.__employeeCount = function(){ return getCards().length; };
+            window.__employeeCount = function(){ return source.count(); };
         })();
 
         // Fuzzy search function with scoring
@@ -326,10 +447,11 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
             
             const suggestions = [];
             const searchLower = searchTerm.toLowerCase();
+            const index = window.__searchIndex;
+            const names = index ? index.names : employees.map(employee => employee['Employee Name'] || employee['Employee Name Alt'] || 'Unknown');
             
-            employees.forEach(employee => {
-                const name = employee['Employee Name'] || employee['Employee Name Alt'] || 'Unknown';
-                const nameLower = name.toLowerCase();
+            names.forEach((name, i) => {
+                const nameLower = index ? index.norm[i] : name.toLowerCase();
                 
                 // Direct substring match
                 if (nameLower.includes(searchLower)) {
@@ -386,12 +508,119 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
                 .slice(0, 5);
         }
 
+        // Prebuilt search index (js/search-index.js): the same matches as fuzzyMatch, answered from postings
+        const SEARCH_DEBOUNCE_MS = 150;
+        let searchTimer = null;
+        let searchPrepared = false;
+
+        function prepareSearchIndex(index) {
+            if (searchPrepared) return;
+            index.compact = index.norm.map(name => name.replace(/\\s+/g, ''));
+            index.wordList = Object.keys(index.words);
+            Object.keys(index.facets).forEach(facet => {
+                index.facets[facet].lower = index.facets[facet].values.map(value => value.toLowerCase());
+            });
+            searchPrepared = true;
+        }
+
+        // fuzzyMatch's rule for one search word against one word of a name
+        function wordMatches(searchWord, targetWord) {
+            if (targetWord.includes(searchWord)) return true;
+            if (searchWord.length > 2 && targetWord.includes(searchWord.substring(0, Math.max(2, searchWord.length - 1)))) return true;
+            const variations = [
+                searchWord.replace(/y$/, 'i'),
+                searchWord.replace(/i$/, 'y'),
+                searchWord.replace(/s$/, ''),
+                searchWord + 's',
+            ];
+            return variations.some(variation => targetWord.includes(variation) || variation.includes(targetWord));
+        }
+
+        function intersect(a, b) {
+            const out = new Set();
+            a.forEach(id => { if (b.has(id)) out.add(id); });
+            return out;
+        }
+
+        // Employee ids whose name fuzzy-matches searchTerm
+        function matchNames(index, searchTerm) {
+            const matches = new Set();
+            const compact = searchTerm.toLowerCase().replace(/\\s+/g, '');
+            // Whole name contains the search: verify the candidates sharing every trigram
+            if (compact.length >= 3) {
+                let candidates = null;
+                for (let i = 0; i + 3 <= compact.length && (!candidates || candidates.size); i++) {
+                    const posting = new Set(index.trigrams[compact.substring(i, i + 3)] || []);
+                    candidates = candidates ? intersect(candidates, posting) : posting;
+                }
+                candidates.forEach(id => { if (index.compact[id].includes(compact)) matches.add(id); });
+            } else {
+                index.compact.forEach((name, id) => { if (name.includes(compact)) matches.add(id); });
+            }
+            // Every search word matches a word of the name: rules are checked per distinct word
+            let common = null;
+            for (const searchWord of searchTerm.toLowerCase().split(/\\s+/)) {
+                const ids = new Set();
+                index.wordList.forEach(word => {
+                    if (wordMatches(searchWord, word)) index.words[word].forEach(id => ids.add(id));
+                });
+                common = common ? intersect(common, ids) : ids;
+                if (!common.size) break;
+            }
+            common.forEach(id => matches.add(id));
+            return matches;
+        }
+
+        // Employee ids matching the search box, or null for everyone; "role:", "title:" and "email:" filter by facet
+        function searchIndexMatches(index, searchTerm) {
+            prepareSearchIndex(index);
+            const facetFilters = [];
+            const nameTerm = searchTerm.replace(/\\b(role|title|email):(\\S+)/gi, function(_m, facet, value) {
+                facetFilters.push([facet.toLowerCase(), value.toLowerCase()]);
+                return ' ';
+            });
+            const term = facetFilters.length ? nameTerm.trim() : searchTerm;
+            let matches = term ? matchNames(index, term) : null;
+            facetFilters.forEach(function([facet, value]) {
+                const data = index.facets[facet];
+                const ids = new Set();
+                if (data) data.ids.forEach((valueId, id) => { if (valueId !== -1 && data.lower[valueId].includes(value)) ids.add(id); });
+                matches = matches ? intersect(matches, ids) : ids;
+            });
+            return matches;
+        }
+
+        // Show exactly the matching cards in one pass, touching only cards whose visibility changes
+        let searchCards = null;
+        let searchShown = null;
+        function showMatches(matches) {
+            if (window.__cardSource) return window.__cardSource.filter(matches ? i => matches.has(i) : null);
+            if (!searchCards) {
+                searchCards = Array.from(document.querySelectorAll('#employee-list .employee-card'));
+                searchShown = searchCards.map(card => card.style.display !== 'none');
+            }
+            let visibleCount = 0;
+            searchCards.forEach((card, i) => {
+                const show = !matches || matches.has(i);
+                if (show !== searchShown[i]) {
+                    card.style.display = show ? 'block' : 'none';
+                    searchShown[i] = show;
+                }
+                if (show) visibleCount++;
+            });
+            return visibleCount;
+        }
+
+        function scheduleFilter() {
+            clearTimeout(searchTimer);
+            searchTimer = setTimeout(filterEmployees, SEARCH_DEBOUNCE_MS);
+        }
+
         // Search functionality
         function filterEmployees() {
             const searchBox = document.querySelector('.search-box');
             const searchIcon = document.querySelector('.search-icon');
             const searchTerm = searchBox.value;
-            const employeeCards = document.querySelectorAll('.employee-card');
             
             // Show/hide search icon based on input content
             const searchIconImg = searchIcon.querySelector('img');
@@ -409,17 +638,25 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
                 }
             }
             
+            clearTimeout(searchTimer);
             let visibleCount = 0;
-            employeeCards.forEach(card => {
-                const name = card.querySelector('.employee-name').textContent;
-                const fuzzyResult = fuzzyMatch(searchTerm, name);
-                if (fuzzyResult.match) {
-                    card.style.display = 'block';
-                    visibleCount++;
-                } else {
-                    card.style.display = 'none';
-                }
-            });
+            if (window.__searchIndex) {
+                visibleCount = showMatches(searchIndexMatches(window.__searchIndex, searchTerm));
+            } else if (window.__cardSource) {
+                // Sharded cards are matched by name from the card index, rendered or not
+                visibleCount = window.__cardSource.filter(searchTerm ? (i, name) => fuzzyMatch(searchTerm, name).match : null);
+            } else {
+                document.querySelectorAll('.employee-card').forEach(card => {
+                    const name = card.querySelector('.employee-name').textContent;
+                    const fuzzyResult = fuzzyMatch(searchTerm, name);
+                    if (fuzzyResult.match) {
+                        card.style.display = 'block';
+                        visibleCount++;
+                    } else {
+                        card.style.display = 'none';
+                    }
+                });
+            }
             
             // Show suggestions or no results message
             let noResults = document.getElementById('no-results');
@@ -519,6 +756,9 @@ def generate_html_template_from_employees(employees: List[Employee]) -> str:
             // Initialize charts if summary tab is selected
             if (tabName === 'summary') {
                 setTimeout(initializeCharts, 100);
+                if (typeof initializeCohortCharts === 'function') {
+                    setTimeout(initializeCohortCharts, 100);
+                }
             }
         }
         
@@ -570,63 +810,16 @@ def generate_analytics_content(employees: List[Employee]) -> str:
     """Generate analytics content with charts."""
     # Generate charts HTML
     charts_html = generate_charts_for_employees(employees)
+    charts_html += generate_cohort_charts(employees)
     
     return charts_html
 
 
 def calculate_performance_stats(employees: List[Employee]) -> Dict[str, Any]:
     """Calculate performance statistics from employee data."""
-    total_employees = len(employees)
-    high_performers = 0
-    needs_improvement = 0
-    total_rating = 0
-    rating_count = 0
-    
-    for employee in employees:
-        # Get overall performance rating from employee attributes
-        overall_rating = None
-        
-        # Look for overall performance rating attribute
-        for attr_name in dir(employee):
-            if 'overall' in attr_name.lower() and 'performance' in attr_name.lower() and 'rating' in attr_name.lower():
-                rating_value = getattr(employee, attr_name, None)
-                if rating_value and isinstance(rating_value, (int, float)):
-                    overall_rating = int(rating_value)
-                    break
-        
-        # If not found, try to calculate from individual ratings
-        if overall_rating is None:
-            rating_sum = 0
-            rating_count_individual = 0
-            
-            # Look for rating attributes
-            for attr_name in dir(employee):
-                if 'rating' in attr_name.lower() and not 'comment' in attr_name.lower():
-                    rating_value = getattr(employee, attr_name, None)
-                    if rating_value and isinstance(rating_value, (int, float)):
-                        rating_sum += int(rating_value)
-                        rating_count_individual += 1
-            
-            if rating_count_individual > 0:
-                overall_rating = round(rating_sum / rating_count_individual)
-        
-        if overall_rating:
-            total_rating += overall_rating
-            rating_count += 1
-            
-            if overall_rating >= 4:
-                high_performers += 1
-            elif overall_rating <= 2:
-                needs_improvement += 1
-    
-    average_rating = total_rating / rating_count if rating_count > 0 else 0
-    
-    return {
-        'total_employees': total_employees,
-        'average_rating': average_rating,
-        'high_performers': high_performers,
-        'needs_improvement': needs_improvement
-    }
+    from .analytics import performance_stats
+
+    return performance_stats(employees)
 
 
 def generate_charts_for_employees(employees: List[Employee]) -> str:
@@ -781,113 +974,147 @@ def generate_charts_for_employees(employees: List[Employee]) -> str:
     """
 
 
-def calculate_chart_data(employees: List[Employee]) -> Dict[str, Any]:
-    """Calculate chart data from employee data using ChartType information."""
-    from .header_mapper import header_mapper, ChartType, CardType
-    
-    chart_data = {}
-    field_types = {}  # Store field type information
-    
-    # Get all header mappings that should be shown in charts
-    chart_fields = []
-    for mapping_list in header_mapper.header_mappings_by_name.values():
-        for mapping in mapping_list:
-            if mapping.data_type_in_chart == ChartType.DONUT:
-                chart_fields.append(mapping)
-    
-    # Separate rating fields from other fields for proper ordering
-    rating_fields = []
-    other_fields = []
-    
-    for mapping in chart_fields:
-        field_name = mapping.mapped_header.lower()
-        # Check if this is a rating-related field
-        if any(rating_term in field_name for rating_term in ['rating', 'performance']):
-            rating_fields.append(mapping)
-        else:
-            other_fields.append(mapping)
-    
-    # Sort rating fields by a specific order to ensure consistent placement
-    rating_field_order = [
-        'communication_rating',
-        'collaboration_rating', 
-        'professionalism_rating',
-        'technical_knowledge_expertise_rating',
-        'workflow_implementation_management_execution_rating',
-        'overall_performance_rating'
-    ]
-    
-    def get_rating_field_priority(mapping):
-        field_name_lower = mapping.mapped_header.lower().replace(' ', '_').replace('&', '').replace(',', '').replace('/', '_')
-        try:
-            return rating_field_order.index(field_name_lower)
-        except ValueError:
-            return len(rating_field_order)  # Put unknown rating fields at the end
-    
-    rating_fields.sort(key=get_rating_field_priority)
-    
-    # Combine ordered fields: rating fields first, then other fields
-    ordered_fields = rating_fields + other_fields
-    
-    # Calculate data for each chart field in the specified order
-    for mapping in ordered_fields:
-        field_name = mapping.mapped_header
-        field_data = {}
-        
-        # Store field type information
-        field_types[field_name] = mapping.data_type_in_card.value
+def generate_cohort_charts(employees: List[Employee]) -> str:
+    """
+    Generate the cohort section of the Summary tab: ratings by role and title as a
+    stacked bar chart, and software proficiency by role as a heatmap.
+
+    The page only renders the JSON precomputed by analytics.cohort_analytics().
+    """
+    from .analytics import cohort_analytics
+
+    cohort_data = cohort_analytics(employees)
+    if not cohort_data['cohorts']:
+        return ""
+
+    group_options = "".join(f'<option value="{html.escape(field)}">{html.escape(field)}</option>'
+                            for field in cohort_data['cohorts'])
+    rating_options = "".join(f'<option value="{html.escape(field)}">{html.escape(field)}</option>'
+                             for field in cohort_data['ratings'])
+    # A "</script>" inside a label must not end the script element
+    cohort_json = json.dumps(cohort_data).replace('</', '<\\/')
+
+    return f"""
+        <div class="chart-divider">
+            <hr class="divider-line">
+            <h2 class="section-title">Ratings by Role & Title</h2>
+            <hr class="divider-line">
+        </div>
+        <div class="chart cohort-chart">
+            <div class="cohort-controls">
+                <label>Group by <select id="cohort-group" onchange="renderCohortChart()">{group_options}</select></label>
+                <label>Rating <select id="cohort-rating" onchange="renderCohortChart()">{rating_options}</select></label>
+            </div>
+            <div id="cohort-chart-box" style="position: relative; height: 400px;">
+                <canvas id="cohort-chart"></canvas>
+            </div>
+        </div>
+        <div class="chart-divider">
+            <hr class="divider-line">
+            <h2 class="section-title">Software Proficiency by Role</h2>
+            <hr class="divider-line">
+        </div>
+        <div class="chart cohort-chart">
+            <div id="software-heatmap" class="heatmap"></div>
+        </div>
         
-        for employee in employees:
-            # Get the value for this field from the employee
-            field_value = getattr(employee, field_name, None)
+        <script>
+            // Crosstabs, means and percentiles precomputed by the generator
+            const cohortData = {cohort_json};
+            const cohortColors = ['rgba(15, 20, 25, 0.8)', 'rgba(74, 74, 74, 0.8)', 'rgba(224, 232, 231, 0.9)',
+                                  'rgba(58, 175, 169, 0.8)', 'rgba(43, 122, 120, 0.8)', 'rgba(26, 90, 88, 0.8)'];
+            let cohortChart = null;
             
-            if field_value is not None:
-                # Convert to string for consistent grouping
-                if isinstance(field_value, (int, float)):
-                    # Check if this is a rating field (rating_num type)
-                    if mapping.data_type_in_card.value == 'rating_num':
-                        # Map numeric ratings to descriptive labels
-                        if field_value == 1:
-                            value_key = "Very Unsatisfied"
-                        elif field_value == 2:
-                            value_key = "Unsatisfied"
-                        elif field_value == 3:
-                            value_key = "Neutral"
-                        elif field_value == 4:
-                            value_key = "Satisfied"
-                        elif field_value == 5:
-                            value_key = "Very Satisfied"
-                        else:
-                            value_key = str(field_value)
-                    else:
-                        # For non-rating numeric fields, use descriptive labels
-                        if field_value == 0:
-                            value_key = "0 (Not Applicable)"
-                        elif field_value == 1:
-                            value_key = "1 (Unsatisfactory)"
-                        elif field_value == 2:
-                            value_key = "2 (Needs to Improve)"
-                        elif field_value == 3:
-                            value_key = "3 (Meets Expectations)"
-                        elif field_value == 4:
-                            value_key = "4 (Exceeds Expectations)"
-                        elif field_value == 5:
-                            value_key = "5 (Exceptional)"
-                        else:
-                            value_key = str(field_value)
-                else:
-                    value_key = str(field_value)
+            function renderCohortChart() {{
+                const cohort = cohortData.cohorts[document.getElementById('cohort-group').value];
+                const field = document.getElementById('cohort-rating').value;
+                const table = cohort.ratings[field];
+                const stats = cohort.stats[field];
+                const box = document.getElementById('cohort-chart-box');
+                box.style.height = Math.max(300, table.groups.length * 32 + 100) + 'px';
                 
-                field_data[value_key] = field_data.get(value_key, 0) + 1
-        
-        if field_data:  # Only add if there's data
-            chart_data[field_name] = field_data
-    
-    # Add field types to the returned data
-    return {
-        'data': chart_data,
-        'field_types': field_types
-    }
+                if (cohortChart) {{
+                    cohortChart.destroy();
+                }}
+                cohortChart = new Chart(document.getElementById('cohort-chart'), {{
+                    type: 'bar',
+                    data: {{
+                        labels: table.groups,
+                        datasets: table.values.map((value, v) => ({{
+                            label: value,
+                            data: table.counts.map(row => row[v]),
+                            backgroundColor: cohortColors[v % cohortColors.length]
+                        }}))
+                    }},
+                    options: {{
+                        indexAxis: 'y',
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        scales: {{
+                            x: {{ stacked: true, beginAtZero: true, ticks: {{ precision: 0 }} }},
+                            y: {{ stacked: true }}
+                        }},
+                        plugins: {{
+                            legend: {{ position: 'bottom', labels: {{ usePointStyle: true, font: {{ family: 'Inter', size: 12 }} }} }},
+                            tooltip: {{
+                                callbacks: {{
+                                    footer: items => {{
+                                        const g = items[0].dataIndex;
+                                        if (stats.mean[g] === null) return '';
+                                        return 'Mean ' + stats.mean[g] + ', median ' + stats.percentiles.p50[g] +
+                                            ' (IQR ' + stats.percentiles.p25[g] + '-' + stats.percentiles.p75[g] +
+                                            ', n=' + stats.count[g] + ')';
+                                    }}
+                                }}
+                            }}
+                        }}
+                    }}
+                }});
+            }}
+            
+            function renderSoftwareHeatmap() {{
+                const software = cohortData.software;
+                const container = document.getElementById('software-heatmap');
+                const table = document.createElement('table');
+                const header = table.insertRow();
+                header.appendChild(document.createElement('th'));
+                software.tools.forEach(tool => {{
+                    const th = document.createElement('th');
+                    th.textContent = tool;
+                    header.appendChild(th);
+                }});
+                software.groups.forEach((group, g) => {{
+                    const row = table.insertRow();
+                    const th = document.createElement('th');
+                    th.textContent = group;
+                    row.appendChild(th);
+                    software.mean[g].forEach((mean, t) => {{
+                        const cell = row.insertCell();
+                        if (mean === null) return;
+                        // Proficiency 1-5 mapped onto the accent colour's opacity
+                        const alpha = Math.min(1, Math.max(0.08, (mean - 1) / 4));
+                        cell.textContent = mean.toFixed(1);
+                        cell.style.background = 'rgba(43, 122, 120, ' + alpha + ')';
+                        cell.style.color = alpha > 0.55 ? 'white' : '#0F1419';
+                        cell.title = group + ' / ' + software.tools[t] + ': mean ' + mean + ' (n=' + software.count[g][t] + ')';
+                    }});
+                }});
+                container.replaceChildren(table);
+            }}
+            
+            function initializeCohortCharts() {{
+                renderCohortChart();
+                renderSoftwareHeatmap();
+            }}
+        </script>
+    """
+
+
+def calculate_chart_data(employees: List[Employee]) -> Dict[str, Any]:
+    """Calculate chart data from employee data using ChartType information."""
+    from .analytics import chart_data
+
+    return chart_data(employees)
 
 
 def convert_to_flat_structure(employees: List[Dict[str, Any]]) -> List[Dict[str, str]]:
@@ -1032,19 +1259,22 @@ def prepare_progression_chart_data(employees: List[Dict[str, str]]) -> Dict[str,
     return {}
 
 
-def copy_images_to_website(output_path: Path):
-    """Copy images and icons to website assets directory."""
-    import shutil
-    
+def copy_images_to_website(output_path: Path, profile_images: Optional[List[str]] = None):
+    """
+    Copy images and icons to website assets directory (only new or changed files).
+
+    Args:
+        output_path: Website output directory
+        profile_images: Photos shown on the cards; only their thumbnails are
+            published (defaults to every thumbnail in the index)
+    """
     # Copy profile images
     source_images_dir = Path(Config.get_image_target_path())
     target_images_dir = output_path / "assets" / "images"
     
     if source_images_dir.exists():
-        for image_file in source_images_dir.iterdir():
-            if image_file.is_file():
-                shutil.copy2(image_file, target_images_dir / image_file.name)
-        print(f"[INFO] Copied images to {target_images_dir}")
+        result = sync_directory(str(source_images_dir), str(target_images_dir))
+        print(f"[INFO] Synced images to {target_images_dir} ({result.summary()})")
     
     # Copy rating icons
     source_icons_dir = Path(os.path.join("assets", "icons"))
@@ -1052,10 +1282,30 @@ def copy_images_to_website(output_path: Path):
     target_icons_dir.mkdir(parents=True, exist_ok=True)
     
     if source_icons_dir.exists():
-        for icon_file in source_icons_dir.iterdir():
-            if icon_file.is_file():
-                shutil.copy2(icon_file, target_icons_dir / icon_file.name)
-        print(f"🎯 Copied rating icons to {target_icons_dir}")
+        result = sync_directory(str(source_icons_dir), str(target_icons_dir))
+        print(f"🎯 Synced rating icons to {target_icons_dir} ({result.summary()})")
+
+    # Copy profile photo thumbnails
+    source_thumbs_dir = Path(Config.get_thumbnail_dir_path())
+    target_thumbs_dir = output_path / Config.THUMBNAIL_DIR
+
+    if source_thumbs_dir.exists():
+        index = load_thumbnail_index(str(source_thumbs_dir))
+        names = index if profile_images is None else profile_images
+        wanted = {filename for name in names for by_format in index.get(name, {}).get('variants', {}).values()
+                  for filename in by_format.values()}
+        result = sync_directory(str(source_thumbs_dir), str(target_thumbs_dir), files=sorted(wanted))
+        # The site's thumbnail folder only ever holds copies; drop those no card shows anymore
+        removed = 0
+        if target_thumbs_dir.is_dir():
+            for stale in target_thumbs_dir.iterdir():
+                if stale.is_file() and stale.name not in wanted:
+                    try:
+                        stale.unlink()
+                        removed += 1
+                    except OSError:
+                        pass
+        print(f"[INFO] Synced thumbnails to {target_thumbs_dir} ({result.summary()}, {removed} removed)")
 
 
 
@@ -1617,6 +1867,52 @@ def get_css_styles() -> str:
             font-weight: 500;
         }
         
+        .cohort-chart {
+            grid-column: 1 / -1;
+        }
+        
+        .cohort-controls {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 16px;
+            margin-bottom: 20px;
+            font-size: 0.875rem;
+            color: #4A4A4A;
+        }
+        
+        .cohort-controls select {
+            margin-left: 8px;
+            max-width: 320px;
+            padding: 6px 10px;
+            border: 1px solid #E0E8E7;
+            border-radius: 6px;
+            font-family: inherit;
+        }
+        
+        .heatmap {
+            overflow-x: auto;
+        }
+        
+        .heatmap table {
+            border-collapse: collapse;
+            font-size: 0.8125rem;
+        }
+        
+        .heatmap th {
+            font-weight: 500;
+            color: #1A5A58;
+            padding: 6px 8px;
+            text-align: left;
+            white-space: nowrap;
+        }
+        
+        .heatmap td {
+            min-width: 56px;
+            padding: 6px 8px;
+            text-align: center;
+            border: 1px solid white;
+        }
+        
         .no-results {
             text-align: center;
             color: #4A4A4A;
@@ -1823,192 +2119,105 @@ def generate_footer() -> str:
 
 
 
-def generate_employee_cards(employees) -> str:
+def _profile_image_html(image_path: str, image_filename: str, alt: str,
+                        thumbnails: Dict[str, Dict[str, Any]]) -> str:
+    """Build a card's profile <img>, served from pre-sized thumbnails when they exist."""
+    entry = thumbnails.get(image_filename)
+    if not entry:
+        return f'<img src="{image_path}" alt="{alt}" class="profile-image">'
+
+    thumb_base = Path(Config.THUMBNAIL_DIR).as_posix()
+    variants = sorted(entry['variants'].items(), key=lambda item: int(item[0]))
+
+    def srcset(fmt: str) -> str:
+        return ", ".join(f"{thumb_base}/{by_format[fmt]} {size}w" for size, by_format in variants if fmt in by_format)
+
+    display_px = Config.CARD_IMAGE_DISPLAY_PX
+    sizes = f"{display_px}px"
+    jpeg_srcset = srcset("jpeg")
+    if jpeg_srcset:
+        # Smallest JPEG that covers the rendered size is the fallback src
+        fallback = next((by_format["jpeg"] for size, by_format in variants
+                         if int(size) >= display_px and "jpeg" in by_format),
+                        [by_format["jpeg"] for _, by_format in variants if "jpeg" in by_format][-1])
+        img = (f'<img src="{thumb_base}/{fallback}" srcset="{jpeg_srcset}" sizes="{sizes}" '
+               f'width="{display_px}" height="{display_px}" loading="lazy" decoding="async" '
+               f'alt="{alt}" class="profile-image">')
+    else:
+        img = (f'<img src="{image_path}" width="{display_px}" height="{display_px}" loading="lazy" '
+               f'decoding="async" alt="{alt}" class="profile-image">')
+    webp_srcset = srcset("webp")
+    if not webp_srcset:
+        return img
+    return f'<picture><source type="image/webp" srcset="{webp_srcset}" sizes="{sizes}">{img}</picture>'
+
+
+def generate_employee_cards(employees, employee_manager: EmployeeManager = None,
+                            thumbnails: Dict[str, Dict[str, Any]] = None, workers: int = 1) -> str:
     """Generate HTML for employee cards from Employee objects, using mapped headers dynamically."""
-    cards_html = ""
+    parts = []
+    offset = 0
+    for body in render_card_bodies(employees, employee_manager, thumbnails, workers):
+        # data-employee-index has always been the length of the preceding markup; kept for stable output
+        card = _CARD_START + str(offset) + body
+        parts.append(card)
+        offset += len(card)
 
-    for employee in employees:
-        # Check if employee is a dict or an Employee object
-        is_dict = isinstance(employee, dict)
+    return "".join(parts)
 
-        # Get basic info dynamically by finding mapped header attributes
-        employee_name = 'Unknown'
-        date_of_evaluation = ''
 
-        if is_dict:
-            # Handle dict objects
-            for key, value in employee.items():
-                if value:
-                    if "name" in key.lower():
-                        employee_name = str(value)
-                        break
-
-            for key, value in employee.items():
-                if value and "date" in key.lower() and "evaluation" in key.lower():
-                    date_of_evaluation = str(value)
-                    break
+def generate_employee_card_fragments(employees, employee_manager: EmployeeManager = None,
+                                     thumbnails: Dict[str, Dict[str, Any]] = None, workers: int = 1) -> List[str]:
+    """Generate one card's HTML per employee, with data-employee-index set to its position."""
+    bodies = render_card_bodies(employees, employee_manager, thumbnails, workers)
+    return [_CARD_START + str(index) + body for index, body in enumerate(bodies)]
 
-            # Default profile image for dict objects
-            profile_image_html = f'<img src="assets/images/DEFAULT_PROFILE.jpg" alt="{employee_name}" class="profile-image">'
-        else:
-            # Handle Employee objects
-            # Find employee name from any field containing "name"
-            for attr_name in dir(employee):
-                if not attr_name.startswith('_'):
-                    attr_value = getattr(employee, attr_name)
-                    if not callable(attr_value) and attr_value:
-                        if "name" in attr_name.lower():
-                            employee_name = str(attr_value)
-                            break
-
-            # Find date of evaluation
-            for attr_name in dir(employee):
-                if not attr_name.startswith('_'):
-                    attr_value = getattr(employee, attr_name)
-                    if not callable(attr_value) and attr_value:
-                        if "date" in attr_name.lower() and "evaluation" in attr_name.lower():
-                            # Format date to YYYY-MM-DD
-                            try:
-                                from datetime import datetime
-                                if isinstance(attr_value, str):
-                                    # Try parsing common date formats
-                                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-                                        try:
-                                            dt = datetime.strptime(attr_value, fmt)
-                                            date_of_evaluation = dt.strftime('%Y-%m-%d')
-                                            break
-                                        except ValueError:
-                                            continue
-                                elif hasattr(attr_value, 'strftime'):
-                                    date_of_evaluation = attr_value.strftime('%Y-%m-%d')
-                                else:
-                                    date_of_evaluation = str(attr_value)
-                            except:
-                                date_of_evaluation = str(attr_value)
-                            break
-
-            # Profile Image - check if employee has profile image
-            profile_image_html = ""
-            profile_image_filename = None
-            profile_image_path = None
 
-            # Look for profile image attributes
-            for attr_name in dir(employee):
-                if not attr_name.startswith('_'):
-                    attr_value = getattr(employee, attr_name)
-                    if not callable(attr_value):
-                        if "profile_image_filename" in attr_name:
-                            profile_image_filename = attr_value
-                        elif "profile_image_path" in attr_name:
-                            profile_image_path = attr_value
+# Card renderer of a pool worker process (set by _init_card_worker)
+_worker_renderer: Optional["CardRenderer"] = None
 
-            if profile_image_filename and profile_image_path:
-                profile_image_html = f'<img src="{profile_image_path}" alt="{employee_name}" class="profile-image">'
-            else:
-                profile_image_html = f'<img src="assets/images/DEFAULT_PROFILE.jpg" alt="{employee_name}" class="profile-image">'
 
-        # Group fields by their card group dynamically
-        grouped_fields = {}
+def _init_card_worker(renderer: "CardRenderer") -> None:
+    global _worker_renderer
+    _worker_renderer = renderer
 
-        # Create reverse mapping from mapped_header to HeaderMapping
-        reverse_mapping = {}
-        for original_header, mapping_list in header_mapper.header_mappings_by_name.items():
-            for mapping in mapping_list:
-                reverse_mapping[mapping.mapped_header] = mapping
 
-        # Process all employee attributes dynamically
-        if is_dict:
-            # Handle dict objects
-            for key, value in employee.items():
-                if key in reverse_mapping:
-                    mapping = reverse_mapping[key]
-                    if mapping.data_type_in_card != CardType.NOSHOW:
-                        group = mapping.group_under
-                        if group not in grouped_fields:
-                            grouped_fields[group] = []
-                        # Format date fields to YYYY-MM-DD
-                        formatted_value = str(value) if value else ''
-                        if mapping.data_type_in_card == CardType.TEXT and ('date' in mapping.mapped_header.lower() or 'evaluation' in mapping.mapped_header.lower()) and value:
-                            try:
-                                from datetime import datetime
-                                if isinstance(value, str):
-                                    # Try parsing common date formats
-                                    for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-                                        try:
-                                            dt = datetime.strptime(value, fmt)
-                                            formatted_value = dt.strftime('%Y-%m-%d')
-                                            break
-                                        except ValueError:
-                                            continue
-                                elif hasattr(value, 'strftime'):
-                                    formatted_value = value.strftime('%Y-%m-%d')
-                            except:
-                                formatted_value = str(value)
-                        grouped_fields[group].append((mapping, formatted_value))
-        else:
-            # Handle Employee objects
-            for attr_name in dir(employee):
-                if not attr_name.startswith('_'):  # Skip private attributes
-                    attr_value = getattr(employee, attr_name)
-                    if not callable(attr_value):  # Skip methods
-
-                        # Check if this attribute has a header mapping using reverse mapping
-                        if attr_name in reverse_mapping:
-                            mapping = reverse_mapping[attr_name]
-
-                            # Only include fields that should be shown in cards
-                            if mapping.data_type_in_card != CardType.NOSHOW:
-                                group = mapping.group_under
-                                if group not in grouped_fields:
-                                    grouped_fields[group] = []
-                                # Format date fields to YYYY-MM-DD
-                                formatted_value = str(attr_value) if attr_value else ''
-                                if mapping.data_type_in_card == CardType.TEXT and ('date' in mapping.mapped_header.lower() or 'evaluation' in mapping.mapped_header.lower()) and attr_value:
-                                    try:
-                                        from datetime import datetime
-                                        if isinstance(attr_value, str):
-                                            # Try parsing common date formats
-                                            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-                                                try:
-                                                    dt = datetime.strptime(attr_value, fmt)
-                                                    formatted_value = dt.strftime('%Y-%m-%d')
-                                                    break
-                                                except ValueError:
-                                                    continue
-                                        elif hasattr(attr_value, 'strftime'):
-                                            formatted_value = attr_value.strftime('%Y-%m-%d')
-                                    except Exception as e:
-                                        formatted_value = str(attr_value)
-                                grouped_fields[group].append((mapping, formatted_value))
-                            # Skip NOSHOW fields
-                        # Skip attributes without mappings
-
-        # Generate HTML for each group in order
-        grouped_fields_html = ""
-        for group in header_mapper.card_group_order:
-            if group in grouped_fields and grouped_fields[group]:
-                # Sort by display order
-                group_fields = sorted(grouped_fields[group], key=lambda x: x[0].display_order)
-                group_html = generate_field_group_html_from_employee_data(group, group_fields)
-                grouped_fields_html += group_html
-
-        card_html = f"""
-        <div class="employee-card" data-employee-index="{len(cards_html)}" role="button" tabindex="0">
-            <div class="employee-header">
-                {profile_image_html}
-                <div class="employee-info">
-                    <div class="employee-name">{employee_name}</div>
-                    <div class="employee-time">{date_of_evaluation}</div>
-                </div>
-            </div>
-            <div class="fields-container">
-                {grouped_fields_html}
-            </div>
-        </div>
-        """
-        cards_html += card_html
+def _render_card_chunk(inputs: List[Tuple[Dict[str, Any], bool]]) -> List[str]:
+    return [_worker_renderer.render_body(record, is_dict) for record, is_dict in inputs]
+
+
+def render_card_bodies(employees, employee_manager: EmployeeManager = None,
+                       thumbnails: Dict[str, Dict[str, Any]] = None, workers: int = 1) -> List[str]:
+    """
+    Render every card after its data-employee-index value, in employee order.
 
-    return cards_html
+    Args:
+        employees: Employee objects, EmployeeStore rows or employee data dictionaries
+        employee_manager: Resolves employee names (defaults to a new EmployeeManager)
+        thumbnails: Profile photo thumbnail index (defaults to load_thumbnail_index())
+        workers: Processes rendering cards; each gets the compiled CardRenderer once and
+            then chunks of (record, is_dict) pairs. The result is the same for any count.
+
+    Returns:
+        Card markup following _CARD_START + index, one per employee
+    """
+    renderer = CardRenderer(employee_manager, thumbnails)
+    inputs = [card_input(employee) for employee in employees]
+    # Small sites stay in one process: never start more workers than full chunks
+    chunk_size = max(1, Config.WEBSITE_CARD_CHUNK_SIZE)
+    chunks = [inputs[i:i + chunk_size] for i in range(0, len(inputs), chunk_size)]
+    workers = min(workers or 1, len(chunks))
+    if workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_card_worker,
+                                     initargs=(renderer,)) as pool:
+                bodies = []
+                for chunk_bodies in pool.map(_render_card_chunk, chunks):
+                    bodies.extend(chunk_bodies)
+                return bodies
+        except Exception as e:
+            print(f"[WARN] Card render workers failed ({e}); rendering in this process")
+    return [renderer.render_body(record, is_dict) for record, is_dict in inputs]
 
 
 def generate_field_group_html_from_employee_data(group: CardGroup, field_data: List) -> str:
@@ -2130,6 +2339,210 @@ def generate_text_field_html(display_label: str, field_value: str) -> str:
     return f'<div class="field text-field"><div class="field-label">{display_label}</div><div class="field-value">{field_value}</div></div>'
 
 
+def _format_date(value: Any) -> Optional[str]:
+    """Return a date value as YYYY-MM-DD, or None for strings in no known format."""
+    if isinstance(value, str):
+        # Try parsing common date formats
+        for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
+            try:
+                return datetime.strptime(value, fmt).strftime('%Y-%m-%d')
+            except ValueError:
+                continue
+        return None
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+# Cards start with this markup and their data-employee-index value; render_body() returns the rest
+_CARD_START = '\n        <div class="employee-card" data-employee-index="'
+
+
+def card_input(employee) -> Tuple[Dict[str, Any], bool]:
+    """Compact, picklable form of an employee for CardRenderer.render_body(): (record, is_dict)."""
+    if isinstance(employee, dict):
+        return employee, True
+    return employee.as_record(), False
+
+
+# Field renderer per CardType (anything else renders as text)
+_FIELD_RENDERERS = {
+    CardType.RATING_NUM: generate_rating_field_html,
+    CardType.RATING_COMPLEX: generate_rating_complex_field_html,
+    CardType.MULTILINE_TEXT: generate_multiline_field_html,
+    CardType.TEXT: generate_text_field_html,
+}
+# Few distinct values, so their field HTML is rendered once per run
+_CACHED_CARD_TYPES = (CardType.RATING_NUM, CardType.RATING_COMPLEX)
+
+
+class _CardField:
+    """Everything about one mapped header that does not depend on the employee."""
+
+    __slots__ = ('mapping', 'order', 'render', 'is_date', 'cache')
+
+    def __init__(self, mapping, group_position: int):
+        self.mapping = mapping
+        self.order = (group_position, mapping.display_order)
+        self.render = _FIELD_RENDERERS.get(mapping.data_type_in_card, generate_text_field_html)
+        header = mapping.mapped_header.lower()
+        self.is_date = mapping.data_type_in_card == CardType.TEXT and ('date' in header or 'evaluation' in header)
+        self.cache = {} if mapping.data_type_in_card in _CACHED_CARD_TYPES else None
+
+    def html(self, value: str) -> str:
+        # Same empty-value handling as generate_field_html
+        if not value or not str(value).strip():
+            value = ""
+        if self.cache is None:
+            return self.render(self.mapping.mapped_header, value)
+        html = self.cache.get(value)
+        if html is None:
+            html = self.cache[value] = self.render(self.mapping.mapped_header, value)
+        return html
+
+
+class CardRenderer:
+    """
+    Employee card renderer compiled once per run.
+
+    The header-mapping lookup, the group order and titles and each field's
+    renderer are resolved when the renderer is created; render() then reads the
+    employee's record once and joins the card's parts. Output is identical to
+    rendering each card from the mappings directly.
+    """
+
+    def __init__(self, employee_manager: EmployeeManager = None, thumbnails: Dict[str, Dict[str, Any]] = None):
+        """
+        Compile the card plan from the current header mappings.
+
+        Args:
+            employee_manager: Resolves employee names (defaults to a new EmployeeManager)
+            thumbnails: Profile photo thumbnail index (defaults to load_thumbnail_index())
+        """
+        self.employee_manager = employee_manager if employee_manager is not None else EmployeeManager()
+        self.thumbnails = thumbnails if thumbnails is not None else load_thumbnail_index()
+
+        group_positions = {group: position for position, group in enumerate(header_mapper.card_group_order)}
+        # mapped_header -> field; the last mapping of a header wins, as in the reverse mapping it replaces
+        self.fields: Dict[str, _CardField] = {}
+        for mapping_list in header_mapper.header_mappings_by_name.values():
+            for mapping in mapping_list:
+                self.fields.pop(mapping.mapped_header, None)
+                if mapping.data_type_in_card != CardType.NOSHOW and mapping.group_under in group_positions:
+                    self.fields[mapping.mapped_header] = _CardField(mapping, group_positions[mapping.group_under])
+
+        self.group_open = []
+        self.group_close = []
+        for group in header_mapper.card_group_order:
+            # Use group name from CardGroup enum, formatted for display
+            group_title = group.value.replace("_", " ").title()
+            if group == CardGroup.SOFTWARE_TOOLS:
+                self.group_open.append(f'<div class="field-group"><div class="group-title">{group_title}</div><div class="software-tools-grid">')
+                self.group_close.append('</div></div>')
+            else:
+                self.group_open.append(f'<div class="field-group"><div class="group-title">{group_title}</div>')
+                self.group_close.append('</div>')
+
+    def render(self, employee, index: int) -> str:
+        """
+        Generate the HTML of one employee card.
+
+        Args:
+            employee: Employee object, EmployeeStore row, or employee data dictionary
+            index: Value of the card's data-employee-index attribute
+        """
+        return _CARD_START + str(index) + self.render_body(*card_input(employee))
+
+    def render_body(self, record: Dict[str, Any], is_dict: bool) -> str:
+        """
+        Generate one card's HTML after its data-employee-index value.
+
+        Args:
+            record: The employee's fields (see card_input())
+            is_dict: The employee was given as a plain dictionary rather than an object
+        """
+        employee_name = self.employee_manager.get_employee_name(record) or 'Unknown'
+        date_of_evaluation = ''
+        default_image = f'<img src="assets/images/DEFAULT_PROFILE.jpg" alt="{employee_name}" class="profile-image">'
+
+        if is_dict:
+            items = list(record.items())
+            for key, value in items:
+                if value and "date" in key.lower() and "evaluation" in key.lower():
+                    date_of_evaluation = str(value)
+                    break
+            profile_image_html = default_image
+        else:
+            # Public, non-callable fields in name order (what scanning dir() used to visit)
+            items = [(key, value) for key, value in sorted(record.items())
+                     if not key.startswith('_') and not callable(value)]
+            profile_image_filename = None
+            profile_image_path = None
+            date_found = False
+            for key, value in items:
+                # The first evaluation date field wins, even when it does not parse
+                if not date_found and value and "date" in key.lower() and "evaluation" in key.lower():
+                    date_found = True
+                    try:
+                        date_of_evaluation = _format_date(value) or ''
+                    except Exception:
+                        date_of_evaluation = str(value)
+                if "profile_image_filename" in key:
+                    profile_image_filename = value
+                elif "profile_image_path" in key:
+                    profile_image_path = value
+
+            if profile_image_filename and profile_image_path:
+                profile_image_html = _profile_image_html(profile_image_path, profile_image_filename,
+                                                         employee_name, self.thumbnails)
+            else:
+                profile_image_html = default_image
+
+        # Mapped fields sorted by group, then display order (ties keep record order)
+        fields = []
+        for key, value in items:
+            field = self.fields.get(key)
+            if field is None:
+                continue
+            # Format date fields to YYYY-MM-DD
+            formatted_value = str(value) if value else ''
+            if field.is_date and value:
+                try:
+                    formatted_value = _format_date(value) or formatted_value
+                except Exception:
+                    formatted_value = str(value)
+            fields.append((field, formatted_value))
+        fields.sort(key=lambda item: item[0].order)
+
+        parts = []
+        current_group = None
+        for field, value in fields:
+            group = field.order[0]
+            if group != current_group:
+                if current_group is not None:
+                    parts.append(self.group_close[current_group])
+                parts.append(self.group_open[group])
+                current_group = group
+            parts.append(field.html(value))
+        if current_group is not None:
+            parts.append(self.group_close[current_group])
+        grouped_fields_html = "".join(parts)
+
+        return f"""" role="button" tabindex="0">
+            <div class="employee-header">
+                {profile_image_html}
+                <div class="employee-info">
+                    <div class="employee-name">{employee_name}</div>
+                    <div class="employee-time">{date_of_evaluation}</div>
+                </div>
+            </div>
+            <div class="fields-container">
+                {grouped_fields_html}
+            </div>
+        </div>
+        """
+
+
 def clean_display_label(original_header: str) -> str:
     """Clean the original header for display as a field label."""
     if not original_header:
@@ -5,13 +5,190 @@ Handles copying, matching, and managing employee profile images with fuzzy name
 """
 
 import os
-import shutil
 import re
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple, Any
-from fuzzywuzzy import fuzz, process
+from typing import List, Dict, Optional, Tuple, Any, Callable
+from fuzzywuzzy import fuzz, utils
 import json
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from .asset_sync import sync_directory
 from .config import Config
+from .employee import EmployeeManager
+from .parse_cache import hash_file
+
+
+THUMBNAIL_EXTENSIONS = {"webp": ".webp", "jpeg": ".jpg"}
+# Below this many images a process pool costs more to start than it saves
+THUMBNAIL_POOL_MIN_IMAGES = 8
+
+# Below this length an exact name match cannot tie with a different name at a rounded score of 100
+EXACT_MATCH_MAX_LENGTH = 100
+
+
+class ImageMatchIndex:
+    """
+    Prebuilt fuzzy-match index over the available image files.
+
+    Each file name is extracted and processed once. Identical names are found
+    through a dictionary; otherwise fuzz.ratio is only computed for candidates
+    whose character-count upper bound can still reach the best score found so
+    far. Results are identical to process.extract(..., scorer=fuzz.ratio) over
+    the full list, including the first-file tie break.
+    """
+
+    def __init__(self, image_files: List[str], extract_name: Callable[[str], str]):
+        """
+        Build the index.
+
+        Args:
+            image_files: Image filenames, in scan order
+            extract_name: Function turning a filename into a normalized employee name
+        """
+        self.image_files = list(image_files)
+        # One candidate per processed name; its first file wins ties like a linear scan
+        self._keys: List[str] = []
+        self._first_file: List[int] = []
+        self._exact: Dict[str, int] = {}
+        for file_index, image_file in enumerate(self.image_files):
+            key = utils.full_process(extract_name(image_file))
+            if key not in self._exact:
+                self._exact[key] = len(self._keys)
+                self._keys.append(key)
+                self._first_file.append(file_index)
+
+        # Character count profile per candidate (LCS <= shared characters bounds the ratio)
+        alphabet = sorted({char for key in self._keys for char in key})
+        self._char_slots = {char: slot for slot, char in enumerate(alphabet)}
+        self._profiles = np.zeros((len(self._keys), len(alphabet)), dtype=np.int32)
+        for row, key in enumerate(self._keys):
+            for char, count in Counter(key).items():
+                self._profiles[row, self._char_slots[char]] = count
+        self._lengths = np.array([len(key) for key in self._keys], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.image_files)
+
+    def best_match(self, normalized_name: str) -> Tuple[Optional[str], int]:
+        """
+        Find the image whose extracted name best matches a normalized employee name.
+
+        Args:
+            normalized_name: Employee name after ImageManager.normalize_name
+
+        Returns:
+            Tuple of (image filename or None when there are no images, fuzz.ratio score)
+        """
+        if not self._keys:
+            return None, 0
+
+        query = utils.full_process(normalized_name)
+        exact = self._exact.get(query)
+        if exact is not None and len(query) < EXACT_MATCH_MAX_LENGTH:
+            return self.image_files[self._first_file[exact]], 100
+        if not query:
+            # fuzz.ratio scores every non-empty candidate 0 against an empty query
+            return self.image_files[0], fuzz.ratio(query, self._keys[0])
+
+        query_profile = np.zeros(len(self._char_slots), dtype=np.int32)
+        for char, count in Counter(query).items():
+            slot = self._char_slots.get(char)
+            if slot is not None:
+                query_profile[slot] = count
+        shared = np.minimum(self._profiles, query_profile).sum(axis=1)
+        # Integer bound >= the rounded score fuzz.ratio can return for each candidate
+        bounds = (200 * shared) // (len(query) + self._lengths) + 1
+
+        best_key, best_score = -1, -1
+        # Stable sort keeps candidates with equal bounds in file order
+        for key_index in np.argsort(-bounds, kind='stable').tolist():
+            bound = bounds[key_index]
+            if bound < best_score:
+                break
+            if bound == best_score and self._first_file[key_index] > self._first_file[best_key]:
+                continue
+            score = fuzz.ratio(query, self._keys[key_index])
+            if score > best_score or (score == best_score
+                                      and self._first_file[key_index] < self._first_file[best_key]):
+                best_key, best_score = key_index, score
+        return self.image_files[self._first_file[best_key]], best_score
+
+
+def _render_thumbnails(task: Tuple[str, str, List[Tuple[int, str, str]], int]) -> Tuple[str, Optional[str]]:
+    """
+    Render the missing thumbnail variants of one source image (runs in a worker process).
+
+    Args:
+        task: (source image path, thumbnail directory, [(edge px, format, filename)], quality)
+
+    Returns:
+        Tuple of (source image path, error message or None)
+    """
+    source_path, thumb_dir, variants, quality = task
+    try:
+        from PIL import Image, ImageOps
+        with Image.open(source_path) as img:
+            img = ImageOps.exif_transpose(img).convert('RGB')
+            for size, fmt, filename in variants:
+                # Center square crop like object-fit: cover; never upscale
+                edge = min(size, *img.size)
+                thumb = ImageOps.fit(img, (edge, edge), Image.LANCZOS)
+                target_path = os.path.join(thumb_dir, filename)
+                thumb.save(target_path + ".tmp", format=fmt.upper(), quality=quality, optimize=True)
+                os.replace(target_path + ".tmp", target_path)
+        return source_path, None
+    except Exception as e:
+        return source_path, str(e)
+
+
+def load_thumbnail_index(thumb_dir: str = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the thumbnail index written by ImageManager.generate_thumbnails.
+
+    Returns:
+        Dictionary mapping source image filenames to their hash, stat and
+        variants ({edge px: {format: thumbnail filename}}), or {} if missing
+    """
+    thumb_dir = thumb_dir or Config.get_thumbnail_dir_path()
+    try:
+        with open(os.path.join(thumb_dir, Config.THUMBNAIL_INDEX_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def thumbnail_for(image_path: str, min_px: int, fmt: str = "jpeg",
+                  index: Dict[str, Dict[str, Any]] = None, thumb_dir: str = None) -> str:
+    """
+    Return the smallest thumbnail of an image that is at least min_px wide.
+
+    Args:
+        image_path: Path of the original image in the asset library
+        min_px: Minimum edge in pixels the caller needs
+        fmt: Thumbnail format ("jpeg" embeds directly in PDFs)
+        index: Thumbnail index (loaded from disk when omitted)
+        thumb_dir: Thumbnail directory (defaults to Config)
+
+    Returns:
+        Thumbnail path, or image_path when no up-to-date variant exists
+    """
+    thumb_dir = thumb_dir or Config.get_thumbnail_dir_path()
+    entry = (index if index is not None else load_thumbnail_index(thumb_dir)).get(os.path.basename(image_path))
+    if not entry:
+        return image_path
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return image_path
+    if stat.st_size != entry['size'] or stat.st_mtime_ns != entry['mtime_ns']:
+        return image_path  # Original changed since the thumbnails were rendered
+    for size in sorted(int(size) for size in entry['variants']):
+        if size >= min_px:
+            thumb_path = os.path.join(thumb_dir, entry['variants'][str(size)].get(fmt, ''))
+            if os.path.isfile(thumb_path):
+                return thumb_path
+    return image_path
 
 
 class ImageManager:
@@ -34,6 +211,7 @@ class ImageManager:
         self.target_dir = Path(target_images_dir)
         self.image_mappings: Dict[str, str] = {}
         self.available_images: List[str] = []
+        self.match_index: Optional[ImageMatchIndex] = None
         
     def setup_directories(self) -> bool:
         """
@@ -69,6 +247,7 @@ class ImageManager:
                 images.append(file_path.name)
         
         self.available_images = images
+        self.match_index = ImageMatchIndex(images, self.extract_name_from_filename)
         print(f"[INFO] Found {len(images)} images in source directory")
         return images
     
@@ -125,40 +304,27 @@ class ImageManager:
         if not self.available_images:
             return None, None
         
-        normalized_employee_name = self.normalize_name(employee_name)
-        
-        # Create list of (filename, normalized_name) tuples
-        image_candidates = []
-        for img_file in self.available_images:
-            img_name = self.extract_name_from_filename(img_file)
-            image_candidates.append((img_file, img_name))
-        
-        # Use fuzzy matching to find best match
-        matches = process.extract(
-            normalized_employee_name, 
-            [candidate[1] for candidate in image_candidates], 
-            limit=3, 
-            scorer=fuzz.ratio
-        )
-        
-        if matches and matches[0][1] >= threshold:
-            best_match_name = matches[0][0]
-            # Find the original filename for the best match
-            for img_file, img_name in image_candidates:
-                if img_name == best_match_name:
-                    confidence = matches[0][1]
-                    print(f"🎯 Matched '{employee_name}' to '{img_file}' (confidence: {confidence}%)")
-                    return img_file, confidence
+        # Rebuild only if available_images was replaced since the last scan
+        if self.match_index is None or self.match_index.image_files != self.available_images:
+            self.match_index = ImageMatchIndex(self.available_images, self.extract_name_from_filename)
+
+        best_match, confidence = self.match_index.best_match(self.normalize_name(employee_name))
+        if best_match and confidence >= threshold:
+            print(f"🎯 Matched '{employee_name}' to '{best_match}' (confidence: {confidence}%)")
+            return best_match, confidence
         
-        print(f"[WARN] No good match found for '{employee_name}' (best match: {matches[0][1] if matches else 0}%)")
+        print(f"[WARN] No good match found for '{employee_name}' (best match: {confidence}%)")
         return None, None
     
-    def copy_employee_images(self, employees: List[Any]) -> Dict[str, Dict[str, Any]]:
+    def copy_employee_images(self, employees: List[Any],
+                             employee_manager: Optional[EmployeeManager] = None) -> Dict[str, Dict[str, Any]]:
         """
         Copy and match employee images, plus copy all available images to asset library.
         
         Args:
             employees: List of Employee objects or employee data dictionaries
+            employee_manager: Manager whose resolved name fields identify each employee
+                (a default manager is created when omitted)
             
         Returns:
             Dictionary mapping employee names to image info dictionaries
@@ -171,45 +337,20 @@ class ImageManager:
             print("[WARN] No images available to copy")
             return {}
         
-        # First, copy ALL images to the asset library
-        print(f"[INFO] Copying all {len(available_images)} images to asset library...")
-        all_images_copied = 0
-        for image_file in available_images:
-            source_path = self.source_dir / image_file
-            target_path = self.target_dir / image_file
-            
-            try:
-                # Only copy if not already exists
-                if not target_path.exists():
-                    shutil.copy2(source_path, target_path)
-                    all_images_copied += 1
-                    print(f"[OK] Copied asset: {image_file}")
-                else:
-                    print(f"[SKIP] Asset already exists: {image_file}")
-            except Exception as e:
-                print(f"[ERROR] Error copying asset {image_file}: {e}")
-        
-        print(f"📦 Asset Library Summary: {all_images_copied} new images copied")
+        # First, sync ALL images to the asset library (only new or changed files are copied)
+        print(f"[INFO] Syncing {len(available_images)} images to asset library...")
+        sync_result = sync_directory(str(self.source_dir), str(self.target_dir), files=available_images)
+        print(f"📦 Asset Library Summary: {sync_result.summary()}")
         
         # Now handle employee-specific matching
         copied_count = 0
         matched_count = 0
         
+        if employee_manager is None:
+            employee_manager = EmployeeManager()
+
         for employee in employees:
-            # Handle both Employee objects and dictionaries
-            employee_name = None
-            
-            if hasattr(employee, 'get'):
-                # Dictionary object
-                employee_name = employee.get('name', '')
-            else:
-                # Employee object - look for name attributes
-                for attr_name in dir(employee):
-                    if not attr_name.startswith('_') and 'name' in attr_name.lower():
-                        attr_value = getattr(employee, attr_name)
-                        if attr_value and not callable(attr_value):
-                            employee_name = str(attr_value)
-                            break
+            employee_name = employee_manager.get_employee_name(employee)
             
             if not employee_name:
                 continue
@@ -270,6 +411,26 @@ class ImageManager:
             print(f"[ERROR] Error saving image mappings: {e}")
             return False
     
+    def load_image_mappings(self, input_file: str = None) -> bool:
+        """
+        Load previously saved image mappings so new matches are merged into them.
+
+        Args:
+            input_file: Path of the mappings file written by save_image_mappings
+
+        Returns:
+            True if mappings were loaded, False otherwise
+        """
+        if input_file is None:
+            input_file = Config.get_image_mappings_path()
+
+        try:
+            with open(input_file, 'r', encoding='utf-8') as f:
+                self.image_mappings.update(json.load(f))
+            return True
+        except Exception:
+            return False
+
     def get_image_path(self, employee_name: str) -> Optional[str]:
         """
         Get the image path for an employee.
@@ -286,6 +447,103 @@ class ImageManager:
                 return f"{Config.IMAGE_TARGET_DIR}/{image_info['filename']}"
         return None
     
+    def generate_thumbnails(self, image_files: List[str] = None, sizes: List[int] = None,
+                            formats: List[str] = None, max_workers: int = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Render pre-sized thumbnails of the asset library images.
+
+        Thumbnails are named after the source image's content hash, so an
+        unchanged image is never re-rendered. Missing variants are rendered in
+        a process pool; thumbnails no longer referenced are removed.
+
+        When image_files is given, only those images are checked; index entries
+        of the other images are kept as they are, so callers that need a few
+        photos do not re-render or prune the rest of the library.
+
+        Args:
+            image_files: Asset library filenames (defaults to all of them)
+            sizes: Square edges in pixels (defaults to Config.THUMBNAIL_SIZES)
+            formats: Output formats (defaults to Config.THUMBNAIL_FORMATS)
+            max_workers: Process pool size (defaults to Config.THUMBNAIL_WORKERS)
+
+        Returns:
+            The thumbnail index (see load_thumbnail_index)
+        """
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            print("[WARN] Pillow not available - skipping thumbnails")
+            return {}
+
+        sizes = sizes or Config.THUMBNAIL_SIZES
+        formats = formats or Config.THUMBNAIL_FORMATS
+        thumb_dir = Config.get_thumbnail_dir_path()
+        if not Config.ensure_directory_exists(thumb_dir):
+            return {}
+
+        previous = load_thumbnail_index(thumb_dir)
+        index: Dict[str, Dict[str, Any]] = {}
+        if image_files is not None:
+            image_files = list(dict.fromkeys(image_files))
+            checked = set(image_files)
+            index = {name: entry for name, entry in previous.items() if name not in checked}
+        kept = len(index)
+        tasks = []
+        for image_file in (image_files if image_files is not None else self.get_all_asset_images()):
+            source_path = os.path.join(self.target_dir, image_file)
+            try:
+                stat = os.stat(source_path)
+            except OSError:
+                continue
+            entry = previous.get(image_file)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                digest = entry['sha256']
+            else:
+                digest = hash_file(source_path)
+            variants = {str(size): {fmt: f"{digest[:20]}_{size}{THUMBNAIL_EXTENSIONS[fmt]}" for fmt in formats}
+                        for size in sizes}
+            missing = [(int(size), fmt, filename) for size, by_format in variants.items()
+                       for fmt, filename in by_format.items()
+                       if not os.path.exists(os.path.join(thumb_dir, filename))]
+            if missing:
+                tasks.append((source_path, thumb_dir, missing, Config.THUMBNAIL_QUALITY))
+            index[image_file] = {'sha256': digest, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                 'variants': variants}
+
+        failed = {}
+        if tasks:
+            workers = max_workers or Config.THUMBNAIL_WORKERS or os.cpu_count() or 1
+            if workers > 1 and len(tasks) >= THUMBNAIL_POOL_MIN_IMAGES:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(_render_thumbnails, tasks, chunksize=16))
+            else:
+                results = [_render_thumbnails(task) for task in tasks]
+            failed = {source_path: error for source_path, error in results if error}
+            for source_path, error in failed.items():
+                print(f"[ERROR] Error creating thumbnails for {os.path.basename(source_path)}: {error}")
+                index.pop(os.path.basename(source_path), None)
+
+        # Drop thumbnails of removed or changed images
+        referenced = {filename for entry in index.values()
+                      for by_format in entry['variants'].values() for filename in by_format.values()}
+        for name in os.listdir(thumb_dir):
+            if name != Config.THUMBNAIL_INDEX_FILE and name not in referenced:
+                try:
+                    os.remove(os.path.join(thumb_dir, name))
+                except OSError:
+                    pass
+
+        if index != previous:
+            try:
+                with open(os.path.join(thumb_dir, Config.THUMBNAIL_INDEX_FILE), 'w', encoding='utf-8') as f:
+                    json.dump(index, f, indent=1, sort_keys=True)
+            except OSError as e:
+                print(f"[WARN] Could not save thumbnail index: {e}")
+
+        print(f"[INFO] Thumbnails: {len(tasks) - len(failed)} images rendered, "
+              f"{len(index) - kept - len(tasks) + len(failed)} up to date, {len(failed)} failed")
+        return index
+
     def get_all_asset_images(self) -> List[str]:
         """
         Get list of all images in the asset library.
@@ -0,0 +1,152 @@
+"""
+Modal PDF
+
+HTML-to-PDF export of the generated website's employee modals. One headless
+Chromium is shared by a pool of pages, each in its own browser context with
+index.html loaded once; modals are printed concurrently across the pages.
+"""
+
+import asyncio
+import os
+import re
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from .config import Config
+
+# Automation hooks exposed by the generated index.html
+EMPLOYEE_COUNT_READY = "() => window.__employeeCount && window.__employeeCount() > 0"
+# Sharded sites only render cards near the viewport, so names come from their card index
+EMPLOYEE_NAMES_JS = ("() => window.__cardSource ? window.__cardSource.names() : "
+                     "Array.from(document.querySelectorAll('#employee-list .employee-card .employee-name'))"
+                     ".map(e => e.textContent.trim())")
+MODAL_OPEN_SELECTOR = '#modalOverlay:not([hidden])'
+PAGE_MARGIN = {"top": "0", "right": "0", "bottom": "0", "left": "0"}
+
+
+def _safe(name: str) -> str:
+    return re.sub(r"[^\w\-\.]+", "_", name)[:80] or "Employee"
+
+
+class BrowserPagePool:
+    """One Chromium with `size` ready pages (index.html loaded); at most `size` renders run at once."""
+
+    def __init__(self, index_html_path: str, size: int):
+        self.url = Path(index_html_path).resolve().as_uri()
+        self.size = max(1, size)
+        self._playwright = None
+        self._browser = None
+        self._idle: "asyncio.Queue" = None
+
+    async def __aenter__(self) -> "BrowserPagePool":
+        from playwright.async_api import async_playwright
+
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch()
+            pages = await asyncio.gather(*(self._open_page() for _ in range(self.size)))
+        except BaseException:
+            await self.close()
+            raise
+        # Idle pages double as the concurrency limit: a render waits here for a free page
+        self._idle = asyncio.Queue()
+        for page in pages:
+            self._idle.put_nowait(page)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _open_page(self):
+        # Separate contexts so modal state and layout never leak between concurrent renders
+        context = await self._browser.new_context()
+        page = await context.new_page()
+        await page.goto(self.url)
+        await page.wait_for_function(EMPLOYEE_COUNT_READY)
+        return page
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def evaluate(self, expression: str):
+        """Evaluate a script on any idle page."""
+        page = await self._idle.get()
+        try:
+            return await page.evaluate(expression)
+        finally:
+            self._idle.put_nowait(page)
+
+    async def render_modal(self, index: int, pdf_path: str) -> None:
+        """Open modal `index` on an idle page and print it to a letter-size PDF."""
+        page = await self._idle.get()
+        try:
+            await page.evaluate(f"window.__openModalAt({index})")
+            await page.wait_for_selector(MODAL_OPEN_SELECTOR)
+            await page.pdf(path=pdf_path, format='letter', print_background=True, margin=PAGE_MARGIN)
+        finally:
+            try:
+                await page.evaluate("window.__closeModal()")
+            except Exception:
+                pass
+            self._idle.put_nowait(page)
+
+
+async def export_modal_pdfs(index_html_path: str, export_dir: str, log_func: Callable[[str], None],
+                            pages: int = None) -> str:
+    """
+    Print every employee modal of a generated index.html to its own PDF.
+
+    Args:
+        index_html_path: Generated website index.html
+        export_dir: Directory to save PDFs
+        log_func: Function to log progress messages (called in employee order)
+        pages: Concurrent browser pages (defaults to Config.PDF_EXPORT_PAGES)
+
+    Returns:
+        export_dir, or "" when Playwright is not available
+    """
+    try:
+        import playwright.async_api  # noqa: F401
+    except Exception as e:
+        log_func(f"Playwright not available: {e}")
+        return ""
+
+    if not export_dir:
+        raise ValueError("PDF export directory is required")
+    os.makedirs(export_dir, exist_ok=True)
+
+    async with BrowserPagePool(index_html_path, pages or Config.PDF_EXPORT_PAGES) as pool:
+        count = await pool.evaluate("() => window.__employeeCount()")
+        names = await pool.evaluate(EMPLOYEE_NAMES_JS)
+
+        pdf_paths: List[str] = []
+        last_index: Dict[str, int] = {}
+        for i in range(count):
+            name = _safe(names[i] if i < len(names) else f"Employee_{i+1}")
+            pdf_path = os.path.join(export_dir, Config.PDF_FILE_NAMING.format(name=name))
+            pdf_paths.append(pdf_path)
+            last_index[pdf_path] = i
+
+        # Duplicate names share a file; only the last one is printed (as when modals were printed in turn)
+        tasks = {i: asyncio.ensure_future(pool.render_modal(i, pdf_path))
+                 for i, pdf_path in enumerate(pdf_paths) if last_index[pdf_path] == i}
+        try:
+            for i, pdf_path in enumerate(pdf_paths):
+                task = tasks.get(i)
+                if task is None:
+                    log_func(f"Skipped duplicate name: {os.path.basename(pdf_path)}")
+                    continue
+                try:
+                    await task
+                    log_func(f"Saved PDF: {pdf_path}")
+                except Exception as e:
+                    log_func(f"PDF export failed for {os.path.basename(pdf_path)}: {e}")
+        finally:
+            for task in tasks.values():
+                task.cancel()
+    return export_dir
@@ -24,6 +24,7 @@ class EmployeeEvaluationOrchestrator:
         self.employees = []
         self.all_fields = []
         self.output_files = []
+        self.delta = None
     
     def run(self) -> int:
         """
@@ -37,6 +38,7 @@ class EmployeeEvaluationOrchestrator:
             self._check_data_source()
             self._setup_output_directory()
             self._parse_data()
+            self._update_warehouse()
             self._generate_reports()
             self._print_summary()
             self._log_completion()
@@ -95,41 +97,40 @@ class EmployeeEvaluationOrchestrator:
         # Step 1: Copy images from external EmployeeData repository (if configured)
         self._copy_images_from_external_repo()
 
-        # Step 2: Parse Excel to Employee objects with image processing
+        # Step 2: Parse Excel to Employee objects with image processing.
+        # Only rows added or changed since the last run are materialized and image-matched.
         excel_path = Config.get_excel_input_path()
         json_path = Config.get_json_output_path()
-        
-        # Use the full pipeline that includes image processing
-        from .excel_parser import parse_excel_to_json
-        success = parse_excel_to_json(excel_path, json_path, copy_images=True)
-        
-        if not success:
+
+        from .excel_parser import parse_excel_incremental
+        result = parse_excel_incremental(excel_path, json_path, copy_images=True)
+        if not result:
             raise ValueError("Failed to parse Excel data!")
-        
-        # Load the employees from the JSON file (which now includes image data)
-        self.employees = self._load_employees_from_json(json_path)
-        if not self.employees:
-            raise ValueError("Failed to load employee data!")
 
+        self.employees, self.delta = result
         log_info(f"Successfully parsed {len(self.employees)} employee records from Excel with image processing")
+        log_info(f"Delta since last run: {self.delta.summary()}")
+
+        # JSON is already saved by parse_excel_incremental, so no need to save again
 
-        # JSON is already saved by parse_excel_to_json, so no need to save again
+    def _update_warehouse(self) -> None:
+        """File this year's responses in the year-over-year evaluation warehouse."""
+        if not Config.WAREHOUSE_ENABLED:
+            return
+        from .warehouse import update_warehouse
+        # EVALUATION_YEAR may be stale for the workbook at hand, so a run never removes filed responses
+        update_warehouse(self.employees, source=os.path.basename(Config.get_excel_input_path()), prune=False)
 
     def _load_employees_from_json(self, json_path: str) -> List[Employee]:
         """Load Employee objects from JSON file."""
         try:
             import json
-            from .employee import Employee
+            from .employee import EmployeeStore
             
             with open(json_path, 'r', encoding='utf-8') as f:
                 employee_data_list = json.load(f)
             
-            employees = []
-            for emp_data in employee_data_list:
-                employee = Employee(emp_data)
-                employees.append(employee)
-            
-            return employees
+            return EmployeeStore.from_json_list(employee_data_list).rows()
             
         except Exception as e:
             log_error(f"Failed to load employees from JSON: {e}")
@@ -159,10 +160,14 @@ class EmployeeEvaluationOrchestrator:
 
         website_path = Config.get_website_output_path()
 
-        success = create_html_output_from_employees(self.employees, website_path)
+        # The generator skips the build itself when neither responses nor its other inputs changed
+        success = create_html_output_from_employees(self.employees, website_path, delta=self.delta)
         if success:
             self.output_files.append(website_path)
             log_info(f"Successfully generated website at: {website_path}")
+            # Only now does the next run diff against this run's responses
+            if self.delta is not None:
+                self.delta.save_manifest()
         else:
             raise ValueError("Failed to generate HTML website!")
     
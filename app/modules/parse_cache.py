@@ -0,0 +1,173 @@
+"""
+Parse Cache
+
+Content-addressed cache for parsed Excel workbooks. Entries are keyed by the
+SHA-256 of the workbook bytes, a signature of the HeaderMapper configuration
+and a digest of the parser source, so an unchanged workbook is restored without
+touching openpyxl while a parser change never serves records it did not clean.
+"""
+
+import hashlib
+import os
+import pickle
+from typing import Any, Dict, Optional
+
+from .config import Config
+from .header_mapper import HeaderMapper, mappings_signature
+from .utils import source_signature
+
+# Bump when the payload layout changes so old entries are never read back
+CACHE_FORMAT_VERSION = 1
+CACHE_FILE_EXTENSION = ".pkl"
+# Modules whose code shapes the cached payload (cleaned column values, header mappings)
+KEYED_MODULES = ("excel_parser.py", "header_mapper.py", "parse_cache.py")
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_code_signature() -> str:
+    """
+    Return a digest of the parser source files.
+
+    Entries hold cleaned column values, so editing the cleaning or extraction
+    code must miss even when CACHE_FORMAT_VERSION was not bumped.
+    """
+    return source_signature(KEYED_MODULES)
+
+
+def mapper_signature(header_mapper: HeaderMapper) -> str:
+    """
+    Return a digest of the header mapper configuration.
+
+    Covers every predefined mapping and the card group order, so editing
+    header_mapper.py invalidates records parsed with the old mappings.
+    """
+    group_order = ",".join(group.value for group in header_mapper.card_group_order)
+    raw = f"{mappings_signature(header_mapper.header_mappings)}:{group_order}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+class ParseCache:
+    """Size-bounded on-disk cache of parsed workbooks (pickle protocol 5)."""
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (defaults to Config)
+            max_bytes: Total size budget; least recently used entries are evicted
+        """
+        self.cache_dir = cache_dir or Config.get_parse_cache_dir_path()
+        self.max_bytes = Config.PARSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+
+    def make_key(self, excel_path: str, header_mapper: HeaderMapper) -> str:
+        """Build the cache key for a workbook parsed with the given mapper."""
+        raw = (f"{CACHE_FORMAT_VERSION}:{parser_code_signature()}:{hash_file(excel_path)}:"
+               f"{mapper_signature(header_mapper)}")
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FILE_EXTENSION)
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload for a key, or None on a miss.
+
+        Unreadable entries are removed and treated as misses.
+        """
+        path = self._entry_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+            # Refresh mtime so eviction keeps recently used entries
+            os.utime(path, None)
+            return payload
+        except Exception as e:
+            print(f"[WARN] Discarding unreadable parse cache entry {path}: {e}")
+            self._remove(path)
+            return None
+
+    def store(self, key: str, payload: Dict[str, Any]) -> bool:
+        """
+        Write a payload for a key, then evict old entries over the size budget.
+
+        Returns:
+            True if the entry was written, False otherwise
+        """
+        if not Config.ensure_directory_exists(self.cache_dir):
+            return False
+        path = self._entry_path(key)
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=5)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"[WARN] Could not write parse cache entry: {e}")
+            self._remove(tmp_path)
+            return False
+        self.evict(keep=key)
+        return True
+
+    def _entries(self):
+        """Return (path, size, mtime) for every cache entry, oldest first."""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CACHE_FILE_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_size, stat.st_mtime))
+        entries.sort(key=lambda e: e[2])
+        return entries
+
+    def evict(self, keep: str = None) -> int:
+        """
+        Remove least recently used entries until the cache fits max_bytes.
+
+        Args:
+            keep: Key that must survive eviction (the entry just written)
+
+        Returns:
+            Number of entries removed
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        keep_path = self._entry_path(keep) if keep else None
+        removed = 0
+        for path, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep_path:
+                continue
+            if self._remove(path):
+                total -= size
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove every cache entry. Returns the number of entries removed."""
+        return sum(1 for path, _, _ in self._entries() if self._remove(path))
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,143 @@
+"""
+PDF Book
+
+Writes many report entries (one per employee or review) into a single PDF
+with an outline entry per report and a table of contents, optionally split
+into parts of about N pages. Images, icons and fonts repeated across entries
+are embedded once per file.
+"""
+
+import math
+import os
+from typing import List, Optional
+
+from .pdf_resources import PdfResourceRegistry
+
+TOC_TOP_MARGIN = 72
+TOC_BOTTOM_MARGIN = 54
+TOC_SIDE_MARGIN = 54
+TOC_TITLE_GAP = 36
+TOC_LEADING = 16
+
+
+class PdfBook:
+    """One consolidated PDF (or a few parts) that report renderers draw into entry by entry."""
+
+    def __init__(self, export_dir: str, file_naming: str, title: str, total_entries: Optional[int] = None,
+                 split_pages: Optional[int] = None):
+        """
+        Initialize the book.
+
+        Args:
+            export_dir: Directory the book files are written to
+            file_naming: File name pattern with a '{part}' placeholder ("" for a
+                single file, "_Part01", "_Part02", ... when split)
+            title: Document title and table of contents heading
+            total_entries: Upper bound on the number of entries; needed to reserve
+                the table of contents pages (None = outline only, no contents pages)
+            split_pages: Start a new part before an entry that would likely take
+                the current part past this many pages (None = one file)
+        """
+        self.export_dir = export_dir
+        self.file_naming = file_naming
+        self.title = title
+        self.total_entries = total_entries
+        self.split_pages = split_pages
+        self.paths: List[str] = []
+        self.canvas = None
+        self.resources: Optional[PdfResourceRegistry] = None
+        self._entries_done = 0
+        self._entry_start = None  # first page of the entry being drawn
+        self._last_entry_pages = 1
+        self._toc = []  # (title, page) of the current part
+        self._toc_pages = 0
+        self._pagesize = None
+
+    @staticmethod
+    def _toc_rows_per_page(height: float) -> int:
+        return max(1, int((height - TOC_TOP_MARGIN - TOC_TITLE_GAP - TOC_BOTTOM_MARGIN) // TOC_LEADING))
+
+    def _start_part(self) -> None:
+        from reportlab.lib.pagesizes import letter
+        from reportlab.pdfgen import canvas
+
+        part = f"_Part{len(self.paths) + 1:02d}" if self.split_pages else ""
+        path = os.path.join(self.export_dir, self.file_naming.format(part=part))
+        self.paths.append(path)
+        c = canvas.Canvas(path, pagesize=letter)
+        self._pagesize = letter
+        c.setTitle(f"{self.title} ({part.lstrip('_')})" if part else self.title)
+        c.showOutline()
+        self.canvas = c
+        self.resources = PdfResourceRegistry(c)
+        self._toc = []
+        self._toc_pages = 0
+
+        if self.total_entries is None:
+            return
+        # Reserve the contents pages now; their text is a form filled in when the part closes
+        bound = self.total_entries - self._entries_done
+        if self.split_pages:
+            bound = min(bound, max(1, self.split_pages - 1))
+        height = letter[1]
+        self._toc_pages = max(1, math.ceil(bound / self._toc_rows_per_page(height)))
+        for page in range(self._toc_pages):
+            if page == 0:
+                c.bookmarkPage("contents")
+                c.addOutlineEntry("Contents", "contents", level=0)
+            c.setFont('Helvetica-Bold', 16)
+            heading = "Contents" if page == 0 else "Contents (continued)"
+            c.drawString(TOC_SIDE_MARGIN, height - TOC_TOP_MARGIN, heading)
+            c.doForm(f"Contents{page}")
+            c.showPage()
+
+    def _finish_part(self) -> None:
+        c = self.canvas
+        width, height = self._pagesize
+        rows = self._toc_rows_per_page(height)
+        for page in range(self._toc_pages):
+            c.beginForm(f"Contents{page}")
+            y = height - TOC_TOP_MARGIN - TOC_TITLE_GAP
+            for title, number in self._toc[page * rows:(page + 1) * rows]:
+                c.setFont('Helvetica', 11)
+                label = str(number)
+                c.drawRightString(width - TOC_SIDE_MARGIN, y, label)
+                max_title = width - 2 * TOC_SIDE_MARGIN - c.stringWidth(label, 'Helvetica', 11) - 18
+                while title and c.stringWidth(title, 'Helvetica', 11) > max_title:
+                    title = title[:-2] + "…"
+                c.drawString(TOC_SIDE_MARGIN, y, title)
+                y -= TOC_LEADING
+            c.endForm()
+        c.save()
+        self.canvas = None
+        self.resources = None
+
+    def begin_entry(self, title: str):
+        """
+        Start an entry on a fresh page and return the canvas to draw it on.
+
+        The renderer finishes the entry with showPage() and must not save the canvas.
+        """
+        if self.canvas is not None and self._entry_start is not None:
+            self._last_entry_pages = self.canvas.getPageNumber() - self._entry_start
+        if self.canvas is not None and self.split_pages:
+            pages_done = self.canvas.getPageNumber() - 1
+            if self._toc and pages_done + self._last_entry_pages > self.split_pages:
+                self._finish_part()
+        if self.canvas is None:
+            self._start_part()
+
+        c = self.canvas
+        key = f"entry{self._entries_done}"
+        c.bookmarkPage(key)
+        c.addOutlineEntry(title, key, level=0)
+        self._entry_start = c.getPageNumber()
+        self._toc.append((title, self._entry_start))
+        self._entries_done += 1
+        return c
+
+    def close(self) -> List[str]:
+        """Write the open part and return the paths of every file written."""
+        if self.canvas is not None:
+            self._finish_part()
+        return self.paths
@@ -2,6 +2,12 @@ import os
 from typing import List, Dict, Any, Callable, Optional
 
 from .config import Config
+from .employee import EmployeeManager
+from .image_manager import load_thumbnail_index, thumbnail_for
+from .pdf_book import PdfBook
+from .pdf_layout import LAYOUT_VERSION, ReportLayout
+from .pdf_manifest import PdfInputs, PdfManifest
+from .pdf_resources import PdfResourceRegistry
 
 
 def _safe_filename(name: str) -> str:
@@ -10,6 +16,14 @@ def _safe_filename(name: str) -> str:
     return re.sub(r"[^\w\-\.]+", "_", str(name))[:80] or "Employee"
 
 
+def pdf_filename_for(emp: Dict[str, Any], employee_manager: Optional[EmployeeManager] = None) -> str:
+    """Return the PDF file name export_pdfs_reportlab writes for an employee record."""
+    if employee_manager is None:
+        employee_manager = EmployeeManager()
+    name_field = employee_manager.get_employee_name(emp)
+    return Config.PDF_FILE_NAMING.format(name=_safe_filename(name_field or 'Employee'))
+
+
 def _format_date_only(val) -> str:
     """Format many possible date/time inputs to ISO date (YYYY-MM-DD)."""
     try:
@@ -38,9 +52,24 @@ def export_pdfs_reportlab(
     export_dir: str,
     log_func: Callable[[str], None],
     header_mappings: Optional[Dict[Any, Any]] = None,
+    book: bool = False,
+    split_pages: Optional[int] = None,
+    force: bool = False,
+    prune: bool = True,
 ) -> str:
     """Export one portrait-letter PDF per employee using ReportLab.
 
+    A PDF whose inputs (record, header mappings, photo, layout version) match
+    the export directory's manifest is reused instead of rendered again; PDFs
+    of employees no longer exported are removed when `prune` is set. `force`
+    renders everything. Pass prune=False when `employees` is only a subset.
+    Employees sharing a file name share the PDF: only the last one is
+    rendered, as in modal_pdf.export_modal_pdfs.
+
+    In book mode every employee goes into one PDF (Config.PDF_BOOK_FILE_NAMING)
+    with an outline entry per employee and a table of contents; split_pages
+    starts a new part file every ~N pages.
+
     Steps:
       1. Ensure output exists; load profile image mappings and rating icon paths
       2. Build group ordering from `header_mappings` to mirror the modal
@@ -48,14 +77,13 @@ def export_pdfs_reportlab(
          a) Header with profile image, name, and date (YYYY-MM-DD)
          b) For each group: teal title + divider
          c) For ratings: render 0..5 icons; for text: teal label + rounded value box
-         d) Proactively page-break when remaining space is insufficient
+         d) Page breaks are planned by ReportLayout before anything is drawn
          e) Save the PDF with a safe file name
     """
     try:
         from reportlab.lib.pagesizes import letter
         from reportlab.pdfgen import canvas
         from reportlab.lib.units import inch
-        from reportlab.lib.utils import simpleSplit
         from .header_mapper import CardGroup
     except Exception as e:
         log_func(f"ReportLab not available: {e}")
@@ -79,13 +107,6 @@ def export_pdfs_reportlab(
     rating_checked_path = os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_checked.png')
     rating_unchecked_path = os.path.join(Config.get_assets_dir_path(), 'icons', 'rating_unchecked.png')
 
-    def _rgb(hex_color: str):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16)/255.0 for i in (0, 2, 4))
-
-    TEAL = _rgb('2B7A78')
-    BOX_BG = _rgb('F7FBFA')
-
     # (2) Precompute grouping from header_mappings
     group_to_fields = {}
     group_order = []
@@ -99,12 +120,37 @@ def export_pdfs_reportlab(
         for grp in group_to_fields:
             group_to_fields[grp] = sorted(group_to_fields[grp], key=lambda m: m.display_order)
 
-    # (3) Export per-employee
-    for emp in employees:
-        name_field = next((v for k, v in emp.items() if v and 'name' in k.lower()), None)
+    # (3) Export per-employee (name fields resolved once for all rows)
+    employee_manager = EmployeeManager(header_mappings)
+    thumbnails = load_thumbnail_index()
+    pdf_book = None
+    manifest = None
+    if book:
+        pdf_book = PdfBook(export_dir, Config.PDF_BOOK_FILE_NAMING, Config.PDF_BOOK_TITLE,
+                           total_entries=len(employees), split_pages=split_pages or Config.PDF_BOOK_SPLIT_PAGES)
+    else:
+        manifest = PdfManifest(export_dir, force=force)
+        inputs = PdfInputs(f"reportlab-{LAYOUT_VERSION}", header_mappings)
+    pdf_names = [pdf_filename_for(emp, employee_manager) for emp in employees]
+    last_index = {pdf_name: i for i, pdf_name in enumerate(pdf_names)}
+    for i, emp in enumerate(employees):
+        if pdf_book is None and last_index[pdf_names[i]] != i:
+            log_func(f"Skipped duplicate name: {pdf_names[i]}")
+            continue
+        name_field = employee_manager.get_employee_name(emp)
         safe = _safe_filename(name_field or 'Employee')
-        pdf_path = os.path.join(export_dir, Config.PDF_FILE_NAMING.format(name=safe))
-        c = canvas.Canvas(pdf_path, pagesize=letter)
+        pdf_path = os.path.join(export_dir, pdf_names[i])
+        img_path = name_to_image.get(name_field or '', None)
+        if manifest is not None:
+            fingerprint = inputs.fingerprint(emp, [img_path])
+            if manifest.is_current(os.path.basename(pdf_path), fingerprint):
+                continue
+        if pdf_book is not None:
+            c = pdf_book.begin_entry(name_field or safe)
+            resources = pdf_book.resources
+        else:
+            c = canvas.Canvas(pdf_path, pagesize=letter)
+            resources = PdfResourceRegistry(c)  # rating icons embedded once per PDF
         width, height = letter
 
         header_y = height - 0.75*inch
@@ -112,10 +158,10 @@ def export_pdfs_reportlab(
         left_margin = 0.75*inch
         top_name_y = header_y - 0.1*inch
 
-        img_path = name_to_image.get(name_field or '', None)
         if img_path and os.path.exists(img_path):
             try:
-                c.drawImage(img_path, left_margin, header_y - img_size, img_size, img_size, preserveAspectRatio=True, mask='auto')
+                c.drawImage(thumbnail_for(img_path, Config.PDF_PROFILE_IMAGE_PX, index=thumbnails),
+                            left_margin, header_y - img_size, img_size, img_size, preserveAspectRatio=True, mask='auto')
             except Exception:
                 pass
 
@@ -129,61 +175,8 @@ def export_pdfs_reportlab(
         c.setLineWidth(1)
         c.line(left_margin, header_y - img_size - 0.15*inch, width - left_margin, header_y - img_size - 0.15*inch)
 
-        # Helpers / typography
-        body_font = 'Helvetica'
-        label_font = 'Helvetica-Bold'
-        body_size = 10
-        label_size = 11
-        line_leading = 12
-        x = 0.75*inch
-        y = header_y - img_size - 0.35*inch
-        max_width = width - 1.5*inch
-
-        def draw_text(text: str, font: str, size: int, extra_gap: int = 0):
-            """Draw wrapped text and move cursor up with leading & gap."""
-            nonlocal y
-            lines = simpleSplit(str(text), font, size, max_width)
-            for ln in lines:
-                c.setFont(font, size)
-                c.drawString(x, y, ln)
-                y -= line_leading
-            if extra_gap:
-                y -= extra_gap
-
-        def ensure_space_lines(lines_needed: int = 4):
-            """Guard: page break by approximate line count."""
-            nonlocal y
-            if y - lines_needed * line_leading < 0.75*inch:
-                c.showPage()
-                y = height - 0.75*inch
-
-        def ensure_space_px(pixels_needed: float):
-            """Guard: page break by pixel height need."""
-            nonlocal y
-            if y - pixels_needed < 0.75*inch:
-                c.showPage()
-                y = height - 0.75*inch
-
-        def draw_value_box(label: str, value: str):
-            """Teal label + rounded rectangle for the value body."""
-            nonlocal y
-            c.setFillColorRGB(*TEAL)
-            c.setFont(label_font, 10)
-            c.drawString(x, y, label)
-            y -= 12
-            c.setFillColorRGB(*BOX_BG)
-            c.setStrokeColorRGB(*TEAL)
-            text_lines = simpleSplit(str(value), body_font, body_size, max_width - 12)
-            box_h = len(text_lines) * line_leading + 12
-            c.roundRect(x, y - box_h + 6, max_width, box_h, 6, stroke=1, fill=1)
-            c.setFillColorRGB(0, 0, 0)
-            c.setFont(body_font, body_size)
-            ty = y - 6
-            for ln in text_lines:
-                c.drawString(x + 6, ty, ln)
-                ty -= line_leading
-            y = y - box_h - 6
-
+        # Body: measured and paginated by the shared layout, then drawn in one pass
+        layout = ReportLayout(letter, rating_icons=(rating_checked_path, rating_unchecked_path))
         if header_mappings:
             for grp in group_order:
                 values = []
@@ -193,60 +186,42 @@ def export_pdfs_reportlab(
                         values.append((m.mapped_header, val, m))
                 if not values:
                     continue
-                ensure_space_lines(6)
-                group_title = grp.value.replace('_', ' ').title()
-                c.setFillColorRGB(*TEAL)
-                c.setFont(label_font, 13)
-                c.drawString(x, y, group_title)
-                # Move divider 1pt closer to title
-                y -= 4
-                c.setLineWidth(0.8)
-                c.setStrokeColorRGB(*TEAL)
-                c.line(x, y, x + max_width, y)
-                y -= 8
+                layout.heading(grp.value.replace('_', ' ').title())
                 basic_allow = {"Title", "Employee Role", "Email"}
                 for label, val, m in values:
                     if grp == CardGroup.BASIC_INFO and label not in basic_allow:
                         continue
-                    mapping = m
-                    base_gap = 18
-                    if getattr(mapping, 'data_type_in_card', None) and mapping.data_type_in_card.value.lower() == 'rating_num':
-                        icon_size = 0.22 * inch
-                        ensure_space_px(icon_size + base_gap + 8)
-                        c.setFillColorRGB(*TEAL)
-                        draw_text(label, label_font, label_size)
+                    if getattr(m, 'data_type_in_card', None) and m.data_type_in_card.value.lower() == 'rating_num':
                         try:
                             score = int(str(val).strip()[:1]) if str(val).strip() else 0
                         except Exception:
                             score = 0
-                        icon_y = y
-                        icon_x = x
-                        for i in range(5):
-                            icon_path = rating_checked_path if i < score else rating_unchecked_path
-                            try:
-                                c.drawImage(icon_path, icon_x, icon_y - icon_size + 8, icon_size, icon_size, mask='auto')
-                            except Exception:
-                                pass
-                            icon_x += icon_size + 2
-                        y -= (icon_size + 6)
+                        layout.rating(label, score)
                     else:
-                        text_lines = simpleSplit(str(val), body_font, body_size, max_width - 12)
-                        box_h = len(text_lines) * line_leading + 12
-                        ensure_space_px(box_h + base_gap)
-                        draw_value_box(label, val)
-                y -= 10
+                        layout.value_box(label, val)
+                layout.space(10)
         else:
             for k, v in emp.items():
                 if not v:
                     continue
-                ensure_space_lines(4)
-                label = k.replace('_', ' ').title()
-                draw_value_box(label, v)
+                layout.ensure_lines(4)
+                layout.value_box(k.replace('_', ' ').title(), v)
+        layout.draw(c, header_y - img_size - 0.35*inch, resources)
 
         c.showPage()
-        c.save()
-        log_func(f"Saved PDF: {pdf_path}")
-
+        if pdf_book is None:
+            c.save()
+            manifest.built(os.path.basename(pdf_path), fingerprint)
+            log_func(f"Saved PDF: {pdf_path}")
+
+    if pdf_book is not None:
+        for book_path in pdf_book.close():
+            log_func(f"Saved PDF: {book_path}")
+    else:
+        removed = manifest.save(prune=prune)
+        log_func(f"PDFs: {manifest.summary()}")
+        if removed:
+            log_func(f"Removed {removed} outdated PDFs")
     return export_dir
 
 
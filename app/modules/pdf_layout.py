@@ -0,0 +1,250 @@
+"""
+PDF Layout
+
+Body layout shared by the ReportLab exporters. A report body is collected
+as a list of blocks (group headings, wrapped text, value boxes, rating rows);
+each block is wrapped and measured once when it is added, page breaks are
+decided in a pre-pass, and the blocks are then drawn top to bottom in a
+single pass.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from .config import Config
+
+# Part of every PDF manifest fingerprint: bump when a drawing change alters exported PDFs
+LAYOUT_VERSION = 1
+
+
+def _rgb(hex_color: str):
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16)/255.0 for i in (0, 2, 4))
+
+
+TEAL = _rgb('2B7A78')
+BOX_BG = _rgb('F7FBFA')
+
+MARGIN = 0.75 * 72  # 0.75 inch on every side
+BODY_FONT = 'Helvetica'
+LABEL_FONT = 'Helvetica-Bold'
+BODY_SIZE = 10
+LABEL_SIZE = 11
+LINE_LEADING = 12
+BLOCK_GAP = 18  # Space kept free below a value box or rating row
+BOX_PADDING = 6
+RATING_ICON_SIZE = 0.22 * 72
+
+
+@lru_cache(maxsize=Config.PDF_WRAP_CACHE_ENTRIES)
+def wrap_lines(text: str, font: str, size: float, width: float) -> Tuple[str, ...]:
+    """Return text wrapped to `width` points; repeated answers are wrapped once per process."""
+    from reportlab.lib.utils import simpleSplit
+    return tuple(simpleSplit(text, font, size, width))
+
+
+@dataclass
+class _Block:
+    """A piece of report body. The base class is a plain guard or spacer."""
+    needs: Optional[float]  # Free space required above the bottom margin, else a page break first
+    gap: float = 0  # Extra distance the block moves the cursor down
+
+    def advance(self, y: float) -> float:
+        """Return the cursor position after the block (same arithmetic as draw)."""
+        return y - self.gap if self.gap else y
+
+    def draw(self, c, layout: "ReportLayout", y: float, resources) -> None:
+        pass
+
+
+@dataclass
+class _Heading(_Block):
+    title: str = ""
+    rule_gap: float = 4
+
+    def advance(self, y: float) -> float:
+        y -= self.rule_gap
+        return y - 8
+
+    def draw(self, c, layout, y, resources):
+        c.setFillColorRGB(*TEAL)
+        c.setFont(LABEL_FONT, 13)
+        c.drawString(layout.x, y, self.title)
+        y -= self.rule_gap
+        c.setLineWidth(0.8)
+        c.setStrokeColorRGB(*TEAL)
+        c.line(layout.x, y, layout.x + layout.max_width, y)
+
+
+@dataclass
+class _Text(_Block):
+    lines: Tuple[str, ...] = ()
+    font: str = BODY_FONT
+    size: float = BODY_SIZE
+    color: Optional[tuple] = None
+
+    def advance(self, y: float) -> float:
+        for _ln in self.lines:
+            y -= LINE_LEADING
+        return super().advance(y)
+
+    def draw(self, c, layout, y, resources):
+        if self.color is not None:
+            c.setFillColorRGB(*self.color)
+        for ln in self.lines:
+            c.setFont(self.font, self.size)
+            c.drawString(layout.x, y, ln)
+            y -= LINE_LEADING
+
+
+@dataclass
+class _ValueBox(_Block):
+    label: str = ""
+    lines: Tuple[str, ...] = ()
+
+    @property
+    def box_height(self) -> float:
+        return len(self.lines) * LINE_LEADING + 2 * BOX_PADDING
+
+    def advance(self, y: float) -> float:
+        y -= 12
+        return y - self.box_height - BOX_PADDING
+
+    def draw(self, c, layout, y, resources):
+        x = layout.x
+        c.setFillColorRGB(*TEAL)
+        c.setFont(LABEL_FONT, 10)
+        c.drawString(x, y, self.label)
+        y -= 12
+        c.setFillColorRGB(*BOX_BG)
+        c.setStrokeColorRGB(*TEAL)
+        box_h = self.box_height
+        c.roundRect(x, y - box_h + BOX_PADDING, layout.max_width, box_h, 6, stroke=1, fill=1)
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont(BODY_FONT, BODY_SIZE)
+        ty = y - BOX_PADDING
+        for ln in self.lines:
+            c.drawString(x + BOX_PADDING, ty, ln)
+            ty -= LINE_LEADING
+
+
+@dataclass
+class _Rating(_Block):
+    label_lines: Tuple[str, ...] = ()
+    score: int = 0
+    icon_size: float = RATING_ICON_SIZE
+
+    def advance(self, y: float) -> float:
+        for _ln in self.label_lines:
+            y -= LINE_LEADING
+        y -= (self.icon_size + 6)
+        return y
+
+    def draw(self, c, layout, y, resources):
+        c.setFillColorRGB(*TEAL)
+        for ln in self.label_lines:
+            c.setFont(LABEL_FONT, LABEL_SIZE)
+            c.drawString(layout.x, y, ln)
+            y -= LINE_LEADING
+        if resources is None or layout.rating_icons is None:
+            return
+        try:
+            resources.draw_rating(self.score, layout.x, y - self.icon_size + 8, self.icon_size, *layout.rating_icons)
+        except Exception:
+            pass
+
+
+class ReportLayout:
+    """
+    Body of one report: blocks are added in reading order, then draw() paginates
+    and emits them.
+
+    Page breaks follow the exporters' existing rules: a group heading needs six
+    free lines, a value box or rating row needs its full height plus BLOCK_GAP,
+    and ensure_lines()/ensure_space() add explicit guards.
+    """
+
+    def __init__(self, page_size: Sequence[float], rating_icons: Optional[Tuple[str, str]] = None):
+        """
+        Initialize an empty layout.
+
+        Args:
+            page_size: (width, height) in points, e.g. reportlab.lib.pagesizes.letter
+            rating_icons: (checked_path, unchecked_path) drawn by rating rows
+        """
+        self.width, self.height = page_size
+        self.x = MARGIN
+        self.max_width = self.width - 2 * MARGIN
+        self.top = self.height - MARGIN
+        self.bottom = MARGIN
+        self.rating_icons = rating_icons
+        self.blocks: List[_Block] = []
+
+    def ensure_space(self, pixels: float) -> None:
+        """Break the page here unless `pixels` of space are left."""
+        self.blocks.append(_Block(needs=pixels))
+
+    def ensure_lines(self, lines: int) -> None:
+        """Break the page here unless `lines` body lines are left."""
+        self.ensure_space(lines * LINE_LEADING)
+
+    def space(self, pixels: float) -> None:
+        """Move the cursor down."""
+        self.blocks.append(_Block(needs=None, gap=pixels))
+
+    def heading(self, title: str, rule_gap: float = 4) -> None:
+        """Teal group title with a divider `rule_gap` points below its baseline."""
+        self.blocks.append(_Heading(needs=6 * LINE_LEADING, title=title, rule_gap=rule_gap))
+
+    def text(self, text, font: str = BODY_FONT, size: float = BODY_SIZE, extra_gap: float = 0,
+             color: Optional[tuple] = None) -> None:
+        """Wrapped text at the full body width (no page break inside)."""
+        lines = wrap_lines(str(text), font, size, self.max_width)
+        self.blocks.append(_Text(needs=None, gap=extra_gap, lines=lines, font=font, size=size, color=color))
+
+    def value_box(self, label: str, value) -> None:
+        """Teal label above a rounded box holding the wrapped value; kept on one page."""
+        lines = wrap_lines(str(value), BODY_FONT, BODY_SIZE, self.max_width - 2 * BOX_PADDING)
+        block = _ValueBox(needs=None, label=label, lines=lines)
+        block.needs = block.box_height + BLOCK_GAP
+        self.blocks.append(block)
+
+    def rating(self, label: str, score: int, icon_size: float = RATING_ICON_SIZE) -> None:
+        """Teal label above a row of five rating icons, the first `score` checked."""
+        lines = wrap_lines(str(label), LABEL_FONT, LABEL_SIZE, self.max_width)
+        self.blocks.append(_Rating(needs=icon_size + BLOCK_GAP + 8, label_lines=lines,
+                                   score=score, icon_size=icon_size))
+
+    def paginate(self, y: float) -> List[Tuple[_Block, float, bool]]:
+        """
+        Place every block, starting at cursor `y` on the current page.
+
+        Returns:
+            (block, y, starts_new_page) in drawing order
+        """
+        placed = []
+        for block in self.blocks:
+            new_page = block.needs is not None and y - block.needs < self.bottom
+            if new_page:
+                y = self.top
+            placed.append((block, y, new_page))
+            y = block.advance(y)
+        return placed
+
+    def draw(self, c, y: float, resources=None) -> int:
+        """
+        Draw the body onto canvas `c` from cursor `y`, breaking pages as paginate() decided.
+
+        The caller finishes the last page with showPage().
+
+        Returns:
+            Number of page breaks inserted
+        """
+        breaks = 0
+        for block, block_y, new_page in self.paginate(y):
+            if new_page:
+                c.showPage()
+                breaks += 1
+            block.draw(c, self, block_y, resources)
+        return breaks
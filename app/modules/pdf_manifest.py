@@ -0,0 +1,164 @@
+"""
+PDF Manifest
+
+Sidecar manifest kept next to exported PDFs. Each file is recorded with a
+fingerprint of everything it was rendered from: the employee's record, the
+header mappings of the fields it shows, the photo files' size and mtime and
+the exporter's layout version. A re-run skips PDFs whose fingerprint is
+unchanged and prunes files no employee produces anymore.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, Optional, Set
+
+from .config import Config
+
+MANIFEST_FORMAT = 1
+
+
+def _mapping_key(mapping) -> list:
+    """The parts of a header mapping that affect how its field is drawn."""
+    return [
+        getattr(getattr(mapping, 'group_under', None), 'value', None),
+        getattr(getattr(mapping, 'data_type_in_card', None), 'value', None),
+        getattr(mapping, 'display_order', None),
+    ]
+
+
+class PdfInputs:
+    """Computes PDF input fingerprints for one export run."""
+
+    def __init__(self, layout_version: str, header_mappings: Optional[Dict[Any, Any]] = None, extra: Any = None):
+        """
+        Initialize the fingerprinter.
+
+        Args:
+            layout_version: Exporter name and drawing version; changing it rebuilds every PDF
+            header_mappings: Column index -> HeaderMapping used by the exporter
+            extra: Anything else shared by every PDF of the run (e.g. workbook columns)
+        """
+        self._mappings: Dict[str, list] = {}
+        group_order = []
+        for m in (header_mappings or {}).values():
+            key = _mapping_key(m)
+            self._mappings[m.mapped_header] = key
+            if key[0] not in group_order:
+                group_order.append(key[0])
+        # Group order is shared by every PDF, so it is hashed once
+        self._base = json.dumps([MANIFEST_FORMAT, layout_version, group_order, extra], default=str)
+
+    def fingerprint(self, record: Dict[str, Any], photo_paths: Iterable[Optional[str]] = (), extra: Any = None) -> str:
+        """
+        Return the fingerprint of one PDF's inputs.
+
+        Args:
+            record: Employee record the PDF is drawn from
+            photo_paths: Image files drawn in the PDF (missing files are fingerprinted as absent)
+            extra: Per-PDF inputs not in the record (e.g. evaluator name, raw row values)
+        """
+        mappings = sorted((k, self._mappings[k]) for k, v in record.items()
+                          if k in self._mappings and v not in (None, ''))
+        photos = []
+        for path in photo_paths:
+            try:
+                stat = os.stat(path) if path else None
+            except OSError:
+                stat = None
+            photos.append([path, stat.st_mtime_ns, stat.st_size] if stat else [path, None])
+        payload = json.dumps([sorted(record.items(), key=lambda kv: str(kv[0])), mappings, photos, extra],
+                             default=str)
+        digest = hashlib.sha1(self._base.encode('utf-8'))
+        digest.update(payload.encode('utf-8'))
+        return digest.hexdigest()
+
+
+class PdfManifest:
+    """Fingerprints of the PDFs in one export directory, loaded at the start of a run and saved at its end."""
+
+    def __init__(self, export_dir: str, force: bool = False):
+        """
+        Load the manifest of an export directory.
+
+        Args:
+            export_dir: Directory holding the PDFs and the sidecar manifest
+            force: Ignore the saved fingerprints and rebuild every PDF
+        """
+        self.export_dir = export_dir
+        self.path = os.path.join(export_dir, Config.PDF_OUTPUT_MANIFEST_NAME)
+        self.previous: Dict[str, str] = {} if force else self._load()
+        self.files: Dict[str, str] = {}
+        self.rebuilt = 0
+        self.reused = 0
+        self._touched: Set[str] = set()  # written (or attempted) during this run
+
+    def _load(self) -> Dict[str, str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data.get('files', {}) if data.get('format') == MANIFEST_FORMAT else {}
+        except (OSError, ValueError, AttributeError):
+            return {}
+
+    def is_current(self, file_name: str, fingerprint: str) -> bool:
+        """
+        Return True and record the file as reused if it exists with the same inputs.
+
+        Otherwise the caller is expected to render it and report built() or failed().
+        A file already rendered during this run (several rows sharing a name) is
+        never reused, so the last writer still wins as in a full rebuild.
+        """
+        if (file_name in self._touched or self.previous.get(file_name) != fingerprint
+                or not os.path.exists(os.path.join(self.export_dir, file_name))):
+            self._touched.add(file_name)
+            return False
+        self.files[file_name] = fingerprint
+        self.reused += 1
+        return True
+
+    def built(self, file_name: str, fingerprint: str) -> None:
+        """Record a file written during this run."""
+        self.files[file_name] = fingerprint
+        self.rebuilt += 1
+
+    def failed(self, file_name: str) -> None:
+        """Record a file that could not be written; it is retried next run and not pruned."""
+        self.files.pop(file_name, None)
+
+    def summary(self) -> str:
+        """Short description for logs, e.g. '3 rebuilt, 30 reused'."""
+        return f"{self.rebuilt} rebuilt, {self.reused} reused"
+
+    def save(self, prune: bool = True) -> int:
+        """
+        Save the manifest, deleting PDFs recorded last run that this run did not produce.
+
+        Args:
+            prune: False when the run only saw some of the employees (e.g. a row
+                delta); unseen files then keep their previous entries
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for file_name, fingerprint in self.previous.items():
+            if file_name in self.files or file_name in self._touched:
+                continue
+            if not prune:
+                self.files[file_name] = fingerprint
+                continue
+            try:
+                os.remove(os.path.join(self.export_dir, file_name))
+                removed += 1
+            except OSError:
+                pass
+
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'format': MANIFEST_FORMAT, 'files': self.files}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[WARN] Could not save PDF manifest: {e}")
+        return removed
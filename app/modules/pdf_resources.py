@@ -0,0 +1,273 @@
+"""
+PDF Resources
+
+Prepared images shared by the ReportLab exporters. A photo drawn on many
+pages (an evaluator reviewing dozens of employees) is masked, downscaled and
+decoded once per process instead of once per draw, and rating icon rows
+repeated within one PDF are drawn through reusable Form XObjects.
+"""
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from .config import Config
+
+CIRCULAR_CACHE_EXTENSION = ".png"
+RATING_ICON_COUNT = 5
+
+# Decoded images shared by every canvas of the process: key -> ImageReader
+_shared_readers: "OrderedDict[Tuple[str, int, int], object]" = OrderedDict()
+SHARED_READER_LIMIT = 64
+
+
+def shared_image_reader(path: str):
+    """
+    Return a process-wide ImageReader for an image file (icons, logos).
+
+    The file is read and decoded once; the reader is refreshed when the
+    file's size or modification time changes.
+
+    Raises:
+        OSError if the file cannot be read
+    """
+    from reportlab.lib.utils import ImageReader
+
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    reader = _shared_readers.get(key)
+    if reader is None:
+        with open(path, 'rb') as f:
+            reader = ImageReader(io.BytesIO(f.read()))
+        reader.getRGBData()  # decode now so a broken file fails here, not mid-form
+        _shared_readers[key] = reader
+        if len(_shared_readers) > SHARED_READER_LIMIT:
+            _shared_readers.popitem(last=False)
+    else:
+        _shared_readers.move_to_end(key)
+    return reader
+
+
+class PdfResourceRegistry:
+    """
+    Rating icon rows repeated across the pages of one canvas, drawn through Form XObjects.
+
+    ReportLab already embeds each icon image once per document, but every
+    drawImage still emits its own placement and digests the image. A row
+    drawn FORM_MIN_USES times is turned into a form, so each later occurrence
+    is a single "Do" of a shared object; rarer rows are drawn directly, where
+    a form would only add bytes.
+    """
+
+    # A form costs ~500 bytes while the placements it replaces compress well,
+    # so only rows drawn this often in one document become forms
+    FORM_MIN_USES = 4
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self._forms: Dict[Tuple, str] = {}
+        self._seen: Dict[Tuple, int] = {}
+
+    def _draw_icons(self, score: int, x: float, y: float, icon_size: float, checked, unchecked, gap: float) -> None:
+        icon_x = x
+        for i in range(RATING_ICON_COUNT):
+            self.canvas.drawImage(checked if i < score else unchecked, icon_x, y, icon_size, icon_size, mask='auto')
+            icon_x += icon_size + gap
+
+    def draw_rating(self, score: int, x: float, y: float, icon_size: float,
+                    checked_path: str, unchecked_path: str, gap: float = 2) -> None:
+        """
+        Draw a row of rating icons, the first `score` checked, with its lower-left corner at (x, y).
+
+        Raises:
+            OSError if an icon cannot be read (nothing is drawn)
+        """
+        score = min(max(score, 0), RATING_ICON_COUNT)
+        checked = shared_image_reader(checked_path)
+        unchecked = shared_image_reader(unchecked_path)
+        key = (score, icon_size, gap, checked_path, unchecked_path)
+        name = self._forms.get(key)
+        if name is None:
+            self._seen[key] = self._seen.get(key, 0) + 1
+            if self._seen[key] < self.FORM_MIN_USES:
+                self._draw_icons(score, x, y, icon_size, checked, unchecked, gap)
+                return
+            name = f"Rating{len(self._forms)}"
+            width = RATING_ICON_COUNT * icon_size + (RATING_ICON_COUNT - 1) * gap
+            self.canvas.beginForm(name, 0, 0, width, icon_size)
+            self._draw_icons(score, 0, 0, icon_size, checked, unchecked, gap)
+            self.canvas.endForm()
+            self._forms[key] = name
+        c = self.canvas
+        c.saveState()
+        c.translate(x, y)
+        c.doForm(name)
+        c.restoreState()
+
+
+def render_circular_png(img_path: str, max_px: int) -> bytes:
+    """
+    Return a photo as PNG bytes with a circular (elliptical) alpha mask.
+
+    Images larger than max_px on either side are downscaled first, keeping
+    their aspect ratio; smaller ones are masked at their own size.
+    """
+    from PIL import Image, ImageDraw
+
+    with Image.open(img_path) as source:
+        pil_img = source.convert('RGBA') if source.mode != 'RGBA' else source.copy()
+    if max(pil_img.size) > max_px:
+        pil_img.thumbnail((max_px, max_px), Image.LANCZOS)
+
+    mask = Image.new('L', pil_img.size, 0)
+    ImageDraw.Draw(mask).ellipse([0, 0, pil_img.size[0], pil_img.size[1]], fill=255)
+    pil_img.putalpha(mask)
+
+    img_bytes = io.BytesIO()
+    pil_img.save(img_bytes, format='PNG')
+    return img_bytes.getvalue()
+
+
+class CircularImageCache:
+    """Bounded LRU cache of circular-masked profile photos as ReportLab ImageReaders."""
+
+    def __init__(self, max_entries: int = None, max_px: int = None, persist: bool = None,
+                 cache_dir: str = None, max_files: int = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: ImageReaders kept in memory (least recently used evicted)
+            max_px: Longest side of the prepared image (defaults to Config.PDF_PROFILE_IMAGE_PX)
+            persist: Also keep the masked PNGs on disk so later runs skip PIL work
+            cache_dir: Directory of the persisted PNGs (defaults to Config)
+            max_files: Persisted PNGs kept on disk (least recently used evicted)
+        """
+        self.max_entries = max_entries or Config.PDF_IMAGE_CACHE_ENTRIES
+        self.max_px = max_px or Config.PDF_PROFILE_IMAGE_PX
+        persist = Config.PDF_IMAGE_CACHE_PERSIST if persist is None else persist
+        self.cache_dir = (cache_dir or Config.get_pdf_image_cache_dir_path()) if persist else None
+        self.max_files = max_files or Config.PDF_IMAGE_CACHE_MAX_FILES
+        self._readers: "OrderedDict[str, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, img_path: str) -> str:
+        stat = os.stat(img_path)
+        raw = f"{os.path.abspath(img_path)}|{stat.st_mtime_ns}|{stat.st_size}|{self.max_px}"
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get(self, img_path: str):
+        """
+        Return the circular-masked ImageReader for a photo.
+
+        The reader is reused across canvases: ReportLab keeps its decoded pixel
+        data, so later draws only pay for embedding.
+
+        Raises:
+            OSError or a PIL error if the image cannot be read
+        """
+        from reportlab.lib.utils import ImageReader
+
+        key = self._key(img_path)
+        reader = self._readers.get(key)
+        if reader is not None:
+            self._readers.move_to_end(key)
+            self.hits += 1
+            return reader
+
+        self.misses += 1
+        png = self._load_persisted(key)
+        if png is None:
+            png = render_circular_png(img_path, self.max_px)
+            self._persist(key, png)
+        reader = ImageReader(io.BytesIO(png))
+        self._readers[key] = reader
+        if len(self._readers) > self.max_entries:
+            self._readers.popitem(last=False)
+        return reader
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CIRCULAR_CACHE_EXTENSION)
+
+    def _load_persisted(self, key: str) -> Optional[bytes]:
+        if not self.cache_dir:
+            return None
+        path = self._entry_path(key)
+        try:
+            with open(path, 'rb') as f:
+                png = f.read()
+            # Refresh mtime so eviction keeps recently used entries
+            os.utime(path, None)
+            return png
+        except OSError:
+            return None
+
+    def _persist(self, key: str, png: bytes) -> None:
+        if not self.cache_dir or not Config.ensure_directory_exists(self.cache_dir):
+            return
+        path = self._entry_path(key)
+        # Unique temporary name: pool workers may persist the same photo at once
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(png)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[WARN] Could not persist masked image: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+        self._evict_files(keep=path)
+
+    def _persisted_files(self):
+        """Return (path, mtime) of every persisted PNG, oldest first."""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(CIRCULAR_CACHE_EXTENSION):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                entries.append((path, os.stat(path).st_mtime))
+            except OSError:
+                continue
+        entries.sort(key=lambda e: e[1])
+        return entries
+
+    def _evict_files(self, keep: str = None) -> None:
+        entries = [path for path, _ in self._persisted_files() if path != keep]
+        for path in entries[:max(0, len(entries) + 1 - self.max_files)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self) -> int:
+        """Drop every cached image, in memory and on disk. Returns the number of files removed."""
+        self._readers.clear()
+        removed = 0
+        for path, _ in self._persisted_files():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+# Process-wide cache (each render worker process has its own)
+_circular_images: Optional[CircularImageCache] = None
+
+
+def circular_image_cache() -> CircularImageCache:
+    """Return the process-wide CircularImageCache, creating it on first use."""
+    global _circular_images
+    if _circular_images is None:
+        _circular_images = CircularImageCache()
+    return _circular_images
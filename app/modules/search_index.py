@@ -0,0 +1,79 @@
+"""
+Search Index
+
+Build-time index for the website's name search. The page used to run its
+fuzzy matcher over every card's DOM text on each keystroke; it now loads
+js/search-index.js and answers queries from postings:
+
+- trigrams of each whitespace-free lowercased name, for whole-name substring
+  matches
+- the distinct lowercased name words, for the per-word fuzzy rules (these are
+  checked once per distinct word instead of once per employee)
+- role, title and email as optional facets ("role:designer", "email:@firm")
+"""
+
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+SEARCH_INDEX_FILE = "search-index.js"
+
+# Same splitting as the page's fuzzyMatch: target.toLowerCase().split(/\s+/)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercased name, as the page lowercases it before matching."""
+    return name.lower()
+
+
+def name_trigrams(normalized: str) -> List[str]:
+    """Distinct trigrams of a normalized name with whitespace removed."""
+    compact = _WHITESPACE.sub("", normalized)
+    return list(dict.fromkeys(compact[i:i + 3] for i in range(len(compact) - 2)))
+
+
+def build_search_index(names: List[str], facets: Optional[Dict[str, List[Optional[str]]]] = None) -> Dict[str, Any]:
+    """
+    Build the search index for the employees in page order.
+
+    Args:
+        names: Display name per employee (as shown on the cards)
+        facets: Facet name -> value per employee (None when unknown)
+
+    Returns:
+        JSON-serializable index; ids are positions in `names`
+    """
+    normalized = [normalize_name(name) for name in names]
+    trigrams: Dict[str, List[int]] = {}
+    words: Dict[str, List[int]] = {}
+    for i, norm in enumerate(normalized):
+        for trigram in name_trigrams(norm):
+            trigrams.setdefault(trigram, []).append(i)
+        for word in dict.fromkeys(_WHITESPACE.split(norm)):
+            words.setdefault(word, []).append(i)
+
+    # Facet values are stored once; each employee points at its value (-1: none)
+    facet_index = {}
+    for facet, values in (facets or {}).items():
+        table: Dict[str, int] = {}
+        ids = [table.setdefault(value, len(table)) if value else -1 for value in values]
+        facet_index[facet] = {"values": list(table), "ids": ids}
+
+    return {"names": names, "norm": normalized, "trigrams": trigrams, "words": words, "facets": facet_index}
+
+
+def build_employee_search_index(employees, employee_manager) -> Dict[str, Any]:
+    """Search index of Employee objects, with names and facets read through an EmployeeManager."""
+    names = [employee_manager.get_employee_name(employee) or 'Unknown' for employee in employees]
+    facets = {
+        "role": [employee_manager.get_employee_role(employee) for employee in employees],
+        "title": [employee_manager.get_employee_title(employee) for employee in employees],
+        "email": [employee_manager.get_employee_email(employee) for employee in employees],
+    }
+    return build_search_index(names, facets)
+
+
+def search_index_script(index: Dict[str, Any]) -> str:
+    """Content of js/search-index.js."""
+    return f"window.__searchIndex = {json.dumps(index, separators=(',', ':'))};\n"
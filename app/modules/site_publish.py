@@ -0,0 +1,355 @@
+"""
+Site Publish
+
+Writes the generated website's pages and assets. In publish mode (see
+Config.WEBSITE_PUBLISH and --publish) pages, CSS and inline scripts are
+minified, assets get content-hashed file names that the pages reference,
+and every text file gets deterministic .gz (and, when the brotli module is
+installed, .br) siblings for hosts that serve precompressed files.
+
+Files whose content did not change are not rewritten, so a redeploy only
+touches what changed. A manifest of the files written by the last build is
+kept in the output directory; files that build produced and this one did
+not (old hashed names, shards of a larger build) are removed, as are the
+files builds wrote before the manifest existed. The manifest
+also records a signature of the build's inputs, so a caller can tell that
+the site on disk is already current and skip the build.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import urllib.request
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from .config import Config
+
+MANIFEST_FORMAT = 1
+COMPRESSED_SUFFIXES = (".html", ".css", ".js", ".json", ".svg")
+HASH_LENGTH = 10
+
+_SCRIPT_OR_STYLE = re.compile(r"(<(script|style)\b[^>]*>)(.*?)(</\2>)", re.S | re.I)
+_HTML_COMMENT = re.compile(r"<!--(?!\[).*?-->", re.S)
+_BETWEEN_TAGS = re.compile(r">\s+<")
+_SEGMENT_END = re.compile(r"^\s+|\s+$")
+_CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_AFTER = re.compile(r"([{};,])\s+")
+_CSS_SPACE_BEFORE = re.compile(r"\s+([{};])")
+# Runs of JavaScript that can never start a literal, comment or template substitution
+_JS_PLAIN = re.compile(r"[^'\"`/{}\s]+")
+_REGEX_PRECEDERS = frozenset("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORD = re.compile(r"(?:^|[^\w$])(?:return|typeof|instanceof|in|of|new|delete|void|throw|case|do|else|"
+                            r"yield|await)$")
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and the whitespace around braces, semicolons and commas."""
+    css = _CSS_COMMENT.sub("", css)
+    css = _CSS_SPACE_AFTER.sub(r"\1", css)
+    css = _CSS_SPACE_BEFORE.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", re.sub(r"\s+", " ", css))
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js: str) -> str:
+    """
+    Drop comments, indentation, trailing whitespace and blank lines.
+
+    Only code outside string, template and regular expression literals is
+    touched, and line breaks are kept, so literal contents and automatic
+    semicolon insertion behave exactly as before.
+    """
+    out = []
+    substitutions = []  # brace depth inside each open template ${...}
+    in_template = False
+    position, length = 0, len(js)
+    while position < length:
+        if in_template:
+            end = position
+            while end < length and js[end] != "`" and not js.startswith("${", end):
+                end += 2 if js[end] == "\\" else 1
+            if js.startswith("${", end):
+                substitutions.append(0)
+                end += 2
+            else:
+                end += 1
+            out.append(js[position:end])
+            in_template = False
+            position = end
+            continue
+
+        char = js[position]
+        plain = _JS_PLAIN.match(js, position)
+        if plain:
+            out.append(plain.group())
+            position = plain.end()
+        elif char in "'\"":
+            end = position + 1
+            while end < length and js[end] not in (char, "\n"):
+                end += 2 if js[end] == "\\" else 1
+            end = min(end + 1 if js[end:end + 1] == char else end, length)
+            out.append(js[position:end])
+            position = end
+        elif char == "`":
+            out.append(char)
+            in_template = True
+            position += 1
+        elif js.startswith("//", position):
+            end = js.find("\n", position)
+            position = length if end < 0 else end
+        elif js.startswith("/*", position):
+            end = js.find("*/", position + 2)
+            end = length if end < 0 else end + 2
+            # A comment spanning lines is a line terminator for semicolon insertion
+            _js_space(out, "\n" if "\n" in js[position:end] else " ")
+            position = end
+        elif char == "/" and _regex_allowed(out):
+            end, in_class = position + 1, False
+            while end < length and js[end] != "\n":
+                if js[end] == "\\":
+                    end += 1
+                elif js[end] == "[":
+                    in_class = True
+                elif js[end] == "]":
+                    in_class = False
+                elif js[end] == "/" and not in_class:
+                    break
+                end += 1
+            end = min(end + 1, length)
+            out.append(js[position:end])
+            position = end
+        elif char in "{}" and substitutions:
+            if char == "}" and substitutions[-1] == 0:
+                substitutions.pop()
+                in_template = True
+            else:
+                substitutions[-1] += 1 if char == "{" else -1
+            out.append(char)
+            position += 1
+        elif char.isspace():
+            _js_space(out, char)
+            position += 1
+        else:
+            out.append(char)
+            position += 1
+    _js_space(out, "\n")
+    return "".join(out).rstrip("\n")
+
+
+def _js_space(out: list, char: str) -> None:
+    # Whitespace pieces are appended one character at a time, so trailing ones can be popped
+    if char not in "\r\n":
+        if out and not out[-1].endswith("\n"):
+            out.append(char)
+        return
+    while out and out[-1] in (" ", "\t", "\r", "\f", "\v"):
+        out.pop()
+    if out and not out[-1].endswith("\n"):
+        out.append("\n")
+
+
+def _regex_allowed(out: list) -> bool:
+    """Whether a / at this point starts a regular expression literal rather than a division."""
+    tail = "".join(out[-4:]).rstrip()
+    return not tail or tail[-1] in _REGEX_PRECEDERS or bool(_REGEX_KEYWORD.search(tail))
+
+
+def minify_html(html: str) -> str:
+    """Minify inline scripts and styles, drop comments and collapse whitespace between tags."""
+    parts = []
+    position = 0
+    for match in _SCRIPT_OR_STYLE.finditer(html):
+        parts.append(_minify_markup(html[position:match.start()]))
+        body = match.group(3)
+        if match.group(2).lower() == "style":
+            body = minify_css(body)
+        elif body.strip():
+            body = minify_js(body)
+        parts.append(match.group(1) + body + match.group(4))
+        position = match.end()
+    parts.append(_minify_markup(html[position:]))
+    return "".join(parts).strip() + "\n"
+
+
+def _minify_markup(markup: str) -> str:
+    # A single space renders like any whitespace run outside <pre> (which the site does not use);
+    # the ends of a segment touch a <script> or <style> tag
+    markup = _BETWEEN_TAGS.sub("> <", _HTML_COMMENT.sub("", markup))
+    return _SEGMENT_END.sub(" ", markup)
+
+
+def _compressors():
+    compressors = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+        compressors[".br"] = lambda data: brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    return compressors
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
+
+
+class SiteWriter:
+    """Writes one build of the website into its output directory."""
+
+    def __init__(self, output_path: Union[str, Path], publish: Optional[bool] = None, inputs: Optional[str] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Website output directory
+            publish: Minify, hash and precompress (defaults to Config.WEBSITE_PUBLISH)
+            inputs: Signature of everything the build is made from (see is_current)
+        """
+        self.output_path = Path(output_path)
+        self.publish = Config.WEBSITE_PUBLISH if publish is None else publish
+        self.inputs = inputs
+        self.manifest_path = self.output_path / Config.WEBSITE_PUBLISH_MANIFEST_NAME
+        self.compressors = _compressors() if self.publish else {}
+        self.references: Dict[str, str] = {}  # reference in the pages -> published path
+        self.written = set()  # relative paths produced by this build
+        self.changed = 0
+
+    def _write(self, rel_path: str, data: bytes) -> None:
+        self.written.add(rel_path)
+        if _write_if_changed(self.output_path / rel_path, data):
+            self.changed += 1
+        if rel_path.endswith(COMPRESSED_SUFFIXES):
+            for suffix, compress in self.compressors.items():
+                self.written.add(rel_path + suffix)
+                if _write_if_changed(self.output_path / (rel_path + suffix), compress(data)):
+                    self.changed += 1
+
+    def asset(self, rel_path: str, content: Union[str, bytes], reference: str = None) -> str:
+        """
+        Write an asset referenced by the pages.
+
+        Args:
+            rel_path: Path below the output directory, with forward slashes (e.g. "css/styles.css")
+            content: File content
+            reference: How pages refer to it (defaults to rel_path)
+
+        Returns:
+            Path the asset was written to; a content-hashed name in publish mode
+        """
+        if self.publish and rel_path.endswith(".css"):
+            content = minify_css(content)
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        published = rel_path
+        if self.publish:
+            stem, ext = os.path.splitext(rel_path)
+            published = f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+        self._write(published, data)
+        self.references[reference or rel_path] = published
+        return published
+
+    def vendor(self, url: str, local_path: str, rel_path: str, sha256: str = "") -> str:
+        """
+        Serve a pinned third-party script from the site instead of its CDN URL.
+
+        The copy at local_path (downloaded once when missing) is only written
+        and served if its SHA-256 matches the pinned digest. Without a pin, a
+        matching copy or network access, pages keep the CDN URL.
+
+        Args:
+            url: Pinned CDN URL the pages reference
+            local_path: Where the vendored copy is kept
+            rel_path: Path below the output directory to serve it from
+            sha256: Expected hex digest of the file
+
+        Returns:
+            Path the pages now reference
+        """
+        if not sha256:
+            print(f"[INFO] No pinned SHA-256 for {url}; pages load it from the CDN (the site needs network access)")
+            return url
+        downloaded = not os.path.exists(local_path)
+        try:
+            if downloaded:
+                with urllib.request.urlopen(url, timeout=20) as response:
+                    data = response.read()
+            else:
+                with open(local_path, 'rb') as f:
+                    data = f.read()
+        except Exception as e:
+            print(f"[WARN] Could not vendor {url} ({e}); pages load it from the CDN")
+            return url
+        if hashlib.sha256(data).hexdigest() != sha256.lower():
+            source = url if downloaded else local_path
+            print(f"[WARN] {source} does not match the pinned SHA-256; pages load {url} from the CDN")
+            return url
+        if downloaded:
+            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+            with open(local_path, 'wb') as f:
+                f.write(data)
+            print(f"[OK] Vendored {url} -> {local_path}")
+        return self.asset(rel_path, data, reference=url)
+
+    def is_current(self) -> bool:
+        """Return True if the last build had the same inputs and every file it wrote is still there."""
+        data = self._read_manifest()
+        if not self.inputs or data.get('inputs') != self.inputs:
+            return False
+        return all((self.output_path / rel_path).exists() for rel_path in data.get('files', []))
+
+    def page(self, rel_path: str, html: str) -> None:
+        """Write a page, pointing its asset references at the published files."""
+        for reference, published in self.references.items():
+            if reference != published:
+                html = html.replace(f'"{reference}"', f'"{published}"')
+        if self.publish:
+            html = minify_html(html)
+        self._write(rel_path, html.encode("utf-8"))
+
+    def finish(self) -> int:
+        """
+        Remove files the previous build wrote and this one did not, and save the manifest.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for rel_path in sorted(set(self._load_manifest()) | set(Config.WEBSITE_LEGACY_FILES)):
+            if rel_path in self.written:
+                continue
+            try:
+                os.remove(self.output_path / rel_path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print(f"[WARN] Could not remove stale website file {rel_path}: {e}")
+
+        tmp_path = str(self.manifest_path) + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'format': MANIFEST_FORMAT, 'inputs': self.inputs, 'files': sorted(self.written)}, f,
+                          indent=1)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            print(f"[WARN] Could not save website manifest: {e}")
+        return removed
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) and data.get('format') == MANIFEST_FORMAT else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _load_manifest(self):
+        return self._read_manifest().get('files', [])
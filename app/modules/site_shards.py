@@ -0,0 +1,220 @@
+"""
+Site Shards
+
+Sharded employee cards for large generated websites. Card HTML is written to
+small script files of Config.WEBSITE_SHARD_SIZE cards each plus an index of
+employee names; index.html only carries the index. The page keeps one
+placeholder per shard and renders shards as they scroll near the viewport
+(releasing them again when they scroll far away), so first paint and
+time-to-interactive do not grow with headcount.
+
+Shards are plain scripts rather than JSON so the site also works when opened
+from disk (file:// pages cannot fetch() local files).
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SHARD_DIR = "data"
+INDEX_FILE = "cards-index.js"
+SHARD_PREFIX = "cards-"
+SHARD_PATTERN = SHARD_PREFIX + "{:04d}.js"
+
+
+def write_card_shards(output_path: Path, names: List[str], fragments: List[str], shard_size: int,
+                      write_asset: Callable[[str, str], str]) -> Dict[str, Any]:
+    """
+    Write card HTML fragments as shard scripts plus the card index.
+
+    Args:
+        output_path: Website output directory
+        names: Employee name per card (used by search and the PDF export)
+        fragments: Card HTML per employee, in page order
+        shard_size: Cards per shard file
+        write_asset: Writes (path below output_path, content) and returns the path
+            written, e.g. SiteWriter.asset (which may content-hash the name)
+
+    Returns:
+        The index written to data/cards-index.js
+    """
+    shard_size = max(1, shard_size)
+    shards = []
+    for number, start in enumerate(range(0, len(fragments), shard_size)):
+        content = f"window.__loadCardShard({number}, {json.dumps(fragments[start:start + shard_size])});\n"
+        shards.append(write_asset(f"{SHARD_DIR}/{SHARD_PATTERN.format(number)}", content))
+
+    index = {"count": len(fragments), "shardSize": shard_size, "shards": shards, "names": names}
+    index_path = write_asset(f"{SHARD_DIR}/{INDEX_FILE}", f"window.__cardIndex = {json.dumps(index)};\n")
+
+    # Shards left over from a larger previous build
+    _remove_shards(Path(output_path) / SHARD_DIR, keep={Path(path).name for path in shards + [index_path]})
+    return index
+
+
+def remove_card_shards(output_path: Path) -> None:
+    """Delete shards and the card index left by a sharded build (the site now inlines its cards)."""
+    _remove_shards(Path(output_path) / SHARD_DIR, keep=set())
+
+
+def _remove_shards(data_dir: Path, keep: set) -> None:
+    if not data_dir.is_dir():
+        return
+    for file_name in os.listdir(data_dir):
+        if file_name.startswith(SHARD_PREFIX) and file_name.endswith(".js") and file_name not in keep:
+            os.remove(data_dir / file_name)
+
+
+def index_script_tag() -> str:
+    """<script> loading the card index (placed in <head>)."""
+    return f'<script src="{SHARD_DIR}/{INDEX_FILE}"></script>'
+
+
+# #employee-list stacks one grid per shard instead of being the grid itself
+SHARDED_CARDS_STYLE = '''
+    <style>
+        .card-shards { display: flex; flex-direction: column; gap: 24px; }
+    </style>'''
+
+
+# Placeholder management, lazy shard loading and the card source used by the
+# modal and search. Runs right after #employee-list, before the page script.
+SHARDED_CARDS_SCRIPT = '''
+    <script>
+        // Sharded cards: one placeholder per shard, rendered near the viewport
+        (function setupShardedCards() {
+            const index = window.__cardIndex;
+            const listEl = document.getElementById('employee-list');
+            if (!index || !listEl) return;
+            const GAP = 24;
+            const MIN_CARD_WIDTH = 400;
+            let cardHeight = 900;  // estimate, calibrated from the first rendered shard
+            let filter = null;     // Set of visible employee indices, or null for all
+            const shards = [];
+            const waiting = {};
+
+            window.__loadCardShard = function(number, cards) {
+                shards[number].cards = cards;
+                if (waiting[number]) {
+                    waiting[number](cards);
+                    delete waiting[number];
+                }
+            };
+
+            function columns() {
+                return Math.max(1, Math.floor((listEl.clientWidth + GAP) / (MIN_CARD_WIDTH + GAP)));
+            }
+            function firstIndex(number) { return number * index.shardSize; }
+            function visibleCount(number) {
+                const start = firstIndex(number);
+                const end = Math.min(index.count, start + index.shardSize);
+                if (!filter) return end - start;
+                let count = 0;
+                for (let i = start; i < end; i++) if (filter.has(i)) count++;
+                return count;
+            }
+            function estimate(number) {
+                const rows = Math.ceil(visibleCount(number) / columns());
+                return rows ? rows * cardHeight + (rows - 1) * GAP : 0;
+            }
+
+            function load(number) {
+                const shard = shards[number];
+                if (shard.cards) return Promise.resolve(shard.cards);
+                if (!shard.promise) {
+                    shard.promise = new Promise(function(resolve, reject) {
+                        waiting[number] = resolve;
+                        const script = document.createElement('script');
+                        script.src = index.shards[number];
+                        script.onerror = function() {
+                            shard.promise = null;
+                            delete waiting[number];
+                            reject(new Error('Could not load ' + index.shards[number]));
+                        };
+                        document.head.appendChild(script);
+                    });
+                }
+                return shard.promise;
+            }
+
+            function applyFilter(number) {
+                const shard = shards[number];
+                shard.el.style.display = visibleCount(number) ? '' : 'none';
+                if (!shard.rendered) {
+                    shard.el.style.minHeight = estimate(number) + 'px';
+                    return;
+                }
+                const start = firstIndex(number);
+                Array.from(shard.el.children).forEach(function(card, k) {
+                    card.style.display = !filter || filter.has(start + k) ? 'block' : 'none';
+                });
+            }
+
+            function render(number) {
+                const shard = shards[number];
+                load(number).then(function(cards) {
+                    if (shard.rendered || !shard.near) return;
+                    shard.el.innerHTML = cards.join('');
+                    shard.el.style.minHeight = '';
+                    shard.rendered = true;
+                    if (filter) applyFilter(number);
+                    const rows = Math.ceil(visibleCount(number) / columns());
+                    if (rows) cardHeight = Math.max(100, (shard.el.offsetHeight - (rows - 1) * GAP) / rows);
+                }).catch(function(err) { console.error(err); });
+            }
+
+            function release(number) {
+                const shard = shards[number];
+                if (!shard.rendered || shard.el.contains(document.activeElement)) return;
+                shard.el.style.minHeight = shard.el.offsetHeight + 'px';
+                shard.el.innerHTML = '';
+                shard.rendered = false;
+            }
+
+            const observer = new IntersectionObserver(function(entries) {
+                entries.forEach(function(entry) {
+                    const number = Number(entry.target.dataset.shard);
+                    shards[number].near = entry.isIntersecting;
+                    if (entry.isIntersecting) render(number); else release(number);
+                });
+            }, { rootMargin: '1500px 0px' });
+
+            for (let number = 0; number < index.shards.length; number++) {
+                const el = document.createElement('div');
+                el.className = 'employee-grid card-shard';
+                el.dataset.shard = number;
+                listEl.appendChild(el);
+                shards.push({ el: el, cards: null, promise: null, rendered: false, near: false });
+                el.style.minHeight = estimate(number) + 'px';
+                observer.observe(el);
+            }
+
+            // Card access for the modal, search and PDF export (cards may not be in the DOM)
+            window.__cardSource = {
+                count: function() { return index.count; },
+                names: function() { return index.names.slice(); },
+                indexOf: function(card) {
+                    const i = Number(card.getAttribute('data-employee-index'));
+                    return isNaN(i) ? -1 : i;
+                },
+                card: function(i) {
+                    const number = Math.floor(i / index.shardSize);
+                    return load(number).then(function(cards) {
+                        const holder = document.createElement('div');
+                        holder.innerHTML = cards[i - firstIndex(number)];
+                        return holder.firstElementChild;
+                    });
+                },
+                filter: function(predicate) {
+                    filter = null;
+                    if (predicate) {
+                        filter = new Set();
+                        for (let i = 0; i < index.count; i++) if (predicate(i, index.names[i])) filter.add(i);
+                    }
+                    for (let number = 0; number < shards.length; number++) applyFilter(number);
+                    return filter ? filter.size : index.count;
+                }
+            };
+        })();
+    </script>'''
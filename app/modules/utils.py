@@ -4,9 +4,11 @@ Utility Functions
 Helper functions and utilities for the Employee Evaluation system.
 """
 
+import functools
+import hashlib
 import os
 import sys
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 VERBOSE = os.environ.get("EE_VERBOSE", "0") in ("1", "true", "True")
@@ -28,6 +30,36 @@ def ensure_output_directory(output_dir: str = None) -> str:
     return output_dir
 
 
+@functools.lru_cache(maxsize=None)
+def source_signature(module_names: Optional[Tuple[str, ...]] = None) -> str:
+    """
+    Return a digest of source files of this package, for keys of caches whose content they shape.
+
+    Args:
+        module_names: File names such as "excel_parser.py" (defaults to every module)
+
+    Frozen builds ship no sources; the executable's size and mtime stand in for them.
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    if module_names is None:
+        try:
+            module_names = tuple(sorted(name for name in os.listdir(module_dir) if name.endswith(".py")))
+        except OSError:
+            module_names = ()
+    digest = hashlib.sha256()
+    for name in module_names:
+        try:
+            with open(os.path.join(module_dir, name), 'rb') as f:
+                digest.update(name.encode('utf-8') + b"\0" + f.read())
+        except OSError:
+            stat = os.stat(sys.executable)
+            digest.update(f"{name}:{sys.executable}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    if not module_names:
+        stat = os.stat(sys.executable)
+        digest.update(f"{sys.executable}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+    return digest.hexdigest()
+
+
 def get_timestamp() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -0,0 +1,314 @@
+"""
+Evaluation Warehouse
+
+Local SQLite store that accumulates every year's parsed evaluation
+responses, so multi-year questions (an employee's trajectory, firm-wide
+trends) are indexed queries instead of re-parsing old workbooks.
+
+Responses are kept in long form (one row per response and field) because
+the form's column layout changes from year to year. Each response is filed
+under a stable employee key (the normalized email, or the name when there
+is no email) and a year, with at most one response per employee and year.
+Numeric scores ("4", "3 (Meets Expectations)") are stored next to the raw
+values so trends can be averaged in SQL.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .analytics import score
+from .config import Config
+from .employee import EmployeeManager
+
+# Bump when the schema changes; databases with another version are refused, not migrated
+SCHEMA_VERSION = 1
+
+# Bookkeeping added by the parser, not part of the response
+SKIPPED_FIELDS = {'data_sources', 'last_updated', 'profile_image_filename', 'profile_image_path',
+                  'image_match_confidence'}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS employees (
+    id INTEGER PRIMARY KEY,
+    employee_key TEXT NOT NULL UNIQUE,
+    name TEXT
+);
+CREATE TABLE IF NOT EXISTS fields (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY,
+    employee_id INTEGER NOT NULL REFERENCES employees(id),
+    year INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    source TEXT,
+    ingested_at TEXT NOT NULL,
+    UNIQUE (employee_id, year)
+);
+CREATE TABLE IF NOT EXISTS response_values (
+    response_id INTEGER NOT NULL REFERENCES responses(id) ON DELETE CASCADE,
+    field_id INTEGER NOT NULL REFERENCES fields(id),
+    value TEXT,
+    score REAL,
+    PRIMARY KEY (response_id, field_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_responses_year ON responses (year, employee_id);
+CREATE INDEX IF NOT EXISTS idx_values_field ON response_values (field_id, response_id, score);
+"""
+
+
+def employee_key(email: Optional[str], name: Optional[str] = None) -> Optional[str]:
+    """Stable warehouse key of an employee: their normalized email, else "name:" + normalized name."""
+    if email and str(email).strip():
+        return EmployeeManager.normalize_key(email)
+    if name and str(name).strip():
+        return "name:" + EmployeeManager.normalize_key(name)
+    return None
+
+
+def _response_values(record: Dict[str, Any]) -> Dict[str, Tuple[str, Optional[float]]]:
+    # Field -> (JSON-encoded value, so numbers and text read back as parsed; numeric score or None)
+    values = {}
+    for field, value in sorted(record.items()):
+        if field not in SKIPPED_FIELDS and not field.startswith('_') and value is not None:
+            number = score(value)
+            values[field] = (json.dumps(value, ensure_ascii=False, default=str), None if number != number else number)
+    return values
+
+
+class EvaluationWarehouse:
+    """SQLite warehouse of evaluation responses by employee and year."""
+
+    def __init__(self, db_path: str = None):
+        """
+        Open (and create if needed) the warehouse.
+
+        Args:
+            db_path: Database file (defaults to Config.get_warehouse_path())
+        """
+        self.db_path = db_path or Config.get_warehouse_path()
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.connection = sqlite3.connect(self.db_path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            self.connection.close()
+            raise ValueError(f"Warehouse {self.db_path} has schema version {version}, expected {SCHEMA_VERSION}")
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._field_ids: Dict[str, int] = dict(self.connection.execute("SELECT name, id FROM fields"))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self) -> 'EvaluationWarehouse':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _field_id(self, name: str) -> int:
+        field_id = self._field_ids.get(name)
+        if field_id is None:
+            field_id = self.connection.execute("INSERT INTO fields (name) VALUES (?)", (name,)).lastrowid
+            self._field_ids[name] = field_id
+        return field_id
+
+    def _employee_id(self, key: str, name: Optional[str]) -> int:
+        self.connection.execute("INSERT INTO employees (employee_key, name) VALUES (?, ?) "
+                                "ON CONFLICT (employee_key) DO UPDATE SET name = COALESCE(excluded.name, name)",
+                                (key, name))
+        return self.connection.execute("SELECT id FROM employees WHERE employee_key = ?", (key,)).fetchone()[0]
+
+    def ingest(self, employees: Iterable[Any], year: int = None, source: str = None,
+               employee_manager: EmployeeManager = None, prune: bool = True) -> Dict[str, int]:
+        """
+        File one year's responses.
+
+        Responses whose values did not change since the last ingest of that year
+        are left alone. With prune=True the employees given are that year's complete
+        set, and responses filed earlier for anyone missing from it are removed.
+
+        Args:
+            employees: Employee objects, EmployeeStore rows or employee data dictionaries
+            year: Evaluation year (defaults to Config.EVALUATION_YEAR)
+            source: Where the responses came from (e.g. the workbook path)
+            employee_manager: Resolves names and emails (defaults to the predefined mappings)
+            prune: Remove the year's responses for employees not given
+
+        Returns:
+            Counts of 'added', 'updated', 'unchanged', 'removed' and 'skipped' (no email or name) responses
+        """
+        year = Config.EVALUATION_YEAR if year is None else int(year)
+        employee_manager = employee_manager or EmployeeManager()
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0, 'skipped': 0}
+        ingested_at = datetime.now().isoformat(timespec='seconds')
+
+        # Later responses of the same employee replace earlier ones, as a resubmitted form would
+        responses: Dict[str, Tuple[Optional[str], Dict[str, Tuple[str, Optional[float]]]]] = {}
+        for employee in employees:
+            record = employee if isinstance(employee, dict) else employee.as_record()
+            name = employee_manager.get_employee_name(record)
+            key = employee_key(employee_manager.get_employee_email(record), name)
+            if key is None:
+                counts['skipped'] += 1
+                continue
+            responses.pop(key, None)
+            responses[key] = (name, _response_values(record))
+
+        try:
+            self._write_responses(responses, year, source, ingested_at, prune, counts)
+        except sqlite3.Error:
+            # The transaction was rolled back; so were any field ids created in it
+            self._field_ids = dict(self.connection.execute("SELECT name, id FROM fields"))
+            raise
+        return counts
+
+    def _write_responses(self, responses: Dict[str, Tuple[Optional[str], Dict[str, Tuple[str, Optional[float]]]]],
+                         year: int, source: Optional[str], ingested_at: str, prune: bool,
+                         counts: Dict[str, int]) -> None:
+        with self.connection:
+            existing = dict(self.connection.execute(
+                "SELECT e.employee_key, r.digest FROM responses r JOIN employees e ON e.id = r.employee_id "
+                "WHERE r.year = ?", (year,)))
+
+            for key, (name, values) in responses.items():
+                digest = hashlib.sha256(json.dumps([(field, value) for field, (value, _) in values.items()])
+                                        .encode('utf-8')).hexdigest()
+                if existing.get(key) == digest:
+                    counts['unchanged'] += 1
+                    continue
+                counts['updated' if key in existing else 'added'] += 1
+
+                employee_id = self._employee_id(key, name)
+                self.connection.execute("DELETE FROM responses WHERE employee_id = ? AND year = ?", (employee_id, year))
+                response_id = self.connection.execute(
+                    "INSERT INTO responses (employee_id, year, digest, source, ingested_at) VALUES (?, ?, ?, ?, ?)",
+                    (employee_id, year, digest, source, ingested_at)).lastrowid
+                self.connection.executemany(
+                    "INSERT INTO response_values (response_id, field_id, value, score) VALUES (?, ?, ?, ?)",
+                    [(response_id, self._field_id(field), value, value_score)
+                     for field, (value, value_score) in values.items()])
+
+            if prune:
+                stale = [key for key in existing if key not in responses]
+                for key in stale:
+                    self.connection.execute(
+                        "DELETE FROM responses WHERE year = ? AND employee_id = "
+                        "(SELECT id FROM employees WHERE employee_key = ?)", (year, key))
+                counts['removed'] = len(stale)
+
+    def years(self) -> List[int]:
+        """Years with at least one response, ascending."""
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT year FROM responses ORDER BY year")]
+
+    def fields(self) -> List[str]:
+        """Every field name ever ingested."""
+        return [row[0] for row in self.connection.execute("SELECT name FROM fields ORDER BY name")]
+
+    def employee_history(self, key: str, fields: List[str] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        All responses of one employee.
+
+        Args:
+            key: Employee key, email or name (see employee_key())
+            fields: Only these fields (default: all)
+
+        Returns:
+            Year -> {field: value}, ascending by year
+        """
+        query = ("SELECT r.year, f.name, v.value FROM employees e "
+                 "JOIN responses r ON r.employee_id = e.id "
+                 "JOIN response_values v ON v.response_id = r.id "
+                 "JOIN fields f ON f.id = v.field_id "
+                 "WHERE e.employee_key = ?")
+        params: List[Any] = [self._resolve_key(key)]
+        if fields:
+            query += f" AND f.name IN ({','.join('?' * len(fields))})"
+            params.extend(fields)
+        history: Dict[int, Dict[str, Any]] = {}
+        for year, field, value in self.connection.execute(query + " ORDER BY r.year", params):
+            history.setdefault(year, {})[field] = json.loads(value)
+        return history
+
+    def employee_trajectory(self, key: str, field: str) -> List[Dict[str, Any]]:
+        """
+        One field of one employee across years.
+
+        Returns:
+            [{'year', 'value', 'score'}] ascending by year (score None when not numeric)
+        """
+        rows = self.connection.execute(
+            "SELECT r.year, v.value, v.score FROM employees e "
+            "JOIN responses r ON r.employee_id = e.id "
+            "JOIN response_values v ON v.response_id = r.id AND v.field_id = "
+            "(SELECT id FROM fields WHERE name = ?) "
+            "WHERE e.employee_key = ? ORDER BY r.year", (field, self._resolve_key(key)))
+        return [{'year': year, 'value': json.loads(value), 'score': value_score} for year, value, value_score in rows]
+
+    def firm_trend(self, field: str) -> List[Dict[str, Any]]:
+        """
+        Firm-wide statistics of one field per year.
+
+        Returns:
+            [{'year', 'responses', 'scored', 'mean', 'distribution': {value: count}}]
+            ascending by year; mean is None when no value is numeric
+        """
+        field_id = self._field_ids.get(field)
+        if field_id is None:
+            return []
+        trend = {}
+        for year, responses, scored, mean in self.connection.execute(
+                "SELECT r.year, COUNT(*), COUNT(v.score), AVG(v.score) FROM response_values v "
+                "JOIN responses r ON r.id = v.response_id WHERE v.field_id = ? "
+                "GROUP BY r.year ORDER BY r.year", (field_id,)):
+            trend[year] = {'year': year, 'responses': responses, 'scored': scored,
+                           'mean': None if mean is None else round(mean, 2), 'distribution': {}}
+        for year, value, count in self.connection.execute(
+                "SELECT r.year, v.value, COUNT(*) FROM response_values v "
+                "JOIN responses r ON r.id = v.response_id WHERE v.field_id = ? "
+                "GROUP BY r.year, v.value ORDER BY r.year, MIN(v.score) IS NULL, MIN(v.score), v.value", (field_id,)):
+            trend[year]['distribution'][str(json.loads(value))] = count
+        return list(trend.values())
+
+    @staticmethod
+    def _resolve_key(key: str) -> str:
+        # Accept a raw email or name as well as a stored key
+        if key.startswith("name:"):
+            return key
+        return employee_key(key) if "@" in key else employee_key(None, key)
+
+
+def update_warehouse(employees: Iterable[Any], year: int = None, source: str = None,
+                     employee_manager: EmployeeManager = None, db_path: str = None,
+                     prune: bool = True) -> Optional[Dict[str, int]]:
+    """
+    File a run's responses in the warehouse, logging instead of raising on failure.
+
+    Args:
+        prune: The employees are the year's complete set (see EvaluationWarehouse.ingest)
+
+    Returns:
+        Ingest counts, or None if the warehouse could not be updated
+    """
+    try:
+        with EvaluationWarehouse(db_path) as warehouse:
+            counts = warehouse.ingest(employees, year, source, employee_manager, prune=prune)
+        year = Config.EVALUATION_YEAR if year is None else year
+        print(f"[OK] Warehouse {year}: {counts['added']} added, {counts['updated']} updated, "
+              f"{counts['unchanged']} unchanged, {counts['removed']} removed")
+        return counts
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print(f"[WARN] Could not update evaluation warehouse: {e}")
+        return None
@@ -1,3 +1,4 @@
+import multiprocessing
 import sys
 import os
 
@@ -19,5 +20,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Worker processes (thumbnail rendering) re-enter here in the frozen exe
+    multiprocessing.freeze_support()
     sys.exit(main())
 
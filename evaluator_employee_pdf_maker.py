@@ -6,6 +6,7 @@ This app reads Excel files with evaluator-employee pairs and generates
 PDFs with both profile images displayed side by side.
 """
 
+import multiprocessing
 import sys
 import os
 import threading
@@ -19,7 +20,7 @@ try:
 except Exception:
     pass
 
-from tkinter import Tk, Button, Label, filedialog, StringVar, DISABLED, NORMAL
+from tkinter import Tk, Button, Frame, Label, Spinbox, filedialog, StringVar, DISABLED, NORMAL
 from app.modules.batch_pdf_generator import export_batch_pdfs_with_dual_images
 from app.modules.config import Config
 
@@ -56,6 +57,10 @@ class EvaluatorEmployeePdfMakerApp:
         self.output_dir_label = StringVar(value="No output folder selected")
         self.output_dir = None
         
+        # Render worker processes
+        self.cpu_count = os.cpu_count() or 1
+        self.workers = StringVar()
+        
         # Status
         self.status = StringVar(value="Ready")
         
@@ -128,6 +133,29 @@ class EvaluatorEmployeePdfMakerApp:
         )
         pick_output_button.pack(padx=12, pady=6, anchor="w")
         
+        # Worker count
+        workers_row = Frame(self.root, bg=DARK_BG)
+        workers_row.pack(padx=12, pady=(12, 0), anchor="w")
+        Label(
+            workers_row, 
+            text=f"Parallel workers (1-{self.cpu_count}):", 
+            fg=DARK_TEXT, 
+            bg=DARK_BG
+        ).pack(side="left")
+        Spinbox(
+            workers_row, 
+            from_=1, 
+            to=self.cpu_count, 
+            textvariable=self.workers, 
+            width=4, 
+            bg=DARK_PANEL, 
+            fg=DARK_TEXT, 
+            buttonbackground=DARK_PANEL, 
+            relief="flat"
+        ).pack(side="left", padx=(6, 0))
+        # Set after the Spinbox exists; creating it resets the variable to from_
+        self.workers.set(str(Config.BATCH_PDF_WORKERS or self.cpu_count))
+        
         # Generate button
         self.generate_button = Button(
             self.root, 
@@ -200,6 +228,13 @@ class EvaluatorEmployeePdfMakerApp:
         else:
             self.generate_button.configure(state=DISABLED)
     
+    def _worker_count(self) -> int:
+        """Return the selected number of render processes (CPU count if invalid)."""
+        try:
+            return max(1, int(self.workers.get()))
+        except ValueError:
+            return self.cpu_count
+    
     def _generate_background(self):
         """Generate PDFs in background thread."""
         try:
@@ -209,7 +244,8 @@ class EvaluatorEmployeePdfMakerApp:
             result = export_batch_pdfs_with_dual_images(
                 self.excel_path,
                 self.output_dir,
-                self.log
+                self.log,
+                workers=self._worker_count()
             )
             
             if result:
@@ -248,5 +284,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
+    # Worker processes (thumbnail and PDF rendering) re-enter here in the frozen exe
+    multiprocessing.freeze_support()
     sys.exit(main())
 
@@ -0,0 +1,134 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules import analytics  # noqa: E402
+from app.modules.config import Config  # noqa: E402
+from app.modules.employee import Employee, EmployeeStore  # noqa: E402
+
+
+def legacy_performance_stats(employees) -> dict:
+    """Previous per-employee statistics: dir() scanned twice per employee."""
+    high_performers = needs_improvement = total_rating = rating_count = 0
+    for employee in employees:
+        overall_rating = None
+        for attr_name in dir(employee):
+            if 'overall' in attr_name.lower() and 'performance' in attr_name.lower() and 'rating' in attr_name.lower():
+                rating_value = getattr(employee, attr_name, None)
+                if rating_value and isinstance(rating_value, (int, float)):
+                    overall_rating = int(rating_value)
+                    break
+        if overall_rating is None:
+            rating_sum = rating_count_individual = 0
+            for attr_name in dir(employee):
+                if 'rating' in attr_name.lower() and not 'comment' in attr_name.lower():
+                    rating_value = getattr(employee, attr_name, None)
+                    if rating_value and isinstance(rating_value, (int, float)):
+                        rating_sum += int(rating_value)
+                        rating_count_individual += 1
+            if rating_count_individual > 0:
+                overall_rating = round(rating_sum / rating_count_individual)
+        if overall_rating:
+            total_rating += overall_rating
+            rating_count += 1
+            if overall_rating >= 4:
+                high_performers += 1
+            elif overall_rating <= 2:
+                needs_improvement += 1
+    return {
+        'total_employees': len(employees),
+        'average_rating': total_rating / rating_count if rating_count > 0 else 0,
+        'high_performers': high_performers,
+        'needs_improvement': needs_improvement
+    }
+
+
+def legacy_chart_data(employees) -> dict:
+    """Previous per-employee donut counting: getattr and label ladders for every employee and field."""
+    chart_data = {}
+    field_types = {}
+    for mapping in analytics.donut_chart_mappings():
+        field_name = mapping.mapped_header
+        field_data = {}
+        field_types[field_name] = mapping.data_type_in_card.value
+        labels = analytics.RATING_NUM_LABELS if mapping.data_type_in_card.value == 'rating_num' \
+            else analytics.SCORE_LABELS
+        for employee in employees:
+            field_value = getattr(employee, field_name, None)
+            if field_value is not None:
+                value_key = str(field_value)
+                if isinstance(field_value, (int, float)):
+                    for number, label in labels.items():
+                        if field_value == number:
+                            value_key = label
+                            break
+                field_data[value_key] = field_data.get(value_key, 0) + 1
+        if field_data:
+            chart_data[field_name] = field_data
+    return {'data': chart_data, 'field_types': field_types}
+
+
+def numeric_ratings(records: list) -> list:
+    """Copies of the records with digit ratings as numbers, so the numeric paths are exercised too."""
+    rng = random.Random(0)
+    converted = []
+    for record in records:
+        record = dict(record)
+        for field, value in record.items():
+            if 'rating' in field.lower() and isinstance(value, str) and value.strip().isdigit():
+                record[field] = rng.choice([int(value), float(value), value])
+        converted.append(record)
+    return converted
+
+
+def timed(func, employees) -> tuple:
+    start = time.perf_counter()
+    result = func(employees)
+    return result, time.perf_counter() - start
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the analytics tab's chart data and statistics")
+    parser.add_argument("--json", default=Config.get_json_output_path(), help="Parsed employee JSON")
+    parser.add_argument("--records", type=int, default=100000, help="Records to analyse (repeated)")
+    parser.add_argument("--objects", action="store_true", help="Use Employee objects instead of EmployeeStore rows")
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.json):
+        print(f"Employee JSON not found: {args.json} (parse the workbook first)")
+        return 1
+    with open(args.json, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    records = (records * (args.records // len(records) + 1))[:args.records]
+
+    identical = True
+    for name, variant in (("as parsed", records), ("numeric ratings", numeric_ratings(records))):
+        if args.objects:
+            employees = [Employee(record) for record in variant]
+        else:
+            employees = EmployeeStore.from_json_list(variant).rows()
+
+        legacy, legacy_seconds = timed(lambda rows: (legacy_chart_data(rows), legacy_performance_stats(rows)),
+                                       employees)
+        vectorized, vectorized_seconds = timed(
+            lambda rows: (analytics.chart_data(rows), analytics.performance_stats(rows)), employees)
+        same = legacy == vectorized and all(list(legacy[0]['data'][field]) == list(counts)
+                                            for field, counts in vectorized[0]['data'].items())
+        identical = identical and same
+
+        print(f"{name} ({len(employees)} records)")
+        print(f"  legacy:     {legacy_seconds:.2f}s")
+        print(f"  vectorized: {vectorized_seconds:.2f}s ({legacy_seconds / vectorized_seconds:.1f}x)")
+        print(f"  output:     {'identical' if same else 'DIFFERENT'} {vectorized[1]}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,79 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.asset_sync import AssetSync  # noqa: E402
+
+
+def build_library(directory: Path, files: int, size: int) -> None:
+    directory.mkdir(parents=True)
+    payload = os.urandom(size)
+    for i in range(files):
+        (directory / f"Employee {i:05d}_profile.jpg").write_bytes(payload[i % 256:] + payload[:i % 256])
+
+
+def legacy_copy(source: Path, target: Path) -> None:
+    """Previous copy_images_to_website: serial copy2 of every file, every run."""
+    target.mkdir(parents=True, exist_ok=True)
+    for image_file in source.iterdir():
+        if image_file.is_file():
+            shutil.copy2(image_file, target / image_file.name)
+
+
+def timed(label: str, func) -> None:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    detail = f"  ({result.summary()})" if result is not None else ""
+    print(f"{label:<34} {elapsed * 1e3:>9.0f} ms{detail}")
+
+
+def run_benchmark(files: int, size: int, workers: int, link_mode: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        source = tmp_path / "images"
+        build_library(source, files, size)
+        print(f"Library: {files} files x {size // 1024} KB, link mode '{link_mode}', {workers} workers")
+
+        timed("legacy serial copy2 (every run)", lambda: legacy_copy(source, tmp_path / "legacy"))
+
+        for use_hash in (False, True):
+            label = "hash" if use_hash else "size+mtime"
+            target = tmp_path / f"site-{label}"
+            sync = AssetSync(use_hash=use_hash, link_mode=link_mode, max_workers=workers,
+                             manifest_dir=str(tmp_path / "manifests"))
+            timed(f"[{label}] initial sync", lambda: sync.sync(str(source), str(target)))
+            timed(f"[{label}] no-op sync", lambda: sync.sync(str(source), str(target)))
+
+            changed = sorted(source.iterdir())[::100]
+            for path in changed:
+                path.write_bytes(path.read_bytes()[::-1])
+            timed(f"[{label}] sync after {len(changed)} edits", lambda: sync.sync(str(source), str(target)))
+
+            for path in changed:
+                os.utime(path, None)
+            timed(f"[{label}] sync after {len(changed)} touches", lambda: sync.sync(str(source), str(target)))
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark AssetSync against serial copying")
+    parser.add_argument("--files", type=int, default=10_000, help="Images in the synthetic library")
+    parser.add_argument("--size-kb", type=int, default=32, help="Size of each image in KB")
+    parser.add_argument("--workers", type=int, default=8, help="Transfer thread pool size")
+    parser.add_argument("--link-mode", default="auto", choices=["auto", "copy", "reflink", "hardlink"],
+                        help="How changed files are written")
+    args = parser.parse_args(argv[1:])
+
+    run_benchmark(args.files, args.size_kb * 1024, args.workers, args.link_mode)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,99 @@
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from reportlab import rl_config  # noqa: E402
+
+from app.modules.batch_pdf_generator import export_batch_pdfs_with_dual_images  # noqa: E402
+from app.modules.excel_parser import ExcelEmployeeParser  # noqa: E402
+
+# Fixed document IDs and timestamps so outputs of different worker counts can be compared byte for byte
+rl_config.invariant = 1
+
+
+def build_workbook(template: Path, target: Path, copies: int) -> int:
+    """Write the template review rows `copies` times, each copy under distinct evaluator names."""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(template)
+    sheet = workbook.active
+    rows = [list(row) for row in sheet.iter_rows(min_row=2, values_only=True)]
+    for copy in range(1, copies):
+        for row in rows:
+            row = list(row)
+            if row[0] is not None:
+                row[0] = f"{row[0]}-{copy}"
+            if row[4]:
+                row[4] = f"{row[4]} {copy}"
+            sheet.append(row)
+    workbook.save(target)
+    return len(rows) * copies
+
+
+def digest_dir(directory: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(directory.iterdir()):
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def run_benchmark(template: Path, copies: int, worker_counts: list) -> bool:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        workbook = tmp_path / "reviews.xlsx"
+        rows = build_workbook(template, workbook, copies)
+        print(f"Workbook: {rows} review rows ({copies} x {template.name}), {os.cpu_count()} CPUs")
+        # Warm the parse cache so every worker count times the same work
+        with contextlib.redirect_stdout(io.StringIO()):
+            ExcelEmployeeParser(str(workbook)).load_excel()
+        print(f"{'workers':>8} {'seconds':>9} {'PDFs':>6} {'PDFs/sec':>9} {'speedup':>8}")
+
+        baseline_s = None
+        digests = set()
+        for workers in worker_counts:
+            export_dir = tmp_path / f"pdfs-{workers}"
+            logs = []
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                export_batch_pdfs_with_dual_images(str(workbook), str(export_dir), logs.append, workers=workers)
+            elapsed = time.perf_counter() - start
+            saved = sum(1 for line in logs if line.startswith("Saved: "))
+            baseline_s = baseline_s or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {saved:>6} {saved / elapsed:>9.1f} {baseline_s / elapsed:>7.2f}x")
+            digests.add(digest_dir(export_dir))
+
+        identical = len(digests) == 1
+        print(f"Outputs identical across worker counts: {identical}")
+        return identical
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark batch review PDF export per worker count")
+    parser.add_argument("--excel", type=Path,
+                        default=REPO_ROOT / "assets" / "data" / "Evaluator Employee Performance Review 2025555.xlsx",
+                        help="Evaluator-employee workbook used as the row template")
+    parser.add_argument("--copies", type=int, default=10, help="Times the template rows are repeated")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="Worker counts to benchmark (the first one is the speedup baseline)")
+    args = parser.parse_args(argv[1:])
+
+    if not args.excel.exists():
+        print(f"Template workbook not found: {args.excel}")
+        return 1
+
+    return 0 if run_benchmark(args.excel, args.copies, args.workers) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,128 @@
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules import html_generator as hg  # noqa: E402
+from app.modules.config import Config  # noqa: E402
+from app.modules.employee import EmployeeManager, EmployeeStore  # noqa: E402
+from app.modules.header_mapper import CardType, header_mapper  # noqa: E402
+from app.modules.image_manager import load_thumbnail_index  # noqa: E402
+
+
+def legacy_card(employee, employee_manager, thumbnails, index: int) -> str:
+    """Previous per-card rendering: reverse mapping rebuilt and dir() scanned for every card."""
+    employee_name = employee_manager.get_employee_name(employee) or 'Unknown'
+    date_of_evaluation = ''
+    for attr_name in dir(employee):
+        if not attr_name.startswith('_'):
+            attr_value = getattr(employee, attr_name)
+            if not callable(attr_value) and attr_value and "date" in attr_name.lower() \
+                    and "evaluation" in attr_name.lower():
+                date_of_evaluation = hg._format_date(attr_value) or ''
+                break
+    profile_image_filename = profile_image_path = None
+    for attr_name in dir(employee):
+        if not attr_name.startswith('_'):
+            attr_value = getattr(employee, attr_name)
+            if not callable(attr_value):
+                if "profile_image_filename" in attr_name:
+                    profile_image_filename = attr_value
+                elif "profile_image_path" in attr_name:
+                    profile_image_path = attr_value
+    if profile_image_filename and profile_image_path:
+        profile_image_html = hg._profile_image_html(profile_image_path, profile_image_filename,
+                                                    employee_name, thumbnails)
+    else:
+        profile_image_html = f'<img src="assets/images/DEFAULT_PROFILE.jpg" alt="{employee_name}" class="profile-image">'
+
+    reverse_mapping = {}
+    for mapping_list in header_mapper.header_mappings_by_name.values():
+        for mapping in mapping_list:
+            reverse_mapping[mapping.mapped_header] = mapping
+    grouped_fields = {}
+    for attr_name in dir(employee):
+        if not attr_name.startswith('_'):
+            attr_value = getattr(employee, attr_name)
+            if not callable(attr_value) and attr_name in reverse_mapping:
+                mapping = reverse_mapping[attr_name]
+                if mapping.data_type_in_card != CardType.NOSHOW:
+                    formatted_value = str(attr_value) if attr_value else ''
+                    header = mapping.mapped_header.lower()
+                    if mapping.data_type_in_card == CardType.TEXT and ('date' in header or 'evaluation' in header) \
+                            and attr_value:
+                        formatted_value = hg._format_date(attr_value) or formatted_value
+                    grouped_fields.setdefault(mapping.group_under, []).append((mapping, formatted_value))
+    grouped_fields_html = ""
+    for group in header_mapper.card_group_order:
+        if grouped_fields.get(group):
+            group_fields = sorted(grouped_fields[group], key=lambda x: x[0].display_order)
+            grouped_fields_html += hg.generate_field_group_html_from_employee_data(group, group_fields)
+
+    return f"""
+        <div class="employee-card" data-employee-index="{index}" role="button" tabindex="0">
+            <div class="employee-header">
+                {profile_image_html}
+                <div class="employee-info">
+                    <div class="employee-name">{employee_name}</div>
+                    <div class="employee-time">{date_of_evaluation}</div>
+                </div>
+            </div>
+            <div class="fields-container">
+                {grouped_fields_html}
+            </div>
+        </div>
+        """
+
+
+def legacy_cards(employees) -> str:
+    employee_manager = EmployeeManager()
+    thumbnails = load_thumbnail_index()
+    cards_html = ""
+    for employee in employees:
+        cards_html += legacy_card(employee, employee_manager, thumbnails, len(cards_html))
+    return cards_html
+
+
+def timed(func, employees) -> tuple:
+    start = time.perf_counter()
+    html = func(employees)
+    return html, time.perf_counter() - start
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark employee card HTML rendering (serial and parallel)")
+    parser.add_argument("--json", default=Config.get_json_output_path(), help="Parsed employee JSON")
+    parser.add_argument("--cards", type=int, default=10000, help="Cards to render (records are repeated)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes for the parallel run")
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.json):
+        print(f"Employee JSON not found: {args.json} (parse the workbook first)")
+        return 1
+    with open(args.json, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    records = (records * (args.cards // len(records) + 1))[:args.cards]
+    employees = EmployeeStore.from_json_list(records).rows()
+
+    legacy_html, legacy_seconds = timed(legacy_cards, employees)
+    compiled_html, compiled_seconds = timed(hg.generate_employee_cards, employees)
+    parallel_html, parallel_seconds = timed(lambda rows: hg.generate_employee_cards(rows, workers=args.workers),
+                                            employees)
+    identical = legacy_html == compiled_html == parallel_html
+
+    print(f"cards:    {len(employees)}")
+    print(f"legacy:   {legacy_seconds:.2f}s")
+    print(f"compiled: {compiled_seconds:.2f}s ({legacy_seconds / compiled_seconds:.1f}x)")
+    print(f"parallel: {parallel_seconds:.2f}s ({legacy_seconds / parallel_seconds:.1f}x, {args.workers} workers)")
+    print(f"output:   {'identical' if identical else 'DIFFERENT'} ({len(compiled_html)} chars)")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
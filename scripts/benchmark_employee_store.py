@@ -0,0 +1,124 @@
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.employee import Employee, EmployeeManager  # noqa: E402
+from app.modules.excel_parser import ExcelEmployeeParser  # noqa: E402
+
+
+def load_template(excel_path: Path):
+    """Return the parsed template records and the parser that produced them."""
+    parser = ExcelEmployeeParser(str(excel_path), use_cache=False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        parser.load_excel()
+    records = parser.parse_all_employees_as_dicts()
+    return records, parser
+
+
+def build_legacy(records):
+    manager = EmployeeManager()
+    for record in records:
+        manager.add_employee(Employee.from_excel_data(record))
+    return manager.employees
+
+
+def build_store(records, parser):
+    store = parser.create_employee_store()
+    for record in records:
+        store.append(record, data_source='excel_parser')
+    return store, store.rows()
+
+
+def measure_memory(build):
+    """Return (result, bytes allocated while building)."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def time_lookups(employees, lookups):
+    start = time.perf_counter()
+    for index, field in lookups:
+        getattr(employees[index], field, None)
+    return time.perf_counter() - start
+
+
+def time_store_lookups(store, lookups):
+    start = time.perf_counter()
+    get_value = store.get_value
+    for index, field in lookups:
+        get_value(index, field)
+    return time.perf_counter() - start
+
+
+def time_name_scans(employees, count):
+    """Time the dir()-based name discovery used across the pipeline."""
+    start = time.perf_counter()
+    for employee in employees[:count]:
+        for attr_name in dir(employee):
+            if not attr_name.startswith('_') and 'name' in attr_name.lower():
+                if getattr(employee, attr_name):
+                    break
+    return time.perf_counter() - start
+
+
+def run_benchmark(excel_path: Path, sizes: list, lookups: int) -> None:
+    template, parser = load_template(excel_path)
+    fields = [field for field, _ in parser._build_column_plan()]
+    print(f"Template: {excel_path.name} ({len(template)} records, {len(fields)} mapped fields)")
+    print(f"{'records':>8} {'impl':>8} {'memory (MB)':>12} {'bytes/rec':>10} "
+          f"{'getattr (ns)':>13} {'dir scan (us)':>14}")
+
+    rng = random.Random(0)
+    for size in sizes:
+        records = [template[i % len(template)] for i in range(size)]
+        pairs = [(rng.randrange(size), rng.choice(fields)) for _ in range(lookups)]
+        scans = min(size, 2_000)
+
+        legacy, legacy_bytes = measure_memory(lambda: build_legacy(records))
+        (store, rows), store_bytes = measure_memory(lambda: build_store(records, parser))
+
+        for label, employees, used in (("Employee", legacy, legacy_bytes), ("Store", rows, store_bytes)):
+            lookup_ns = time_lookups(employees, pairs) / lookups * 1e9
+            scan_us = time_name_scans(employees, scans) / scans * 1e6
+            print(f"{size:>8} {label:>8} {used / 1e6:>12.1f} {used / size:>10.0f} "
+                  f"{lookup_ns:>13.0f} {scan_us:>14.1f}")
+        column_ns = time_store_lookups(store, pairs) / lookups * 1e9
+        print(f"{'':>8} {'column':>8} {'':>12} {'':>10} {column_ns:>13.0f}   (store.get_value)")
+
+        identical = all(a.to_dict() == b.to_dict() for a, b in zip(legacy[:scans], rows[:scans]))
+        print(f"{'':>8} to_dict identical: {identical}")
+        del legacy, rows, store
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark EmployeeStore against Employee objects")
+    parser.add_argument("--excel", type=Path,
+                        default=REPO_ROOT / "assets" / "data" / "Employee Self-Evaluation Data Export From MS Form.xlsx",
+                        help="Workbook used as the record template")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000],
+                        help="Record counts to benchmark")
+    parser.add_argument("--lookups", type=int, default=200_000,
+                        help="Random field lookups per size")
+    args = parser.parse_args(argv[1:])
+
+    if not args.excel.exists():
+        print(f"Template workbook not found: {args.excel}")
+        return 1
+
+    run_benchmark(args.excel, args.sizes, args.lookups)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,69 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.excel_parser import ExcelEmployeeParser  # noqa: E402
+
+
+def build_parser(template_df: pd.DataFrame, rows: int) -> ExcelEmployeeParser:
+    """Return a parser whose DataFrame repeats the template rows up to `rows`."""
+    repeats = rows // len(template_df) + 1
+    df = pd.concat([template_df] * repeats, ignore_index=True).iloc[:rows]
+
+    parser = ExcelEmployeeParser("benchmark.xlsx", use_cache=False)
+    parser.df = df
+    parser.header_mappings = parser.header_mapper.map_excel_headers(df)
+    return parser
+
+
+def time_call(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_benchmark(excel_path: Path, sizes: list) -> None:
+    """Compare iterrows-based extraction with the columnar path."""
+    template_df = pd.read_excel(excel_path, engine="openpyxl")
+    print(f"Template: {excel_path.name} ({len(template_df)} rows, {template_df.shape[1]} columns)")
+    print(f"{'rows':>8} {'iterrows (s)':>14} {'columnar (s)':>14} {'speedup':>9} {'identical':>10}")
+
+    for rows in sizes:
+        parser = build_parser(template_df, rows)
+
+        legacy = []
+        legacy_time = time_call(lambda: legacy.extend(
+            parser.extract_employee_data(row) for _, row in parser.df.iterrows()))
+
+        columnar = []
+        columnar_time = time_call(lambda: columnar.extend(parser.extract_all_employee_data()))
+
+        speedup = legacy_time / columnar_time if columnar_time else float("inf")
+        print(f"{rows:>8} {legacy_time:>14.3f} {columnar_time:>14.3f} {speedup:>8.1f}x {str(legacy == columnar):>10}")
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Excel row extraction paths")
+    parser.add_argument("--excel", type=Path,
+                        default=REPO_ROOT / "assets" / "data" / "Employee Self-Evaluation Data Export From MS Form.xlsx",
+                        help="Workbook used as the row template")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="Row counts to benchmark")
+    args = parser.parse_args(argv[1:])
+
+    if not args.excel.exists():
+        print(f"Template workbook not found: {args.excel}")
+        return 1
+
+    run_benchmark(args.excel, args.sizes)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,85 @@
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules import header_mapper as hm  # noqa: E402
+from app.modules.config import Config  # noqa: E402
+
+
+def legacy_best_match(mapper: hm.HeaderMapper, header):
+    """Previous fuzzy pass for one column: every predefined mapping scored, word sets rebuilt each time."""
+    best_match = None
+    best_score = 0
+    for predefined_mapping in mapper.header_mappings.values():
+        similarity = mapper._calculate_similarity(header, predefined_mapping.original_header)
+        if similarity > best_score and similarity > hm.FUZZY_MATCH_THRESHOLD:
+            best_score = similarity
+            best_match = predefined_mapping
+    return best_match
+
+
+def wide_header_row(headers: list, width: int, rng: random.Random) -> list:
+    """The workbook's headers plus near-miss and unknown columns, as a later year's export might have."""
+    columns = list(headers)
+    while len(columns) < width:
+        words = str(rng.choice(headers)).split()
+        rng.shuffle(words)
+        columns.append(" ".join(words[:rng.randint(1, len(words))] + [f"q{len(columns)}"]))
+    return columns
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark header mapping resolution")
+    parser.add_argument("--excel", default=Config.get_excel_input_path(), help="Workbook whose header row is used")
+    parser.add_argument("--width", type=int, default=2000, help="Columns in the widened header row")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.excel):
+        print(f"Workbook not found: {args.excel}")
+        return 1
+    sample = pd.read_excel(args.excel, engine='openpyxl', nrows=1)
+    columns = wide_header_row(list(sample.columns), args.width, random.Random(0))
+    df = pd.DataFrame([list(sample.iloc[0]) + [None] * (len(columns) - sample.shape[1])] if len(sample) else [],
+                      columns=columns)
+
+    mapper = hm.HeaderMapper()
+    index = hm._SimilarityIndex(list(mapper.header_mappings.values()))
+    same = all(legacy_best_match(mapper, header) is index.best_match(header) for header in columns)
+
+    legacy = timed(lambda: [legacy_best_match(mapper, header) for header in columns], args.repeat)
+    indexed = timed(lambda: [index.best_match(header) for header in columns], args.repeat)
+
+    def cold():
+        hm._resolution_cache.clear()
+        return mapper.map_excel_headers(df)
+
+    cold_seconds = timed(cold, args.repeat)
+    warm_seconds = timed(lambda: mapper.map_excel_headers(df), args.repeat)
+
+    print(f"columns:          {len(columns)} ({sample.shape[1]} from the workbook)")
+    print(f"fuzzy, legacy:    {legacy * 1000:.1f}ms")
+    print(f"fuzzy, indexed:   {indexed * 1000:.1f}ms ({legacy / indexed:.1f}x)")
+    print(f"resolve, cold:    {cold_seconds * 1000:.1f}ms")
+    print(f"resolve, cached:  {warm_seconds * 1000:.1f}ms ({cold_seconds / warm_seconds:.1f}x)")
+    print(f"matches:          {'identical' if same else 'DIFFERENT'}")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,115 @@
+import argparse
+import contextlib
+import io
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from fuzzywuzzy import fuzz, process  # noqa: E402
+
+from app.modules.image_manager import ImageManager, ImageMatchIndex  # noqa: E402
+
+FIRST_NAMES = ["Adriana", "Aidan", "Akil", "Alex", "Alfonso", "Amber", "Amy", "Ana", "Annie", "Brett",
+               "Clayton", "Daniel", "Elena", "Hannah", "Jia", "Kevin", "Leah", "Matthew", "Regina", "Vivian",
+               "Xinya", "Yuki", "Zoe", "Omar", "Priya", "Sofia", "Tomas", "Wei", "Nadia", "Lucas"]
+SUFFIXES = ["_profile", "_pic", "_photo", ""]
+EXTENSIONS = [".jpg", ".png", ".jpeg"]
+
+
+def _surname(rng: random.Random) -> str:
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 9))).title()
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    chars = list(name)
+    position = rng.randrange(len(chars))
+    if rng.random() < 0.5:
+        del chars[position]
+    else:
+        chars.insert(position, rng.choice(string.ascii_lowercase))
+    return "".join(chars)
+
+
+def build_dataset(employees: int, images: int, seed: int):
+    """Return (image filenames, employee names): exact matches, typos and unknown people."""
+    rng = random.Random(seed)
+    people = [f"{rng.choice(FIRST_NAMES)} {_surname(rng)}" for _ in range(images)]
+    files = [f"{name.replace(' ', rng.choice([' ', '_', '-']))}{rng.choice(SUFFIXES)}{rng.choice(EXTENSIONS)}"
+             for name in people]
+    queries = []
+    for _ in range(employees):
+        roll = rng.random()
+        if roll < 0.6:
+            queries.append(rng.choice(people))
+        elif roll < 0.85:
+            queries.append(_typo(rng, rng.choice(people)))
+        else:
+            queries.append(f"{rng.choice(FIRST_NAMES)} {_surname(rng)}")
+    return files, queries
+
+
+def legacy_best_match(manager: ImageManager, employee_name: str, threshold: int = 70):
+    """Previous find_best_image_match: re-extract every filename and scan them all."""
+    normalized_employee_name = manager.normalize_name(employee_name)
+    image_candidates = [(img_file, manager.extract_name_from_filename(img_file))
+                        for img_file in manager.available_images]
+    matches = process.extract(normalized_employee_name, [candidate[1] for candidate in image_candidates],
+                              limit=3, scorer=fuzz.ratio)
+    if matches and matches[0][1] >= threshold:
+        for img_file, img_name in image_candidates:
+            if img_name == matches[0][0]:
+                return img_file, matches[0][1]
+    return None, None
+
+
+def run_benchmark(employees: int, images: int, legacy_sample: int, seed: int) -> bool:
+    files, queries = build_dataset(employees, images, seed)
+    manager = ImageManager()
+    manager.available_images = files
+    print(f"Dataset: {employees} employees x {images} images")
+
+    start = time.perf_counter()
+    manager.match_index = ImageMatchIndex(files, manager.extract_name_from_filename)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        indexed = [manager.find_best_image_match(name) for name in queries]
+    indexed_s = time.perf_counter() - start
+    matched = sum(1 for match, _ in indexed if match)
+    print(f"ImageMatchIndex: build {build_s * 1e3:.0f} ms, {employees} lookups {indexed_s:.2f} s "
+          f"({indexed_s / employees * 1e3:.2f} ms/lookup, {matched} matched)")
+
+    sample = queries[:legacy_sample]
+    start = time.perf_counter()
+    legacy = [legacy_best_match(manager, name) for name in sample]
+    legacy_s = time.perf_counter() - start
+    per_lookup = legacy_s / len(sample)
+    print(f"Legacy scan:     {len(sample)} lookups {legacy_s:.2f} s "
+          f"({per_lookup * 1e3:.2f} ms/lookup, ~{per_lookup * employees:.0f} s extrapolated)")
+    print(f"Speedup: {per_lookup / (indexed_s / employees):.0f}x")
+
+    identical = legacy == indexed[:len(sample)]
+    print(f"Results identical on sample: {identical}")
+    return identical
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark ImageMatchIndex against the linear fuzzy scan")
+    parser.add_argument("--employees", type=int, default=5_000, help="Employee names to match")
+    parser.add_argument("--images", type=int, default=5_000, help="Available image files")
+    parser.add_argument("--legacy-sample", type=int, default=200,
+                        help="Lookups timed with the linear scan (extrapolated to all employees)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the synthetic dataset")
+    args = parser.parse_args(argv[1:])
+
+    return 0 if run_benchmark(args.employees, args.images, args.legacy_sample, args.seed) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,54 @@
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.config import Config  # noqa: E402
+from app.modules.modal_pdf import export_modal_pdfs  # noqa: E402
+
+
+def run_once(index_html: str, pages: int) -> tuple:
+    """Export every modal with `pages` concurrent pages; return (PDFs written, seconds)."""
+    with tempfile.TemporaryDirectory(prefix="modal_pdf_bench_") as out_dir:
+        start = time.perf_counter()
+        result = asyncio.run(export_modal_pdfs(index_html, out_dir, lambda _msg: None, pages=pages))
+        elapsed = time.perf_counter() - start
+        if not result:
+            raise RuntimeError("Playwright is not available (pip install playwright && playwright install chromium)")
+        written = len([f for f in os.listdir(out_dir) if f.endswith(".pdf")])
+    return written, elapsed
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark modal HTML-to-PDF export at several browser page counts")
+    parser.add_argument("--index", default=os.path.join(Config.get_website_output_path(), "index.html"),
+                        help="Generated website index.html (default: the website output directory)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 4, 8], help="Concurrent page counts to measure")
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.index):
+        print(f"index.html not found: {args.index} (run --generate-website first)")
+        return 1
+
+    baseline = None
+    print(f"{'pages':>6} {'PDFs':>6} {'seconds':>9} {'PDFs/min':>9} {'speedup':>8}")
+    for pages in args.pages:
+        try:
+            written, elapsed = run_once(args.index, pages)
+        except RuntimeError as e:
+            print(e)
+            return 1
+        rate = written / elapsed * 60 if elapsed else 0.0
+        baseline = baseline or rate
+        print(f"{pages:>6} {written:>6} {elapsed:>9.2f} {rate:>9.1f} {rate / baseline if baseline else 0:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,124 @@
+import argparse
+import io
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from reportlab import rl_config  # noqa: E402
+from reportlab.lib.pagesizes import letter  # noqa: E402
+from reportlab.lib.units import inch  # noqa: E402
+from reportlab.lib.utils import simpleSplit  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from app.modules.pdf_layout import BOX_BG, TEAL, ReportLayout, wrap_lines  # noqa: E402
+
+rl_config.invariant = 1
+
+WORDS = ("project team design client review schedule detail model coordination drawings "
+         "feedback mentoring consultants deadline proposal presentation quality growth").split()
+
+
+def make_answers(reports: int, fields: int, words: int, distinct: int, seed: int = 7) -> list:
+    """Free-text answers per report; `distinct` of them are reused across reports (boilerplate, N/A, ...)."""
+    rng = random.Random(seed)
+    pool = [" ".join(rng.choice(WORDS) for _ in range(words)) for _ in range(distinct)]
+    return [[(f"Question {f + 1}", rng.choice(pool) if rng.random() < 0.3 else
+              " ".join(rng.choice(WORDS) for _ in range(words))) for f in range(fields)]
+            for _ in range(reports)]
+
+
+def legacy_body(c, answers, y) -> None:
+    """Previous exporters: measure each box with simpleSplit, then split again while drawing."""
+    width, height = letter
+    x = 0.75*inch
+    max_width = width - 1.5*inch
+    line_leading = 12
+
+    def ensure_space_px(pixels_needed: float):
+        nonlocal y
+        if y - pixels_needed < 0.75*inch:
+            c.showPage()
+            y = height - 0.75*inch
+
+    def draw_value_box(label: str, value: str):
+        nonlocal y
+        c.setFillColorRGB(*TEAL)
+        c.setFont('Helvetica-Bold', 10)
+        c.drawString(x, y, label)
+        y -= 12
+        c.setFillColorRGB(*BOX_BG)
+        c.setStrokeColorRGB(*TEAL)
+        text_lines = simpleSplit(str(value), 'Helvetica', 10, max_width - 12)
+        box_h = len(text_lines) * line_leading + 12
+        c.roundRect(x, y - box_h + 6, max_width, box_h, 6, stroke=1, fill=1)
+        c.setFillColorRGB(0, 0, 0)
+        c.setFont('Helvetica', 10)
+        ty = y - 6
+        for ln in text_lines:
+            c.drawString(x + 6, ty, ln)
+            ty -= line_leading
+        y = y - box_h - 6
+
+    for label, value in answers:
+        text_lines = simpleSplit(str(value), 'Helvetica', 10, max_width - 12)
+        box_h = len(text_lines) * line_leading + 12
+        ensure_space_px(box_h + 18)
+        draw_value_box(label, value)
+
+
+def layout_body(c, answers, y) -> None:
+    layout = ReportLayout(letter)
+    for label, value in answers:
+        layout.value_box(label, value)
+    layout.draw(c, y)
+
+
+def render(body, reports: list) -> tuple:
+    """Render every report into its own in-memory PDF; return (total bytes, list of PDFs)."""
+    pdfs = []
+    for answers in reports:
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=letter)
+        body(c, answers, letter[1] - 1.5*inch)
+        c.showPage()
+        c.save()
+        pdfs.append(buffer.getvalue())
+    return sum(len(p) for p in pdfs), pdfs
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the shared PDF layout engine on long free-text answers")
+    parser.add_argument("--reports", type=int, default=100, help="Reports rendered per run")
+    parser.add_argument("--fields", type=int, default=12, help="Free-text answers per report")
+    parser.add_argument("--words", type=int, default=250, help="Words per answer")
+    parser.add_argument("--distinct", type=int, default=20,
+                        help="Answers shared across reports (about 30%% of answers are drawn from them)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs (best is reported)")
+    args = parser.parse_args(argv[1:])
+
+    reports = make_answers(args.reports, args.fields, args.words, args.distinct)
+    results = {}
+    for label, body in (("legacy", legacy_body), ("layout", layout_body)):
+        best = float("inf")
+        for _ in range(args.repeat):
+            wrap_lines.cache_clear()  # every run starts cold, like a fresh export process
+            start = time.perf_counter()
+            size, pdfs = render(body, reports)
+            best = min(best, time.perf_counter() - start)
+        results[label] = (best, pdfs)
+        print(f"{label:>7}: {best:.2f}s for {args.reports} reports ({size} bytes)")
+
+    (old_s, old_pdfs), (new_s, new_pdfs) = results["legacy"], results["layout"]
+    print(f"Speedup: {old_s / new_s:.2f}x")
+    print(f"Wrap cache: {wrap_lines.cache_info()}")
+    identical = old_pdfs == new_pdfs
+    print(f"Output identical: {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
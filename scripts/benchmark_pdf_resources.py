@@ -0,0 +1,77 @@
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from reportlab import rl_config  # noqa: E402
+from reportlab.pdfgen import canvas  # noqa: E402
+
+from app.modules.config import Config  # noqa: E402
+from app.modules.pdf_resources import PdfResourceRegistry  # noqa: E402
+
+rl_config.invariant = 1
+
+ICON_SIZE = 0.22 * 72
+CHECKED = str(Path(Config.get_assets_dir_path()) / "icons" / "rating_checked.png")
+UNCHECKED = str(Path(Config.get_assets_dir_path()) / "icons" / "rating_unchecked.png")
+
+
+def legacy_rating(c, resources, score, x, y):
+    """Previous exporters: five drawImage calls with icon file paths."""
+    icon_x = x
+    for i in range(5):
+        c.drawImage(CHECKED if i < score else UNCHECKED, icon_x, y, ICON_SIZE, ICON_SIZE, mask='auto')
+        icon_x += ICON_SIZE + 2
+
+
+def registry_rating(c, resources, score, x, y):
+    resources.draw_rating(score, x, y, ICON_SIZE, CHECKED, UNCHECKED)
+
+
+def render(draw, pages: int, ratings: int) -> bytes:
+    """Render a document of rating rows the way the exporters lay them out."""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer)
+    resources = PdfResourceRegistry(c)
+    for page in range(pages):
+        for field in range(ratings):
+            draw(c, resources, (page + field) % 6, 54, 720 - field * 22)
+        c.showPage()
+    c.save()
+    return buffer.getvalue()
+
+
+def run_benchmark(documents: list, ratings: int, repeat: int) -> None:
+    print(f"{'pages':>6} {'impl':>9} {'bytes':>9} {'ms':>9}")
+    for pages in documents:
+        results = {}
+        for label, draw in (("legacy", legacy_rating), ("registry", registry_rating)):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                pdf = render(draw, pages, ratings)
+                best = min(best, time.perf_counter() - start)
+            results[label] = (len(pdf), best)
+            print(f"{pages:>6} {label:>9} {len(pdf):>9} {best * 1e3:>9.1f}")
+        (old_size, old_s), (new_size, new_s) = results["legacy"], results["registry"]
+        print(f"{'':>6} {'delta':>9} {(new_size - old_size) / old_size:>+9.1%} {(new_s - old_s) / old_s:>+9.1%}")
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark rating icon Form XObjects against per-icon drawImage")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 10, 300],
+                        help="Document lengths to render")
+    parser.add_argument("--ratings", type=int, default=6, help="Rating rows per page")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is reported)")
+    args = parser.parse_args(argv[1:])
+
+    run_benchmark(args.pages, args.ratings, args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,66 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules import html_generator  # noqa: E402
+from app.modules.config import Config  # noqa: E402
+from app.modules.employee import EmployeeStore  # noqa: E402
+from app.modules.site_shards import INDEX_FILE, SHARD_DIR  # noqa: E402
+
+
+def load_employees(json_path: str, headcount: int) -> list:
+    """Employees from the parsed JSON, repeated up to `headcount` records."""
+    with open(json_path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+    repeated = (records * (headcount // len(records) + 1))[:headcount]
+    return EmployeeStore.from_json_list(repeated).rows()
+
+
+def build(employees: list, sharded: bool) -> tuple:
+    """Generate the site; return (seconds, index.html bytes, bytes needed before the first cards show)."""
+    with tempfile.TemporaryDirectory(prefix="site_shards_bench_") as out_dir:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            html_generator.create_html_output_from_employees(employees, out_dir, sharded=sharded, publish=False)
+        elapsed = time.perf_counter() - start
+        page = os.path.getsize(os.path.join(out_dir, "index.html"))
+        first_load = page
+        if sharded:
+            data_dir = os.path.join(out_dir, SHARD_DIR)
+            first_load += os.path.getsize(os.path.join(data_dir, INDEX_FILE))
+            first_load += os.path.getsize(os.path.join(data_dir, sorted(f for f in os.listdir(data_dir)
+                                                                        if f != INDEX_FILE)[0]))
+    return elapsed, page, first_load
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Compare inline and sharded website output as headcount grows")
+    parser.add_argument("--json", default=Config.get_json_output_path(), help="Parsed employee JSON")
+    parser.add_argument("--headcounts", type=int, nargs="+", default=[100, 1000, 5000])
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.json):
+        print(f"Employee JSON not found: {args.json} (parse the workbook first)")
+        return 1
+
+    print(f"{'employees':>9} {'mode':>8} {'build s':>8} {'index.html':>12} {'first load':>12}")
+    for headcount in args.headcounts:
+        employees = load_employees(args.json, headcount)
+        for sharded in (False, True):
+            elapsed, page, first_load = build(employees, sharded)
+            mode = "sharded" if sharded else "inline"
+            print(f"{headcount:>9} {mode:>8} {elapsed:>8.2f} {page / 1024:>10.0f}KB {first_load / 1024:>10.0f}KB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,82 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.config import Config  # noqa: E402
+from app.modules.warehouse import EvaluationWarehouse  # noqa: E402
+
+RATING_FIELD = "Communication Rating"
+
+
+def synthetic_year(records: list, headcount: int, year: int, rng: random.Random) -> list:
+    """One year's responses: the template records spread over `headcount` employees with varied ratings."""
+    responses = []
+    for i in range(headcount):
+        record = dict(records[i % len(records)])
+        record["Email"] = f"employee{i}@example.com"
+        record["Employee Name"] = f"Employee {i}"
+        for field in record:
+            if field.endswith("Rating"):
+                record[field] = str(rng.randint(1, 5))
+        record["Date of Evaluation"] = f"{year}-09-09 00:00:00"
+        responses.append(record)
+    return responses
+
+
+def timed(func, repeat: int = 1) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark evaluation warehouse ingest and year-over-year queries")
+    parser.add_argument("--json", default=Config.get_json_output_path(), help="Parsed employee JSON")
+    parser.add_argument("--years", type=int, default=10, help="Evaluation years to file")
+    parser.add_argument("--headcount", type=int, default=2000, help="Responses per year")
+    args = parser.parse_args(argv[1:])
+
+    if not os.path.exists(args.json):
+        print(f"Employee JSON not found: {args.json} (parse the workbook first)")
+        return 1
+    with open(args.json, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    rng = random.Random(0)
+    first_year = Config.EVALUATION_YEAR - args.years + 1
+    with tempfile.TemporaryDirectory(prefix="warehouse_bench_") as tmp_dir:
+        with EvaluationWarehouse(os.path.join(tmp_dir, "warehouse.sqlite")) as warehouse:
+            ingest_seconds = 0.0
+            for year in range(first_year, Config.EVALUATION_YEAR + 1):
+                responses = synthetic_year(records, args.headcount, year, rng)
+                _, seconds = timed(lambda: warehouse.ingest(responses, year))
+                ingest_seconds += seconds
+            _, reingest_seconds = timed(lambda: warehouse.ingest(responses, Config.EVALUATION_YEAR))
+
+            key = f"employee{args.headcount // 2}@example.com"
+            trajectory, trajectory_seconds = timed(lambda: warehouse.employee_trajectory(key, RATING_FIELD), 20)
+            history, history_seconds = timed(lambda: warehouse.employee_history(key), 20)
+            trend, trend_seconds = timed(lambda: warehouse.firm_trend(RATING_FIELD), 5)
+            size = os.path.getsize(warehouse.db_path)
+
+    print(f"responses:          {args.years} years x {args.headcount} ({size / 1024 / 1024:.1f} MB)")
+    print(f"ingest:             {ingest_seconds:.2f}s ({ingest_seconds / args.years:.2f}s per year)")
+    print(f"re-ingest, same:    {reingest_seconds:.2f}s")
+    print(f"trajectory:         {trajectory_seconds * 1000:.1f}ms ({len(trajectory)} years)")
+    print(f"employee history:   {history_seconds * 1000:.1f}ms ({sum(len(v) for v in history.values())} values)")
+    print(f"firm-wide trend:    {trend_seconds * 1000:.1f}ms ({len(trend)} years, "
+          f"means {[point['mean'] for point in trend][:3]}...)")
+    return 0 if max(trajectory_seconds, history_seconds, trend_seconds) < 1 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO_ROOT))
+
+from app.modules.config import Config  # noqa: E402
+
+# A trimmed MS Forms export: every header maps exactly onto a predefined mapping
+WORKBOOK_HEADERS = ["ID", "Start time", "Completion time", "Email", "Name", "Last modified time",
+                    "Employee Name", "Title", "Role", "Date", "Communication", "Communication2"]
+
+
+def workbook_row(row_id, name: str, rating: int = 4, comment: str = "Clear and timely") -> list:
+    """One response in WORKBOOK_HEADERS order."""
+    email = name.lower().replace(" ", ".") + "@example.com"
+    return [row_id, "2025-09-01 09:00:00", "2025-09-01 09:30:00", email, name, "",
+            name, "Designer", "Architect", "2025-09-09", f"{rating} - Meets", comment]
+
+
+@pytest.fixture
+def project_root(tmp_path, monkeypatch):
+    """Point every Config path (and relative writes such as header_mappings.json) at a temporary project."""
+    monkeypatch.setattr(Config, "PROJECT_ROOT", str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def write_workbook(project_root):
+    """Write rows (see workbook_row) to an .xlsx file below the temporary project and return its path."""
+    def write(rows, name: str = "responses.xlsx") -> str:
+        path = project_root / name
+        pd.DataFrame(rows, columns=WORKBOOK_HEADERS).to_excel(path, index=False, engine="openpyxl")
+        return str(path)
+    return write
@@ -0,0 +1,44 @@
+from app.modules.batch_pdf_generator import _load_review_rows
+from app.modules.excel_parser import ExcelEmployeeParser
+
+from conftest import WORKBOOK_HEADERS, workbook_row
+
+RATING = WORKBOOK_HEADERS.index("Communication")
+
+
+def _numeric_rows():
+    # pandas reads a numeric column with a blank cell as float64 (4.0); openpyxl hands over 4
+    rows = [workbook_row(1, "Ada Lovelace"), workbook_row(2, "Alan Turing"), workbook_row(3, "Grace Hopper")]
+    for row, rating in zip(rows, [4, None, 5]):
+        row[RATING] = rating
+    rows[2][WORKBOOK_HEADERS.index("Communication2")] = 2.5
+    return rows
+
+
+def _mapped(parser):
+    return {index: mapping.mapped_header for index, mapping in parser.header_mappings.items()}
+
+
+def test_streaming_matches_the_dataframe_path(write_workbook):
+    path = write_workbook(_numeric_rows())
+    loaded = ExcelEmployeeParser(path, use_cache=False)
+    assert loaded.load_excel()
+    records = loaded.extract_all_employee_data()
+
+    streamed = ExcelEmployeeParser(path, use_cache=False)
+    stream = streamed.stream_rows()
+    assert [record for _, record in stream] == records
+    assert _mapped(streamed) == _mapped(loaded)
+    assert [record.get("Communication Rating") for record in records] == ["4", None, "5"]
+    assert records[2]["Communication Comments"] == "2.5"
+
+    # The per-row path cleans cells the same way
+    assert [loaded.extract_employee_data(row) for _, row in loaded.df.iterrows()] == records
+
+
+def test_review_rows_match_in_both_modes(write_workbook):
+    path = write_workbook(_numeric_rows())
+    loaded = _load_review_rows(ExcelEmployeeParser(path, use_cache=False), False, lambda message: None)
+    streamed = list(_load_review_rows(ExcelEmployeeParser(path, use_cache=False), True, lambda message: None))
+    assert streamed == loaded
+    assert [values[RATING] for values, _ in loaded] == [4, None, 5]
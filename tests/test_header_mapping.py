@@ -0,0 +1,83 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from app.modules import header_mapper
+from app.modules.header_mapper import HeaderMapper
+
+from conftest import WORKBOOK_HEADERS, workbook_row
+
+
+@pytest.fixture(autouse=True)
+def empty_resolution_cache():
+    header_mapper._resolution_cache.clear()
+    yield
+    header_mapper._resolution_cache.clear()
+
+
+def _frame(headers=WORKBOOK_HEADERS, rating=4):
+    return pd.DataFrame([workbook_row(1, "Ada Lovelace", rating=rating)], columns=headers)
+
+
+def _as_tuples(mappings):
+    return {index: (m.original_header, m.mapped_header, m.group_under, m.data_type_in_card, m.display_order)
+            for index, m in mappings.items()}
+
+
+def test_cached_resolution_matches_a_fresh_one(monkeypatch):
+    mapper = HeaderMapper()
+    df = _frame()
+    first = mapper.map_excel_headers(df)
+    assert _as_tuples(first) == _as_tuples(HeaderMapper()._resolve_headers(df))
+
+    monkeypatch.setattr(HeaderMapper, "_resolve_headers", lambda self, df: pytest.fail("resolved again"))
+    assert _as_tuples(HeaderMapper().map_excel_headers(df)) == _as_tuples(first)
+
+
+def test_callers_get_copies(monkeypatch):
+    mapper = HeaderMapper()
+    predefined = _as_tuples(mapper.header_mappings)
+    first = mapper.map_excel_headers(_frame())
+    for mapping in first.values():
+        mapping.mapped_header = "changed"
+        mapping.display_order = -1
+
+    second = mapper.map_excel_headers(_frame())
+    assert all(mapping.mapped_header != "changed" for mapping in second.values())
+    assert not any(a is b for a in first.values() for b in second.values())
+    assert _as_tuples(mapper.header_mappings) == predefined
+
+
+def test_signature_covers_layout_first_row_types_and_mappings():
+    mapper = HeaderMapper()
+    signature = mapper._header_signature(_frame())
+    assert mapper._header_signature(_frame(rating=5)) == signature
+
+    # A number where text was can settle a fuzzy-match conflict differently
+    row = workbook_row(1, "Ada Lovelace")
+    row[WORKBOOK_HEADERS.index("Communication")] = 4
+    numeric = pd.DataFrame([row], columns=WORKBOOK_HEADERS)
+    assert mapper._header_signature(numeric) != signature
+    assert mapper._header_signature(_frame(headers=WORKBOOK_HEADERS[:-1] + ["Comments"])) != signature
+
+    edited = HeaderMapper()
+    next(iter(edited.header_mappings.values())).display_order += 1
+    assert edited._header_signature(_frame()) != signature
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(header_mapper, "RESOLUTION_CACHE_ENTRIES", 2)
+    mapper = HeaderMapper()
+    for suffix in range(4):
+        mapper.map_excel_headers(_frame(headers=WORKBOOK_HEADERS[:-1] + [f"Extra {suffix}"]))
+    assert len(header_mapper._resolution_cache) == 2
+
+
+def test_concurrent_loads_agree():
+    layouts = [WORKBOOK_HEADERS[:-1] + [f"Extra {i % 3}"] for i in range(24)]
+    expected = [_as_tuples(HeaderMapper()._resolve_headers(_frame(headers=headers))) for headers in layouts]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda headers: _as_tuples(HeaderMapper().map_excel_headers(_frame(headers))),
+                                layouts))
+    assert results == expected
@@ -0,0 +1,83 @@
+import os
+
+import pandas as pd
+
+from app.modules import parse_cache
+from app.modules.excel_parser import ExcelEmployeeParser
+from app.modules.header_mapper import HeaderMapper
+from app.modules.parse_cache import ParseCache
+
+from conftest import workbook_row
+
+
+def _rows():
+    return [workbook_row(1, "Ada Lovelace"), workbook_row(2, "Alan Turing", rating=5)]
+
+
+def test_key_covers_workbook_mapper_and_parser_code(write_workbook, monkeypatch):
+    cache = ParseCache()
+    mapper = HeaderMapper()
+    path = write_workbook(_rows())
+    key = cache.make_key(path, mapper)
+    assert cache.make_key(path, HeaderMapper()) == key
+
+    other = write_workbook(_rows() + [workbook_row(3, "Grace Hopper")], name="other.xlsx")
+    assert cache.make_key(other, mapper) != key
+
+    changed_mapper = HeaderMapper()
+    next(iter(changed_mapper.header_mappings.values())).display_order += 1
+    assert cache.make_key(path, changed_mapper) != key
+
+    monkeypatch.setattr(parse_cache, "parser_code_signature", lambda: "edited parser")
+    assert cache.make_key(path, mapper) != key
+
+
+def test_parser_code_signature_reads_the_keyed_sources():
+    signature = parse_cache.parser_code_signature()
+    assert len(signature) == 64
+    module_dir = os.path.dirname(parse_cache.__file__)
+    assert all(os.path.exists(os.path.join(module_dir, name)) for name in parse_cache.KEYED_MODULES)
+
+
+def test_cached_load_returns_the_same_records(write_workbook, monkeypatch):
+    path = write_workbook(_rows())
+    fresh = ExcelEmployeeParser(path)
+    assert fresh.load_excel()
+    expected = fresh.extract_all_employee_data()
+    assert len(os.listdir(ParseCache().cache_dir)) == 1
+
+    def no_read(*args, **kwargs):
+        raise AssertionError("workbook read despite a cache hit")
+
+    monkeypatch.setattr(pd, "read_excel", no_read)
+    cached = ExcelEmployeeParser(path)
+    assert cached.load_excel()
+    assert cached.extract_all_employee_data() == expected
+    assert cached.columns == fresh.columns
+
+
+def test_edited_workbook_misses(write_workbook):
+    path = write_workbook(_rows())
+    assert ExcelEmployeeParser(path).load_excel()
+    write_workbook(_rows()[:1])
+    parser = ExcelEmployeeParser(path)
+    assert parser.load_excel()
+    assert [record["Employee Name"] for record in parser.extract_all_employee_data()] == ["Ada Lovelace"]
+
+
+def test_eviction_keeps_the_entry_just_written(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path / "cache"), max_bytes=0)
+    assert cache.store("old", {"data": "x" * 1000})
+    assert cache.store("new", {"data": "y" * 1000})
+    assert cache.load("old") is None
+    assert cache.load("new") == {"data": "y" * 1000}
+
+
+def test_unreadable_entry_is_discarded(tmp_path):
+    cache = ParseCache(cache_dir=str(tmp_path / "cache"))
+    assert cache.store("key", {"data": 1})
+    with open(cache._entry_path("key"), "wb") as f:
+        f.write(b"not a pickle")
+    assert cache.load("key") is None
+    assert not os.path.exists(cache._entry_path("key"))
+    assert cache.clear() == 0
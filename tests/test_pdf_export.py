@@ -0,0 +1,89 @@
+import os
+
+import pytest
+
+pytest.importorskip("reportlab")
+
+from app.modules.batch_pdf_generator import export_batch_pdfs_with_dual_images  # noqa: E402
+from app.modules.config import Config  # noqa: E402
+from app.modules.pdf_exporter import export_pdfs_reportlab  # noqa: E402
+
+from conftest import workbook_row  # noqa: E402
+
+
+def _pdfs(directory) -> set:
+    return {name for name in os.listdir(directory) if name.endswith(".pdf")}
+
+
+def _records(*names):
+    return [{"Employee Name": name, "Email": f"{i}@example.com", "Title": "Designer"} for i, name in enumerate(names)]
+
+
+def test_reportlab_export_reuses_unchanged_pdfs(project_root):
+    export_dir = str(project_root / "pdfs")
+    logs = []
+    export_pdfs_reportlab(_records("Ada Lovelace", "Alan Turing"), export_dir, logs.append)
+    assert "PDFs: 2 rebuilt, 0 reused" in logs
+
+    logs.clear()
+    export_pdfs_reportlab(_records("Ada Lovelace", "Alan Turing"), export_dir, logs.append)
+    assert "PDFs: 0 rebuilt, 2 reused" in logs
+
+    logs.clear()
+    export_pdfs_reportlab(_records("Ada Lovelace"), export_dir, logs.append)
+    assert "PDFs: 0 rebuilt, 1 reused" in logs
+    assert _pdfs(export_dir) == {Config.PDF_FILE_NAMING.format(name="Ada_Lovelace")}
+
+
+def test_reportlab_duplicate_names_keep_the_last_row_and_stay_reusable(project_root):
+    export_dir = str(project_root / "pdfs")
+    employees = _records("Ada Lovelace", "Ada Lovelace")
+    employees[1]["Title"] = "Principal"
+    logs = []
+    export_pdfs_reportlab(employees, export_dir, logs.append)
+    assert "PDFs: 1 rebuilt, 0 reused" in logs
+    assert any(message.startswith("Skipped duplicate name") for message in logs)
+
+    logs.clear()
+    export_pdfs_reportlab(employees, export_dir, logs.append)
+    assert "PDFs: 0 rebuilt, 1 reused" in logs
+
+
+def test_batch_export_numbers_repeated_pairs_and_reuses_them(write_workbook, project_root):
+    rows = [workbook_row(1, "Ada Lovelace"), workbook_row(2, "Ada Lovelace", rating=2),
+            workbook_row(3, "Alan Turing")]
+    path = write_workbook(rows)
+    export_dir = str(project_root / "reviews")
+
+    logs = []
+    assert export_batch_pdfs_with_dual_images(path, export_dir, logs.append, workers=1)
+    assert _pdfs(export_dir) == {"Ada_Lovelace_Ada_Lovelace_Review.pdf", "Ada_Lovelace_Ada_Lovelace_Review_2.pdf",
+                                 "Alan_Turing_Alan_Turing_Review.pdf"}
+    assert "PDFs: 3 rebuilt, 0 reused" in logs
+
+    logs.clear()
+    assert export_batch_pdfs_with_dual_images(path, export_dir, logs.append, workers=1)
+    assert "PDFs: 0 rebuilt, 3 reused" in logs
+
+    write_workbook(rows[:1] + rows[2:])
+    logs.clear()
+    assert export_batch_pdfs_with_dual_images(path, export_dir, logs.append, workers=1)
+    assert "PDFs: 0 rebuilt, 2 reused" in logs
+    assert "Removed 1 outdated PDFs" in logs
+    assert _pdfs(export_dir) == {"Ada_Lovelace_Ada_Lovelace_Review.pdf", "Alan_Turing_Alan_Turing_Review.pdf"}
+
+
+def test_streamed_cli_export_matches_the_loaded_export(write_workbook, project_root):
+    from app.modules.cli import run_cli
+
+    rows = [workbook_row(1, "Ada Lovelace"), workbook_row(2, "Alan Turing")]
+    rows[1][-2] = None  # a blank rating cell
+    path = write_workbook(rows)
+    export_dir = str(project_root / "reviews")
+    assert run_cli(["--batch-pdfs", path, export_dir, "--stream", "--pdf-workers", "1"]) == 0
+    assert len(_pdfs(export_dir)) == 2
+
+    # Same rows and fingerprints either way, so nothing is rendered again
+    logs = []
+    assert export_batch_pdfs_with_dual_images(path, export_dir, logs.append, workers=1)
+    assert "PDFs: 0 rebuilt, 2 reused" in logs
@@ -0,0 +1,166 @@
+import json
+import os
+
+from app.modules import excel_parser
+from app.modules.excel_parser import ExcelEmployeeParser, parse_excel_incremental
+from app.modules.html_generator import create_html_output_from_employees
+
+from conftest import workbook_row
+
+
+def _rows():
+    return [workbook_row(1, "Ada Lovelace"), workbook_row(2, "Alan Turing", rating=5),
+            workbook_row(3, "Grace Hopper")]
+
+
+def _run(workbook, json_path, save=True, **kwargs):
+    employees, delta = parse_excel_incremental(workbook, json_path, copy_images=False, **kwargs)
+    if save:
+        assert delta.save_manifest()
+    return employees, delta
+
+
+def _names(employees):
+    return [employee.to_dict()["Employee Name"] for employee in employees]
+
+
+def _materialized(monkeypatch):
+    """Record the row positions each parse_excel_incremental call materializes."""
+    calls = []
+    extract = ExcelEmployeeParser.extract_all_employee_data
+
+    def spy(self, positions=None):
+        calls.append(None if positions is None else list(positions))
+        return extract(self, positions)
+
+    monkeypatch.setattr(ExcelEmployeeParser, "extract_all_employee_data", spy)
+    return calls
+
+
+def test_first_run_rebuilds_and_second_run_reuses_everything(write_workbook, project_root, monkeypatch):
+    workbook = write_workbook(_rows())
+    json_path = str(project_root / "employees.json")
+    first, delta = _run(workbook, json_path)
+    assert delta.full_rebuild and sorted(delta.added) == ["1", "2", "3"]
+
+    calls = _materialized(monkeypatch)
+    second, delta = _run(workbook, json_path)
+    assert not delta.has_changes() and sorted(delta.unchanged) == ["1", "2", "3"]
+    assert calls == [[]]
+    assert [e.to_dict() for e in second] == [e.to_dict() for e in first]
+
+
+def test_edited_added_and_deleted_rows(write_workbook, project_root, monkeypatch):
+    json_path = str(project_root / "employees.json")
+    _run(write_workbook(_rows()), json_path)
+
+    rows = _rows()
+    rows[1] = workbook_row(2, "Alan Turing", rating=2, comment="Late handoffs")
+    del rows[2]
+    rows.append(workbook_row(4, "Katherine Johnson"))
+    calls = _materialized(monkeypatch)
+    employees, delta = _run(write_workbook(rows), json_path)
+
+    assert (delta.added, delta.changed, delta.deleted, delta.unchanged) == (["4"], ["2"], ["3"], ["1"])
+    assert calls == [[1, 2]]
+    assert _names(employees) == ["Ada Lovelace", "Alan Turing", "Katherine Johnson"]
+    with open(json_path, encoding="utf-8") as f:
+        assert [record["Employee Name"] for record in json.load(f)] == _names(employees)
+
+
+def test_synthesized_row_ids_reuse_their_own_records(write_workbook, project_root, monkeypatch):
+    # A blank ID gets "row-N" and a repeated one "ID#N"; both must map back to the right record
+    rows = [workbook_row("r1", "Ada Lovelace"), workbook_row(None, "Alan Turing"),
+            workbook_row("r1", "Grace Hopper")]
+    workbook = write_workbook(rows)
+    json_path = str(project_root / "employees.json")
+    first, delta = _run(workbook, json_path)
+    assert sorted(delta.added) == ["r1", "r1#3", "row-2"]
+
+    calls = _materialized(monkeypatch)
+    second, delta = _run(workbook, json_path)
+    assert not delta.has_changes() and calls == [[]]
+    assert _names(second) == ["Ada Lovelace", "Alan Turing", "Grace Hopper"]
+
+
+def test_edited_export_is_not_reused(write_workbook, project_root):
+    workbook = write_workbook(_rows())
+    json_path = str(project_root / "employees.json")
+    _run(workbook, json_path)
+    with open(json_path, encoding="utf-8") as f:
+        records = json.load(f)
+    records[0]["Employee Name"] = "Someone Else"
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(records, f)
+
+    employees, _ = _run(workbook, json_path)
+    assert _names(employees)[0] == "Ada Lovelace"
+
+
+def test_manifest_is_only_saved_on_request(write_workbook, project_root):
+    workbook = write_workbook(_rows())
+    json_path = str(project_root / "employees.json")
+    _, delta = _run(workbook, json_path, save=False)
+    assert not os.path.exists(delta.manifest_path)
+
+    # A failed website build leaves the baseline alone, so the next run still sees the rows as new
+    _, delta = _run(workbook, json_path)
+    assert sorted(delta.added) == ["1", "2", "3"]
+    _, delta = _run(workbook, json_path)
+    assert not delta.has_changes()
+
+
+def test_each_workbook_and_export_keeps_its_own_manifest(write_workbook, project_root):
+    workbook = write_workbook(_rows())
+    other_workbook = write_workbook(_rows()[:1], name="other.xlsx")
+    json_path = str(project_root / "employees.json")
+    _run(workbook, json_path)
+
+    _, delta = _run(workbook, str(project_root / "copy.json"))
+    assert delta.full_rebuild
+    _, delta = _run(other_workbook, json_path)
+    assert delta.full_rebuild
+    _, delta = _run(workbook, json_path)
+    assert not delta.has_changes()
+    assert len(os.listdir(os.path.dirname(delta.manifest_path))) == 3
+
+
+def test_photo_library_change_is_a_change(write_workbook, project_root, monkeypatch):
+    monkeypatch.setattr(excel_parser, "_attach_profile_images", lambda employees, *args, **kwargs: None)
+    image_dir = project_root / "photos"
+    image_dir.mkdir()
+    (image_dir / "Ada Lovelace_profile.jpg").write_bytes(b"jpeg")
+    workbook = write_workbook(_rows())
+    json_path = str(project_root / "employees.json")
+
+    def run():
+        employees, delta = parse_excel_incremental(workbook, json_path, image_source_dir=str(image_dir))
+        delta.save_manifest()
+        return delta
+
+    run()
+    assert not run().has_changes()
+    (image_dir / "Alan Turing_profile.jpg").write_bytes(b"jpeg")
+    delta = run()
+    assert delta.images_changed and delta.has_changes() and not delta.changed
+
+
+def test_website_is_kept_only_when_nothing_changed(write_workbook, project_root, capsys):
+    workbook = write_workbook(_rows())
+    json_path = str(project_root / "employees.json")
+    site = str(project_root / "site")
+    employees, delta = _run(workbook, json_path)
+    assert create_html_output_from_employees(employees, site, workers=1, publish=False, delta=delta)
+
+    employees, delta = _run(workbook, json_path)
+    capsys.readouterr()
+    assert create_html_output_from_employees(employees, site, workers=1, publish=False, delta=delta)
+    assert "keeping existing website" in capsys.readouterr().out
+
+    # A different setting is a different input even without response changes
+    assert create_html_output_from_employees(employees, site, workers=1, publish=True, delta=delta)
+    assert "keeping existing website" not in capsys.readouterr().out
+
+    os.remove(os.path.join(site, "index.html"))
+    assert create_html_output_from_employees(employees, site, workers=1, publish=True, delta=delta)
+    assert os.path.exists(os.path.join(site, "index.html"))
@@ -0,0 +1,157 @@
+import base64
+import hashlib
+import re
+import shutil
+import subprocess
+
+import pytest
+
+from app.modules.config import Config
+from app.modules.excel_parser import parse_excel_incremental
+from app.modules.html_generator import generate_html_template_from_employees
+from app.modules.site_publish import SiteWriter, _SCRIPT_OR_STYLE, minify_js
+
+from conftest import workbook_row
+
+NODE = shutil.which("node")
+needs_node = pytest.mark.skipif(NODE is None, reason="node is not installed")
+
+# Literals that look like comments or indentation must come out unchanged
+SCRIPT = r"""
+// Leading comment
+const url = "https://example.com//path";   // trailing comment
+const pattern = /\/\/+|[/]/g;
+const nested = { a: { b: 1 } };
+/* block
+   comment */
+const html = `
+    <div>
+        // not a comment
+        /* nor this */
+    </div>
+    ${nested.a.b + `${ { x: "}" }.x }`}
+`;
+let total = 1
+total
+++total
+console.log(JSON.stringify([url, url.replace(pattern, "/"), html, total, 10 / 2 / 5]));
+"""
+
+
+def _run_node(path, source):
+    path.write_text(source, encoding="utf-8")
+    return subprocess.run([NODE, str(path)], capture_output=True, text=True, check=True).stdout
+
+
+def _inline_scripts(html):
+    return [match.group(3) for match in _SCRIPT_OR_STYLE.finditer(html)
+            if match.group(2).lower() == "script" and match.group(3).strip()]
+
+
+def test_minify_js_drops_comments_and_indentation_only():
+    minified = minify_js(SCRIPT)
+    assert "Leading comment" not in minified and "trailing comment" not in minified
+    assert "block" not in minified
+    assert "        // not a comment\n        /* nor this */\n" in minified
+    assert '"https://example.com//path"' in minified
+    assert r"/\/\/+|[/]/g" in minified
+    assert minify_js(minified) == minified
+    assert "\nconst nested = { a: { b: 1 } };\nconst html = `\n    <div>" in minified
+
+
+@needs_node
+def test_minified_script_behaves_the_same(tmp_path):
+    assert _run_node(tmp_path / "minified.js", minify_js(SCRIPT)) == _run_node(tmp_path / "original.js", SCRIPT)
+
+
+@pytest.mark.parametrize("sharded", [False, True])
+def test_generated_scripts_round_trip(write_workbook, project_root, tmp_path, sharded):
+    workbook = write_workbook([workbook_row(1, "Ada Lovelace"),
+                               workbook_row(2, "Alan Turing", comment="`Quoted` // text")])
+    employees, _ = parse_excel_incremental(workbook, str(project_root / "employees.json"), copy_images=False)
+    scripts = _inline_scripts(generate_html_template_from_employees(employees, sharded=sharded))
+    assert scripts
+    for index, script in enumerate(scripts):
+        minified = minify_js(script)
+        assert minify_js(minified) == minified
+        assert minified.count("`") == script.count("`")
+        assert minified.count("`Quoted` // text") == script.count("`Quoted` // text")
+        if NODE:
+            path = tmp_path / f"script-{index}.js"
+            path.write_text(minified, encoding="utf-8")
+            subprocess.run([NODE, "--check", str(path)], capture_output=True, text=True, check=True)
+
+
+def test_publish_is_opt_in(tmp_path):
+    assert SiteWriter(tmp_path).publish is False
+
+
+def test_vendor_only_serves_a_copy_matching_the_pin(tmp_path):
+    url = "https://cdn.example.com/lib.js"
+    local = tmp_path / "vendor" / "lib.js"
+    local.parent.mkdir()
+    local.write_bytes(b"console.log('lib');\n")
+    digest = hashlib.sha256(local.read_bytes()).hexdigest()
+
+    writer = SiteWriter(tmp_path / "site", publish=False)
+    assert writer.vendor(url, str(local), "js/lib.js") == url
+    assert writer.vendor(url, str(local), "js/lib.js", "0" * 64) == url
+    assert writer.vendor(url, str(local), "js/lib.js", digest) == "js/lib.js"
+    assert (tmp_path / "site" / "js" / "lib.js").read_bytes() == local.read_bytes()
+
+
+def test_finish_prunes_files_the_build_no_longer_writes(tmp_path):
+    site = tmp_path / "site"
+    for rel_path in ("js/script.js", "_headers", "css/styles.css", "js/old.js"):
+        (site / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (site / rel_path).write_text("stale")
+
+    first = SiteWriter(site, publish=False)
+    first.asset("js/old.js", "old")
+    first.asset("css/styles.css", "body {}")
+    first.page("index.html", "<html></html>")
+    first.finish()
+    assert not (site / "js" / "script.js").exists() and not (site / "_headers").exists()
+    assert (site / "css" / "styles.css").read_text() == "body {}"
+
+    second = SiteWriter(site, publish=True)
+    second.asset("css/styles.css", "body {}")
+    second.page("index.html", "<html></html>")
+    second.finish()
+    assert not (site / "js" / "old.js").exists() and not (site / "css" / "styles.css").exists()
+    assert not (site / "_headers").exists()
+    assert any(path.name.startswith("styles.") for path in (site / "css").iterdir())
+
+
+def _build_site(write_workbook, project_root, publish=True):
+    from app.modules.html_generator import create_html_output_from_employees
+
+    workbook = write_workbook([workbook_row(1, "Ada Lovelace")])
+    employees, _ = parse_excel_incremental(workbook, str(project_root / "employees.json"), copy_images=False)
+    site = project_root / "site"
+    assert create_html_output_from_employees(employees, str(site), workers=1, publish=publish)
+    return site, (site / "index.html").read_text(encoding="utf-8")
+
+
+def test_published_page_references_the_pinned_local_chart_js(write_workbook, project_root, monkeypatch):
+    # Stands in for the pinned release; vendoring only compares bytes with the pin
+    data = b"/*! Chart.js stand-in */window.Chart = function () {};\n"
+    local = project_root / Config.CHART_JS_VENDOR_FILE
+    local.parent.mkdir(parents=True)
+    local.write_bytes(data)
+    integrity = "sha384-" + base64.b64encode(hashlib.sha384(data).digest()).decode()
+    monkeypatch.setattr(Config, "CHART_JS_SHA256", hashlib.sha256(data).hexdigest())
+    monkeypatch.setattr(Config, "CHART_JS_INTEGRITY", integrity)
+
+    site, html = _build_site(write_workbook, project_root)
+    published = re.search(r'<script src="(js/chart\.umd\.[0-9a-f]+\.js)"([^>]*)>', html)
+    assert published and Config.CHART_JS_URL not in html
+    assert (site / published.group(1)).read_bytes() == data
+    assert f'integrity="{integrity}"' in published.group(2)
+
+
+def test_unpinned_chart_js_stays_on_the_cdn(write_workbook, project_root, monkeypatch):
+    monkeypatch.setattr(Config, "CHART_JS_SHA256", "")
+    site, html = _build_site(write_workbook, project_root)
+    assert f'<script src="{Config.CHART_JS_URL}"' in html
+    assert not (site / "js").exists() or not any(path.name.startswith("chart.") for path in (site / "js").iterdir())
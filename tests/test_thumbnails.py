@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+PIL = pytest.importorskip("PIL")
+from PIL import Image  # noqa: E402
+
+from app.modules.config import Config  # noqa: E402
+from app.modules.html_generator import copy_images_to_website  # noqa: E402
+from app.modules.image_manager import ImageManager, load_thumbnail_index  # noqa: E402
+
+
+@pytest.fixture
+def library(project_root):
+    """Three photos in the asset library."""
+    image_dir = project_root / Config.IMAGE_TARGET_DIR
+    image_dir.mkdir(parents=True)
+    for i, name in enumerate(["Ada Lovelace", "Alan Turing", "Grace Hopper"]):
+        Image.new("RGB", (300, 300), (40 * i, 80, 120)).save(image_dir / f"{name}_profile.jpg")
+    return image_dir
+
+
+def _variant_files(index, names):
+    return {filename for name in names for by_format in index[name]['variants'].values()
+            for filename in by_format.values()}
+
+
+def test_only_requested_images_are_rendered(library):
+    index = ImageManager().generate_thumbnails(["Ada Lovelace_profile.jpg"], max_workers=1)
+    assert set(index) == {"Ada Lovelace_profile.jpg"}
+    thumbs = set(os.listdir(Config.get_thumbnail_dir_path())) - {Config.THUMBNAIL_INDEX_FILE}
+    assert thumbs == _variant_files(index, index)
+
+
+def test_subset_keeps_other_entries_and_skips_up_to_date(library, capsys):
+    manager = ImageManager()
+    manager.generate_thumbnails(max_workers=1)
+    capsys.readouterr()
+
+    index = manager.generate_thumbnails(["Alan Turing_profile.jpg"], max_workers=1)
+    assert "0 images rendered, 1 up to date" in capsys.readouterr().out
+    assert len(index) == 3
+    thumbs = set(os.listdir(Config.get_thumbnail_dir_path())) - {Config.THUMBNAIL_INDEX_FILE}
+    assert thumbs == _variant_files(index, index)
+
+
+def test_website_gets_only_the_shown_photos_thumbnails(library, project_root):
+    ImageManager().generate_thumbnails(max_workers=1)
+    site = project_root / "site"
+    copy_images_to_website(site)
+    assert len(os.listdir(site / Config.THUMBNAIL_DIR)) == len(_variant_files(load_thumbnail_index(),
+                                                                               load_thumbnail_index()))
+
+    shown = ["Grace Hopper_profile.jpg"]
+    copy_images_to_website(site, shown)
+    assert set(os.listdir(site / Config.THUMBNAIL_DIR)) == _variant_files(load_thumbnail_index(), shown)
@@ -0,0 +1,129 @@
+import sqlite3
+
+import pytest
+
+from app.modules.config import Config
+from app.modules.orchestrator import EmployeeEvaluationOrchestrator
+from app.modules.warehouse import SCHEMA_VERSION, EvaluationWarehouse, employee_key
+
+
+def _record(name, rating="4 - Meets", comment="Clear and timely", email=True):
+    record = {"Employee Name": name, "Communication Rating": rating, "Communication Comments": comment,
+              "data_sources": ["excel_parser"]}
+    if email:
+        record["Email"] = name.lower().replace(" ", ".") + "@Example.com"
+    return record
+
+
+@pytest.fixture
+def warehouse(tmp_path):
+    with EvaluationWarehouse(str(tmp_path / "warehouse.sqlite")) as warehouse:
+        yield warehouse
+
+
+def _response_ids(warehouse, year, column="id"):
+    return dict(warehouse.connection.execute(
+        f"SELECT e.employee_key, r.{column} FROM responses r JOIN employees e ON e.id = r.employee_id "
+        "WHERE r.year = ?", (year,)))
+
+
+def test_reingest_only_touches_changed_responses(warehouse):
+    records = [_record("Ada Lovelace"), _record("Alan Turing", rating="5 - Exceeds")]
+    assert warehouse.ingest(records, 2025) == {'added': 2, 'updated': 0, 'unchanged': 0, 'removed': 0,
+                                               'skipped': 0}
+    before = _response_ids(warehouse, 2025)
+    digests = _response_ids(warehouse, 2025, "digest")
+
+    # Bookkeeping fields are not part of the response
+    records[0]["last_updated"] = "2025-10-01"
+    records[1]["Communication Rating"] = "3 - Meets"
+    counts = warehouse.ingest(records, 2025)
+    assert (counts['unchanged'], counts['updated'], counts['added']) == (1, 1, 0)
+    assert _response_ids(warehouse, 2025)["ada.lovelace@example.com"] == before["ada.lovelace@example.com"]
+    assert _response_ids(warehouse, 2025, "digest")["alan.turing@example.com"] != digests["alan.turing@example.com"]
+    assert warehouse.employee_trajectory("alan.turing@example.com", "Communication Rating") == [
+        {'year': 2025, 'value': "3 - Meets", 'score': 3.0}]
+
+
+def test_prune_removes_only_that_years_missing_responses(warehouse):
+    warehouse.ingest([_record("Ada Lovelace"), _record("Alan Turing")], 2024)
+    warehouse.ingest([_record("Ada Lovelace"), _record("Alan Turing")], 2025)
+
+    counts = warehouse.ingest([_record("Ada Lovelace")], 2025)
+    assert counts['removed'] == 1
+    assert set(_response_ids(warehouse, 2025)) == {"ada.lovelace@example.com"}
+    assert set(_response_ids(warehouse, 2024)) == {"ada.lovelace@example.com", "alan.turing@example.com"}
+    assert warehouse.connection.execute("SELECT COUNT(*) FROM response_values v LEFT JOIN responses r "
+                                        "ON r.id = v.response_id WHERE r.id IS NULL").fetchone()[0] == 0
+
+    counts = warehouse.ingest([_record("Grace Hopper")], 2025, prune=False)
+    assert counts['removed'] == 0
+    assert set(_response_ids(warehouse, 2025)) == {"ada.lovelace@example.com", "grace.hopper@example.com"}
+
+
+def test_keys_fall_back_to_names_and_resubmissions_replace(warehouse):
+    records = [_record("Ada Lovelace", email=False), {"Communication Rating": "2"},
+               _record("Ada Lovelace", email=False, rating="5 - Exceeds")]
+    counts = warehouse.ingest(records, 2025)
+    assert (counts['added'], counts['skipped']) == (1, 1)
+    assert employee_key(None, "Ada Lovelace") in _response_ids(warehouse, 2025)
+    assert warehouse.employee_history("Ada Lovelace")[2025]["Communication Rating"] == "5 - Exceeds"
+
+
+def test_failed_ingest_rolls_back(warehouse, monkeypatch):
+    warehouse.ingest([_record("Ada Lovelace")], 2025)
+    fields = warehouse.fields()
+    employee_id = warehouse._employee_id
+    calls = []
+
+    def fail_second(key, name):
+        calls.append(key)
+        if len(calls) > 1:
+            raise sqlite3.OperationalError("disk I/O error")
+        return employee_id(key, name)
+
+    # The first response (and its new field) is written before the second one fails
+    monkeypatch.setattr(warehouse, "_employee_id", fail_second)
+    with pytest.raises(sqlite3.OperationalError):
+        warehouse.ingest([_record("Grace Hopper") | {"New Field": 1}, _record("Ada Lovelace", rating="1 - Below")],
+                         2025, prune=False)
+    monkeypatch.undo()
+    assert warehouse.fields() == fields and "New Field" not in warehouse._field_ids
+    assert set(_response_ids(warehouse, 2025)) == {"ada.lovelace@example.com"}
+    assert warehouse.ingest([_record("Ada Lovelace")], 2025)['unchanged'] == 1
+
+
+def _pipeline_run(records):
+    orchestrator = EmployeeEvaluationOrchestrator()
+    orchestrator.employees = records
+    orchestrator._update_warehouse()
+
+
+def test_pipeline_runs_only_file_when_enabled(project_root):
+    _pipeline_run([_record("Ada Lovelace")])
+    assert not (project_root / Config.WAREHOUSE_FILE).exists()
+
+
+def test_pipeline_run_never_removes_filed_responses(project_root, monkeypatch):
+    everyone = [_record("Ada Lovelace"), _record("Alan Turing")]
+    with EvaluationWarehouse() as warehouse:
+        warehouse.ingest(everyone, Config.EVALUATION_YEAR - 1)
+        warehouse.ingest(everyone, Config.EVALUATION_YEAR)
+
+    # Next year's workbook run before EVALUATION_YEAR was moved on
+    monkeypatch.setattr(Config, "WAREHOUSE_ENABLED", True)
+    _pipeline_run([_record("Grace Hopper")])
+    with EvaluationWarehouse() as warehouse:
+        assert set(_response_ids(warehouse, Config.EVALUATION_YEAR - 1)) == {
+            "ada.lovelace@example.com", "alan.turing@example.com"}
+        assert set(_response_ids(warehouse, Config.EVALUATION_YEAR)) == {
+            "ada.lovelace@example.com", "alan.turing@example.com", "grace.hopper@example.com"}
+
+
+def test_other_schema_versions_are_refused(tmp_path):
+    path = str(tmp_path / "warehouse.sqlite")
+    connection = sqlite3.connect(path)
+    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+    connection.close()
+    with pytest.raises(ValueError):
+        EvaluationWarehouse(path)